@@ -10,6 +10,7 @@
  *   archive_account              → action: "archive"
  *   reassign_trades              → action: "reassign" (destructive, confirmation)
  *   record_balance               → action: "balance"
+ *   (balance history listing)    → action: "balance_history"
  *   get_account_review_checklist → action: "checklist"
  *
  * Source: implementation-plan.md MC3
@@ -200,6 +201,26 @@ const accountRouter = new CompoundToolRouter({
         },
     },
 
+    // ── balance_history ───────────────────────────────────────────────
+    balance_history: {
+        schema: z.object({
+            account_id: z.string(),
+            limit: z.number().int().min(1).max(1000).optional(),
+            cursor: z.string().optional(),
+            include_total: z.boolean().optional(),
+        }).strict(),
+        handler: async (params): Promise<ToolResult> => {
+            const qp = new URLSearchParams();
+            if (params.limit !== undefined) qp.set("limit", String(params.limit));
+            if (params.cursor) qp.set("cursor", params.cursor);
+            if (params.include_total !== undefined) qp.set("include_total", String(params.include_total));
+            const query = qp.toString() ? `?${qp}` : "";
+            return textResult(await fetchApi(
+                `/accounts/${params.account_id}/balances${query}`,
+            ));
+        },
+    },
+
     // ── checklist ─────────────────────────────────────────────────────
     checklist: {
         schema: z.object({
@@ -274,7 +295,7 @@ const accountRouter = new CompoundToolRouter({
 
 const ACCOUNT_ACTIONS = [
     "list", "get", "create", "update", "delete",
-    "archive", "reassign", "balance", "checklist",
+    "archive", "reassign", "balance", "balance_history", "checklist",
 ] as const;
 
 export function registerAccountTool(server: McpServer): RegisteredToolHandle[] {
@@ -284,10 +305,11 @@ export function registerAccountTool(server: McpServer): RegisteredToolHandle[] {
             {
                 description:
                     "Account management — list, get, create, update, delete, archive, " +
-                    "reassign trades, record balance, review checklist. " +
+                    "reassign trades, record balance, list balance history, review checklist. " +
                     "\\n\\nWorkflow: create → update → (archive | delete). Archived accounts are hidden from default list but preserved. " +
                     "Use list with include_archived:true to see them. " +
                     "\\n\\nConfirmation: 'delete' and 'reassign' actions require a confirmation_token from zorivest_system(action:\"confirm_token\"). " +
+                    "balance_history pages newest-first; pass next_cursor back as cursor for the next page. " +
                     "The checklist action identifies stale accounts needing sync or balance updates (default: stale_only with 7-day threshold). " +
                     "\\n\\nReturns: JSON with { success, data }. Account types: BROKER, BANK, IRA, K401, ROTH_IRA, HSA, OTHER. " +
                     "Errors: 404 if account_id not found, 422 if required fields missing. " +
@@ -309,6 +331,9 @@ export function registerAccountTool(server: McpServer): RegisteredToolHandle[] {
                     include_system: z.boolean().optional(),
                     scope: z.enum(["all", "stale_only", "broker_only", "bank_only"]).optional(),
                     stale_threshold_days: z.number().optional(),
+                    limit: z.number().optional(),
+                    cursor: z.string().optional(),
+                    include_total: z.boolean().optional(),
                 }).strict(),
                 annotations: {
                     readOnlyHint: false,
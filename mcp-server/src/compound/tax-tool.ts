@@ -135,6 +135,12 @@ const taxRouter = new CompoundToolRouter({
             sort_by: z.enum(["acquired_date", "cost_basis", "gain_loss"])
                 .default("acquired_date")
                 .describe("Sort order"),
+            limit: z.number().int().min(1).max(1000).optional()
+                .describe("Page size; enables cursor paging (acquired_date sort only)"),
+            cursor: z.string().optional()
+                .describe("next_cursor from a previous page"),
+            include_total: z.boolean().optional()
+                .describe("Count all matching lots (default true)"),
         }).strict(),
         handler: async (params): Promise<ToolResult> => {
             const qp = new URLSearchParams();
@@ -142,6 +148,9 @@ const taxRouter = new CompoundToolRouter({
             if (params.ticker) qp.set("ticker", params.ticker);
             qp.set("status", params.status);
             qp.set("sort_by", params.sort_by);
+            if (params.limit !== undefined) qp.set("limit", String(params.limit));
+            if (params.cursor) qp.set("cursor", params.cursor);
+            if (params.include_total !== undefined) qp.set("include_total", String(params.include_total));
             return textResult(await fetchApi(`/tax/lots?${qp}`));
         },
     },
@@ -355,6 +364,7 @@ export function registerTaxTool(server: McpServer): RegisteredToolHandle[] {
                     "\\n\\nWorkflow: sync_lots (materialize trades → lots) → simulate (pre-trade what-if) → " +
                     "estimate (overall liability) → scan_wash_sales (trigger wash sale detection) → " +
                     "wash_sales (view detected violations) → lots (view positions) → " +
+                    "lots accepts limit/cursor for keyset paging (returns next_cursor). " +
                     "quarterly (payment obligations) → record_payment (record actual payment) → " +
                     "harvest (loss harvesting opportunities) → ytd_summary (dashboard data). " +
                     "\\n\\nConfirmation: 'record_payment' requires confirm:true to prevent accidental writes. " +
@@ -377,6 +387,9 @@ export function registerTaxTool(server: McpServer): RegisteredToolHandle[] {
                     date_range_end: z.string().optional(),
                     status: z.enum(["open", "closed", "all"]).optional(),
                     sort_by: z.enum(["acquired_date", "cost_basis", "gain_loss"]).optional(),
+                    limit: z.number().optional(),
+                    cursor: z.string().optional(),
+                    include_total: z.boolean().optional(),
                     quarter: z.enum(["Q1", "Q2", "Q3", "Q4"]).optional(),
                     estimation_method: z.enum(["annualized", "actual", "prior_year"]).optional(),
                     payment_amount: z.number().optional(),
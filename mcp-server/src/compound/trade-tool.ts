@@ -3,6 +3,7 @@
  *
  * Absorbs 6 individual tools from trade-tools.ts:
  *   create_trade        → action: "create"
+ *   (bulk ingestion)     → action: "create_bulk"
  *   list_trades          → action: "list"
  *   delete_trade         → action: "delete"
  *   attach_screenshot    → action: "screenshot_attach"
@@ -68,6 +69,55 @@ const tradeRouter = new CompoundToolRouter({
         },
     },
 
+    // ── create_bulk ───────────────────────────────────────────────────
+    create_bulk: {
+        schema: z.object({
+            trades: z.array(z.object({
+                exec_id: z.string(),
+                time: z.string(),
+                instrument: z.string(),
+                trade_action: z.enum(["BOT", "SLD"]),
+                quantity: z.number().positive(),
+                price: z.number().min(0),
+                account_id: z.string(),
+                commission: z.number().min(0).optional(),
+                realized_pnl: z.number().optional(),
+                notes: z.string().optional(),
+            }).strict()).min(1).max(50000),
+            confirmation_token: z.string().optional(),
+        }).strict(),
+        handler: async (params): Promise<ToolResult> => {
+            const handler = withConfirmation(
+                "create_trades_bulk",
+                async (p: typeof params, _extra: unknown) => {
+                    const body = {
+                        trades: p.trades.map((t) => ({
+                            exec_id: t.exec_id,
+                            time: t.time,
+                            instrument: t.instrument,
+                            action: t.trade_action,
+                            quantity: t.quantity,
+                            price: t.price,
+                            account_id: t.account_id,
+                            commission: t.commission ?? 0,
+                            realized_pnl: t.realized_pnl ?? 0,
+                            notes: t.notes,
+                        })),
+                    };
+                    const result = await fetchApi("/trades/bulk", {
+                        method: "POST",
+                        headers: { "Content-Type": "application/json" },
+                        body: JSON.stringify(body),
+                    });
+                    return {
+                        content: [{ type: "text" as const, text: JSON.stringify(result) }],
+                    };
+                },
+            );
+            return handler(params, {}) as Promise<ToolResult>;
+        },
+    },
+
     // ── list ──────────────────────────────────────────────────────────
     list: {
         schema: z.object({
@@ -75,6 +125,8 @@ const tradeRouter = new CompoundToolRouter({
             offset: z.number().int().min(0).optional(),
             account_id: z.string().optional(),
             sort: z.string().optional(),
+            cursor: z.string().optional(),
+            include_total: z.boolean().optional(),
         }).strict(),
         handler: async (params): Promise<ToolResult> => {
             const queryParts: string[] = [];
@@ -82,6 +134,8 @@ const tradeRouter = new CompoundToolRouter({
             if (params.offset !== undefined) queryParts.push(`offset=${params.offset}`);
             if (params.account_id) queryParts.push(`account_id=${params.account_id}`);
             if (params.sort) queryParts.push(`sort=${params.sort}`);
+            if (params.cursor) queryParts.push(`cursor=${encodeURIComponent(params.cursor)}`);
+            if (params.include_total !== undefined) queryParts.push(`include_total=${params.include_total}`);
             const query = queryParts.length > 0 ? `?${queryParts.join("&")}` : "";
             const result = await fetchApi(`/trades${query}`);
             return {
@@ -190,7 +244,7 @@ const tradeRouter = new CompoundToolRouter({
 // ── Registration ───────────────────────────────────────────────────────
 
 const TRADE_ACTIONS = [
-    "create", "list", "delete",
+    "create", "create_bulk", "list", "delete",
     "screenshot_attach", "screenshot_list", "screenshot_get",
 ] as const;
 
@@ -200,11 +254,13 @@ export function registerTradeTool(server: McpServer): RegisteredToolHandle[] {
             "zorivest_trade",
             {
                 description:
-                    "Trade management — create, list, delete trades; attach/list/get screenshots. " +
-                    "\\n\\nConfirmation: 'create' and 'delete' actions require a confirmation_token from zorivest_system(action:\"confirm_token\"). " +
+                    "Trade management — create (single or bulk), list, delete trades; attach/list/get screenshots. " +
+                    "\\n\\nConfirmation: 'create', 'create_bulk' and 'delete' actions require a confirmation_token from zorivest_system(action:\"confirm_token\"). " +
                     "Screenshot workflow: screenshot_attach (upload base64 image) → screenshot_list (get all for a trade) → screenshot_get (retrieve by ID with embedded image). " +
                     "\\n\\nPrerequisite: An account must exist before creating trades. Use zorivest_account(action:\"list\") to find account_id. " +
                     "Returns: JSON with { success, data }. screenshot_get returns both text metadata and an embedded image content block. " +
+                    "list returns next_cursor for time-sorted pages; pass it back as cursor to page without offset (include_total:false skips the count). " +
+                    "create_bulk takes trades[] (same fields as create) and returns per-row status: accepted, duplicate (exec_id or fingerprint match) or error. " +
                     "Errors: 404 if exec_id/image_id not found, 422 if required fields missing. " +
                     `Actions: ${TRADE_ACTIONS.join(", ")}`,
                 inputSchema: z.object({
@@ -224,9 +280,12 @@ export function registerTradeTool(server: McpServer): RegisteredToolHandle[] {
                     limit: z.number().optional(),
                     offset: z.number().optional(),
                     sort: z.string().optional(),
+                    cursor: z.string().optional(),
+                    include_total: z.boolean().optional(),
                     image_base64: z.string().optional(),
                     caption: z.string().optional(),
                     image_id: z.number().optional(),
+                    trades: z.array(z.record(z.string(), z.unknown())).optional(),
                 }).strict(),
                 annotations: {
                     readOnlyHint: false,
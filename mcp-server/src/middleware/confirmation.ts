@@ -23,6 +23,7 @@ let confirmationRequired = false; // Default to pass-through; set to true by set
 const DESTRUCTIVE_TOOLS = new Set([
     "zorivest_emergency_stop",
     "create_trade",
+    "create_trades_bulk",
     "delete_trade",
     "delete_account",
     "delete_policy",
@@ -1,7 +1,7 @@
 /**
  * Behavior tests for zorivest_account compound tool.
  *
- * Verifies all 9 actions route correctly through CompoundToolRouter.
+ * Verifies all 10 actions route correctly through CompoundToolRouter.
  * Source: mcp-consolidation-proposal-v3.md §6 zorivest_account
  * Phase: P2.5f corrections (Finding 3)
  */
@@ -103,6 +103,19 @@ describe("zorivest_account compound tool", () => {
         expect(getLastFetchMethod(fetchMock)).toBe("POST");
     });
 
+    it("routes balance_history to GET /accounts/:id/balances with cursor", async () => {
+        const client = await createClient(registerAccountTool);
+        await client.callTool({
+            name: "zorivest_account",
+            arguments: { action: "balance_history", account_id: "acc-1", limit: 50, cursor: "abc" },
+        });
+        const url = getLastFetchUrl(fetchMock);
+        expect(url).toContain("/accounts/acc-1/balances?");
+        expect(url).toContain("limit=50");
+        expect(url).toContain("cursor=abc");
+        expect(getLastFetchMethod(fetchMock)).toBe("GET");
+    });
+
     it("routes checklist to aggregated /brokers + /banking/accounts", async () => {
         const client = await createClient(registerAccountTool);
         await client.callTool({
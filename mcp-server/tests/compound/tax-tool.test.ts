@@ -90,6 +90,17 @@ describe("zorivest_tax compound tool", () => {
         expect(getLastFetchMethod(fetchMock)).toBe("GET");
     });
 
+    it("forwards lots cursor pagination params", async () => {
+        const client = await createClient(registerTaxTool);
+        await client.callTool({
+            name: "zorivest_tax",
+            arguments: { action: "lots", limit: 100, cursor: "tok" },
+        });
+        const url = getLastFetchUrl(fetchMock);
+        expect(url).toContain("limit=100");
+        expect(url).toContain("cursor=tok");
+    });
+
     it("routes quarterly to GET /tax/quarterly", async () => {
         const client = await createClient(registerTaxTool);
         await client.callTool({
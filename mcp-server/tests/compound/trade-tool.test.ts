@@ -1,7 +1,7 @@
 /**
  * Behavior tests for zorivest_trade compound tool.
  *
- * Verifies all 6 actions route correctly through CompoundToolRouter.
+ * Verifies all 7 actions route correctly through CompoundToolRouter.
  * Source: mcp-consolidation-proposal-v3.md §2 zorivest_trade
  * Phase: P2.5f corrections (Finding 3)
  */
@@ -29,6 +29,17 @@ describe("zorivest_trade compound tool", () => {
         expect(getLastFetchUrl(fetchMock)).toContain("/trades");
     });
 
+    it("forwards cursor pagination params on list", async () => {
+        const client = await createClient(registerTradeTool);
+        await client.callTool({
+            name: "zorivest_trade",
+            arguments: { action: "list", limit: 25, cursor: "eyJrIjoi", include_total: false },
+        });
+        const url = getLastFetchUrl(fetchMock);
+        expect(url).toContain("cursor=eyJrIjoi");
+        expect(url).toContain("include_total=false");
+    });
+
     it("routes create to POST /trades (pass-through mode)", async () => {
         const client = await createClient(registerTradeTool);
         await client.callTool({
@@ -43,6 +54,28 @@ describe("zorivest_trade compound tool", () => {
         expect(getLastFetchMethod(fetchMock)).toBe("POST");
     });
 
+    it("routes create_bulk to POST /trades/bulk with API field names", async () => {
+        const client = await createClient(registerTradeTool);
+        await client.callTool({
+            name: "zorivest_trade",
+            arguments: {
+                action: "create_bulk",
+                trades: [
+                    {
+                        exec_id: "exec-1", time: "2026-01-15T10:00:00", instrument: "AAPL",
+                        trade_action: "BOT", quantity: 100, price: 150.0, account_id: "acc-1",
+                    },
+                ],
+            },
+        });
+        expect(getLastFetchUrl(fetchMock)).toContain("/trades/bulk");
+        expect(getLastFetchMethod(fetchMock)).toBe("POST");
+        const [, opts] = fetchMock.mock.calls[fetchMock.mock.calls.length - 1];
+        const body = JSON.parse((opts as RequestInit).body as string);
+        expect(body.trades[0].action).toBe("BOT");
+        expect(body.trades[0]).not.toHaveProperty("trade_action");
+    });
+
     it("routes delete to DELETE /trades/:id (pass-through mode)", async () => {
         const client = await createClient(registerTradeTool);
         await client.callTool({
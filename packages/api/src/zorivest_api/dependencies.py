@@ -5,8 +5,12 @@ Source: 04-rest-api.md §Dependencies
 
 from __future__ import annotations
 
+from typing import AsyncIterator
+
 from fastapi import HTTPException, Request
 
+from zorivest_api.event_loop import run_handlers_on_loop
+
 
 async def require_unlocked_db(request: Request) -> None:
     """Mode-gating dependency: raises 403 if database is locked.
@@ -21,6 +25,29 @@ async def require_unlocked_db(request: Request) -> None:
         )
 
 
+async def open_db_scope(request: Request) -> AsyncIterator[None]:
+    """App-wide dependency: one database session per request.
+
+    Enters the scoped UnitOfWork for the lifetime of the request so every
+    service call made while handling it shares one session, isolated from
+    concurrent requests and pipeline runs.  Unhandled errors roll the
+    session back.  No-op when the UoW is not configured.  When it is
+    shared, the request's blocking handler runs on the loop instead of a
+    worker thread, since the shared Session must not be used from two
+    threads at once.
+    """
+    uow = getattr(request.app.state, "uow", None)
+    if uow is None:
+        yield
+        return
+    if not getattr(uow, "scoped", False):
+        run_handlers_on_loop()
+        yield
+        return
+    with uow:
+        yield
+
+
 # ── Service providers ───────────────────────────────────────────────────
 # In production: resolved from app.state (set during lifespan/unlock).
 # In tests: overridden via app.dependency_overrides.
@@ -146,6 +173,14 @@ async def get_scheduler_service(request: Request):  # noqa: ANN201
     return svc
 
 
+async def get_fetch_cache_sweeper(request: Request):  # noqa: ANN201
+    """Resolve FetchCacheSweeper from app state."""
+    sweeper = getattr(request.app.state, "fetch_cache_sweeper", None)
+    if sweeper is None:
+        raise HTTPException(500, "FetchCacheSweeper not configured")
+    return sweeper
+
+
 async def get_email_provider_service(request: Request):  # noqa: ANN201
     """Resolve EmailProviderService from app state (MEU-73)."""
     svc = getattr(request.app.state, "email_provider_service", None)
@@ -0,0 +1,211 @@
+"""Event-loop execution layer: worker thread pool sizing and loop-lag metrics.
+
+Route handlers that call synchronous (SQLAlchemy-backed) services are plain
+``def`` functions on routers built with ``BlockingHandlerRoute``, which runs
+them on anyio's worker thread pool instead of the event loop.  In shared
+session mode every request and pipeline run uses one non-thread-safe
+Session, so ``open_db_scope`` calls ``run_handlers_on_loop`` and those
+handlers run inline on the loop instead.  This module sizes the pool and
+measures how late the loop wakes up, so anything that still blocks it shows
+up as lag.
+
+Configuration (read once in the lifespan):
+
+- ``ZORIVEST_THREAD_POOL_SIZE``: worker threads for blocking handlers.
+  Defaults to one per pooled database connection in scoped session mode
+  and to 1 in shared mode, where every request uses the same session.
+- ``ZORIVEST_LOOP_LAG_WARN_MS``: lag above which a ``event_loop_lag``
+  warning is logged (default 100 ms).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import os
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import anyio.to_thread
+import structlog
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+from zorivest_infra.database.unit_of_work import default_reader_count
+
+DEFAULT_LOOP_LAG_WARN_MS = 100.0
+_SAMPLE_INTERVAL_S = 0.25
+_WINDOW = 240  # samples kept: one minute at the default interval
+
+
+# Set per request by ``run_handlers_on_loop`` (shared session mode).
+_handlers_on_loop: ContextVar[bool] = ContextVar("handlers_on_loop", default=False)
+
+
+def run_handlers_on_loop() -> None:
+    """Run this request's blocking handlers on the loop instead of a worker.
+
+    Call from an async dependency; the flag lives in the request's context.
+    """
+    _handlers_on_loop.set(True)
+
+
+def _offloaded(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(endpoint)
+    async def call(*args: Any, **kwargs: Any) -> Any:
+        if _handlers_on_loop.get():
+            return endpoint(*args, **kwargs)
+        return await run_in_threadpool(endpoint, *args, **kwargs)
+
+    return call
+
+
+class BlockingHandlerRoute(APIRoute):
+    """Route whose ``def`` endpoint runs on the worker pool.
+
+    Unlike FastAPI's own offloading, the request can opt back into running
+    the endpoint on the loop (``run_handlers_on_loop``).
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        if inspect.isfunction(endpoint) and not (
+            inspect.iscoroutinefunction(endpoint)
+            or inspect.isgeneratorfunction(endpoint)
+        ):
+            endpoint = _offloaded(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def default_thread_pool_size(*, scoped: bool, readers: int | None = None) -> int:
+    """Worker threads matching the database pool: one writer plus readers.
+
+    More threads than connections would only queue on the SQLAlchemy pool
+    checkout (and its timeout) instead of on the thread limiter.
+    """
+    if not scoped:
+        return 1
+    return 1 + (readers if readers is not None else default_reader_count())
+
+
+def thread_pool_size_from_env(*, scoped: bool, readers: int | None = None) -> int:
+    """Resolve the pool size from ``ZORIVEST_THREAD_POOL_SIZE`` or the default."""
+    raw = os.environ.get("ZORIVEST_THREAD_POOL_SIZE")
+    if raw:
+        return int(raw)
+    return default_thread_pool_size(scoped=scoped, readers=readers)
+
+
+def configure_thread_pool(size: int) -> None:
+    """Bound the worker threads used by ``def`` handlers and ``run_in_threadpool``.
+
+    Must be called from inside the running event loop (e.g. the lifespan);
+    anyio keeps one default limiter per loop.
+    """
+    if size < 1:
+        raise ValueError(f"Thread pool size must be at least 1, got {size}")
+    anyio.to_thread.current_default_thread_limiter().total_tokens = size
+
+
+@dataclass(frozen=True)
+class ThreadPoolStats:
+    """Worker thread pool occupancy at one instant."""
+
+    size: int
+    busy: int
+    waiting: int
+
+
+def thread_pool_stats() -> ThreadPoolStats:
+    """Current occupancy of the default worker pool (call from the loop)."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return ThreadPoolStats(
+        size=int(limiter.total_tokens),
+        busy=limiter.borrowed_tokens,
+        waiting=limiter.statistics().tasks_waiting,
+    )
+
+
+@dataclass(frozen=True)
+class LoopLagStats:
+    """Event-loop lag over the monitor's recent sample window."""
+
+    samples: int
+    last_ms: float
+    mean_ms: float
+    p99_ms: float
+    max_ms: float
+    slow_ticks: int
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a periodic wake-up.
+
+    Every *interval* seconds the monitor sleeps and records the delay past
+    the scheduled wake-up time.  A handler or job that blocks the loop
+    delays every tick for as long as it runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = _SAMPLE_INTERVAL_S,
+        warn_ms: float = DEFAULT_LOOP_LAG_WARN_MS,
+        window: int = _WINDOW,
+    ) -> None:
+        self._interval = interval
+        self._warn_ms = warn_ms
+        self._samples: deque[float] = deque(maxlen=window)
+        self._max_ms = 0.0
+        self._slow_ticks = 0
+        self._task: asyncio.Task[None] | None = None
+        self._log = structlog.get_logger()
+
+    def start(self) -> None:
+        """Start sampling on the running loop (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling and wait for the sampler task to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def record(self, lag_ms: float) -> None:
+        """Record one lag sample (exposed for the sampler and tests)."""
+        self._samples.append(lag_ms)
+        self._max_ms = max(self._max_ms, lag_ms)
+        if lag_ms > self._warn_ms:
+            self._slow_ticks += 1
+            self._log.warning("event_loop_lag", lag_ms=round(lag_ms, 1))
+
+    def stats(self) -> LoopLagStats:
+        """Summary of the sample window; ``max_ms``/``slow_ticks`` are lifetime."""
+        samples = sorted(self._samples)
+        if not samples:
+            return LoopLagStats(0, 0.0, 0.0, 0.0, self._max_ms, self._slow_ticks)
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        return LoopLagStats(
+            samples=len(samples),
+            last_ms=self._samples[-1],
+            mean_ms=sum(samples) / len(samples),
+            p99_ms=p99,
+            max_ms=self._max_ms,
+            slow_ticks=self._slow_ticks,
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self.record(max(0.0, (loop.time() - scheduled) * 1000))
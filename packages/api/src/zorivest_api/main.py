@@ -11,7 +11,7 @@ import uuid
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -42,6 +42,13 @@ from zorivest_api.routes.mcp_toolsets import mcp_toolsets_router  # MEU-46a
 from zorivest_api.routes.email_settings import email_settings_router  # MEU-73
 from zorivest_api.routes.config import config_router  # MEU-75
 from zorivest_api.routes.backups import backup_router  # MEU-74
+from zorivest_api.dependencies import open_db_scope
+from zorivest_api.event_loop import (
+    DEFAULT_LOOP_LAG_WARN_MS,
+    LoopLagMonitor,
+    configure_thread_pool,
+    thread_pool_size_from_env,
+)
 from zorivest_api.schemas.common import ErrorEnvelope
 from zorivest_api.auth.auth_service import AuthService
 from zorivest_api.services.mcp_guard import McpGuardService
@@ -69,19 +76,29 @@ from zorivest_infra.database.unit_of_work import (
     create_engine_with_wal,
 )
 from zorivest_infra.database.models import Base
+from zorivest_infra.database.scheduling_repositories import (
+    DeliveryRepository,
+    FetchCacheRepository,
+    PipelineStateRepository,
+    ReportRepository,
+)
 from zorivest_infra.market_data.provider_registry import PROVIDER_REGISTRY
-from zorivest_infra.market_data.rate_limiter import RateLimiter
+from zorivest_infra.market_data.rate_budget import Priority, RateBudget
 from zorivest_infra.market_data.service_factory import (
     FernetEncryptionAdapter,
     HttpxClient,
 )
 from zorivest_infra.market_data.normalizers import (
     NORMALIZERS,
+    BATCH_QUOTE_NORMALIZERS,
     QUOTE_NORMALIZERS,
     NEWS_NORMALIZERS,
     SEARCH_NORMALIZERS,
 )
+from zorivest_core.services.fetch_memory_cache import FetchMemoryCache
+from zorivest_core.services.market_data_cache import MarketDataCache
 from zorivest_core.services.market_data_service import MarketDataService  # MEU-91
+from zorivest_core.services.provider_health import ProviderHealthTracker
 from sqlalchemy import text
 from zorivest_api.scheduling_adapters import (
     PolicyStoreAdapter,
@@ -216,7 +233,7 @@ def _seed_default_templates(repo: Any, session: Any) -> None:
 
 
 def _get_inline_migrations() -> list[str]:
-    """Return the list of ``ALTER TABLE`` statements for schema evolution.
+    """Return the list of DDL statements for schema evolution.
 
     Each statement is run inside a try/except during startup so that
     columns already present on a fresh database (via ``create_all``) are
@@ -241,6 +258,36 @@ def _get_inline_migrations() -> list[str]:
         "ALTER TABLE tax_lots ADD COLUMN is_user_modified BOOLEAN DEFAULT 0 NOT NULL",
         "ALTER TABLE tax_lots ADD COLUMN source_hash VARCHAR(64)",
         "ALTER TABLE tax_lots ADD COLUMN sync_status VARCHAR(20) DEFAULT 'synced' NOT NULL",
+        # Indexed trade fingerprint for duplicate detection (backfilled at startup)
+        "ALTER TABLE trades ADD COLUMN fingerprint VARCHAR(64)",
+        "CREATE INDEX IF NOT EXISTS ix_trades_fingerprint_time ON trades (fingerprint, time)",
+        # Composite indexes backing keyset (cursor) pagination
+        "CREATE INDEX IF NOT EXISTS ix_trades_time_exec_id ON trades (time, exec_id)",
+        "CREATE INDEX IF NOT EXISTS ix_trades_account_time_exec_id"
+        " ON trades (account_id, time, exec_id)",
+        "CREATE INDEX IF NOT EXISTS ix_tax_lots_open_date_lot_id"
+        " ON tax_lots (open_date, lot_id)",
+        "CREATE INDEX IF NOT EXISTS ix_balance_snapshots_account_datetime_id"
+        " ON balance_snapshots (account_id, datetime, id)",
+        # Hot-path indexes flagged by zorivest_infra.database.query_plan_advisor
+        "CREATE INDEX IF NOT EXISTS ix_audit_log_action_created_at"
+        " ON audit_log (action, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_tax_lots_closed_close_date"
+        " ON tax_lots (is_closed, close_date)",
+        "CREATE INDEX IF NOT EXISTS ix_tax_lots_ticker_open_date"
+        " ON tax_lots (ticker, open_date)",
+        # Per-account plan counts for the accounts page
+        "CREATE INDEX IF NOT EXISTS ix_trade_plans_account_id"
+        " ON trade_plans (account_id)",
+        # Read-through market history store (MarketDataService)
+        "ALTER TABLE market_fundamentals ADD COLUMN text_value VARCHAR(128)",
+        "ALTER TABLE market_dividends ADD COLUMN fetched_at DATETIME",
+        "ALTER TABLE market_splits ADD COLUMN fetched_at DATETIME",
+        # Compressed, content-addressed fetch cache payloads (fetch_cache_blobs)
+        "CREATE INDEX IF NOT EXISTS ix_fetch_cache_content_hash"
+        " ON fetch_cache (content_hash)",
+        # Fetch cache retention (LRU by last hit)
+        "ALTER TABLE fetch_cache ADD COLUMN last_hit_at DATETIME",
     ]
 
 
@@ -252,9 +299,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan: initialize state on startup, cleanup on shutdown.
 
     MEU-90a: Uses real SqlAlchemyUnitOfWork with persistent SQLite storage.
-    UoW is pre-entered once at startup (reentrant depth counting) — each
-    service method re-enters via 'with self.uow:' per call.  Rollback
-    isolation under nested failure is proven by test_nested_failure_does_not_leak.
+    By default the UoW is *scoped*: every API request (``open_db_scope``)
+    and every pipeline run gets its own session from a pooled WAL engine.
+    ``ZORIVEST_DB_SESSION_SCOPE=shared`` restores the legacy mode where the
+    UoW is pre-entered once at startup (reentrant depth counting) and all
+    callers share one session.  Rollback isolation under nested failure is
+    proven by test_nested_failure_does_not_leak.
     """
     app.state.start_time = time.time()
     app.state.db_unlocked = bool(os.environ.get("ZORIVEST_DEV_UNLOCK", ""))
@@ -267,7 +317,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # ── Engine & schema ──────────────────────────────────────────────────
     db_url = os.environ.get("ZORIVEST_DB_URL", "sqlite:///zorivest.db")
-    engine = create_engine_with_wal(db_url)
+    _db_readers = os.environ.get("ZORIVEST_DB_READERS")
+    engine = create_engine_with_wal(
+        db_url, readers=int(_db_readers) if _db_readers else None
+    )
     Base.metadata.create_all(engine)
 
     # ── Schema migrations (no Alembic) ────────────────────────────────
@@ -282,17 +335,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 # Column already exists (fresh DB or already migrated) — ignore
                 conn.rollback()
 
-    # ── Seed system account (MEU-37 AC-3) ─────────────────────────────
+    # ── Seed system account (MEU-37 AC-3) + startup backfills ─────────
     from zorivest_infra.database.seed_system_account import seed_system_account
     from sqlalchemy.orm import Session as _SaSession
 
+    from zorivest_infra.database.backfill_trade_fingerprints import (
+        backfill_trade_fingerprints,
+    )
+
+    from zorivest_infra.database.migrate_fetch_cache import (
+        migrate_fetch_cache_payloads,
+    )
+
     with _SaSession(engine) as _seed_session:
         seed_system_account(_seed_session)
+        backfill_trade_fingerprints(_seed_session)
+        migrate_fetch_cache_payloads(_seed_session)
         _seed_session.commit()
 
-    # ── Unit of Work (reentrant — pre-entered once, services re-enter per call) ──
-    uow: Any = SqlAlchemyUnitOfWork(engine)
-    uow.__enter__()  # Pre-enter: session stays alive until shutdown; services re-enter safely
+    # ── Unit of Work ─────────────────────────────────────────────────────
+    # Scoped (default): the startup scope below is closed before serving;
+    # requests and pipeline runs then open their own sessions.
+    # Shared: the pre-entered session stays alive until shutdown.
+    _scope_mode = os.environ.get("ZORIVEST_DB_SESSION_SCOPE", "request").lower()
+    uow: Any = SqlAlchemyUnitOfWork(engine, scoped=_scope_mode != "shared")
+    uow.__enter__()
+    app.state.uow = uow
+    # Session handle for long-lived collaborators: resolves per scope in
+    # scoped mode, or is the shared session itself in shared mode.
+    _session = uow.contextual_session
 
     # ── Core services ────────────────────────────────────────────────────
     app.state.auth_service = AuthService()
@@ -307,10 +378,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # MEU-91: shared HTTP client, encryption, rate limiters for all market data services
     _http_client = HttpxClient()
     _encryption = FernetEncryptionAdapter()
-    _rate_limiters = {
-        name: RateLimiter(cfg.default_rate_limit)
-        for name, cfg in PROVIDER_REGISTRY.items()
-    }
+    # One request budget per provider, shared by the API services
+    # (interactive) and the pipeline fetch steps (background).
+    _rate_budget = RateBudget(
+        {name: cfg.default_rate_limit for name, cfg in PROVIDER_REGISTRY.items()}
+    )
+    _rate_limiters = _rate_budget.limiters(Priority.INTERACTIVE)
+    _provider_health = ProviderHealthTracker()
     # MEU-91: real MarketDataService — wires real provider fallback chain with Yahoo Finance fallback
     app.state.market_data_service = MarketDataService(
         uow=uow,
@@ -319,9 +393,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         rate_limiters=_rate_limiters,
         provider_registry=PROVIDER_REGISTRY,
         quote_normalizers=QUOTE_NORMALIZERS,
+        batch_quote_normalizers=BATCH_QUOTE_NORMALIZERS,
         news_normalizers=NEWS_NORMALIZERS,
         search_normalizers=SEARCH_NORMALIZERS,
         normalizers=NORMALIZERS,
+        read_through=True,
+        cache=MarketDataCache(),
+        health=_provider_health,
     )
     # MEU-65: real ProviderConnectionService — shares same http/encryption/rate_limiters
     app.state.provider_connection_service = ProviderConnectionService(
@@ -330,6 +408,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         http_client=_http_client,
         rate_limiters=_rate_limiters,
         provider_registry=PROVIDER_REGISTRY,
+        health=_provider_health,
+        rate_budget=_rate_budget,
     )
     app.state.report_service = ReportService(uow)  # MEU-53
     app.state.watchlist_service = WatchlistService(uow)  # MEU-68
@@ -352,15 +432,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     _sandboxed_conn = open_sandbox_connection(_db_path, read_only=True)
     _sql_sandbox = SqlSandbox(_db_path, connection=_sandboxed_conn)
     _template_engine = create_template_engine()
-    _db_write_adapter = DbWriteAdapter(session=uow._session)  # noqa: SLF001
+    _db_write_adapter = DbWriteAdapter(session=_session)
     _smtp_runtime_config = app.state.email_provider_service.get_smtp_runtime_config()
 
     # ── Fetch step wiring (MEU-PW2) ──────────────────────────────────────
-    _rate_limits: dict[str, tuple[float, float]] = {
-        name: (float(cfg.default_rate_limit), 1.0)
-        for name, cfg in PROVIDER_REGISTRY.items()
-    }
-    _pipeline_rate_limiter = PipelineRateLimiter(_rate_limits)
+    _pipeline_rate_limiter = PipelineRateLimiter(
+        {}, budget=_rate_budget, priority=Priority.BACKGROUND
+    )
     _market_data_adapter = MarketDataProviderAdapter(
         http_client=_http_client,
         rate_limiter=_pipeline_rate_limiter,
@@ -373,23 +451,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         EmailTemplateRepository,
     )
 
-    _template_repo = EmailTemplateRepository(uow._session)  # noqa: SLF001
+    _template_repo = EmailTemplateRepository(_session)
+
+    from zorivest_infra.database.market_history_repository import (
+        SqlMarketHistoryRepository,
+    )
+
+    _fetch_cache_repo = FetchCacheRepository(_session, memory=FetchMemoryCache())
 
     pipeline_runner = PipelineRunner(
         uow,
         RefResolver(),
         ConditionEvaluator(),
-        delivery_repository=uow.deliveries,
+        delivery_repository=DeliveryRepository(_session),
         smtp_config=_smtp_runtime_config,
         provider_adapter=_market_data_adapter,
         db_writer=_db_write_adapter,
         db_connection=_sandboxed_conn,
         sql_sandbox=_sql_sandbox,
-        report_repository=uow.reports,
+        report_repository=ReportRepository(_session),
         template_engine=_template_engine,
         template_port=_template_repo,
-        pipeline_state_repo=uow.pipeline_state,
-        fetch_cache_repo=uow.fetch_cache,
+        pipeline_state_repo=PipelineStateRepository(_session),
+        fetch_cache_repo=_fetch_cache_repo,
+        market_history_repo=SqlMarketHistoryRepository(_session),
     )
 
     # ── Zombie recovery (MEU-PW5 §9.3e) ─────────────────────────────────
@@ -413,6 +498,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         db_url=db_url,  # MEU-90a: persistent APScheduler job store
     )
     app.state.scheduler_service = scheduler_svc
+
+    # Fetch cache retention: expire long-stale entries, cap stored bytes
+    from zorivest_infra.database.fetch_cache_retention import FetchCacheSweeper
+
+    _fetch_cache_sweeper = FetchCacheSweeper(uow, _fetch_cache_repo)
+    scheduler_svc.schedule_maintenance(
+        "fetch_cache_sweep",
+        _fetch_cache_sweeper.sweep,
+        _fetch_cache_sweeper.retention.interval_seconds,
+    )
+    app.state.fetch_cache_sweeper = _fetch_cache_sweeper
     app.state.scheduling_service = SchedulingService(
         policy_store=policy_adapter,
         run_store=run_adapter,
@@ -475,15 +571,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
 
     # ── PH10: Seed default templates ────────────────────────────────────
-    _seed_default_templates(_template_repo, uow._session)  # noqa: SLF001
+    _seed_default_templates(_template_repo, _session)
+
+    if uow.scoped:
+        uow.__exit__(None, None, None)  # Close the startup scope
+
+    # ── Worker threads + loop-lag monitor ───────────────────────────────
+    # Sync route handlers run on anyio's worker pool, sized to the DB pool
+    # (ZORIVEST_THREAD_POOL_SIZE overrides); the monitor reports how long
+    # anything still blocks the loop.
+    configure_thread_pool(
+        thread_pool_size_from_env(
+            scoped=uow.scoped, readers=int(_db_readers) if _db_readers else None
+        )
+    )
+    loop_lag_monitor = LoopLagMonitor(
+        warn_ms=float(
+            os.environ.get("ZORIVEST_LOOP_LAG_WARN_MS", DEFAULT_LOOP_LAG_WARN_MS)
+        )
+    )
+    app.state.loop_lag_monitor = loop_lag_monitor
+    loop_lag_monitor.start()
 
     await scheduler_svc.start()
     try:
         yield
     finally:
+        await loop_lag_monitor.stop()
         await scheduler_svc.shutdown()
         await _http_client.aclose()  # MEU-65: close httpx session
-        uow.__exit__(None, None, None)  # Close session
+        if not uow.scoped:
+            uow.__exit__(None, None, None)  # Close shared session
         engine.dispose()  # MEU-90a: cleanup engine on shutdown
 
 
@@ -498,6 +616,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         openapi_tags=TAGS_METADATA,
         lifespan=lifespan,
+        dependencies=[Depends(open_db_scope)],
     )
 
     # ── CORS middleware ─────────────────────────────────────────────
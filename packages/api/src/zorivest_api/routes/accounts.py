@@ -17,9 +17,11 @@ from pydantic.functional_validators import BeforeValidator
 from typing import Annotated, Optional
 
 from zorivest_core.application.commands import CreateAccount, UpdateBalance
+from zorivest_core.application.pagination import InvalidCursorError, encode_cursor
 from zorivest_core.domain.enums import AccountType
 from zorivest_core.domain.exceptions import ConflictError, ForbiddenError, NotFoundError
 from zorivest_api.dependencies import get_account_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
 
 def _strip_whitespace(v: object) -> object:
@@ -29,7 +31,9 @@ def _strip_whitespace(v: object) -> object:
 
 StrippedStr = Annotated[str, BeforeValidator(_strip_whitespace)]
 
-account_router = APIRouter(prefix="/api/v1/accounts", tags=["accounts"])
+account_router = APIRouter(
+    prefix="/api/v1/accounts", tags=["accounts"], route_class=BlockingHandlerRoute
+)
 
 
 # Case-insensitive AccountType: normalize input to lowercase before enum validation
@@ -95,7 +99,8 @@ class BalanceSnapshotResponse(BaseModel):
 
 class PaginatedBalanceResponse(BaseModel):
     items: list[BalanceSnapshotResponse]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
 
 
 class BalanceRequest(BaseModel):
@@ -107,13 +112,18 @@ class BalanceRequest(BaseModel):
 
 
 def _enrich_account_response(
-    account, service, include_metrics: bool = False
+    account, service, include_metrics: bool = False, latest_balances=None
 ) -> AccountResponse:
     """Build AccountResponse with latest_balance enrichment (MEU-71 AC-3).
 
     If include_metrics is True, also compute trade-based metrics (AC-12).
+    ``latest_balances`` is a prefetched {account_id: snapshot} map for list
+    responses; without it the balance is looked up per account.
     """
-    latest = service.get_latest_balance(account.account_id)
+    if latest_balances is not None:
+        latest = latest_balances.get(account.account_id)
+    else:
+        latest = service.get_latest_balance(account.account_id)
 
     metrics: dict = {}
     if include_metrics:
@@ -146,9 +156,7 @@ def _enrich_account_response(
 
 
 @account_router.post("", status_code=201, dependencies=[Depends(require_unlocked_db)])
-async def create_account(
-    body: CreateAccountRequest, service=Depends(get_account_service)
-):
+def create_account(body: CreateAccountRequest, service=Depends(get_account_service)):
     """Create a new account."""
     try:
         # MEU-37 AC-13: auto-assign account_id if not provided
@@ -169,7 +177,7 @@ async def create_account(
 
 
 @account_router.get("", dependencies=[Depends(require_unlocked_db)])
-async def list_accounts(
+def list_accounts(
     include_archived: bool = Query(default=False),
     include_system: bool = Query(default=False),
     service=Depends(get_account_service),
@@ -183,11 +191,15 @@ async def list_accounts(
         include_archived=include_archived,
         include_system=include_system,
     )
-    return [_enrich_account_response(a, service) for a in accounts]
+    latest_balances = service.get_latest_balances([a.account_id for a in accounts])
+    return [
+        _enrich_account_response(a, service, latest_balances=latest_balances)
+        for a in accounts
+    ]
 
 
 @account_router.get("/{account_id}", dependencies=[Depends(require_unlocked_db)])
-async def get_account(account_id: str, service=Depends(get_account_service)):
+def get_account(account_id: str, service=Depends(get_account_service)):
     """Get a single account (enriched with latest balance + metrics)."""
     try:
         account = service.get_account(account_id)
@@ -197,7 +209,7 @@ async def get_account(account_id: str, service=Depends(get_account_service)):
 
 
 @account_router.put("/{account_id}", dependencies=[Depends(require_unlocked_db)])
-async def update_account(
+def update_account(
     account_id: str,
     body: UpdateAccountRequest,
     service=Depends(get_account_service),
@@ -218,7 +230,7 @@ async def update_account(
 @account_router.delete(
     "/{account_id}", status_code=204, dependencies=[Depends(require_unlocked_db)]
 )
-async def delete_account(account_id: str, service=Depends(get_account_service)):
+def delete_account(account_id: str, service=Depends(get_account_service)):
     """Delete an account (block-only: fails if trades exist)."""
     try:
         service.delete_account(account_id)
@@ -238,7 +250,7 @@ async def delete_account(account_id: str, service=Depends(get_account_service)):
     status_code=200,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def archive_account(account_id: str, service=Depends(get_account_service)):
+def archive_account(account_id: str, service=Depends(get_account_service)):
     """Soft-delete: set is_archived=True. Trades remain unchanged."""
     try:
         service.archive_account(account_id)
@@ -254,7 +266,7 @@ async def archive_account(account_id: str, service=Depends(get_account_service))
     status_code=200,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def unarchive_account(account_id: str, service=Depends(get_account_service)):
+def unarchive_account(account_id: str, service=Depends(get_account_service)):
     """Restore an archived account: set is_archived=False."""
     try:
         service.update_account(account_id, is_archived=False)
@@ -270,7 +282,7 @@ async def unarchive_account(account_id: str, service=Depends(get_account_service
     status_code=200,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def reassign_trades(account_id: str, service=Depends(get_account_service)):
+def reassign_trades(account_id: str, service=Depends(get_account_service)):
     """Move all trades to SYSTEM_DEFAULT, then hard-delete the account."""
     try:
         count = service.reassign_trades_and_delete(account_id)
@@ -295,9 +307,7 @@ class TradeCountsRequest(BaseModel):
     status_code=200,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def get_trade_counts(
-    body: TradeCountsRequest, service=Depends(get_account_service)
-):
+def get_trade_counts(body: TradeCountsRequest, service=Depends(get_account_service)):
     """Return trade + plan counts for a list of account IDs.
 
     Used by the UI to determine which accounts need a second confirmation
@@ -314,7 +324,7 @@ async def get_trade_counts(
     status_code=201,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def record_balance(
+def record_balance(
     account_id: str,
     body: BalanceRequest,
     service=Depends(get_account_service),
@@ -343,23 +353,42 @@ async def record_balance(
 @account_router.get(
     "/{account_id}/balances", dependencies=[Depends(require_unlocked_db)]
 )
-async def list_balance_history(
+def list_balance_history(
     account_id: str,
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
+    include_total: bool = True,
     service=Depends(get_account_service),
 ):
     """List balance history for an account with pagination (P1 wrapper).
 
-    Returns paginated response with items + total count.
+    Returns paginated response with items + total count. Passing
+    ``cursor`` (from a previous ``next_cursor``) pages by
+    ``(datetime, id)`` keyset; ``include_total=false`` skips the count.
     """
     try:
-        snapshots = service.list_balance_history(
-            account_id,
-            limit=limit,
-            offset=offset,
-        )
-        total = service.count_balance_history(account_id)
+        if cursor is not None:
+            page = service.list_balance_history_page(
+                account_id,
+                limit=limit,
+                cursor=cursor,
+                include_total=include_total,
+            )
+            snapshots, total, next_cursor = page.items, page.total, page.next_cursor
+        else:
+            snapshots = service.list_balance_history(
+                account_id,
+                limit=limit,
+                offset=offset,
+            )
+            total = service.count_balance_history(account_id) if include_total else None
+            next_cursor = None
+            if snapshots and len(snapshots) == limit:
+                last = snapshots[-1]
+                next_cursor = encode_cursor(
+                    f"balances:{account_id}", (last.datetime, last.id)
+                )
         return PaginatedBalanceResponse(
             items=[
                 BalanceSnapshotResponse(
@@ -371,6 +400,9 @@ async def list_balance_history(
                 for s in snapshots
             ],
             total=total,
+            next_cursor=next_cursor,
         )
+    except InvalidCursorError as e:
+        raise HTTPException(422, str(e))
     except NotFoundError:
         raise HTTPException(404, f"Account not found: {account_id}")
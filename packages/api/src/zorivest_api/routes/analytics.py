@@ -16,16 +16,18 @@ from zorivest_api.dependencies import (
     get_review_service,
     require_unlocked_db,
 )
+from zorivest_api.event_loop import BlockingHandlerRoute
 
 analytics_router = APIRouter(
     prefix="/api/v1/analytics",
     tags=["analytics"],
     dependencies=[Depends(require_unlocked_db)],
+    route_class=BlockingHandlerRoute,
 )
 
 
 @analytics_router.get("/expectancy")
-async def get_expectancy(
+def get_expectancy(
     account_id: str | None = None,
     period: str = "all",
     service: Any = Depends(get_analytics_service),
@@ -35,7 +37,7 @@ async def get_expectancy(
 
 
 @analytics_router.get("/drawdown")
-async def get_drawdown_table(
+def get_drawdown_table(
     account_id: str | None = None,
     simulations: int = 10000,
     service: Any = Depends(get_analytics_service),
@@ -45,7 +47,7 @@ async def get_drawdown_table(
 
 
 @analytics_router.get("/execution-quality")
-async def get_execution_quality(
+def get_execution_quality(
     trade_id: str | None = None,
     service: Any = Depends(get_analytics_service),
 ) -> dict:
@@ -54,7 +56,7 @@ async def get_execution_quality(
 
 
 @analytics_router.get("/pfof-report")
-async def get_pfof_report(
+def get_pfof_report(
     account_id: str,
     period: str = "ytd",
     service: Any = Depends(get_analytics_service),
@@ -64,7 +66,7 @@ async def get_pfof_report(
 
 
 @analytics_router.get("/strategy-breakdown")
-async def get_strategy_breakdown(
+def get_strategy_breakdown(
     account_id: str | None = None,
     service: Any = Depends(get_analytics_service),
 ) -> dict:
@@ -73,7 +75,7 @@ async def get_strategy_breakdown(
 
 
 @analytics_router.get("/sqn")
-async def get_sqn(
+def get_sqn(
     account_id: str | None = None,
     period: str = "all",
     service: Any = Depends(get_analytics_service),
@@ -83,7 +85,7 @@ async def get_sqn(
 
 
 @analytics_router.get("/cost-of-free")
-async def get_cost_of_free(
+def get_cost_of_free(
     account_id: str | None = None,
     period: str = "ytd",
     service: Any = Depends(get_analytics_service),
@@ -93,7 +95,7 @@ async def get_cost_of_free(
 
 
 @analytics_router.post("/ai-review")
-async def ai_review_trade(
+def ai_review_trade(
     body: dict,
     service: Any = Depends(get_review_service),
 ) -> dict:
@@ -102,7 +104,7 @@ async def ai_review_trade(
 
 
 @analytics_router.post("/excursion/{trade_exec_id}")
-async def enrich_trade_excursion(
+def enrich_trade_excursion(
     trade_exec_id: str,
     service: Any = Depends(get_analytics_service),
 ) -> dict:
@@ -111,7 +113,7 @@ async def enrich_trade_excursion(
 
 
 @analytics_router.post("/options-strategy")
-async def detect_options_strategy(
+def detect_options_strategy(
     body: dict,
     service: Any = Depends(get_analytics_service),
 ) -> dict:
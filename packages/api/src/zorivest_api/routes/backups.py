@@ -15,8 +15,11 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from zorivest_api.dependencies import require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
-backup_router = APIRouter(prefix="/api/v1/backups", tags=["backups"])
+backup_router = APIRouter(
+    prefix="/api/v1/backups", tags=["backups"], route_class=BlockingHandlerRoute
+)
 
 
 class BackupPathRequest(BaseModel):
@@ -82,7 +85,7 @@ def _get_backup_recovery_manager(request: Request) -> Any:
 
 
 @backup_router.post("", dependencies=[Depends(require_unlocked_db)])
-async def create_backup(
+def create_backup(
     request: Request,
 ) -> BackupResultResponse:
     """Create a manual backup of all databases.
@@ -103,7 +106,7 @@ async def create_backup(
 
 
 @backup_router.get("", dependencies=[Depends(require_unlocked_db)])
-async def list_backups(
+def list_backups(
     request: Request,
 ) -> list[BackupEntryResponse]:
     """List all backup files, newest first.
@@ -134,7 +137,7 @@ async def list_backups(
 
 
 @backup_router.post("/verify", dependencies=[Depends(require_unlocked_db)])
-async def verify_backup(
+def verify_backup(
     body: BackupPathRequest,
     request: Request,
 ) -> VerifyResultResponse:
@@ -153,7 +156,7 @@ async def verify_backup(
 
 
 @backup_router.post("/restore", dependencies=[Depends(require_unlocked_db)])
-async def restore_backup(
+def restore_backup(
     body: BackupPathRequest,
     request: Request,
 ) -> RestoreResultResponse:
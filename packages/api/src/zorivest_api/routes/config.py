@@ -16,8 +16,11 @@ from zorivest_api.dependencies import (
     get_settings_service,
     require_unlocked_db,
 )
+from zorivest_api.event_loop import BlockingHandlerRoute
 
-config_router = APIRouter(prefix="/api/v1/config", tags=["config"])
+config_router = APIRouter(
+    prefix="/api/v1/config", tags=["config"], route_class=BlockingHandlerRoute
+)
 
 
 class ConfigImportRequest(BaseModel):
@@ -44,7 +47,7 @@ class ImportPreviewResponse(BaseModel):
 
 
 @config_router.get("/export", dependencies=[Depends(require_unlocked_db)])
-async def export_config(
+def export_config(
     service: Any = Depends(get_settings_service),
 ) -> dict[str, Any]:
     """Export portable (exportable + non-sensitive) settings as JSON.
@@ -66,7 +69,7 @@ async def export_config(
 
 
 @config_router.post("/import", dependencies=[Depends(require_unlocked_db)])
-async def import_config(
+def import_config(
     body: ConfigImportRequest,
     dry_run: bool = False,
     service: Any = Depends(get_settings_service),
@@ -19,11 +19,13 @@ from pydantic import BaseModel, ConfigDict, Field
 from pydantic.functional_validators import BeforeValidator
 
 from zorivest_api.dependencies import get_email_provider_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
 email_settings_router = APIRouter(
     prefix="/api/v1/settings/email",
     tags=["email-settings"],
     dependencies=[Depends(require_unlocked_db)],
+    route_class=BlockingHandlerRoute,
 )
 
 
@@ -87,7 +89,7 @@ class EmailStatusResponse(BaseModel):
 
 
 @email_settings_router.get("", response_model=EmailConfigResponse)
-async def get_email_config(
+def get_email_config(
     svc: Any = Depends(get_email_provider_service),
 ) -> Any:
     """Get current email provider config.
@@ -99,7 +101,7 @@ async def get_email_config(
 
 
 @email_settings_router.put("", response_model=EmailConfigResponse)
-async def save_email_config(
+def save_email_config(
     body: EmailConfigRequest,
     svc: Any = Depends(get_email_provider_service),
 ) -> Any:
@@ -113,7 +115,7 @@ async def save_email_config(
 
 
 @email_settings_router.post("/test", response_model=TestConnectionResponse)
-async def test_email_connection(
+def test_email_connection(
     svc: Any = Depends(get_email_provider_service),
 ) -> Any:
     """Send a test SMTP connection using stored credentials.
@@ -127,7 +129,7 @@ async def test_email_connection(
 
 
 @email_settings_router.get("/status", response_model=EmailStatusResponse)
-async def get_email_status(
+def get_email_status(
     svc: Any = Depends(get_email_provider_service),
 ) -> Any:
     """Get minimal SMTP readiness without exposing credentials.
@@ -12,16 +12,18 @@ from typing import Any
 from fastapi import APIRouter, Depends
 
 from zorivest_api.dependencies import get_analytics_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
 fees_router = APIRouter(
     prefix="/api/v1/fees",
     tags=["fees"],
     dependencies=[Depends(require_unlocked_db)],
+    route_class=BlockingHandlerRoute,
 )
 
 
 @fees_router.get("/summary")
-async def fee_summary(
+def fee_summary(
     account_id: str | None = None,
     period: str = "ytd",
     service: Any = Depends(get_analytics_service),
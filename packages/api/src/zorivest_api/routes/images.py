@@ -13,8 +13,11 @@ from pydantic import BaseModel
 
 from zorivest_core.domain.exceptions import NotFoundError
 from zorivest_api.dependencies import get_image_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
-image_router = APIRouter(prefix="/api/v1/images", tags=["trades"])
+image_router = APIRouter(
+    prefix="/api/v1/images", tags=["trades"], route_class=BlockingHandlerRoute
+)
 
 
 class ImageMetadataResponse(BaseModel):
@@ -30,7 +33,7 @@ class ImageMetadataResponse(BaseModel):
 
 
 @image_router.get("/{image_id}", dependencies=[Depends(require_unlocked_db)])
-async def get_image_metadata(image_id: int, service=Depends(get_image_service)):
+def get_image_metadata(image_id: int, service=Depends(get_image_service)):
     """Get image metadata."""
     try:
         img = service.get_image(image_id)
@@ -40,7 +43,7 @@ async def get_image_metadata(image_id: int, service=Depends(get_image_service)):
 
 
 @image_router.get("/{image_id}/thumbnail", dependencies=[Depends(require_unlocked_db)])
-async def get_image_thumbnail(
+def get_image_thumbnail(
     image_id: int,
     max_size: int = 200,
     service=Depends(get_image_service),
@@ -56,7 +59,7 @@ async def get_image_thumbnail(
 
 
 @image_router.get("/{image_id}/full", dependencies=[Depends(require_unlocked_db)])
-async def get_image_full(image_id: int, service=Depends(get_image_service)):
+def get_image_full(image_id: int, service=Depends(get_image_service)):
     """Get full image data."""
     try:
         data = service.get_full_image(image_id)
@@ -72,7 +75,7 @@ async def get_image_full(image_id: int, service=Depends(get_image_service)):
     status_code=204,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def delete_image(image_id: int, service=Depends(get_image_service)):
+def delete_image(image_id: int, service=Depends(get_image_service)):
     """Delete an image by ID.
 
     Returns 204 on success, 404 if image does not exist.
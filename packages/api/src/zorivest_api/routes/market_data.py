@@ -142,6 +142,16 @@ class ProviderConfigRequest(BaseModel):
     is_enabled: Optional[bool] = None
 
 
+class QuotesRequest(BaseModel):
+    """Body for POST /quotes."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    tickers: list[Annotated[StrippedStr, Field(min_length=1, max_length=20)]] = Field(
+        ..., min_length=1, max_length=500, description="Stock ticker symbols"
+    )
+
+
 # ── Quote & News endpoints ──────────────────────────────────────────────
 
 
@@ -157,6 +167,22 @@ async def get_quote(
         raise HTTPException(503, detail=str(e))
 
 
+@market_data_router.post("/quotes", dependencies=[Depends(require_unlocked_db)])
+async def get_quotes(
+    body: QuotesRequest,
+    service: Any = Depends(get_market_data_service),
+) -> Any:
+    """Get quotes for many tickers, batching symbols per provider.
+
+    Tickers no provider could quote are listed under ``missing``.
+    """
+    quotes = await service.get_quotes(body.tickers)
+    return {
+        "quotes": list(quotes.values()),
+        "missing": [t for t in dict.fromkeys(body.tickers) if t not in quotes],
+    }
+
+
 @market_data_router.get("/news", dependencies=[Depends(require_unlocked_db)])
 async def get_news(
     ticker: Optional[str] = Query(None, description="Optional ticker filter"),
@@ -194,6 +220,17 @@ async def get_sec_filings(
         raise HTTPException(503, detail=str(e))
 
 
+@market_data_router.get("/cache", dependencies=[Depends(require_unlocked_db)])
+async def get_cache_stats(
+    service: Any = Depends(get_market_data_service),
+) -> Any:
+    """Quote/news/search cache size and hit, miss and coalesced counters."""
+    stats = service.cache_stats()
+    if stats is None:
+        raise HTTPException(404, detail="Market data cache is disabled")
+    return stats
+
+
 # ── Provider management endpoints ───────────────────────────────────────
 
 
@@ -12,16 +12,18 @@ from typing import Any
 from fastapi import APIRouter, Depends
 
 from zorivest_api.dependencies import get_review_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
 mistakes_router = APIRouter(
     prefix="/api/v1/mistakes",
     tags=["mistakes"],
     dependencies=[Depends(require_unlocked_db)],
+    route_class=BlockingHandlerRoute,
 )
 
 
 @mistakes_router.post("", status_code=201)
-async def track_mistake(
+def track_mistake(
     body: dict,
     service: Any = Depends(get_review_service),
 ) -> dict:
@@ -30,7 +32,7 @@ async def track_mistake(
 
 
 @mistakes_router.get("/summary")
-async def mistake_summary(
+def mistake_summary(
     account_id: str | None = None,
     period: str = "ytd",
     service: Any = Depends(get_review_service),
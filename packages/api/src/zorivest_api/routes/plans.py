@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field, model_validator
 from pydantic.functional_validators import BeforeValidator
 
 from zorivest_api.dependencies import get_report_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 from zorivest_core.domain.enums import ConvictionLevel, PlanStatus, TradeAction
 
 
@@ -24,7 +25,9 @@ def _strip_whitespace(v: object) -> object:
 
 StrippedStr = Annotated[str, BeforeValidator(_strip_whitespace)]
 
-plan_router = APIRouter(prefix="/api/v1/trade-plans", tags=["trade-plans"])
+plan_router = APIRouter(
+    prefix="/api/v1/trade-plans", tags=["trade-plans"], route_class=BlockingHandlerRoute
+)
 
 
 # Direction alias normalizer: accept MCP names (long/short) and enum values (BOT/SLD)
@@ -141,7 +144,7 @@ class PlanResponse(BaseModel):
     status_code=201,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def create_plan(
+def create_plan(
     body: CreatePlanRequest,
     service=Depends(get_report_service),
 ):
@@ -161,7 +164,7 @@ async def create_plan(
     "",
     dependencies=[Depends(require_unlocked_db)],
 )
-async def list_plans(
+def list_plans(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
     service=Depends(get_report_service),
@@ -175,7 +178,7 @@ async def list_plans(
     "/{plan_id}",
     dependencies=[Depends(require_unlocked_db)],
 )
-async def get_plan(
+def get_plan(
     plan_id: int,
     service=Depends(get_report_service),
 ):
@@ -190,7 +193,7 @@ async def get_plan(
     "/{plan_id}",
     dependencies=[Depends(require_unlocked_db)],
 )
-async def update_plan(
+def update_plan(
     plan_id: int,
     body: UpdatePlanRequest,
     service=Depends(get_report_service),
@@ -224,7 +227,7 @@ class PatchStatusRequest(BaseModel):
     "/{plan_id}/status",
     dependencies=[Depends(require_unlocked_db)],
 )
-async def patch_plan_status(
+def patch_plan_status(
     plan_id: int,
     body: PatchStatusRequest,
     service=Depends(get_report_service),
@@ -256,7 +259,7 @@ async def patch_plan_status(
     status_code=204,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def delete_plan(
+def delete_plan(
     plan_id: int,
     service=Depends(get_report_service),
 ):
@@ -14,9 +14,12 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from zorivest_api.dependencies import get_report_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 from zorivest_core.domain.enums import QUALITY_GRADE_MAP, QUALITY_INT_MAP
 
-report_router = APIRouter(prefix="/api/v1/trades", tags=["reports"])
+report_router = APIRouter(
+    prefix="/api/v1/trades", tags=["reports"], route_class=BlockingHandlerRoute
+)
 
 
 # ── Request/Response schemas ────────────────────────────────────────────
@@ -75,7 +78,7 @@ def _int_to_grade(value: int) -> str:
     status_code=201,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def create_report(
+def create_report(
     exec_id: str,
     body: CreateReportRequest,
     service=Depends(get_report_service),
@@ -101,7 +104,7 @@ async def create_report(
     "/{exec_id}/report",
     dependencies=[Depends(require_unlocked_db)],
 )
-async def get_report(
+def get_report(
     exec_id: str,
     service=Depends(get_report_service),
 ):
@@ -116,7 +119,7 @@ async def get_report(
     "/{exec_id}/report",
     dependencies=[Depends(require_unlocked_db)],
 )
-async def update_report(
+def update_report(
     exec_id: str,
     body: UpdateReportRequest,
     service=Depends(get_report_service),
@@ -140,7 +143,7 @@ async def update_report(
     status_code=204,
     dependencies=[Depends(require_unlocked_db)],
 )
-async def delete_report(
+def delete_report(
     exec_id: str,
     service=Depends(get_report_service),
 ):
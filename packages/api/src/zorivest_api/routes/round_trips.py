@@ -8,12 +8,15 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends
 
 from zorivest_api.dependencies import get_trade_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
-round_trip_router = APIRouter(prefix="/api/v1/round-trips", tags=["trades"])
+round_trip_router = APIRouter(
+    prefix="/api/v1/round-trips", tags=["trades"], route_class=BlockingHandlerRoute
+)
 
 
 @round_trip_router.get("", dependencies=[Depends(require_unlocked_db)])
-async def list_round_trips(
+def list_round_trips(
     account_id: str | None = None,
     status: str = "all",
     ticker: str | None = None,
@@ -21,6 +21,7 @@ from pydantic.functional_validators import BeforeValidator
 from typing import Annotated
 
 from zorivest_api.dependencies import (
+    get_fetch_cache_sweeper,
     get_policy_emulator,
     get_scheduling_service,
     get_session_budget,
@@ -130,6 +131,42 @@ class SchedulerStatusResponse(BaseModel):
     jobs: list[dict[str, Any]]
 
 
+class FetchCacheSweepResponse(BaseModel):
+    """Outcome of the last fetch cache sweep."""
+
+    at: datetime
+    expired: int
+    evicted: int
+    blobs_deleted: int
+    bytes_freed: int
+
+
+class FetchCacheMemoryResponse(BaseModel):
+    """In-process tier in front of the fetch cache table."""
+
+    entries: int
+    bytes: int
+    max_bytes: int
+    evictions: int
+    tiers: dict[str, dict[str, float]]
+
+
+class FetchCacheStatsResponse(BaseModel):
+    """Fetch cache size, retention limits and last sweep."""
+
+    entries: int
+    stale_entries: int
+    blobs: int
+    stored_bytes: int
+    raw_bytes: int
+    oldest_fetched_at: datetime | None = None
+    max_bytes: int
+    max_stale_age_seconds: int
+    sweep_interval_seconds: int
+    last_sweep: FetchCacheSweepResponse | None = None
+    memory: FetchCacheMemoryResponse | None = None
+
+
 class RunTriggerRequest(BaseModel):
     """Request body for triggering a pipeline run."""
 
@@ -316,6 +353,54 @@ async def get_scheduler_status(
     return service.get_scheduler_status()
 
 
+# ── Fetch Cache ────────────────────────────────────────────────────────
+
+
+@scheduling_router.get("/cache/stats", response_model=FetchCacheStatsResponse)
+async def get_fetch_cache_stats(
+    sweeper: Any = Depends(get_fetch_cache_sweeper),
+) -> FetchCacheStatsResponse:
+    """Fetch cache entry counts and sizes, retention limits, last sweep."""
+    stats = sweeper.repo.stats()
+    retention = sweeper.retention
+    last = sweeper.last_sweep
+    memory = sweeper.repo.memory
+    memory_stats = memory.stats() if memory is not None else None
+    return FetchCacheStatsResponse(
+        entries=stats.entries,
+        stale_entries=stats.stale_entries,
+        blobs=stats.blobs,
+        stored_bytes=stats.stored_bytes,
+        raw_bytes=stats.raw_bytes,
+        oldest_fetched_at=stats.oldest_fetched_at,
+        max_bytes=retention.max_bytes,
+        max_stale_age_seconds=int(retention.max_stale_age.total_seconds()),
+        sweep_interval_seconds=retention.interval_seconds,
+        last_sweep=(
+            FetchCacheSweepResponse(
+                at=sweeper.last_sweep_at,
+                expired=last.expired,
+                evicted=last.evicted,
+                blobs_deleted=last.blobs_deleted,
+                bytes_freed=last.bytes_freed,
+            )
+            if last is not None
+            else None
+        ),
+        memory=(
+            FetchCacheMemoryResponse(
+                entries=memory_stats.entries,
+                bytes=memory_stats.bytes,
+                max_bytes=memory_stats.max_bytes,
+                evictions=memory_stats.evictions,
+                tiers=memory_stats.as_dict(),
+            )
+            if memory_stats is not None
+            else None
+        ),
+    )
+
+
 # ── Schema / Discovery ─────────────────────────────────────────────────
 
 
@@ -3,6 +3,7 @@
 
 Source: 04g-api-system.md §Service Routes
 MEU-30: GET /status (auth), POST /graceful-shutdown (admin).
+GET /runtime (auth): event-loop lag and worker thread pool occupancy.
 """
 
 from __future__ import annotations
@@ -18,8 +19,12 @@ from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from pydantic import BaseModel
 
 from zorivest_api.dependencies import require_authenticated, require_admin
+from zorivest_api.event_loop import BlockingHandlerRoute
+from zorivest_api.event_loop import LoopLagMonitor, thread_pool_stats
 
-service_router = APIRouter(prefix="/api/v1/service", tags=["service"])
+service_router = APIRouter(
+    prefix="/api/v1/service", tags=["service"], route_class=BlockingHandlerRoute
+)
 
 logger = logging.getLogger("zorivest.service")
 
@@ -35,7 +40,7 @@ class ServiceStatusResponse(BaseModel):
 
 
 @service_router.get("/status", status_code=200)
-async def service_status(
+def service_status(
     request: Request,
     _user: Any = Depends(require_authenticated),
 ) -> ServiceStatusResponse:
@@ -65,6 +70,57 @@ async def service_status(
     )
 
 
+class EventLoopLagResponse(BaseModel):
+    """Loop wake-up delay over the monitor's recent window (milliseconds)."""
+
+    samples: int
+    last_ms: float
+    mean_ms: float
+    p99_ms: float
+    max_ms: float
+    slow_ticks: int
+
+
+class ThreadPoolResponse(BaseModel):
+    """Worker threads running blocking route handlers."""
+
+    size: int
+    busy: int
+    waiting: int
+
+
+class RuntimeMetricsResponse(BaseModel):
+    """Event-loop health metrics response."""
+
+    event_loop: EventLoopLagResponse
+    thread_pool: ThreadPoolResponse
+
+
+@service_router.get("/runtime", status_code=200)
+async def runtime_metrics(
+    request: Request,
+    _user: Any = Depends(require_authenticated),
+) -> RuntimeMetricsResponse:
+    """Event-loop lag and worker thread pool occupancy.
+    Requires authenticated user."""
+    monitor = getattr(request.app.state, "loop_lag_monitor", None) or LoopLagMonitor()
+    lag = monitor.stats()
+    pool = thread_pool_stats()
+    return RuntimeMetricsResponse(
+        event_loop=EventLoopLagResponse(
+            samples=lag.samples,
+            last_ms=round(lag.last_ms, 2),
+            mean_ms=round(lag.mean_ms, 2),
+            p99_ms=round(lag.p99_ms, 2),
+            max_ms=round(lag.max_ms, 2),
+            slow_ticks=lag.slow_ticks,
+        ),
+        thread_pool=ThreadPoolResponse(
+            size=pool.size, busy=pool.busy, waiting=pool.waiting
+        ),
+    )
+
+
 def _shutdown_process() -> None:
     """Flush logs and send SIGINT to trigger graceful shutdown.
 
@@ -79,7 +135,7 @@ def _shutdown_process() -> None:
 
 
 @service_router.post("/graceful-shutdown", status_code=202)
-async def graceful_shutdown(
+def graceful_shutdown(
     background_tasks: BackgroundTasks,
     _user: Any = Depends(require_admin),
 ) -> dict[str, str]:
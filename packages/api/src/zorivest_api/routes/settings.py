@@ -13,9 +13,12 @@ from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
 
 from zorivest_api.dependencies import get_settings_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 from zorivest_core.domain.settings_validator import SettingsValidationError
 
-settings_router = APIRouter(prefix="/api/v1/settings", tags=["settings"])
+settings_router = APIRouter(
+    prefix="/api/v1/settings", tags=["settings"], route_class=BlockingHandlerRoute
+)
 
 
 class SettingResponse(BaseModel):
@@ -44,7 +47,7 @@ class ResolvedSettingResponse(BaseModel):
 
 
 @settings_router.get("", dependencies=[Depends(require_unlocked_db)])
-async def get_all_settings(
+def get_all_settings(
     service: Any = Depends(get_settings_service),
 ) -> Any:
     """Bulk read all settings as key-value dict.
@@ -62,7 +65,7 @@ async def get_all_settings(
 
 
 @settings_router.get("/resolved", dependencies=[Depends(require_unlocked_db)])
-async def get_resolved_settings(
+def get_resolved_settings(
     service: Any = Depends(get_settings_service),
 ) -> dict[str, ResolvedSettingResponse]:
     """Bulk read all settings with three-tier source attribution.
@@ -86,7 +89,7 @@ async def get_resolved_settings(
 
 
 @settings_router.get("/{key}", dependencies=[Depends(require_unlocked_db)])
-async def get_setting(
+def get_setting(
     key: str,
     service: Any = Depends(get_settings_service),
 ) -> SettingResponse:
@@ -117,7 +120,7 @@ async def get_setting(
 
 
 @settings_router.put("", dependencies=[Depends(require_unlocked_db)])
-async def update_settings(
+def update_settings(
     body: dict[str, Any],
     service: Any = Depends(get_settings_service),
 ) -> dict[str, Any]:
@@ -138,7 +141,7 @@ async def update_settings(
 
 
 @settings_router.put("/{key}", dependencies=[Depends(require_unlocked_db)])
-async def update_single_setting(
+def update_single_setting(
     key: str,
     body: UpdateSettingRequest,
     service: Any = Depends(get_settings_service),
@@ -157,7 +160,7 @@ async def update_single_setting(
 
 
 @settings_router.delete("/{key}", dependencies=[Depends(require_unlocked_db)])
-async def delete_setting(
+def delete_setting(
     key: str,
     service: Any = Depends(get_settings_service),
 ) -> Response:
@@ -14,15 +14,18 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from zorivest_core.application.pagination import InvalidCursorError
 from zorivest_api.dependencies import get_tax_service, require_unlocked_db
+from zorivest_api.event_loop import BlockingHandlerRoute
 
 tax_router = APIRouter(
     prefix="/api/v1/tax",
     tags=["tax"],
     dependencies=[Depends(require_unlocked_db)],
+    route_class=BlockingHandlerRoute,
 )
 
 
@@ -176,7 +179,7 @@ _QUARTER_MAP = {"Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
 
 
 @tax_router.post("/simulate", status_code=200)
-async def simulate_tax_impact(
+def simulate_tax_impact(
     body: SimulateTaxRequest,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -214,7 +217,7 @@ async def simulate_tax_impact(
 
 
 @tax_router.post("/estimate", status_code=200)
-async def estimate_tax(
+def estimate_tax(
     body: EstimateTaxRequest,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -254,7 +257,7 @@ def _build_lot_account_map(service: Any, chains: list) -> dict[str, str]:
 
 
 @tax_router.post("/wash-sales", status_code=200)
-async def find_wash_sales(
+def find_wash_sales(
     body: WashSaleRequest,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -284,21 +287,50 @@ async def find_wash_sales(
 
 
 @tax_router.get("/lots", status_code=200)
-async def get_tax_lots(
+def get_tax_lots(
     account_id: Optional[str] = None,
     ticker: Optional[str] = None,
     status: Literal["open", "closed", "all"] = "all",
     sort_by: Literal["acquired_date", "cost_basis", "gain_loss"] = "acquired_date",
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
     service: Any = Depends(get_tax_service),
 ) -> dict:
     """List tax lots with basis, holding period, and gain/loss.
 
     AC-148.3: get_lots returns list[TaxLot] → serialized to dict.
+
+    With ``limit`` and/or ``cursor`` the listing is paged by
+    ``(open_date, lot_id)`` keyset and returns ``next_cursor``; keyset
+    paging is only available for ``sort_by=acquired_date``.
     """
-    lots = service.get_lots(account_id, ticker, status, sort_by)
+    if limit is None and cursor is None:
+        lots = service.get_lots(account_id, ticker, status, sort_by)
+        return {
+            "lots": _serialize(lots),
+            "total_count": len(lots),
+        }
+
+    if sort_by != "acquired_date":
+        raise HTTPException(
+            422, "cursor pagination is only supported for sort_by=acquired_date"
+        )
+    try:
+        page = service.get_lots_page(
+            account_id=account_id,
+            ticker=ticker,
+            status=status,
+            limit=limit or 100,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(422, str(exc))
     return {
-        "lots": _serialize(lots),
-        "total_count": len(lots),
+        "lots": _serialize(page.items),
+        "total_count": page.total,
+        "next_cursor": page.next_cursor,
     }
 
 
@@ -306,7 +338,7 @@ async def get_tax_lots(
 
 
 @tax_router.get("/quarterly", status_code=200)
-async def get_quarterly_estimate(
+def get_quarterly_estimate(
     quarter: Literal["Q1", "Q2", "Q3", "Q4"],
     tax_year: int,
     estimation_method: Literal["annualized", "actual", "prior_year"] = "annualized",
@@ -335,7 +367,7 @@ async def get_quarterly_estimate(
 
 
 @tax_router.post("/quarterly/payment", status_code=200)
-async def record_quarterly_tax_payment(
+def record_quarterly_tax_payment(
     body: RecordPaymentRequest,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -365,7 +397,7 @@ async def record_quarterly_tax_payment(
 
 
 @tax_router.get("/harvest", status_code=200)
-async def harvest_losses(
+def harvest_losses(
     account_id: Optional[str] = None,
     min_loss_threshold: float = 0.0,
     exclude_wash_risk: bool = False,
@@ -418,7 +450,7 @@ async def harvest_losses(
 
 
 @tax_router.get("/ytd-summary", status_code=200)
-async def get_ytd_tax_summary(
+def get_ytd_tax_summary(
     tax_year: int,
     account_id: Optional[str] = None,
     service: Any = Depends(get_tax_service),
@@ -448,7 +480,7 @@ async def get_ytd_tax_summary(
 
 
 @tax_router.post("/lots/{lot_id}/close", status_code=200)
-async def close_tax_lot(
+def close_tax_lot(
     lot_id: str,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -466,7 +498,7 @@ async def close_tax_lot(
 
 
 @tax_router.put("/lots/{lot_id}/reassign", status_code=200)
-async def reassign_lot_basis(
+def reassign_lot_basis(
     lot_id: str,
     body: ReassignLotBasisRequest,
     service: Any = Depends(get_tax_service),
@@ -492,7 +524,7 @@ async def reassign_lot_basis(
 
 
 @tax_router.post("/wash-sales/scan", status_code=200)
-async def scan_wash_sales(
+def scan_wash_sales(
     body: ScanWashSalesRequest = ScanWashSalesRequest(),
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -523,7 +555,7 @@ async def scan_wash_sales(
 
 
 @tax_router.post("/audit", status_code=200)
-async def run_tax_audit(
+def run_tax_audit(
     account_id: Optional[str] = None,
     tax_year: Optional[int] = None,
     service: Any = Depends(get_tax_service),
@@ -537,7 +569,7 @@ async def run_tax_audit(
 
 
 @tax_router.get("/deferred-losses", status_code=200)
-async def get_deferred_loss_report(
+def get_deferred_loss_report(
     tax_year: Optional[int] = None,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -550,7 +582,7 @@ async def get_deferred_loss_report(
 
 
 @tax_router.get("/alpha", status_code=200)
-async def get_tax_alpha_report(
+def get_tax_alpha_report(
     tax_year: int,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -566,7 +598,7 @@ async def get_tax_alpha_report(
 
 
 @tax_router.post("/sync-lots", status_code=200)
-async def sync_tax_lots(
+def sync_tax_lots(
     body: SyncTaxLotsRequest = SyncTaxLotsRequest(),
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -591,7 +623,7 @@ async def sync_tax_lots(
 
 
 @tax_router.get("/profiles", status_code=200)
-async def list_profiles(
+def list_profiles(
     service: Any = Depends(get_tax_service),
 ) -> list[dict]:
     """List all tax profiles ordered by year desc."""
@@ -600,7 +632,7 @@ async def list_profiles(
 
 
 @tax_router.get("/profiles/{year}", status_code=200)
-async def get_profile(
+def get_profile(
     year: int,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -613,7 +645,7 @@ async def get_profile(
 
 
 @tax_router.post("/profiles", status_code=201)
-async def create_profile(
+def create_profile(
     body: TaxProfileCreateRequest,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -651,7 +683,7 @@ async def create_profile(
 
 
 @tax_router.put("/profiles/{year}", status_code=200)
-async def update_profile(
+def update_profile(
     year: int,
     body: TaxProfileUpdateRequest,
     service: Any = Depends(get_tax_service),
@@ -720,7 +752,7 @@ async def update_profile(
 
 
 @tax_router.delete("/profiles/{year}", status_code=200)
-async def delete_profile(
+def delete_profile(
     year: int,
     service: Any = Depends(get_tax_service),
 ) -> dict:
@@ -8,12 +8,13 @@ from __future__ import annotations
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from pydantic.functional_validators import BeforeValidator
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional
 
 from zorivest_core.application.commands import AttachImage, CreateTrade
-from zorivest_core.domain.enums import ImageOwnerType, TradeAction
+from zorivest_core.application.pagination import encode_cursor, scoped_kind
+from zorivest_core.domain.enums import BulkRowStatus, ImageOwnerType, TradeAction
 from zorivest_infra.image_processing import (
     generate_thumbnail,
     standardize_to_webp,
@@ -25,6 +26,7 @@ from zorivest_api.dependencies import (
     get_image_service,
     require_unlocked_db,
 )
+from zorivest_api.event_loop import BlockingHandlerRoute
 from zorivest_api.schemas.common import PaginatedResponse
 
 
@@ -35,7 +37,9 @@ def _strip_whitespace(v: object) -> object:
 
 StrippedStr = Annotated[str, BeforeValidator(_strip_whitespace)]
 
-trade_router = APIRouter(prefix="/api/v1/trades", tags=["trades"])
+trade_router = APIRouter(
+    prefix="/api/v1/trades", tags=["trades"], route_class=BlockingHandlerRoute
+)
 
 
 # ── Request/Response schemas ────────────────────────────────────────────
@@ -56,6 +60,31 @@ class CreateTradeRequest(BaseModel):
     notes: Optional[str] = None
 
 
+MAX_BULK_TRADES = 50_000
+
+
+class BulkCreateTradesRequest(BaseModel):
+    """Rows are validated one by one so a bad row is reported, not fatal."""
+
+    model_config = {"extra": "forbid"}
+
+    trades: list[dict[str, Any]] = Field(min_length=1, max_length=MAX_BULK_TRADES)
+
+
+class BulkTradeRowResponse(BaseModel):
+    index: int
+    exec_id: str
+    status: BulkRowStatus
+    reason: str = ""
+
+
+class BulkCreateTradesResponse(BaseModel):
+    accepted: int
+    duplicates: int
+    errors: int
+    results: list[BulkTradeRowResponse]
+
+
 class UpdateTradeRequest(BaseModel):
     model_config = {"extra": "forbid"}
 
@@ -89,24 +118,13 @@ class TradeResponse(BaseModel):
 
 
 @trade_router.post("", status_code=201, dependencies=[Depends(require_unlocked_db)])
-async def create_trade(
+def create_trade(
     body: CreateTradeRequest,
     service=Depends(get_trade_service),
 ):
     """Create a new trade."""
     try:
-        cmd = CreateTrade(
-            exec_id=body.exec_id,
-            time=body.time,
-            instrument=body.instrument,
-            action=body.action,  # Already validated as TradeAction by Pydantic
-            quantity=body.quantity,
-            price=body.price,
-            account_id=body.account_id,
-            commission=body.commission,
-            realized_pnl=body.realized_pnl,
-            notes=body.notes or "",
-        )
+        cmd = _command_from_request(body)
         trade = service.create_trade(cmd)
         return TradeResponse.model_validate(trade)
     except ValueError as e:
@@ -115,16 +133,114 @@ async def create_trade(
         raise HTTPException(409, str(e))
 
 
+def _command_from_request(body: CreateTradeRequest) -> CreateTrade:
+    return CreateTrade(
+        exec_id=body.exec_id,
+        time=body.time,
+        instrument=body.instrument,
+        action=body.action,
+        quantity=body.quantity,
+        price=body.price,
+        account_id=body.account_id,
+        commission=body.commission,
+        realized_pnl=body.realized_pnl,
+        notes=body.notes or "",
+    )
+
+
+def _bulk_error_row(
+    index: int, raw: dict[str, Any], reason: str
+) -> BulkTradeRowResponse:
+    return BulkTradeRowResponse(
+        index=index,
+        exec_id=str(raw.get("exec_id", "")),
+        status=BulkRowStatus.ERROR,
+        reason=reason,
+    )
+
+
+@trade_router.post("/bulk", dependencies=[Depends(require_unlocked_db)])
+def create_trades_bulk(
+    body: BulkCreateTradesRequest,
+    service=Depends(get_trade_service),
+) -> BulkCreateTradesResponse:
+    """Create many trades in chunked transactions with per-row status.
+
+    Rows failing validation are reported as ``error``; rows matching an
+    existing exec_id or fingerprint (or an earlier row) as ``duplicate``.
+    """
+    results: list[BulkTradeRowResponse | None] = [None] * len(body.trades)
+    commands: list[CreateTrade] = []
+    positions: list[int] = []
+    for i, raw in enumerate(body.trades):
+        try:
+            commands.append(
+                _command_from_request(CreateTradeRequest.model_validate(raw))
+            )
+            positions.append(i)
+        except ValidationError as e:
+            reason = "; ".join(
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+                for err in e.errors()
+            )
+            results[i] = _bulk_error_row(i, raw, reason)
+        except ValueError as e:
+            results[i] = _bulk_error_row(i, raw, str(e))
+
+    bulk = service.create_trades_bulk(commands)
+    for row in bulk.rows:
+        i = positions[row.index]
+        results[i] = BulkTradeRowResponse(
+            index=i, exec_id=row.exec_id, status=row.status, reason=row.reason
+        )
+
+    rows = [r for r in results if r is not None]
+    return BulkCreateTradesResponse(
+        accepted=sum(r.status == BulkRowStatus.ACCEPTED for r in rows),
+        duplicates=sum(r.status == BulkRowStatus.DUPLICATE for r in rows),
+        errors=sum(r.status == BulkRowStatus.ERROR for r in rows),
+        results=rows,
+    )
+
+
 @trade_router.get("", dependencies=[Depends(require_unlocked_db)])
-async def list_trades(
+def list_trades(
     limit: int = 50,
     offset: int = 0,
     account_id: str | None = None,
     search: str | None = None,
     sort: str = "-time",
+    cursor: str | None = None,
+    include_total: bool = True,
     service=Depends(get_trade_service),
 ):
-    """List trades with optional account filter, search, and sort."""
+    """List trades with optional account filter, search, and sort.
+
+    Time-sorted listings return ``next_cursor``; passing it back as
+    ``cursor`` pages by ``(time, exec_id)`` keyset instead of OFFSET.
+    ``include_total=false`` skips the count query. ``sort=relevance``
+    orders search hits best-match first.
+    """
+    if cursor is not None:
+        try:
+            page = service.list_trades_page(
+                limit=limit,
+                cursor=cursor,
+                account_id=account_id,
+                sort=sort,
+                search=search,
+                include_total=include_total,
+            )
+        except ValueError as e:
+            raise HTTPException(422, str(e))
+        return PaginatedResponse(
+            items=[TradeResponse.model_validate(t) for t in page.items],
+            total=page.total,
+            limit=limit,
+            offset=0,
+            next_cursor=page.next_cursor,
+        )
+
     trades = service.list_trades(
         limit=limit,
         offset=offset,
@@ -132,18 +248,28 @@ async def list_trades(
         sort=sort,
         search=search,
     )
-    total = service.count_trades(account_id=account_id, search=search)
+    total = (
+        service.count_trades(account_id=account_id, search=search)
+        if include_total
+        else None
+    )
     items = [TradeResponse.model_validate(t) for t in trades]
+    next_cursor = None
+    if sort in ("time", "-time") and trades and len(trades) == limit:
+        last = trades[-1]
+        kind = scoped_kind(f"trades:{sort}", account_id, search)
+        next_cursor = encode_cursor(kind, (last.time, last.exec_id))
     return PaginatedResponse(
         items=items,
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
 @trade_router.get("/{exec_id}", dependencies=[Depends(require_unlocked_db)])
-async def get_trade(exec_id: str, service=Depends(get_trade_service)):
+def get_trade(exec_id: str, service=Depends(get_trade_service)):
     """Get a single trade by exec_id."""
     try:
         trade = service.get_trade(exec_id)
@@ -153,7 +279,7 @@ async def get_trade(exec_id: str, service=Depends(get_trade_service)):
 
 
 @trade_router.put("/{exec_id}", dependencies=[Depends(require_unlocked_db)])
-async def update_trade(
+def update_trade(
     exec_id: str,
     body: UpdateTradeRequest,
     service=Depends(get_trade_service),
@@ -172,7 +298,7 @@ async def update_trade(
 @trade_router.delete(
     "/{exec_id}", status_code=204, dependencies=[Depends(require_unlocked_db)]
 )
-async def delete_trade(exec_id: str, service=Depends(get_trade_service)):
+def delete_trade(exec_id: str, service=Depends(get_trade_service)):
     """Delete a trade."""
     try:
         service.delete_trade(exec_id)
@@ -184,7 +310,7 @@ async def delete_trade(exec_id: str, service=Depends(get_trade_service)):
 
 
 @trade_router.get("/{exec_id}/images", dependencies=[Depends(require_unlocked_db)])
-async def list_trade_images(exec_id: str, service=Depends(get_image_service)):
+def list_trade_images(exec_id: str, service=Depends(get_image_service)):
     """List all images attached to a trade."""
     images = service.get_images_for_owner("trade", exec_id)
     return [
@@ -202,7 +328,7 @@ async def list_trade_images(exec_id: str, service=Depends(get_image_service)):
 @trade_router.post(
     "/{exec_id}/images", status_code=201, dependencies=[Depends(require_unlocked_db)]
 )
-async def upload_trade_image(
+def upload_trade_image(
     exec_id: str,
     file: UploadFile = File(...),
     caption: str = Form(""),
@@ -214,7 +340,7 @@ async def upload_trade_image(
     Validates the image (magic bytes, 10 MB size limit), converts to WebP,
     extracts real dimensions, and stores via the service layer.
     """
-    raw_data = await file.read()
+    raw_data = file.file.read()
     try:
         # Validate format and size, extract dimensions
         _mime, width, height = validate_image(raw_data)
@@ -14,8 +14,11 @@ from pydantic.functional_validators import BeforeValidator
 from typing import Annotated
 
 from zorivest_api.dependencies import get_watchlist_service
+from zorivest_api.event_loop import BlockingHandlerRoute
 
-watchlist_router = APIRouter(prefix="/api/v1/watchlists", tags=["watchlists"])
+watchlist_router = APIRouter(
+    prefix="/api/v1/watchlists", tags=["watchlists"], route_class=BlockingHandlerRoute
+)
 
 
 # ── Request/Response schemas ────────────────────────────────────────────
@@ -78,7 +81,7 @@ class UpdateItemNotesRequest(BaseModel):
 
 
 @watchlist_router.post("/", status_code=201)
-async def create_watchlist(
+def create_watchlist(
     body: CreateWatchlistRequest,
     service=Depends(get_watchlist_service),
 ):
@@ -91,7 +94,7 @@ async def create_watchlist(
 
 
 @watchlist_router.get("/")
-async def list_watchlists(
+def list_watchlists(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
     service=Depends(get_watchlist_service),
@@ -102,7 +105,7 @@ async def list_watchlists(
 
 
 @watchlist_router.get("/{watchlist_id}")
-async def get_watchlist(
+def get_watchlist(
     watchlist_id: int,
     service=Depends(get_watchlist_service),
 ):
@@ -116,7 +119,7 @@ async def get_watchlist(
 
 
 @watchlist_router.put("/{watchlist_id}")
-async def update_watchlist(
+def update_watchlist(
     watchlist_id: int,
     body: UpdateWatchlistRequest,
     service=Depends(get_watchlist_service),
@@ -134,7 +137,7 @@ async def update_watchlist(
 
 
 @watchlist_router.delete("/{watchlist_id}", status_code=204)
-async def delete_watchlist(
+def delete_watchlist(
     watchlist_id: int,
     service=Depends(get_watchlist_service),
 ):
@@ -146,7 +149,7 @@ async def delete_watchlist(
 
 
 @watchlist_router.post("/{watchlist_id}/items", status_code=201)
-async def add_ticker(
+def add_ticker(
     watchlist_id: int,
     body: AddTickerRequest,
     service=Depends(get_watchlist_service),
@@ -173,7 +176,7 @@ async def add_ticker(
 
 
 @watchlist_router.delete("/{watchlist_id}/items/{ticker}", status_code=204)
-async def remove_ticker(
+def remove_ticker(
     watchlist_id: int,
     ticker: str,
     service=Depends(get_watchlist_service),
@@ -4,9 +4,9 @@ to synchronous ORM repositories via SqlAlchemyUnitOfWork.
 
 MEU-90a: These adapters translate between the async dict-based APIs
 expected by SchedulingService and the sync ORM repository methods
-provided by SqlAlchemyUnitOfWork.  The UoW is pre-entered in the
-lifespan with reentrant depth tracking, so adapters access repos
-directly via the shared session.
+provided by SqlAlchemyUnitOfWork.  Every adapter call enters the UoW,
+which joins the caller's request/task scope (or the pre-entered shared
+session in legacy mode) via reentrant depth tracking.
 """
 
 from __future__ import annotations
@@ -15,7 +15,7 @@ import json
 from datetime import datetime
 from typing import Any
 
-from zorivest_infra.database.models import AuditLogModel, PipelineStepModel
+from zorivest_infra.database.models import PipelineStepModel
 from zorivest_infra.database.unit_of_work import SqlAlchemyUnitOfWork
 
 
@@ -78,38 +78,43 @@ class PolicyStoreAdapter:
         self._uow = uow
 
     async def create(self, data: dict[str, Any]) -> dict[str, Any]:
-        filtered = {k: v for k, v in data.items() if k in self._CREATE_KEYS}
-        # SchedulingService passes policy_json as a dict; repo expects JSON string
-        if "policy_json" in filtered and isinstance(filtered["policy_json"], dict):
-            filtered["policy_json"] = json.dumps(filtered["policy_json"])
-        policy_id = self._uow.policies.create(**filtered)
-        self._uow.commit()
-        model = self._uow.policies.get_by_id(policy_id)
-        return _policy_model_to_dict(model) if model else {"id": policy_id}
+        with self._uow:
+            filtered = {k: v for k, v in data.items() if k in self._CREATE_KEYS}
+            # SchedulingService passes policy_json as a dict; repo expects JSON string
+            if "policy_json" in filtered and isinstance(filtered["policy_json"], dict):
+                filtered["policy_json"] = json.dumps(filtered["policy_json"])
+            policy_id = self._uow.policies.create(**filtered)
+            self._uow.commit()
+            model = self._uow.policies.get_by_id(policy_id)
+            return _policy_model_to_dict(model) if model else {"id": policy_id}
 
     async def get_by_id(self, policy_id: str) -> dict[str, Any] | None:
-        model = self._uow.policies.get_by_id(policy_id)
-        return _policy_model_to_dict(model) if model else None
+        with self._uow:
+            model = self._uow.policies.get_by_id(policy_id)
+            return _policy_model_to_dict(model) if model else None
 
     async def list_all(self, enabled_only: bool = False) -> list[dict[str, Any]]:
-        models = self._uow.policies.list_all(enabled_only=enabled_only)
-        return [_policy_model_to_dict(m) for m in models]
+        with self._uow:
+            models = self._uow.policies.list_all(enabled_only=enabled_only)
+            return [_policy_model_to_dict(m) for m in models]
 
     async def update(
         self, policy_id: str, data: dict[str, Any]
     ) -> dict[str, Any] | None:
-        filtered = {k: v for k, v in data.items() if k in self._UPDATE_KEYS}
-        # SchedulingService passes policy_json as a dict; repo expects JSON string
-        if "policy_json" in filtered and isinstance(filtered["policy_json"], dict):
-            filtered["policy_json"] = json.dumps(filtered["policy_json"])
-        self._uow.policies.update(policy_id, **filtered)
-        self._uow.commit()
-        model = self._uow.policies.get_by_id(policy_id)
-        return _policy_model_to_dict(model) if model else None
+        with self._uow:
+            filtered = {k: v for k, v in data.items() if k in self._UPDATE_KEYS}
+            # SchedulingService passes policy_json as a dict; repo expects JSON string
+            if "policy_json" in filtered and isinstance(filtered["policy_json"], dict):
+                filtered["policy_json"] = json.dumps(filtered["policy_json"])
+            self._uow.policies.update(policy_id, **filtered)
+            self._uow.commit()
+            model = self._uow.policies.get_by_id(policy_id)
+            return _policy_model_to_dict(model) if model else None
 
     async def delete(self, policy_id: str) -> None:
-        self._uow.policies.delete(policy_id)
-        self._uow.commit()
+        with self._uow:
+            self._uow.policies.delete(policy_id)
+            self._uow.commit()
 
 
 # ── RunStoreAdapter ──────────────────────────────────────────────────────
@@ -152,42 +157,47 @@ class RunStoreAdapter:
         self._uow = uow
 
     async def create(self, data: dict[str, Any]) -> dict[str, Any]:
-        # Translate service-layer keys → repo-layer keys
-        mapped = dict(data)
-        if "run_id" in mapped:
-            mapped["id"] = mapped.pop("run_id")
-        filtered = {k: v for k, v in mapped.items() if k in self._CREATE_KEYS}
-        run_id = self._uow.pipeline_runs.create(**filtered)
-        self._uow.commit()
-        model = self._uow.pipeline_runs.get_by_id(run_id)
-        return _run_model_to_dict(model) if model else {"run_id": run_id}
+        with self._uow:
+            # Translate service-layer keys → repo-layer keys
+            mapped = dict(data)
+            if "run_id" in mapped:
+                mapped["id"] = mapped.pop("run_id")
+            filtered = {k: v for k, v in mapped.items() if k in self._CREATE_KEYS}
+            run_id = self._uow.pipeline_runs.create(**filtered)
+            self._uow.commit()
+            model = self._uow.pipeline_runs.get_by_id(run_id)
+            return _run_model_to_dict(model) if model else {"run_id": run_id}
 
     async def get_by_id(self, run_id: str) -> dict[str, Any] | None:
-        model = self._uow.pipeline_runs.get_by_id(run_id)
-        return _run_model_to_dict(model) if model else None
+        with self._uow:
+            model = self._uow.pipeline_runs.get_by_id(run_id)
+            return _run_model_to_dict(model) if model else None
 
     async def list_for_policy(
         self, policy_id: str, limit: int = 20
     ) -> list[dict[str, Any]]:
-        # Method renamed: list_for_policy → list_by_policy
-        models = self._uow.pipeline_runs.list_by_policy(policy_id, limit=limit)
-        return [_run_model_to_dict(m) for m in models]
+        with self._uow:
+            # Method renamed: list_for_policy → list_by_policy
+            models = self._uow.pipeline_runs.list_by_policy(policy_id, limit=limit)
+            return [_run_model_to_dict(m) for m in models]
 
     async def list_recent(self, limit: int = 20) -> list[dict[str, Any]]:
-        models = self._uow.pipeline_runs.list_recent(limit=limit)
-        return [_run_model_to_dict(m) for m in models]
+        with self._uow:
+            models = self._uow.pipeline_runs.list_recent(limit=limit)
+            return [_run_model_to_dict(m) for m in models]
 
     async def update(self, run_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
-        # Shape split: extract status/error/duration_ms from dict
-        self._uow.pipeline_runs.update_status(
-            run_id,
-            status=data.get("status", "completed"),
-            error=data.get("error"),
-            duration_ms=data.get("duration_ms"),
-        )
-        self._uow.commit()
-        model = self._uow.pipeline_runs.get_by_id(run_id)
-        return _run_model_to_dict(model) if model else None
+        with self._uow:
+            # Shape split: extract status/error/duration_ms from dict
+            self._uow.pipeline_runs.update_status(
+                run_id,
+                status=data.get("status", "completed"),
+                error=data.get("error"),
+                duration_ms=data.get("duration_ms"),
+            )
+            self._uow.commit()
+            model = self._uow.pipeline_runs.get_by_id(run_id)
+            return _run_model_to_dict(model) if model else None
 
 
 # ── AuditCounterAdapter ─────────────────────────────────────────────────
@@ -198,7 +208,7 @@ class AuditCounterAdapter:
 
     Method translations:
     - log() → append() (renamed, adds actor="system")
-    - count_actions_since() → new query (no direct repo method)
+    - count_actions_since() → count_since()
     """
 
     def __init__(self, uow: SqlAlchemyUnitOfWork) -> None:
@@ -211,24 +221,19 @@ class AuditCounterAdapter:
         resource_id: str,
         details: dict[str, Any] | None = None,
     ) -> None:
-        self._uow.audit_log.append(
-            actor="system",
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            details=details,
-        )
-        self._uow.commit()
+        with self._uow:
+            self._uow.audit_log.append(
+                actor="system",
+                action=action,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                details=details,
+            )
+            self._uow.commit()
 
     async def count_actions_since(self, action: str, since: datetime) -> int:
-        return (
-            self._uow._session.query(AuditLogModel)  # noqa: SLF001  # pyright: ignore[reportOptionalMemberAccess]
-            .filter(
-                AuditLogModel.action == action,
-                AuditLogModel.created_at >= since,
-            )
-            .count()
-        )
+        with self._uow:
+            return self._uow.audit_log.count_since(action, since)
 
 
 # ── StepStoreAdapter ────────────────────────────────────────────────────
@@ -241,9 +246,10 @@ class StepStoreAdapter:
         self._uow = uow
 
     async def list_for_run(self, run_id: str) -> list[dict[str, Any]]:
-        models = (
-            self._uow._session.query(PipelineStepModel)  # noqa: SLF001  # pyright: ignore[reportOptionalMemberAccess]
-            .filter_by(run_id=run_id)
-            .all()
-        )
-        return [_model_to_dict(m) for m in models]
+        with self._uow:
+            models = (
+                self._uow._session.query(PipelineStepModel)  # noqa: SLF001  # pyright: ignore[reportOptionalMemberAccess]
+                .filter_by(run_id=run_id)
+                .all()
+            )
+            return [_model_to_dict(m) for m in models]
@@ -13,12 +13,18 @@ T = TypeVar("T")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Standard pagination envelope for list endpoints."""
+    """Standard pagination envelope for list endpoints.
+
+    ``next_cursor`` is set on keyset-capable listings while more rows may
+    follow; pass it back as ``cursor`` to fetch the next page without
+    OFFSET. ``total`` is None when the caller opted out of counting.
+    """
 
     items: list[T]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class ErrorEnvelope(BaseModel):
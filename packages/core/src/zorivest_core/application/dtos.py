@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
 from zorivest_core.domain.enums import (
     AccountType,
     BalanceSource,
+    BulkRowStatus,
     ImageOwnerType,
     TradeAction,
 )
@@ -68,3 +69,44 @@ class ImageAttachmentDTO:
     height: int
     file_size: int
     created_at: datetime
+
+
+@dataclass(frozen=True)
+class AccountTradeStats:
+    """Trade aggregates for one account, computed in the database."""
+
+    trade_count: int = 0
+    total_realized_pnl: float = 0.0
+    winning_trades: int = 0
+
+
+@dataclass(frozen=True)
+class BulkTradeRowResult:
+    """Outcome of one row in a bulk trade ingestion."""
+
+    index: int
+    exec_id: str
+    status: BulkRowStatus
+    reason: str = ""
+
+
+@dataclass(frozen=True)
+class BulkTradeResult:
+    """Per-row results of ``TradeService.create_trades_bulk``, in input order."""
+
+    rows: list[BulkTradeRowResult] = field(default_factory=list)
+
+    def _count(self, status: BulkRowStatus) -> int:
+        return sum(1 for r in self.rows if r.status == status)
+
+    @property
+    def accepted(self) -> int:
+        return self._count(BulkRowStatus.ACCEPTED)
+
+    @property
+    def duplicates(self) -> int:
+        return self._count(BulkRowStatus.DUPLICATE)
+
+    @property
+    def errors(self) -> int:
+        return self._count(BulkRowStatus.ERROR)
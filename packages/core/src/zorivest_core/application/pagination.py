@@ -0,0 +1,104 @@
+# packages/core/src/zorivest_core/application/pagination.py
+"""Keyset (cursor) pagination primitives.
+
+A cursor is an opaque, URL-safe token wrapping the sort key of the last
+row on a page, e.g. ``(time, exec_id)`` for trades. Repositories resume
+strictly after that key with an index seek instead of ``OFFSET``, so deep
+pages cost the same as the first one.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+_DATETIME_TAG = "$dt"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token is malformed or belongs to another listing."""
+
+
+@dataclass(frozen=True)
+class CursorPage(Generic[T]):
+    """One page of a keyset listing.
+
+    ``next_cursor`` is None on the last page. ``total`` is only filled in
+    when the caller asked for a count.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and _DATETIME_TAG in value:
+        return datetime.fromisoformat(value[_DATETIME_TAG])
+    return value
+
+
+def scoped_kind(kind: str, *filters: str | None) -> str:
+    """Bind a listing *kind* to the filters the listing was produced under.
+
+    A cursor taken from one filtered listing then fails ``decode_cursor``
+    on a listing with other filters instead of resuming at a key that
+    means nothing there.
+    """
+    digest = hashlib.sha256(json.dumps(filters).encode("utf-8")).hexdigest()
+    return f"{kind}:{digest[:16]}"
+
+
+def encode_cursor(kind: str, key: tuple[Any, ...]) -> str:
+    """Encode the sort *key* of the last row of a *kind* listing."""
+    payload = {"k": kind, "v": [_encode_value(v) for v in key]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(kind: str, token: str) -> tuple[Any, ...]:
+    """Decode a token produced by ``encode_cursor`` for the same *kind*.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or for another listing.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload["k"] != kind:
+            raise InvalidCursorError(f"Cursor does not belong to '{kind}' listing")
+        return tuple(_decode_value(v) for v in payload["v"])
+    except InvalidCursorError:
+        raise
+    except Exception as exc:
+        raise InvalidCursorError("Malformed pagination cursor") from exc
+
+
+def paginate(
+    kind: str,
+    rows: list[T],
+    limit: int,
+    key: Callable[[T], tuple[Any, ...]],
+) -> CursorPage[T]:
+    """Build a page from up to ``limit + 1`` rows fetched after a cursor.
+
+    The extra row only signals that another page exists; it is dropped
+    and the cursor points at the last row that is returned.
+    """
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    next_cursor = encode_cursor(kind, key(items[-1])) if has_more and items else None
+    return CursorPage(items=items, next_cursor=next_cursor)
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Optional, Protocol, TypedDict
+from typing import (
+    Any,
+    Collection,
+    NotRequired,
+    Optional,
+    Protocol,
+    Sequence,
+    TypedDict,
+)
 
 from zorivest_core.domain.enums import BrokerType
 from zorivest_core.domain.import_types import ImportResult, RawExecution
 
+from zorivest_core.application.dtos import AccountTradeStats
 from zorivest_core.application.market_dtos import (
     MarketNewsItem,
     MarketQuote,
@@ -71,6 +80,17 @@ class TradeRepository(Protocol):
         """List trades with optional account filter, search, and sort."""
         ...
 
+    def list_after(
+        self,
+        limit: int = 100,
+        after: tuple[Any, ...] | None = None,
+        account_id: str | None = None,
+        search: str | None = None,
+        descending: bool = True,
+    ) -> list[Trade]:
+        """Keyset page ordered by (time, exec_id), strictly after *after*."""
+        ...
+
     def count_filtered(
         self,
         account_id: str | None = None,
@@ -87,10 +107,30 @@ class TradeRepository(Protocol):
         """Check if a trade with this fingerprint exists within lookback window."""
         ...
 
+    def existing_exec_ids(self, exec_ids: Collection[str]) -> set[str]:
+        """Return the subset of *exec_ids* already stored."""
+        ...
+
+    def existing_fingerprints_since(
+        self, fingerprints: Collection[str], lookback_days: int = 30
+    ) -> set[str]:
+        """Return the subset of *fingerprints* seen within the lookback window."""
+        ...
+
+    def save_many(self, trades: Sequence[Trade]) -> None:
+        """Stage several new trades for insertion in one flush."""
+        ...
+
     def list_for_account(self, account_id: str) -> list[Trade]:
         """Return all trades belonging to the given account."""
         ...
 
+    def stats_by_account(
+        self, account_ids: Collection[str]
+    ) -> dict[str, AccountTradeStats]:
+        """Return trade aggregates per account; accounts without trades are omitted."""
+        ...
+
 
 class ImageRepository(Protocol):
     """Repository for ImageAttachment entities."""
@@ -178,10 +218,25 @@ class BalanceSnapshotRepository(Protocol):
         """Return balance snapshots for an account with pagination, newest first."""
         ...
 
+    def list_for_account_after(
+        self,
+        account_id: str,
+        limit: int = 100,
+        after: tuple[Any, ...] | None = None,
+    ) -> list[BalanceSnapshot]:
+        """Keyset page, newest first, strictly after the (datetime, id) key."""
+        ...
+
     def count_for_account(self, account_id: str) -> int:
         """Return total count of balance snapshots for an account."""
         ...
 
+    def latest_for_accounts(
+        self, account_ids: Collection[str]
+    ) -> dict[str, BalanceSnapshot]:
+        """Return the most recent snapshot per account; accounts without one are omitted."""
+        ...
+
 
 class RoundTripRepository(Protocol):
     """Repository for RoundTrip entities.
@@ -229,6 +284,62 @@ class MarketProviderSettingsRepository(Protocol):
     def delete(self, provider_name: str) -> None: ...
 
 
+class MarketHistoryRepository(Protocol):
+    """Read-through store over the pipeline market data tables.
+
+    Backs MarketDataService's local reads of ``market_ohlcv``,
+    ``market_fundamentals``, ``market_dividends`` and ``market_splits``.
+    Timestamps are UTC datetimes; ``save_*`` methods upsert on each
+    table's unique key and stamp rows with *fetched_at*.
+    """
+
+    def list_ohlcv(
+        self, ticker: str, start: Any, end: Any
+    ) -> list[tuple[OHLCVBar, Any]]:
+        """Bars with ``start <= timestamp < end``, one per timestamp, with fetched_at."""
+        ...
+
+    def ohlcv_coverage(
+        self,
+        tickers: Collection[str],
+        provider: str,
+        start: Any,
+        end: Any,
+        now: Any = None,
+    ) -> dict[str, list[tuple[Any, Any]]]:
+        """Coverage index: per ticker, the date ranges of final daily bars stored.
+
+        Finality follows ``bar_is_final`` as of *now* (default: the current
+        time). Only *provider*'s bars with ``start <= timestamp < end``
+        count; tickers without any are omitted.
+        """
+        ...
+
+    def save_ohlcv(self, bars: Sequence[OHLCVBar], fetched_at: Any) -> None: ...
+
+    def get_fundamentals(self, ticker: str) -> FundamentalsSnapshot | None:
+        """Newest stored snapshot; its ``timestamp`` is when it was fetched."""
+        ...
+
+    def save_fundamentals(
+        self, snapshot: FundamentalsSnapshot, fetched_at: Any
+    ) -> None: ...
+
+    def list_dividends(self, ticker: str) -> list[DividendRecord]: ...
+
+    def save_dividends(
+        self, records: Sequence[DividendRecord], fetched_at: Any
+    ) -> None: ...
+
+    def list_splits(self, ticker: str) -> list[StockSplit]: ...
+
+    def save_splits(self, splits: Sequence[StockSplit], fetched_at: Any) -> None: ...
+
+    def last_fetched(self, data_type: str, ticker: str) -> Any:
+        """Newest fetched_at of a ticker's ``dividends`` or ``splits`` rows, or None."""
+        ...
+
+
 class TradeReportRepository(Protocol):
     """Repository for TradeReport entities."""
 
@@ -268,6 +379,10 @@ class TradePlanRepository(Protocol):
         """Count plans referencing a specific account."""
         ...
 
+    def count_by_account(self, account_ids: Collection[str]) -> dict[str, int]:
+        """Count plans per account; accounts without plans are omitted."""
+        ...
+
 
 class WatchlistRepository(Protocol):
     """Repository for Watchlist entities (MEU-68)."""
@@ -324,6 +439,7 @@ class UnitOfWork(Protocol):
     settings: SettingsRepository
     app_defaults: AppDefaultsRepository
     market_provider_settings: MarketProviderSettingsRepository
+    market_history: MarketHistoryRepository
     trade_reports: TradeReportRepository  # MEU-52
     trade_plans: TradePlanRepository  # MEU-66
     watchlists: WatchlistRepository  # MEU-68
@@ -357,6 +473,14 @@ class TaxLotRepository(Protocol):
 
     def update(self, lot: TaxLot) -> None: ...
 
+    def save_many(self, lots: Sequence[TaxLot]) -> None:
+        """Insert several new lots in one batch."""
+        ...
+
+    def update_many(self, lots: Sequence[TaxLot]) -> None:
+        """Write back several existing lots in one batch."""
+        ...
+
     def delete(self, lot_id: str) -> None: ...
 
     def list_for_account(self, account_id: str) -> list[TaxLot]:
@@ -374,6 +498,17 @@ class TaxLotRepository(Protocol):
         """List tax lots with optional filters."""
         ...
 
+    def list_after(
+        self,
+        limit: int = 100,
+        after: tuple[Any, ...] | None = None,
+        account_id: str | None = None,
+        ticker: str | None = None,
+        is_closed: bool | None = None,
+    ) -> list[TaxLot]:
+        """Keyset page ordered by (open_date, lot_id), strictly after *after*."""
+        ...
+
     def list_all_filtered(
         self,
         account_id: str | None = None,
@@ -554,6 +689,8 @@ class MarketDataPort(Protocol):
 
     async def get_quote(self, ticker: str) -> MarketQuote: ...
 
+    async def get_quotes(self, tickers: Sequence[str]) -> dict[str, MarketQuote]: ...
+
     async def get_news(
         self, ticker: str | None, count: int
     ) -> list[MarketNewsItem]: ...
@@ -595,6 +732,7 @@ class FetchAdapterResult(TypedDict):
     cache_status: str  # "miss" | "hit" | "revalidated"
     etag: str | None
     last_modified: str | None
+    content_type: NotRequired[str | None]
 
 
 class MarketDataAdapterPort(Protocol):
@@ -613,4 +751,6 @@ class MarketDataAdapterPort(Protocol):
         cached_content: bytes | None = None,
         cached_etag: str | None = None,
         cached_last_modified: str | None = None,
+        max_body_bytes: int | None = None,
+        allowed_mime_types: list[str] | None = None,
     ) -> FetchAdapterResult: ...
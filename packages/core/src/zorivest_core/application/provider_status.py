@@ -9,6 +9,42 @@ from __future__ import annotations
 from pydantic import BaseModel
 
 
+class ProviderHealth(BaseModel):
+    """Observed health of a provider (see services.provider_health).
+
+    ``state`` is the circuit breaker state: ``closed``, ``open`` (calls
+    skipped for ``retry_in_s`` more seconds) or ``half_open`` (one probe
+    call in flight).
+    """
+
+    state: str
+    latency_ms: float | None = None
+    error_rate: float
+    requests: int
+    failures: int
+    rate_limited: int
+    consecutive_failures: int
+    retry_in_s: float | None = None
+
+
+class RateBudgetStatus(BaseModel):
+    """Shared per-minute request budget of a provider.
+
+    ``effective_per_minute`` drops below ``limit_per_minute`` after 429
+    responses and recovers with each success; ``remaining`` counts the
+    requests left in the current 60-second window.
+    """
+
+    limit_per_minute: int
+    effective_per_minute: float
+    used: int
+    remaining: int
+    throttled: int
+    blocked_for_s: float
+    waiting_interactive: int
+    waiting_background: int
+
+
 class ProviderStatus(BaseModel):
     """Status information for a single market data provider.
 
@@ -24,3 +60,5 @@ class ProviderStatus(BaseModel):
     timeout: int
     last_test_status: str | None = None
     signup_url: str | None = None
+    health: ProviderHealth | None = None
+    rate_budget: RateBudgetStatus | None = None
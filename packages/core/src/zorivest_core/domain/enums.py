@@ -246,6 +246,14 @@ class ImportStatus(StrEnum):  # ADR-0003
     FAILED = "FAILED"  # No rows could be parsed
 
 
+class BulkRowStatus(StrEnum):
+    """Per-row outcome of a bulk trade ingestion."""
+
+    ACCEPTED = "accepted"  # Inserted
+    DUPLICATE = "duplicate"  # exec_id or fingerprint already known
+    ERROR = "error"  # Rejected (validation or insert failure)
+
+
 # ── Phase 3A: Tax Foundation ─────────────────────────────────────────────
 
 
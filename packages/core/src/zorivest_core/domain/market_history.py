@@ -0,0 +1,245 @@
+# packages/core/src/zorivest_core/domain/market_history.py
+"""Freshness policy for the read-through market history store.
+
+``MarketDataService`` serves OHLCV bars, fundamentals, dividends and splits
+from the tables the pipelines already fill (``market_ohlcv``,
+``market_fundamentals``, ``market_dividends``, ``market_splits``) and only
+goes to a provider for what is missing or stale:
+
+- A daily bar fetched after its session ended is final and never
+  refetched.  Pipeline writes stamp the fetch time too; a bar stored
+  without one is taken as final backfilled history only once it is older
+  than the settlement window, since it may have been written mid-session.
+- A bar fetched while its session was still open is refetched once the
+  session is over, and during the session whenever it is older than the
+  ``ohlcv`` TTL.
+- Fundamentals, dividends and splits are refetched once their newest
+  ``fetched_at`` is older than the TTL for their data type.
+
+Bars are keyed by their UTC calendar date.  Market holidays are not
+modelled; a single missing weekday next to stored bars is assumed to be
+one rather than refetched on every request.
+
+The same rules back the pipeline's coverage index: ``covered_ranges``
+compacts the final bar dates stored per ticker/provider into date ranges,
+``coverage_gaps`` returns what a requested window still lacks, and
+``split_windows`` cuts those gaps into provider-sized requests.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+
+from zorivest_core.domain.pipeline import FRESHNESS_TTL
+
+# TTL in seconds per stored data type (dividends/splits change at most daily).
+HISTORY_TTL: dict[str, int] = {
+    "ohlcv": FRESHNESS_TTL["ohlcv"],
+    "fundamentals": FRESHNESS_TTL["fundamentals"],
+    "dividends": 86400,
+    "splits": 86400,
+}
+
+# More gaps than this are fetched as one window spanning all of them.
+MAX_FETCH_WINDOWS = 4
+
+# Longest daily-bar window (calendar days) requested from a provider at once,
+# kept under each API's per-response row cap or history limit.
+OHLCV_WINDOW_DAYS: dict[str, int] = {
+    "Yahoo Finance": 3650,
+    "EODHD": 3650,
+    "Tradier": 3650,
+    "Financial Modeling Prep": 1825,
+    "Polygon.io": 730,
+    "Alpaca": 365,
+    "Finnhub": 365,
+}
+DEFAULT_OHLCV_WINDOW_DAYS = 365
+
+# Days back from today (UTC) whose bars are not trusted as final without a
+# fetch time; older unstamped bars are backfilled history.
+SETTLEMENT_WINDOW_DAYS = 1
+
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def is_fresh(data_type: str, fetched_at: datetime | None, now: datetime) -> bool:
+    """True when data fetched at *fetched_at* is still within its TTL."""
+    if fetched_at is None:
+        return False
+    age = (_as_utc(now) - _as_utc(fetched_at)).total_seconds()
+    return age < HISTORY_TTL[data_type]
+
+
+def settled_before(now: datetime) -> date:
+    """First day whose bars are not final unless stamped after their session."""
+    return _as_utc(now).date() - timedelta(days=SETTLEMENT_WINDOW_DAYS)
+
+
+def bar_is_final(day: date, fetched_at: datetime | None, now: datetime) -> bool:
+    """True when the daily bar for *day* can no longer change.
+
+    A bar is final once fetched after *day* ended in UTC, which is after the
+    US close on every trading day.  A bar without a fetch time is final only
+    before the settlement window (``settled_before``).
+    """
+    if fetched_at is None:
+        return day < settled_before(now)
+    session_over = datetime.combine(day + timedelta(days=1), time(), timezone.utc)
+    return _as_utc(fetched_at) >= session_over
+
+
+def _weekdays(start: date, end: date) -> list[date]:
+    days = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def _adjacent_weekdays(day: date) -> tuple[date, date]:
+    prev = day - timedelta(days=3 if day.weekday() == 0 else 1)
+    nxt = day + timedelta(days=3 if day.weekday() == 4 else 1)
+    return prev, nxt
+
+
+def missing_ohlcv_ranges(
+    start: date,
+    end: date,
+    stored: Mapping[date, datetime | None],
+    now: datetime,
+) -> list[tuple[date, date]]:
+    """Date windows of daily bars that must be fetched to serve [start, end].
+
+    Args:
+        start: First requested day.
+        end: Last requested day (clamped to today).
+        stored: Stored bar dates mapped to their ``fetched_at``.
+        now: Current time, used for today's date and TTL checks.
+
+    Returns:
+        Inclusive ``(first, last)`` windows in ascending order; empty when
+        the store already covers the range.
+    """
+    today = _as_utc(now).date()
+
+    def needs_fetch(day: date) -> bool:
+        if day not in stored:
+            return True
+        fetched_at = stored[day]
+        if bar_is_final(day, fetched_at, now):
+            return False
+        return day < today or not is_fresh("ohlcv", fetched_at, now)
+
+    runs: list[list[date]] = []
+    in_run = False
+    for day in _weekdays(start, min(end, today)):
+        if needs_fetch(day):
+            if in_run:
+                runs[-1].append(day)
+            else:
+                runs.append([day])
+            in_run = True
+        else:
+            in_run = False
+
+    windows = [
+        (run[0], run[-1])
+        for run in runs
+        if not (
+            len(run) == 1
+            and run[0] != today
+            and run[0] not in stored
+            and any(d in stored for d in _adjacent_weekdays(run[0]))
+        )
+    ]
+    if len(windows) > MAX_FETCH_WINDOWS:
+        return [(windows[0][0], windows[-1][1])]
+    return windows
+
+
+def _next_weekday(day: date) -> date:
+    return _adjacent_weekdays(day)[1]
+
+
+def covered_ranges(days: Iterable[date]) -> list[tuple[date, date]]:
+    """Compact stored bar dates into inclusive ``(first, last)`` ranges.
+
+    Consecutive weekdays extend a range, and so does a single missing
+    weekday between two stored ones (a market holiday).
+    """
+    ranges: list[tuple[date, date]] = []
+    for day in sorted(set(days)):
+        if ranges:
+            first, last = ranges[-1]
+            step = _next_weekday(last)
+            if day <= step or day == _next_weekday(step):
+                ranges[-1] = (first, max(last, day))
+                continue
+        ranges.append((day, day))
+    return ranges
+
+
+def coverage_gaps(
+    start: date,
+    end: date,
+    covered: Sequence[tuple[date, date]],
+) -> list[tuple[date, date]]:
+    """Weekday windows of [start, end] not inside any *covered* range.
+
+    A lone missing weekday next to a covered range is treated as a holiday,
+    as in ``missing_ohlcv_ranges``, unless nothing is covered after it (it
+    may be the newest session, not yet stored).
+    """
+    gaps: list[tuple[date, date]] = []
+    cursor = start
+    for first, last in sorted(covered):
+        if last < cursor:
+            continue
+        if first > end:
+            break
+        if first > cursor:
+            gaps.append((cursor, first - timedelta(days=1)))
+        cursor = last + timedelta(days=1)
+    if cursor <= end:
+        gaps.append((cursor, end))
+
+    newest = max((last for _, last in covered), default=None)
+
+    def is_holiday(day: date) -> bool:
+        if newest is None or day > newest:
+            return False
+        return any(
+            first <= d <= last
+            for first, last in covered
+            for d in _adjacent_weekdays(day)
+        )
+
+    result = []
+    for first, last in gaps:
+        weekdays = _weekdays(first, last)
+        if not weekdays:
+            continue
+        if len(weekdays) == 1 and is_holiday(weekdays[0]):
+            continue
+        result.append((weekdays[0], weekdays[-1]))
+    return result
+
+
+def split_windows(
+    gaps: Sequence[tuple[date, date]], max_days: int
+) -> list[tuple[date, date]]:
+    """Cut each gap into consecutive windows of at most *max_days* days."""
+    windows: list[tuple[date, date]] = []
+    span = timedelta(days=max_days - 1)
+    for first, last in gaps:
+        while first <= last:
+            stop = min(first + span, last)
+            windows.append((first, stop))
+            first = stop + timedelta(days=1)
+    return windows
@@ -279,6 +279,12 @@ FRESHNESS_TTL: dict[str, int] = {
     "fundamentals": 86400,  # 24 hours — changes infrequently
 }
 
+# Data types that benefit from extended TTL when markets are closed
+MARKET_SENSITIVE_TYPES = frozenset({"ohlcv", "quote"})
+
+# Multiplier for TTL when market is closed (e.g., weekends)
+MARKET_CLOSED_TTL_MULTIPLIER = 4
+
 
 # US market hours: NYSE/NASDAQ open 9:30 AM–4:00 PM Eastern (UTC-5 / UTC-4 DST).
 _ET_OFFSET_STANDARD = timedelta(hours=-5)
@@ -9,25 +9,29 @@ from __future__ import annotations
 
 import hashlib
 import json
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from zorivest_core.domain.enums import PipelineStatus
 from zorivest_core.domain.pipeline import (
+    MARKET_CLOSED_TTL_MULTIPLIER,
+    MARKET_SENSITIVE_TYPES,
     FetchResult,
     StepContext,
     StepResult,
     is_market_closed,
 )
 from zorivest_core.domain.step_registry import RegisteredStep
+from zorivest_core.services.fetch_memory_cache import (
+    CachedFetch,
+    FetchMemoryCache,
+    parse_records,
+)
 
-# Data types that benefit from extended TTL when markets are closed
-_MARKET_SENSITIVE_TYPES = {"ohlcv", "quote"}
-
-# Multiplier for TTL when market is closed (e.g., weekends)
-_MARKET_CLOSED_TTL_MULTIPLIER = 4
+# Interval spellings that mean daily bars (the only ones market_ohlcv tracks)
+_DAILY_INTERVALS = {"1d", "1day", "day", "daily", "d"}
 
 
 def _compute_entity_key(criteria: dict[str, Any]) -> str:
@@ -39,6 +43,39 @@ def _compute_entity_key(criteria: dict[str, Any]) -> str:
     return hashlib.sha256(serialized.encode()).hexdigest()[:16]
 
 
+def _as_day(value: Any) -> date | None:
+    """Coerce a resolved date_range bound (datetime, date or ISO str) to a date."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return _as_day(datetime.fromisoformat(value))
+        except ValueError:
+            return None
+    return None
+
+
+def _extract_records(content: bytes | str, provider: str, data_type: str) -> list:
+    """Unwrap a provider response into records (infra extractors when present)."""
+    try:
+        from zorivest_infra.market_data.response_extractors import extract_records
+
+        return extract_records(content, provider, data_type)
+    except ImportError:
+        pass  # Infrastructure not available
+    try:
+        data = json.loads(content)
+    except (ValueError, UnicodeDecodeError):
+        return []
+    if isinstance(data, list):
+        return data
+    return [data] if isinstance(data, dict) else []
+
+
 class FetchStep(RegisteredStep):
     """Fetch market data from a configured provider.
 
@@ -79,6 +116,22 @@ class FetchStep(RegisteredStep):
             default=5 * 1024 * 1024,
             description="Maximum response body size in bytes",
         )
+        # Gap-aware OHLCV: only request date ranges missing from market_ohlcv
+        gap_fill: bool = Field(
+            default=True,
+            description="ohlcv: fetch only the date ranges not yet stored",
+        )
+        window_days: int | None = Field(
+            default=None,
+            ge=1,
+            description="Max calendar days per gap request (default: per provider)",
+        )
+        # Downstream steps read the parsed ``records``; the raw body doubles
+        # the output (and its persisted output_json), so it is opt-in.
+        include_content: bool = Field(
+            default=False,
+            description="Also return the raw response body as 'content'",
+        )
 
     async def execute(self, params: dict, context: StepContext) -> StepResult:
         """Execute the fetch step.
@@ -111,6 +164,11 @@ class FetchStep(RegisteredStep):
             )
             resolved_criteria = resolver.resolve(p.criteria)
 
+        # 1b. Daily OHLCV with stored coverage: fetch only the missing windows
+        gap_requests = self._plan_gap_requests(p, resolved_criteria, context)
+        if gap_requests is not None:
+            return await self._fetch_gaps(p, resolved_criteria, gap_requests, context)
+
         # 2. Check cache first if enabled
         stale_meta: dict[str, Any] | None = None
         if p.use_cache:
@@ -122,17 +180,17 @@ class FetchStep(RegisteredStep):
                     if isinstance(hit_content, bytes):
                         hit_content = hit_content.decode("utf-8", errors="replace")
                     # Parse records for downstream compose/template consumption
-                    import json as _json_cache
-
-                    hit_records: Any = None
-                    try:
-                        hit_records = _json_cache.loads(hit_content)
-                    except (ValueError, _json_cache.JSONDecodeError):
-                        hit_records = hit_content
+                    # (memory-tier hits carry them already parsed)
+                    if "records" in cache_result:
+                        hit_records = cache_result["records"]
+                    else:
+                        hit_records = parse_records(
+                            hit_content, p.provider, p.data_type
+                        )
                     return StepResult(
                         status=PipelineStatus.SUCCESS,
                         output={
-                            "content": hit_content,
+                            **self._content_output(p, hit_content),
                             "records": hit_records,
                             "cache_status": "hit",
                             "content_hash": cache_result.get("content_hash"),
@@ -142,6 +200,7 @@ class FetchStep(RegisteredStep):
                             "resolved_criteria": resolved_criteria,
                             "etag": cache_result.get("etag"),
                             "last_modified": cache_result.get("last_modified"),
+                            **self._tier_stats(context),
                         },
                     )
                 # Stale entry — preserve metadata for conditional revalidation
@@ -158,32 +217,11 @@ class FetchStep(RegisteredStep):
             cached_last_modified=stale_meta.get("last_modified")
             if stale_meta
             else None,
+            params=p,
         )
 
         content = adapter_result["content"]
-
-        # §9C.4b: Body size cap (5 MB per spec L393)
-        if len(content) > p.max_body_bytes:
-            from zorivest_core.services.sql_sandbox import SecurityError
-
-            raise SecurityError(
-                f"FetchStep response body size {len(content)} bytes "
-                f"exceeds {p.max_body_bytes} byte limit (5 MB, §9C.4b)"
-            )
-
-        # §9C.4c: MIME type validation
-        response_type = adapter_result.get("content_type", "")
-        if p.allowed_mime_types and response_type:
-            # Normalize: strip parameters (e.g., "application/json; charset=utf-8")
-            base_type = response_type.split(";")[0].strip().lower()
-            allowed = [m.lower() for m in p.allowed_mime_types]
-            if base_type not in allowed:
-                from zorivest_core.services.sql_sandbox import SecurityError
-
-                raise SecurityError(
-                    f"FetchStep MIME type mismatch: got '{base_type}', "
-                    f"allowed: {allowed}"
-                )
+        self._validate_response(p, adapter_result)
 
         result = FetchResult(
             provider=p.provider,
@@ -211,43 +249,17 @@ class FetchStep(RegisteredStep):
             )
 
         # 5. Update pipeline cursor state for incremental tracking (MEU-PW11)
-        state_repo = context.outputs.get("pipeline_state_repo")
-        if state_repo is not None:
-            from datetime import datetime as _dt
-            from datetime import timezone as _tz
+        self._record_state(p, resolved_criteria, result.content_hash, context)
 
-            entity_key = _compute_entity_key(resolved_criteria)
-            state_repo.upsert(
-                policy_id=context.policy_id,
-                provider_id=p.provider,
-                data_type=p.data_type,
-                entity_key=entity_key,
-                last_cursor=_dt.now(_tz.utc).isoformat(),
-                last_hash=result.content_hash,
-            )
         # Parse content as JSON for downstream compose/template consumption.
         # ComposeStep sources reference key="records" to get structured data.
-        import json as _json
-
         records: Any = None
         if isinstance(content, (bytes, str)):
-            text = content.decode("utf-8") if isinstance(content, bytes) else content
-            try:
-                records = _json.loads(text)
-            except (ValueError, _json.JSONDecodeError):
-                records = text  # non-JSON → pass raw string
-        # Ensure content is str (not bytes) for JSON-serializable output.
-        # Bytes break Jinja2 |tojson filter when SendStep flattens context.
-        content_str: str
-        if isinstance(result.content, bytes):
-            content_str = result.content.decode("utf-8", errors="replace")
-        else:
-            content_str = result.content
-
+            records = parse_records(content, p.provider, p.data_type)
         return StepResult(
             status=PipelineStatus.SUCCESS,
             output={
-                "content": content_str,
+                **self._content_output(p, result.content),
                 "records": records,
                 "content_hash": result.content_hash,
                 "content_len": len(result.content),
@@ -257,6 +269,207 @@ class FetchStep(RegisteredStep):
                 "resolved_criteria": resolved_criteria,
                 "etag": adapter_result.get("etag"),
                 "last_modified": adapter_result.get("last_modified"),
+                **self._tier_stats(context),
+            },
+        )
+
+    @staticmethod
+    def _content_output(params: Params, content: bytes | str) -> dict[str, str]:
+        """``content`` output, present only when ``include_content`` is set."""
+        if not params.include_content:
+            return {}
+        # Ensure content is str (not bytes) for JSON-serializable output.
+        # Bytes break Jinja2 |tojson filter when SendStep flattens context.
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+        return {"content": content}
+
+    @staticmethod
+    def _tier_stats(context: StepContext) -> dict[str, Any]:
+        """``cache_tiers`` output: hit rates of the memory and database tiers."""
+        memory = getattr(context.outputs.get("fetch_cache_repo"), "memory", None)
+        if not isinstance(memory, FetchMemoryCache):
+            return {}
+        return {"cache_tiers": memory.stats().as_dict()}
+
+    def _validate_response(self, params: Params, adapter_result: dict) -> None:
+        """Enforce the body size cap and MIME allowlist on a provider response."""
+        content = adapter_result["content"]
+
+        # §9C.4b: Body size cap (5 MB per spec L393)
+        if len(content) > params.max_body_bytes:
+            from zorivest_core.services.sql_sandbox import SecurityError
+
+            raise SecurityError(
+                f"FetchStep response body size {len(content)} bytes "
+                f"exceeds {params.max_body_bytes} byte limit (5 MB, §9C.4b)"
+            )
+
+        # §9C.4c: MIME type validation
+        response_type = adapter_result.get("content_type", "")
+        if params.allowed_mime_types and response_type:
+            # Normalize: strip parameters (e.g., "application/json; charset=utf-8")
+            base_type = response_type.split(";")[0].strip().lower()
+            allowed = [m.lower() for m in params.allowed_mime_types]
+            if base_type not in allowed:
+                from zorivest_core.services.sql_sandbox import SecurityError
+
+                raise SecurityError(
+                    f"FetchStep MIME type mismatch: got '{base_type}', "
+                    f"allowed: {allowed}"
+                )
+
+    def _record_state(
+        self,
+        params: Params,
+        resolved_criteria: dict[str, Any],
+        content_hash: str,
+        context: StepContext,
+    ) -> None:
+        """Update the pipeline cursor state for incremental tracking."""
+        state_repo = context.outputs.get("pipeline_state_repo")
+        if state_repo is not None:
+            entity_key = _compute_entity_key(resolved_criteria)
+            state_repo.upsert(
+                policy_id=context.policy_id,
+                provider_id=params.provider,
+                data_type=params.data_type,
+                entity_key=entity_key,
+                last_cursor=datetime.now(timezone.utc).isoformat(),
+                last_hash=content_hash,
+            )
+
+    def _plan_gap_requests(
+        self,
+        params: Params,
+        resolved_criteria: dict[str, Any],
+        context: StepContext,
+    ) -> list[dict[str, Any]] | None:
+        """Split a daily OHLCV request into the windows market_ohlcv lacks.
+
+        Needs 'market_history_repo' in context.outputs, tickers and a
+        resolved ``date_range``. Tickers missing the same window share one
+        request; windows are capped at the provider's history limit.
+
+        Returns:
+            None when gap filling does not apply or nothing is stored yet
+            (the request goes out unchanged), otherwise the criteria of
+            each request still needed -- empty when everything is stored.
+        """
+        history_repo = context.outputs.get("market_history_repo")
+        if history_repo is None or not params.gap_fill or params.data_type != "ohlcv":
+            return None
+        interval = str(resolved_criteria.get("interval", "1d")).lower()
+        date_range = resolved_criteria.get("date_range")
+        if interval not in _DAILY_INTERVALS or not isinstance(date_range, dict):
+            return None
+        if "tickers" in resolved_criteria:
+            tickers = list(resolved_criteria["tickers"])
+        elif "symbol" in resolved_criteria:
+            tickers = [resolved_criteria["symbol"]]
+        else:
+            tickers = []
+        start = _as_day(date_range.get("start_date"))
+        end = _as_day(date_range.get("end_date"))
+        if not tickers or start is None or end is None:
+            return None
+        now = datetime.now(timezone.utc)
+        end = min(end, now.date())
+        if start > end:
+            return None
+
+        from zorivest_core.domain.market_history import (
+            DEFAULT_OHLCV_WINDOW_DAYS,
+            OHLCV_WINDOW_DAYS,
+            coverage_gaps,
+            split_windows,
+        )
+
+        coverage = history_repo.ohlcv_coverage(
+            tickers,
+            params.provider,
+            datetime.combine(start, time(), timezone.utc),
+            datetime.combine(end + timedelta(days=1), time(), timezone.utc),
+            now=now,
+        )
+        if not coverage:
+            return None
+
+        max_days = params.window_days or OHLCV_WINDOW_DAYS.get(
+            params.provider, DEFAULT_OHLCV_WINDOW_DAYS
+        )
+        by_window: dict[tuple[date, date], list[str]] = {}
+        for ticker in tickers:
+            gaps = coverage_gaps(start, end, coverage.get(ticker, []))
+            for window in split_windows(gaps, max_days):
+                by_window.setdefault(window, []).append(ticker)
+
+        requests: list[dict[str, Any]] = []
+        for (first, last), group in sorted(by_window.items()):
+            criteria = {k: v for k, v in resolved_criteria.items() if k != "symbol"}
+            criteria["tickers"] = group
+            criteria["date_range"] = {
+                **date_range,
+                "start_date": first.isoformat(),
+                "end_date": last.isoformat(),
+            }
+            requests.append(criteria)
+        return requests
+
+    async def _fetch_gaps(
+        self,
+        params: Params,
+        resolved_criteria: dict[str, Any],
+        requests: list[dict[str, Any]],
+        context: StepContext,
+    ) -> StepResult:
+        """Fetch each gap request and merge the records into one JSON array.
+
+        The merged content covers only the gaps, so it is not written to the
+        fetch cache under the full request's key.
+        """
+        records: list[Any] = []
+        for criteria in requests:
+            adapter_result = await self._fetch_from_provider(
+                provider=params.provider,
+                data_type=params.data_type,
+                resolved_criteria=criteria,
+                context=context,
+                params=params,
+            )
+            self._validate_response(params, adapter_result)
+            records.extend(
+                _extract_records(
+                    adapter_result["content"], params.provider, params.data_type
+                )
+            )
+
+        content = json.dumps(records, default=str)
+        self._validate_response(params, {"content": content})
+        result = FetchResult(
+            provider=params.provider,
+            data_type=params.data_type,
+            content=content,
+        )
+        self._record_state(params, resolved_criteria, result.content_hash, context)
+
+        return StepResult(
+            status=PipelineStatus.SUCCESS,
+            output={
+                **self._content_output(params, content),
+                "records": records,
+                "content_hash": result.content_hash,
+                "content_len": len(content),
+                "cache_status": "partial" if requests else "covered",
+                "provider": params.provider,
+                "data_type": params.data_type,
+                "resolved_criteria": resolved_criteria,
+                "gap_windows": [
+                    [c["date_range"]["start_date"], c["date_range"]["end_date"]]
+                    for c in requests
+                ],
+                "etag": None,
+                "last_modified": None,
             },
         )
 
@@ -270,6 +483,7 @@ class FetchStep(RegisteredStep):
         cached_content: bytes | str | None = None,
         cached_etag: str | None = None,
         cached_last_modified: str | None = None,
+        params: Params | None = None,
     ) -> dict[str, Any]:
         """Fetch data from the configured provider adapter.
 
@@ -280,6 +494,10 @@ class FetchStep(RegisteredStep):
         conditional headers (If-None-Match / If-Modified-Since) for
         HTTP 304 revalidation.
 
+        The body size cap and MIME allowlist from *params* go to the adapter
+        so it can stop reading an oversized or disallowed response early;
+        ``_validate_response`` still checks the result afterwards.
+
         Returns:
             FetchAdapterResult dict with content, cache_status, etag, last_modified.
         """
@@ -288,6 +506,12 @@ class FetchStep(RegisteredStep):
             raise ValueError(
                 "provider_adapter required in context.outputs for FetchStep"
             )
+        limits: dict[str, Any] = {}
+        if params is not None:
+            limits = {
+                "max_body_bytes": params.max_body_bytes,
+                "allowed_mime_types": params.allowed_mime_types,
+            }
         return await adapter.fetch(
             provider=provider,
             data_type=data_type,
@@ -295,6 +519,7 @@ class FetchStep(RegisteredStep):
             cached_content=cached_content,
             cached_etag=cached_etag,
             cached_last_modified=cached_last_modified,
+            **limits,
         )
 
     async def _check_cache(
@@ -311,6 +536,9 @@ class FetchStep(RegisteredStep):
               exists (caller should forward metadata for revalidation).
             - None when no cache entry exists at all.
 
+        Hits served by the repository's memory tier also carry the parsed
+        ``records``.
+
         TTL extension: During market-closed hours (weekends and weekday
         after-hours), ohlcv and quote data types get 4× TTL extension
         since prices don't change.
@@ -345,8 +573,8 @@ class FetchStep(RegisteredStep):
 
         # Apply market-closed extension for market-sensitive data types
         # Uses canonical is_market_closed() with weekday after-hours (F3)
-        if params.data_type in _MARKET_SENSITIVE_TYPES and is_market_closed(now):
-            effective_ttl = entry.ttl_seconds * _MARKET_CLOSED_TTL_MULTIPLIER
+        if params.data_type in MARKET_SENSITIVE_TYPES and is_market_closed(now):
+            effective_ttl = entry.ttl_seconds * MARKET_CLOSED_TTL_MULTIPLIER
 
         if elapsed > effective_ttl:
             # Stale — return metadata for conditional revalidation (F1)
@@ -359,10 +587,13 @@ class FetchStep(RegisteredStep):
             }
 
         # Cache hit — fresh data
-        return {
+        hit = {
             "content": content,
             "cache_status": "hit",
             "etag": entry.etag,
             "last_modified": entry.last_modified,
             "content_hash": entry.content_hash,
         }
+        if isinstance(entry, CachedFetch):
+            hit["records"] = entry.records
+        return hit
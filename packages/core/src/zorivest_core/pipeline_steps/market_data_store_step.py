@@ -312,6 +312,8 @@ class MarketDataStoreStep(RegisteredStep):
 
         # Write in batches (AC-7)
         total_written = 0
+        total_inserted = 0
+        total_updated = 0
         for i in range(0, len(valid_records), config.batch_size):
             batch = valid_records[i : i + config.batch_size]
             df_wrapper = _DictWrapper(batch)
@@ -329,13 +331,19 @@ class MarketDataStoreStep(RegisteredStep):
                 disposition=disposition,
                 key_columns=key_columns,
             )
-            total_written += written
+            # DbWriteAdapter returns a WriteResult; plain writers an int.
+            batch_total = getattr(written, "total", written)
+            total_written += batch_total
+            total_inserted += getattr(written, "inserted", batch_total)
+            total_updated += getattr(written, "updated", 0)
 
         return StepResult(
             status=PipelineStatus.SUCCESS,
             output={
                 "table": target_table,
                 "records_written": total_written,
+                "records_inserted": total_inserted,
+                "records_updated": total_updated,
                 "skipped": skipped,
                 "data_type": config.data_type,
                 "batch_count": (len(valid_records) + config.batch_size - 1)
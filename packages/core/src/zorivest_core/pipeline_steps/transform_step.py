@@ -31,6 +31,17 @@ _PRESENTATION_MAP: dict[str, str] = {
     "last": "price",
 }
 
+# Column dtypes the columnar path casts to before validation. Price arrays
+# with gaps hold None, or ints when every price happened to be whole.
+_COLUMN_DTYPES: dict[str, dict[str, str]] = {
+    "ohlcv": {
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+    },
+}
+
 
 class AssertionDef(BaseModel):
     """Definition of a single assertion gate (§9D.4b)."""
@@ -89,6 +100,15 @@ class TransformStep(RegisteredStep):
             le=1.0,
             description="Minimum ratio of valid records to proceed",
         )
+        validation_sample_size: int | None = Field(
+            default=None,
+            ge=1,
+            description=(
+                "Trusted providers only: check value rules on a random sample "
+                "of this many rows and accept the rest unchecked if it passes. "
+                "None validates every row."
+            ),
+        )
         # AC-1: Dynamic source resolution
         source_step_id: str | None = Field(
             default=None,
@@ -126,8 +146,9 @@ class TransformStep(RegisteredStep):
 
         Resolution priority:
         1. Explicit ``source_step_id`` — direct lookup in context.outputs.
-        2. Auto-discovery — scan context.outputs for dicts with both
-           ``content`` and ``provider`` keys (FetchStep output signature).
+        2. Auto-discovery — scan context.outputs for dicts with a
+           ``provider`` key and ``records`` or ``content`` (FetchStep
+           output signature).
         3. Legacy fallback — look for ``"fetch_result"`` for backward compat.
 
         Returns an empty dict if nothing matches (handled downstream as
@@ -143,7 +164,11 @@ class TransformStep(RegisteredStep):
 
         # 2. Auto-discover by FetchStep output shape
         for key, value in context.outputs.items():
-            if isinstance(value, dict) and "content" in value and "provider" in value:
+            if (
+                isinstance(value, dict)
+                and "provider" in value
+                and ("records" in value or "content" in value)
+            ):
                 logger.debug(
                     "TransformStep: auto-discovered fetch output under key '%s'",
                     key,
@@ -183,12 +208,6 @@ class TransformStep(RegisteredStep):
         # 1. Resolve source data (AC-1)
         source_output = self._resolve_source(p.source_step_id, context)
 
-        # Get raw content from source step output
-        source_content = (
-            source_output.get("content", b"")
-            if isinstance(source_output, dict)
-            else b""
-        )
         provider = (
             source_output.get("provider") if isinstance(source_output, dict) else None
         )
@@ -196,10 +215,34 @@ class TransformStep(RegisteredStep):
             source_output.get("data_type") if isinstance(source_output, dict) else None
         )
 
-        # 2. Extract records (AC-2: use response extractors for envelope unwrapping)
-        records = self._extract_records(source_content, provider, data_type)
+        # 2. Extract records (AC-2: use response extractors for envelope unwrapping).
+        # FetchStep has already parsed the body into ``records``; raw
+        # ``content`` is only there when the fetch was asked to keep it.
+        # Responses that arrive as parallel arrays stay columns through
+        # mapping into the DataFrame; everything else goes record by record.
+        columns = None
+        records: list[dict] = []
+        if (
+            isinstance(source_output, dict)
+            and provider
+            and source_output.get("records") is not None
+        ):
+            columns = self._extract_parsed_columns(
+                source_output["records"], provider, data_type
+            )
+            if columns is None:
+                records = self._extract_parsed_records(
+                    source_output["records"], provider, data_type
+                )
+        else:
+            source_content = (
+                source_output.get("content", b"")
+                if isinstance(source_output, dict)
+                else b""
+            )
+            records = self._extract_records(source_content, provider, data_type)
 
-        if not records:
+        if columns is None and not records:
             # AC-8: Zero-record warning
             status = PipelineStatus.SUCCESS
             if p.min_records > 0:
@@ -223,15 +266,24 @@ class TransformStep(RegisteredStep):
                 },
             )
 
-        # 3. Apply field mapping
-        records = self._apply_mapping(records, provider, data_type)
+        if columns is not None:
+            # 3–4. Rename whole columns, enrich, and cast (AC-5)
+            columns = self._apply_column_mapping(columns, provider, data_type)
+            columns = self._enrich_columns(columns, provider)
+            df = self._columns_to_frame(columns, data_type)
+        else:
+            # 3. Apply field mapping
+            records = self._apply_mapping(records, provider, data_type)
+
+            # 4. Enrich records with provider/timestamp (AC-5)
+            records = self._enrich_records(records, provider)
 
-        # 4. Enrich records with provider/timestamp (AC-5)
-        records = self._enrich_records(records, provider)
+            df = pd.DataFrame(records)
 
-        # 5. Create DataFrame and validate
-        df = pd.DataFrame(records)
-        valid_df, quarantined_df = validate_dataframe(df, p.validation_rules)
+        # 5. Validate
+        valid_df, quarantined_df = validate_dataframe(
+            df, p.validation_rules, sample_size=p.validation_sample_size
+        )
 
         # 6. Check quality threshold
         quality = check_quality(len(valid_df), len(df), p.quality_threshold)
@@ -255,15 +307,18 @@ class TransformStep(RegisteredStep):
         #    Drop _extra before write — it's a passthrough bag for unmapped
         #    provider fields, not a DB column.
         write_df = valid_df.drop(columns=["_extra"], errors="ignore")
-        records_written = self._write_data(
+        write_result = self._write_data(
             write_df,
             p.target_table,
             p.write_disposition,
             context,
         )
+        # DbWriteAdapter reports a WriteResult (inserted/updated); plain
+        # writers may still return an int count.
+        records_written = getattr(write_result, "total", write_result)
 
         # 8. Apply presentation mapping + prepare output records (AC-6)
-        output_records = self._apply_presentation_mapping(valid_df.to_dict("records"))
+        output_records = self._presentation_records(valid_df)
 
         return StepResult(
             status=PipelineStatus.SUCCESS,
@@ -271,6 +326,8 @@ class TransformStep(RegisteredStep):
                 "target_table": p.target_table,
                 "write_disposition": p.write_disposition,
                 "records_written": records_written,
+                "records_inserted": getattr(write_result, "inserted", records_written),
+                "records_updated": getattr(write_result, "updated", 0),
                 "records_quarantined": len(quarantined_df),
                 "quality_ratio": quality["ratio"],
                 p.output_key: output_records,
@@ -322,6 +379,55 @@ class TransformStep(RegisteredStep):
             return source_content
         return []
 
+    def _extract_parsed_records(
+        self,
+        parsed: Any,
+        provider: str | None,
+        data_type: str | None,
+    ) -> list[dict]:
+        """Extract records from a fetch step's already-parsed ``records``.
+
+        The parsed payload may be shared with the fetch cache, so later
+        stages build new dicts rather than modifying these.
+        """
+        if isinstance(parsed, (bytes, str)):
+            # Body was not JSON (e.g. CSV); FetchStep kept it as text
+            return self._extract_records(parsed, provider, data_type)
+        if provider and data_type:
+            try:
+                from zorivest_infra.market_data.response_extractors import (
+                    extract_parsed_records,
+                )
+
+                return extract_parsed_records(parsed, provider, data_type)
+            except ImportError:
+                pass  # Infrastructure not available
+        if isinstance(parsed, list):
+            return parsed
+        if isinstance(parsed, dict):
+            return [parsed]
+        return []
+
+    def _extract_parsed_columns(
+        self,
+        parsed: Any,
+        provider: str | None,
+        data_type: str | None,
+    ) -> dict[str, list] | None:
+        """Columns of a fetch step's parsed ``records``, if it has that shape.
+
+        None means the records have to be extracted row-wise instead.
+        """
+        if not provider or not data_type:
+            return None
+        try:
+            from zorivest_infra.market_data.response_extractors import (
+                extract_parsed_columns,
+            )
+        except ImportError:
+            return None  # Infrastructure not available
+        return extract_parsed_columns(parsed, provider, data_type)
+
     def _apply_mapping(
         self,
         records: list[dict],
@@ -371,12 +477,77 @@ class TransformStep(RegisteredStep):
             return records
 
         now = datetime.now(timezone.utc).isoformat()
-        for r in records:
-            if "provider" not in r:
-                r["provider"] = provider
-            if "timestamp" not in r:
-                r["timestamp"] = now
-        return records
+        # New dicts: the records may belong to a shared parsed payload
+        return [{"provider": provider, "timestamp": now, **r} for r in records]
+
+    def _apply_column_mapping(
+        self,
+        columns: dict[str, list],
+        provider: str | None,
+        data_type: str | None,
+    ) -> dict[str, Any]:
+        """Column-wise ``_apply_mapping``: same fields, renamed per column."""
+        if provider and data_type:
+            try:
+                from zorivest_infra.market_data.field_mappings import (
+                    FIELD_MAPPINGS,
+                    _PROVIDER_SLUG_MAP,
+                    apply_field_mapping_columns,
+                )
+
+                slug = _PROVIDER_SLUG_MAP.get(provider, provider)
+                if (slug, data_type) not in FIELD_MAPPINGS:
+                    return columns  # No mapping registered — pass through
+
+                return apply_field_mapping_columns(
+                    columns=columns,
+                    provider=provider,
+                    data_type=data_type,
+                )
+            except ImportError:
+                pass  # Infrastructure not available — skip mapping
+        return columns
+
+    def _enrich_columns(
+        self,
+        columns: dict[str, Any],
+        provider: str | None,
+    ) -> dict[str, Any]:
+        """Column-wise ``_enrich_records``: scalars that fill their column."""
+        if not provider:
+            return columns
+
+        now = datetime.now(timezone.utc).isoformat()
+        return {"provider": provider, "timestamp": now, **columns}
+
+    @staticmethod
+    def _columns_to_frame(columns: dict[str, Any], data_type: str | None) -> Any:
+        """Build the DataFrame from columns, casting known fields per column.
+
+        A column that cannot be cast is left as is for validation to reject.
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(columns)
+        for name, dtype in _COLUMN_DTYPES.get(data_type or "", {}).items():
+            if name in df.columns and df[name].dtype != dtype:
+                try:
+                    df[name] = df[name].astype(dtype)
+                except (TypeError, ValueError):
+                    pass
+        return df
+
+    @staticmethod
+    def _presentation_records(df: Any) -> list[dict]:
+        """Output records with presentation names, renamed per column (AC-6).
+
+        Falls back to renaming record by record when a target name is
+        already a column, so clashes resolve exactly as they always have.
+        """
+        renames = {k: v for k, v in _PRESENTATION_MAP.items() if k in df.columns}
+        if set(renames.values()) & set(df.columns):
+            return TransformStep._apply_presentation_mapping(df.to_dict("records"))
+        return df.rename(columns=renames).to_dict("records")
 
     @staticmethod
     def _apply_presentation_mapping(records: list[dict]) -> list[dict]:
@@ -399,7 +570,7 @@ class TransformStep(RegisteredStep):
         target_table: str,
         write_disposition: str,
         context: StepContext,
-    ) -> int:
+    ) -> Any:
         """Write validated data to the target table.
 
         Requires 'db_writer' in context.outputs. Raises ValueError
@@ -10,6 +10,8 @@ from __future__ import annotations
 from decimal import Decimal
 
 from zorivest_core.application.commands import CreateAccount, UpdateBalance
+from zorivest_core.application.dtos import AccountTradeStats
+from zorivest_core.application.pagination import CursorPage, decode_cursor, paginate
 from zorivest_core.application.ports import UnitOfWork
 from zorivest_core.domain.entities import Account, BalanceSnapshot
 from zorivest_core.domain.exceptions import (
@@ -194,9 +196,9 @@ class AccountService:
         """
         with self.uow:
             self._guard_not_found(account_id)
-            trades = self.uow.trades.list_for_account(account_id)
-            trade_count = len(trades)
-            total_realized_pnl = sum(t.realized_pnl for t in trades)
+            stats = self.uow.trades.stats_by_account([account_id]).get(
+                account_id, AccountTradeStats()
+            )
 
             # Round-trip count: use round_trips repo if available
             round_trip_count = 0
@@ -205,32 +207,39 @@ class AccountService:
                 round_trip_count = len(rts)
 
             # Win rate: % of trades with positive realized_pnl
-            winning_trades = sum(1 for t in trades if t.realized_pnl > 0)
-            win_rate = (winning_trades / trade_count * 100) if trade_count > 0 else 0.0
+            win_rate = (
+                (stats.winning_trades / stats.trade_count * 100)
+                if stats.trade_count > 0
+                else 0.0
+            )
 
             return {
-                "trade_count": trade_count,
+                "trade_count": stats.trade_count,
                 "round_trip_count": round_trip_count,
                 "win_rate": round(win_rate, 2),
-                "total_realized_pnl": round(total_realized_pnl, 2),
+                "total_realized_pnl": round(stats.total_realized_pnl, 2),
             }
 
     def get_trade_counts(self, account_ids: list[str]) -> dict[str, dict[str, int]]:
         """Return trade + plan counts for a batch of account IDs.
 
+        Two grouped queries regardless of how many accounts are asked for.
+
         Returns:
             dict mapping account_id -> {trade_count, plan_count}
         """
+        if not account_ids:
+            return {}
         with self.uow:
-            result: dict[str, dict[str, int]] = {}
-            for aid in account_ids:
-                trades = self.uow.trades.list_for_account(aid)
-                plan_count = self.uow.trade_plans.count_for_account(aid)
-                result[aid] = {
-                    "trade_count": len(trades) if trades else 0,
-                    "plan_count": plan_count or 0,
+            stats = self.uow.trades.stats_by_account(account_ids)
+            plan_counts = self.uow.trade_plans.count_by_account(account_ids)
+            return {
+                aid: {
+                    "trade_count": stats[aid].trade_count if aid in stats else 0,
+                    "plan_count": plan_counts.get(aid, 0),
                 }
-            return result
+                for aid in account_ids
+            }
 
     # ── Balance management ───────────────────────────────────────────────
 
@@ -271,6 +280,32 @@ class AccountService:
                 offset=offset,
             )
 
+    def list_balance_history_page(
+        self,
+        account_id: str,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> CursorPage[BalanceSnapshot]:
+        """Keyset page of balance snapshots, newest first.
+
+        Raises:
+            NotFoundError: If the account does not exist.
+            InvalidCursorError: If *cursor* is malformed.
+        """
+        kind = f"balances:{account_id}"
+        after = decode_cursor(kind, cursor) if cursor else None
+        with self.uow:
+            self._guard_not_found(account_id)
+            rows = self.uow.balance_snapshots.list_for_account_after(
+                account_id, limit=limit + 1, after=after
+            )
+            page = paginate(kind, rows, limit, key=lambda s: (s.datetime, s.id))
+            if include_total:
+                total = self.uow.balance_snapshots.count_for_account(account_id)
+                page = CursorPage(page.items, page.next_cursor, total)
+            return page
+
     def count_balance_history(self, account_id: str) -> int:
         """Return total count of balance snapshots for an account."""
         with self.uow:
@@ -281,6 +316,16 @@ class AccountService:
         with self.uow:
             return self.uow.balance_snapshots.get_latest(account_id)
 
+    def get_latest_balances(self, account_ids: list[str]) -> dict[str, BalanceSnapshot]:
+        """Return the most recent snapshot per account in a single query.
+
+        Accounts without snapshots are absent from the result.
+        """
+        if not account_ids:
+            return {}
+        with self.uow:
+            return self.uow.balance_snapshots.latest_for_accounts(account_ids)
+
     def get_portfolio_total(self) -> Decimal:
         """Return the sum of most recent balances across all accounts."""
         with self.uow:
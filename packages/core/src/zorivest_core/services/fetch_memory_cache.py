@@ -0,0 +1,237 @@
+"""In-process first tier in front of the SQLite fetch cache.
+
+``FetchCacheRepository`` consults a ``FetchMemoryCache`` before querying
+``fetch_cache``. The memory tier holds fresh entries only, each with its
+payload already decompressed and, once asked for, its parsed records, so a
+repeated fetch of the same entity skips the query, the decompression and
+the JSON parse. Upserts write through to it and ``invalidate`` drops from it.
+Hits answered here never touch ``fetch_cache.last_hit_at``, so the tier
+keeps their times until the repository writes them back in one batch.
+
+The tier is bounded by bytes. Each entry is charged for its text plus an
+estimate of its parsed form (``PARSED_SIZE_FACTOR`` times the text), and
+the least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any
+
+from zorivest_core.domain.pipeline import (
+    MARKET_CLOSED_TTL_MULTIPLIER,
+    MARKET_SENSITIVE_TYPES,
+    is_market_closed,
+)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Parsed JSON takes several times its text size as Python objects.
+PARSED_SIZE_FACTOR = 3
+
+
+def parse_records(content: bytes | str, provider: str, data_type: str) -> Any:
+    """Parse a response body for the ``records`` output.
+
+    Large Polygon aggs and Alpha Vantage time series bodies are read
+    incrementally straight into their bars, as FetchStep's gap path merges
+    them, instead of building the parse tree. Anything else is parsed
+    whole; a body that is not JSON is passed on as text. Fresh responses
+    and both cache tiers go through here, so they yield the same records.
+    """
+    try:
+        from zorivest_infra.market_data.response_extractors import stream_records
+
+        streamed = stream_records(content, provider, data_type)
+        if streamed is not None:
+            return streamed
+    except ImportError:
+        pass  # Infrastructure not available
+    text = content.decode("utf-8") if isinstance(content, bytes) else content
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text  # non-JSON → pass raw string
+
+
+@dataclass(eq=False)
+class CachedFetch:
+    """A fetch cache entry held in memory; quacks like ``FetchCacheModel``.
+
+    ``records`` is parsed on first access and shared by later hits, so
+    callers must treat it as read-only.
+    """
+
+    provider: str
+    data_type: str
+    entity_key: str
+    payload_json: str
+    content_hash: str
+    fetched_at: datetime
+    ttl_seconds: int
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def __post_init__(self) -> None:
+        # SQLite returns naive datetimes; they are UTC
+        if self.fetched_at.tzinfo is None:
+            self.fetched_at = self.fetched_at.replace(tzinfo=timezone.utc)
+
+    @cached_property
+    def records(self) -> Any:
+        """The payload parsed by ``parse_records``, as a database hit is."""
+        return parse_records(self.payload_json, self.provider, self.data_type)
+
+    @property
+    def size(self) -> int:
+        return len(self.payload_json) * (1 + PARSED_SIZE_FACTOR)
+
+    def is_fresh(self, now: datetime) -> bool:
+        """Same rule as FetchStep: TTL, stretched for market data while closed."""
+        ttl = self.ttl_seconds
+        if self.data_type in MARKET_SENSITIVE_TYPES and is_market_closed(now):
+            ttl *= MARKET_CLOSED_TTL_MULTIPLIER
+        return (now - self.fetched_at).total_seconds() <= ttl
+
+
+@dataclass(frozen=True)
+class TierCounters:
+    """Lookups answered (hits) and passed on (misses) by one tier."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class FetchTierStats:
+    """Snapshot of the memory tier and the lookups that reached the store."""
+
+    entries: int
+    bytes: int
+    max_bytes: int
+    evictions: int
+    memory: TierCounters = field(default_factory=TierCounters)
+    db: TierCounters = field(default_factory=TierCounters)
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """Per-tier counters and hit rates, for step output."""
+        return {
+            tier: {
+                "hits": counters.hits,
+                "misses": counters.misses,
+                "hit_rate": round(counters.hit_rate, 4),
+            }
+            for tier, counters in (("memory", self.memory), ("db", self.db))
+        }
+
+
+class FetchMemoryCache:
+    """Byte-bounded LRU of fresh fetch cache entries.
+
+    Args:
+        max_bytes: Upper bound on the summed ``CachedFetch.size``.
+        now: Wall clock returning an aware UTC datetime, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        *,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._now = now
+        # (provider, data_type, entity_key) → entry, least recently used first
+        self._entries: OrderedDict[tuple[str, str, str], CachedFetch] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._memory_hits = 0
+        self._memory_misses = 0
+        self._db_hits = 0
+        self._db_misses = 0
+        # key → time of the latest hit not yet written to last_hit_at
+        self._unrecorded_hits: dict[tuple[str, str, str], datetime] = {}
+
+    def get(self, provider: str, data_type: str, entity_key: str) -> CachedFetch | None:
+        """Return the fresh entry, or None (counted as a memory miss)."""
+        key = (provider, data_type, entity_key)
+        now = self._now()
+        entry = self._entries.get(key)
+        if entry is not None and not entry.is_fresh(now):
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self._memory_misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._memory_hits += 1
+        self._unrecorded_hits[key] = now
+        return entry
+
+    def take_hits(self) -> dict[tuple[str, str, str], datetime]:
+        """Latest hit time per key since the last call, then forget them."""
+        hits, self._unrecorded_hits = self._unrecorded_hits, {}
+        return hits
+
+    def put(self, entry: CachedFetch) -> bool:
+        """Store *entry* if it is fresh and fits; True when stored."""
+        key = (entry.provider, entry.data_type, entry.entity_key)
+        self._remove(key)
+        if entry.size > self._max_bytes or not entry.is_fresh(self._now()):
+            return False
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+        return True
+
+    def record_db_lookup(self, found: bool) -> None:
+        """Count a lookup the memory tier passed on to the database."""
+        if found:
+            self._db_hits += 1
+        else:
+            self._db_misses += 1
+
+    def invalidate(self, provider: str, data_type: str | None = None) -> int:
+        """Drop a provider's entries (optionally one data type); returns count."""
+        keys = [
+            key
+            for key in self._entries
+            if key[0] == provider and (data_type is None or key[1] == data_type)
+        ]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def discard(self, provider: str, data_type: str, entity_key: str) -> None:
+        self._remove((provider, data_type, entity_key))
+
+    def stats(self) -> FetchTierStats:
+        return FetchTierStats(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            max_bytes=self._max_bytes,
+            evictions=self._evictions,
+            memory=TierCounters(self._memory_hits, self._memory_misses),
+            db=TierCounters(self._db_hits, self._db_misses),
+        )
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
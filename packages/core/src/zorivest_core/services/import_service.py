@@ -8,14 +8,21 @@ file-parsing adapters live in infrastructure/broker_adapters/.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from collections.abc import Sequence
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
+from zorivest_core.application.commands import CreateTrade
+from zorivest_core.application.dtos import BulkTradeResult
 from zorivest_core.application.ports import BrokerFileAdapter, CSVBrokerAdapter
+from zorivest_core.domain import import_types
 from zorivest_core.domain.enums import BrokerType
-from zorivest_core.domain.import_types import ImportResult
+from zorivest_core.domain.import_types import ImportResult, RawExecution
+
+if TYPE_CHECKING:
+    from zorivest_core.services.trade_service import TradeService
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,55 @@ class UnknownBrokerFormat(Exception):
     """Raised when auto-detection cannot identify the broker format."""
 
 
+# Broker-native execution identifiers preserved in ``RawExecution.raw_data``.
+_RAW_EXEC_ID_KEYS = ("ibExecID", "execID", "tradeID", "transactionID")
+
+
+def execution_exec_id(execution: RawExecution) -> str:
+    """Return a stable exec_id for a parsed execution.
+
+    Uses the broker's own execution id when the adapter preserved one;
+    otherwise derives a deterministic id from the execution's fields so
+    re-importing the same file yields the same ids.
+    """
+    for key in _RAW_EXEC_ID_KEYS:
+        value = execution.raw_data.get(key, "").strip()
+        if value:
+            return value
+    payload = "|".join(
+        [
+            execution.broker.value,
+            execution.account_id,
+            execution.exec_time.isoformat(),
+            execution.symbol,
+            execution.side.value,
+            str(execution.quantity),
+            str(execution.price),
+            execution.order_id or "",
+        ]
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+    return f"{execution.broker.value}-{digest}"
+
+
+def execution_to_command(execution: RawExecution) -> CreateTrade:
+    """Map a canonical ``RawExecution`` to a ``CreateTrade`` command.
+
+    Raises:
+        ValueError: If the execution violates CreateTrade invariants.
+    """
+    return CreateTrade(
+        exec_id=execution_exec_id(execution),
+        time=execution.exec_time,
+        instrument=execution.symbol,
+        action=execution.side,
+        quantity=float(execution.quantity),
+        price=float(execution.price),
+        account_id=execution.account_id,
+        commission=float(execution.commission + execution.fees),
+    )
+
+
 class ImportService:
     """Orchestrates file import by routing to the correct adapter.
 
@@ -83,6 +139,32 @@ class ImportService:
 
         raise UnknownBrokerFormat(f"Unsupported file extension: {suffix}")
 
+    def import_trades(
+        self,
+        file_path: Path,
+        trade_service: TradeService,
+        broker_hint: BrokerType | None = None,
+    ) -> tuple[ImportResult, BulkTradeResult]:
+        """Parse a broker file and ingest its executions in one bulk call.
+
+        Executions that cannot become a ``CreateTrade`` are appended to the
+        ImportResult errors; the rest go to
+        ``TradeService.create_trades_bulk``.
+
+        Returns:
+            The parse result and the per-row ingestion result.
+        """
+        result = self.import_file(file_path, broker_hint=broker_hint)
+        commands: list[CreateTrade] = []
+        for execution in result.executions:
+            try:
+                commands.append(execution_to_command(execution))
+            except ValueError as exc:
+                result.errors.append(
+                    import_types.ImportError(field="execution", message=str(exc))
+                )
+        return result, trade_service.create_trades_bulk(commands)
+
     def auto_detect_csv_broker(self, file_path: Path) -> BrokerType:
         """Read CSV headers and try each parser's detect() method.
 
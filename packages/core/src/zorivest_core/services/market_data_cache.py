@@ -0,0 +1,183 @@
+"""In-process cache for MarketDataService quote, news and search lookups.
+
+Entries live for the data type's ``FRESHNESS_TTL`` (``CACHE_TTL`` adds
+``search``), stretched by ``MARKET_CLOSED_TTL_MULTIPLIER`` for quotes while
+US markets are closed. Concurrent lookups of the same key share one
+provider request (single-flight), and the cache holds at most
+``max_entries`` values, evicting the least recently used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from zorivest_core.domain.pipeline import (
+    FRESHNESS_TTL,
+    MARKET_CLOSED_TTL_MULTIPLIER,
+    MARKET_SENSITIVE_TYPES,
+    is_market_closed,
+)
+
+T = TypeVar("T")
+
+# TTL in seconds per cached data type; symbol search results rarely change.
+CACHE_TTL: dict[str, int] = {**FRESHNESS_TTL, "search": 3600}
+
+DEFAULT_MAX_ENTRIES = 2048
+
+
+@dataclass
+class CacheCounters:
+    """Lookup outcomes for one data type."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # waited on another caller's in-flight fetch
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache occupancy and counters."""
+
+    size: int
+    max_entries: int
+    in_flight: int
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    by_type: dict[str, CacheCounters] = field(default_factory=dict)
+
+
+class MarketDataCache:
+    """Bounded TTL cache with single-flight fetches (one event loop).
+
+    Args:
+        max_entries: LRU bound on stored values.
+        ttls: TTL in seconds per data type (default ``CACHE_TTL``).
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        *,
+        ttls: Mapping[str, int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttls = dict(ttls or CACHE_TTL)
+        self._clock = clock
+        # key → (expires_at, value), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._counters: dict[str, CacheCounters] = {}
+        self._evictions = 0
+
+    def get(self, data_type: str, key: Hashable) -> Any | None:
+        """Return the fresh cached value, or None (counted as a miss)."""
+        counters = self._counters_for(data_type)
+        value = self._lookup((data_type, key))
+        if value is None:
+            counters.misses += 1
+        else:
+            counters.hits += 1
+        return value
+
+    def put(self, data_type: str, key: Hashable, value: Any) -> None:
+        """Store *value* under the data type's TTL."""
+        full_key = (data_type, key)
+        self._entries[full_key] = (self._clock() + self._ttl(data_type), value)
+        self._entries.move_to_end(full_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def get_or_fetch(
+        self,
+        data_type: str,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Return the cached value or run *fetch* once for all waiters.
+
+        Failures are not cached: every waiter sees the exception and the
+        next lookup fetches again.
+        """
+        full_key = (data_type, key)
+        counters = self._counters_for(data_type)
+        value = self._lookup(full_key)
+        if value is not None:
+            counters.hits += 1
+            return value
+
+        task = self._in_flight.get(full_key)
+        if task is not None:
+            counters.coalesced += 1
+        else:
+            counters.misses += 1
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[full_key] = task
+            task.add_done_callback(lambda t: self._settle(data_type, key, full_key, t))
+        # shield: one waiter's cancellation must not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def stats(self) -> CacheStats:
+        """Current size and counters (totals and per data type)."""
+        by_type = {
+            data_type: CacheCounters(c.hits, c.misses, c.coalesced)
+            for data_type, c in self._counters.items()
+        }
+        return CacheStats(
+            size=len(self._entries),
+            max_entries=self._max_entries,
+            in_flight=len(self._in_flight),
+            hits=sum(c.hits for c in by_type.values()),
+            misses=sum(c.misses for c in by_type.values()),
+            coalesced=sum(c.coalesced for c in by_type.values()),
+            evictions=self._evictions,
+            by_type=by_type,
+        )
+
+    def clear(self) -> None:
+        """Drop every stored value (counters are kept)."""
+        self._entries.clear()
+
+    def _lookup(self, full_key: Hashable) -> Any | None:
+        entry = self._entries.get(full_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[full_key]
+            return None
+        self._entries.move_to_end(full_key)
+        return value
+
+    def _settle(
+        self,
+        data_type: str,
+        key: Hashable,
+        full_key: Hashable,
+        task: asyncio.Task[Any],
+    ) -> None:
+        self._in_flight.pop(full_key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if result is not None:
+            self.put(data_type, key, result)
+
+    def _ttl(self, data_type: str) -> float:
+        ttl = self._ttls.get(data_type, FRESHNESS_TTL["quote"])
+        if data_type in MARKET_SENSITIVE_TYPES and is_market_closed():
+            ttl *= MARKET_CLOSED_TTL_MULTIPLIER
+        return ttl
+
+    def _counters_for(self, data_type: str) -> CacheCounters:
+        return self._counters.setdefault(data_type, CacheCounters())
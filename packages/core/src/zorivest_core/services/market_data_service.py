@@ -13,10 +13,12 @@ Source: docs/build-plan/08a-market-data-expansion.md §8a.9/§8a.10.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Callable, Mapping, Protocol
+from time import monotonic
+from typing import Any, Awaitable, Callable, Mapping, Protocol, Sequence, TypeVar
 
 from zorivest_core.application.market_dtos import (
     MarketNewsItem,
@@ -35,15 +37,60 @@ from zorivest_core.application.market_expansion_dtos import (
     StockSplit,
 )
 from zorivest_core.domain.market_data import ProviderConfig
+from zorivest_core.domain.market_history import is_fresh, missing_ohlcv_ranges
+from zorivest_core.services.market_data_cache import CacheStats, MarketDataCache
+from zorivest_core.services.provider_health import ProviderHealthTracker
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Health-tracker name for the zero-config Yahoo Finance path.
+_YAHOO = "Yahoo Finance"
+
+# Sorts before any real fetch time (backfilled rows have none).
+_NEVER = datetime.min.replace(tzinfo=timezone.utc)
+
+# Yahoo chart ``range`` values in calendar days, for read-through windows.
+_RANGE_DAYS = {
+    "1d": 1,
+    "5d": 7,
+    "1mo": 31,
+    "3mo": 92,
+    "6mo": 183,
+    "1y": 366,
+    "2y": 731,
+    "5y": 1827,
+    "10y": 3653,
+}
+
+# Symbols per batch quote request (well under every provider's URL limits).
+_QUOTE_BATCH_SIZE = 100
+
+# Concurrent single-symbol fallbacks in get_quotes().
+_QUOTE_FALLBACK_CONCURRENCY = 8
+
 
 # ── Exceptions ──────────────────────────────────────────────────────────
 
 
 class MarketDataError(Exception):
-    """Raised when a market data request cannot be fulfilled."""
+    """Raised when a market data request cannot be fulfilled.
+
+    ``status_code`` is set when a provider answered with a non-200 status,
+    and ``retry_after`` to its raw ``Retry-After`` header, if any.
+    """
+
+    def __init__(
+        self,
+        message: str = "",
+        *,
+        status_code: int | None = None,
+        retry_after: str | None = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 # ── Protocols (same as ProviderConnectionService) ───────────────────────
@@ -77,6 +124,11 @@ class RateLimiterProtocol(Protocol):
     async def wait_if_needed(self) -> None: ...
 
 
+# Optional limiter hook: limiters that adapt to provider responses (the
+# shared rate budget) also define
+#     async def record_response(self, status_code: int, retry_after: str | None) -> None
+
+
 # ── Service ─────────────────────────────────────────────────────────────
 
 
@@ -90,10 +142,20 @@ class MarketDataService:
         rate_limiters: Per-provider rate limiters.
         provider_registry: Static provider configuration registry.
         quote_normalizers: Maps provider name → quote normalizer function.
+        batch_quote_normalizers: Maps provider name → multi-symbol quote
+            normalizer, for providers whose URL builder batches symbols.
         news_normalizers: Maps provider name → news normalizer function.
         search_normalizers: Maps provider name → search normalizer function.
         normalizers: Generic normalizer registry for Layer 4+ data types.
             Maps data_type → {provider_name → normalizer_function}.
+        read_through: Serve daily OHLCV, fundamentals, dividends and splits
+            from ``uow.market_history`` and fetch only what is missing or
+            stale (see zorivest_core.domain.market_history).
+        cache: In-process cache for quotes, news and search results;
+            concurrent lookups of the same key share one provider call.
+        health: Per-provider latency/error tracker. Fallback chains are
+            ordered by its ``rank`` and providers with an open circuit are
+            skipped without a request.
     """
 
     # Data types that support Yahoo Finance as first-try source.
@@ -107,11 +169,16 @@ class MarketDataService:
         rate_limiters: Mapping[str, RateLimiterProtocol],
         provider_registry: dict[str, ProviderConfig],
         quote_normalizers: dict[str, Callable[..., MarketQuote]] | None = None,
+        batch_quote_normalizers: dict[str, Callable[..., list[MarketQuote]]]
+        | None = None,
         news_normalizers: dict[str, Callable[..., list[MarketNewsItem]]] | None = None,
         search_normalizers: dict[str, Callable[..., list[TickerSearchResult]]]
         | None = None,
         sec_normalizer: Callable[..., list[SecFiling]] | None = None,
         normalizers: dict[str, dict[str, Callable[..., Any]]] | None = None,
+        read_through: bool = False,
+        cache: MarketDataCache | None = None,
+        health: ProviderHealthTracker | None = None,
     ) -> None:
         self._uow = uow
         self._encryption = encryption
@@ -119,10 +186,14 @@ class MarketDataService:
         self._rate_limiters = rate_limiters
         self._registry = provider_registry
         self._quote_normalizers = quote_normalizers or {}
+        self._batch_quote_normalizers = batch_quote_normalizers or {}
         self._news_normalizers = news_normalizers or {}
         self._search_normalizers = search_normalizers or {}
         self._sec_normalizer = sec_normalizer
         self._normalizers = normalizers or {}
+        self._read_through = read_through
+        self._cache = cache
+        self._health = health
 
     # ── Core queries ────────────────────────────────────────────────
 
@@ -133,9 +204,18 @@ class MarketDataService:
         Falls back to configured providers (Finnhub, Alpha Vantage, etc.) if Yahoo fails.
         Implements MarketDataPort.get_quote.
         """
+        if self._cache is None:
+            return await self._fetch_quote(ticker)
+        return await self._cache.get_or_fetch(
+            "quote", ticker.upper(), lambda: self._fetch_quote(ticker)
+        )
+
+    async def _fetch_quote(self, ticker: str) -> MarketQuote:
         # Yahoo Finance is always tried first — no API key needed
         try:
-            yahoo_quote = await self._yahoo_quote(ticker)
+            yahoo_quote = await self._call_provider(
+                _YAHOO, lambda: self._yahoo_quote(ticker)
+            )
             if yahoo_quote:
                 return yahoo_quote
         except Exception as exc:
@@ -152,7 +232,9 @@ class MarketDataService:
         last_error = ""
         for name, setting in providers:
             try:
-                data = await self._fetch_quote_data(name, ticker, setting)
+                data = await self._call_provider(
+                    name, lambda: self._fetch_quote_data(name, ticker, setting)
+                )
                 normalizer = self._quote_normalizers[name]
 
                 # Finnhub normalizer needs ticker passed explicitly
@@ -169,6 +251,82 @@ class MarketDataService:
             f"All providers failed for quote '{ticker}'. Last error: {last_error}"
         )
 
+    async def get_quotes(self, tickers: Sequence[str]) -> dict[str, MarketQuote]:
+        """Get quotes for many tickers with as few provider calls as possible.
+
+        Tickers go to batch-capable providers first, one request per chunk
+        of _QUOTE_BATCH_SIZE symbols, in normalizer priority order. Only
+        tickers no batch response covered fall back to the single-symbol
+        chain one at a time (Yahoo first, as in ``get_quote``). Each ticker
+        is looked up in the cache once, so counts one hit or one miss.
+
+        Returns:
+            Quotes keyed by requested ticker, in request order. Tickers no
+            provider could quote are absent.
+        """
+        wanted = list(dict.fromkeys(tickers))
+        found: dict[str, MarketQuote] = {}
+        if self._cache is not None:
+            for ticker in wanted:
+                cached = self._cache.get("quote", ticker.upper())
+                if cached is not None:
+                    found[ticker] = cached
+
+        pending = [t for t in wanted if t not in found]
+        providers = self._get_enabled_providers(self._batch_quote_normalizers)
+        for name, setting in providers:
+            if not pending:
+                break
+            normalizer = self._batch_quote_normalizers[name]
+            for i in range(0, len(pending), _QUOTE_BATCH_SIZE):
+                chunk = pending[i : i + _QUOTE_BATCH_SIZE]
+                try:
+                    data = await self._call_provider(
+                        name,
+                        lambda: self._generic_api_fetch(
+                            name, "quote", ",".join(chunk), setting, symbols=chunk
+                        ),
+                    )
+                    quotes = normalizer(data)
+                except Exception as exc:
+                    logger.warning(
+                        "Provider %s failed for batch quote (%d symbols): %s",
+                        name,
+                        len(chunk),
+                        exc,
+                    )
+                    continue
+                by_symbol = {q.ticker.upper(): q for q in quotes}
+                for ticker in chunk:
+                    quote = by_symbol.get(ticker.upper())
+                    if quote is not None:
+                        found[ticker] = quote
+                        if self._cache is not None:
+                            self._cache.put("quote", ticker.upper(), quote)
+            pending = [t for t in pending if t not in found]
+
+        if pending:
+            limit = asyncio.Semaphore(_QUOTE_FALLBACK_CONCURRENCY)
+
+            async def single(ticker: str) -> MarketQuote | None:
+                async with limit:
+                    try:
+                        # Already a counted cache miss: skip get_quote's lookup
+                        quote = await self._fetch_quote(ticker)
+                    except MarketDataError as exc:
+                        logger.warning("No quote for %s: %s", ticker, exc)
+                        return None
+                    if self._cache is not None:
+                        self._cache.put("quote", ticker.upper(), quote)
+                    return quote
+
+            results = await asyncio.gather(*(single(t) for t in pending))
+            for ticker, quote in zip(pending, results):
+                if quote is not None:
+                    found[ticker] = quote
+
+        return {t: found[t] for t in wanted if t in found}
+
     async def get_news(
         self, ticker: str | None = None, count: int = 5
     ) -> list[MarketNewsItem]:
@@ -176,6 +334,14 @@ class MarketDataService:
 
         Implements MarketDataPort.get_news.
         """
+        if self._cache is None:
+            return await self._fetch_news(ticker, count)
+        key = (ticker.upper() if ticker else None, count)
+        return await self._cache.get_or_fetch(
+            "news", key, lambda: self._fetch_news(ticker, count)
+        )
+
+    async def _fetch_news(self, ticker: str | None, count: int) -> list[MarketNewsItem]:
         providers = self._get_enabled_providers(self._news_normalizers)
         if not providers:
             raise MarketDataError("No news provider available — configure Finnhub")
@@ -183,7 +349,9 @@ class MarketDataService:
         last_error = ""
         for name, setting in providers:
             try:
-                data = await self._fetch_news_data(name, ticker, count, setting)
+                data = await self._call_provider(
+                    name, lambda: self._fetch_news_data(name, ticker, count, setting)
+                )
                 normalizer = self._news_normalizers[name]
                 return normalizer(data)
 
@@ -203,9 +371,18 @@ class MarketDataService:
         Falls back to configured providers (FMP, Alpha Vantage) if Yahoo fails.
         Implements MarketDataPort.search_ticker.
         """
+        if self._cache is None:
+            return await self._search(query)
+        return await self._cache.get_or_fetch(
+            "search", query.strip().lower(), lambda: self._search(query)
+        )
+
+    async def _search(self, query: str) -> list[TickerSearchResult]:
         # Yahoo Finance is always tried first — no API key, no provider settings needed
         try:
-            yahoo_results = await self._yahoo_search(query)
+            yahoo_results = await self._call_provider(
+                _YAHOO, lambda: self._yahoo_search(query)
+            )
             if yahoo_results:
                 return yahoo_results
         except Exception as exc:
@@ -221,7 +398,9 @@ class MarketDataService:
         last_error = ""
         for name, setting in providers:
             try:
-                data = await self._fetch_search_data(name, query, setting)
+                data = await self._call_provider(
+                    name, lambda: self._fetch_search_data(name, query, setting)
+                )
                 normalizer = self._search_normalizers[name]
                 return normalizer(data)
 
@@ -234,6 +413,10 @@ class MarketDataService:
             f"All providers failed for search '{query}'. Last error: {last_error}"
         )
 
+    def cache_stats(self) -> CacheStats | None:
+        """Quote/news/search cache counters, or None without a cache."""
+        return self._cache.stats() if self._cache is not None else None
+
     async def _yahoo_search(self, query: str) -> list[TickerSearchResult]:
         """Search Yahoo Finance (no API key required) — MEU-91 zero-config fallback.
 
@@ -256,7 +439,9 @@ class MarketDataService:
         )
         if response.status_code != 200:
             raise MarketDataError(
-                f"Yahoo Finance search returned {response.status_code}"
+                f"Yahoo Finance search returned {response.status_code}",
+                status_code=response.status_code,
+                retry_after=_retry_after(response),
             )
         quotes = response.json().get("quotes", [])
         return [
@@ -293,6 +478,7 @@ class MarketDataService:
             url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10
         )
         if response.status_code != 200:
+            _raise_if_unavailable(response, "Yahoo Finance quote")
             return None
 
         data = response.json()
@@ -389,6 +575,10 @@ class MarketDataService:
 
         Source: §8a.9 — MEU-190.
         """
+        if self._read_through and interval == "1d":
+            window = _requested_window(kwargs)
+            if window is not None:
+                return await self._read_through_ohlcv(ticker, *window)
         result = await self._fetch_data_type(
             "ohlcv", ticker, interval=interval, **kwargs
         )
@@ -403,6 +593,13 @@ class MarketDataService:
 
         Source: §8a.9 — MEU-190.
         """
+        if self._read_through and "provider" not in kwargs:
+            return await self._read_through_fundamentals(ticker, **kwargs)
+        return await self._fetch_fundamentals(ticker, **kwargs)
+
+    async def _fetch_fundamentals(
+        self, ticker: str, **kwargs: Any
+    ) -> FundamentalsSnapshot:
         result = await self._fetch_data_type("fundamentals", ticker, **kwargs)
         if not isinstance(result, FundamentalsSnapshot):
             raise MarketDataError(f"Unexpected fundamentals result type for '{ticker}'")
@@ -423,6 +620,8 @@ class MarketDataService:
 
         Source: §8a.10 — MEU-191.
         """
+        if self._read_through and "provider" not in kwargs:
+            return await self._read_through_events("dividends", ticker, **kwargs)
         result = await self._fetch_data_type("dividends", ticker, **kwargs)
         if not isinstance(result, list):
             raise MarketDataError(f"Unexpected dividends result type for '{ticker}'")
@@ -433,6 +632,8 @@ class MarketDataService:
 
         Source: §8a.10 — MEU-191.
         """
+        if self._read_through and "provider" not in kwargs:
+            return await self._read_through_events("splits", ticker, **kwargs)
         result = await self._fetch_data_type("splits", ticker, **kwargs)
         if not isinstance(result, list):
             raise MarketDataError(f"Unexpected splits result type for '{ticker}'")
@@ -473,6 +674,115 @@ class MarketDataService:
             )
         return result
 
+    # ── Read-through local store ────────────────────────────────────
+
+    def _stored_ohlcv(
+        self, ticker: str, start: date, end: date
+    ) -> dict[date, tuple[OHLCVBar, datetime | None]]:
+        """Stored daily bars keyed by UTC date, newest fetch winning."""
+        lo = datetime.combine(start, time(), timezone.utc)
+        hi = datetime.combine(end + timedelta(days=1), time(), timezone.utc)
+        with self._uow as uow:
+            rows = uow.market_history.list_ohlcv(ticker, lo, hi)
+        by_day: dict[date, tuple[OHLCVBar, datetime | None]] = {}
+        for bar, fetched_at in rows:
+            day = bar.timestamp.astimezone(timezone.utc).date()
+            current = by_day.get(day)
+            if current is None or (fetched_at or _NEVER) > (current[1] or _NEVER):
+                by_day[day] = (bar, fetched_at)
+        return by_day
+
+    async def _read_through_ohlcv(
+        self, ticker: str, start: date, end: date
+    ) -> list[OHLCVBar]:
+        """Serve [start, end] daily bars from the store, fetching only the gaps.
+
+        A failed gap fetch is logged and the stored bars are served; it only
+        raises when nothing is stored for the range.
+        """
+        now = datetime.now(timezone.utc)
+        stored = self._stored_ohlcv(ticker, start, end)
+        windows = missing_ohlcv_ranges(
+            start, end, {day: row[1] for day, row in stored.items()}, now
+        )
+        fetched: list[OHLCVBar] = []
+        for first, last in windows:
+            try:
+                result = await self._fetch_data_type(
+                    "ohlcv",
+                    ticker,
+                    interval="1d",
+                    date_range={
+                        "start_date": first.isoformat(),
+                        "end_date": last.isoformat(),
+                    },
+                )
+            except MarketDataError as exc:
+                if not stored:
+                    raise
+                logger.warning(
+                    "OHLCV gap %s..%s for %s not fetched, serving stored bars: %s",
+                    first,
+                    last,
+                    ticker,
+                    exc,
+                )
+                continue
+            if isinstance(result, list):
+                fetched.extend(result)
+
+        if fetched:
+            with self._uow as uow:
+                uow.market_history.save_ohlcv(fetched, now)
+                uow.commit()
+            stored = self._stored_ohlcv(ticker, start, end)
+        return [stored[day][0] for day in sorted(stored)]
+
+    async def _read_through_fundamentals(
+        self, ticker: str, **kwargs: Any
+    ) -> FundamentalsSnapshot:
+        now = datetime.now(timezone.utc)
+        with self._uow as uow:
+            cached = uow.market_history.get_fundamentals(ticker)
+        if cached is not None and is_fresh("fundamentals", cached.timestamp, now):
+            return cached
+        try:
+            result = await self._fetch_fundamentals(ticker, **kwargs)
+        except MarketDataError as exc:
+            if cached is None:
+                raise
+            logger.warning("Serving stale fundamentals for %s: %s", ticker, exc)
+            return cached
+        with self._uow as uow:
+            uow.market_history.save_fundamentals(result, now)
+            uow.commit()
+        return result
+
+    async def _read_through_events(
+        self, data_type: str, ticker: str, **kwargs: Any
+    ) -> Any:
+        """Read-through for ``dividends``/``splits``, refreshed per HISTORY_TTL."""
+        now = datetime.now(timezone.utc)
+        with self._uow as uow:
+            store = uow.market_history
+            fetched_at = store.last_fetched(data_type, ticker)
+            cached = getattr(store, f"list_{data_type}")(ticker)
+        if cached and is_fresh(data_type, fetched_at, now):
+            return cached
+        try:
+            result = await self._fetch_data_type(data_type, ticker, **kwargs)
+        except MarketDataError as exc:
+            if not cached:
+                raise
+            logger.warning("Serving stale %s for %s: %s", data_type, ticker, exc)
+            return cached
+        if not isinstance(result, list):
+            raise MarketDataError(f"Unexpected {data_type} result type for '{ticker}'")
+        with self._uow as uow:
+            getattr(uow.market_history, f"save_{data_type}")(result, now)
+            uow.commit()
+        return result
+
     # ── Generic data-type fetch with fallback ───────────────────────
 
     async def _fetch_data_type(self, data_type: str, ticker: str, **kwargs: Any) -> Any:
@@ -487,7 +797,9 @@ class MarketDataService:
             yahoo_method = getattr(self, f"_yahoo_{data_type}", None)
             if yahoo_method:
                 try:
-                    result = await yahoo_method(ticker, **kwargs)
+                    result = await self._call_provider(
+                        _YAHOO, lambda: yahoo_method(ticker, **kwargs)
+                    )
                     if result:
                         return result
                 except Exception as exc:
@@ -509,12 +821,11 @@ class MarketDataService:
         last_error = ""
         for name, setting in providers:
             try:
-                data = await self._generic_api_fetch(
+                data = await self._call_provider(
                     name,
-                    data_type,
-                    ticker,
-                    setting,
-                    criteria=kwargs,
+                    lambda: self._generic_api_fetch(
+                        name, data_type, ticker, setting, criteria=kwargs
+                    ),
                 )
                 normalizer = type_normalizers[name]
                 return normalizer(data, ticker=ticker)
@@ -540,18 +851,21 @@ class MarketDataService:
         ticker: str,
         setting: Any,
         criteria: dict[str, Any] | None = None,
+        symbols: list[str] | None = None,
     ) -> Any:
         """Fetch raw data from an API-key provider.
 
         Uses provider-specific URL builders from the url_builders registry
         and injects authentication based on the provider's auth_method.
         Supports POST-body providers via builder.build_request() when available.
+        ``symbols`` overrides ``[ticker]`` for builders that batch symbols.
         """
         from zorivest_infra.market_data.url_builders import get_url_builder
 
         api_key = self._encryption.decrypt(setting.encrypted_api_key)
         config = self._registry[name]
         resolved_criteria = criteria or {}
+        tickers = symbols if symbols is not None else [ticker]
 
         limiter = self._rate_limiters.get(name)
         if limiter:
@@ -569,7 +883,7 @@ class MarketDataService:
             spec = build_request_fn(
                 config.base_url,
                 data_type,
-                [ticker],
+                tickers,
                 resolved_criteria,
             )
             url = spec.url
@@ -579,7 +893,7 @@ class MarketDataService:
             url = builder.build_url(
                 config.base_url,
                 data_type,
-                [ticker],
+                tickers,
                 resolved_criteria,
             )
 
@@ -601,7 +915,9 @@ class MarketDataService:
 
         if response.status_code != 200:
             raise MarketDataError(
-                f"{name} returned status {response.status_code} for {ticker}"
+                f"{name} returned status {response.status_code} for {ticker}",
+                status_code=response.status_code,
+                retry_after=_retry_after(response),
             )
         return response.json()
 
@@ -610,16 +926,33 @@ class MarketDataService:
     async def _yahoo_ohlcv(
         self, ticker: str, interval: str = "1d", **kwargs: Any
     ) -> list[OHLCVBar] | None:
-        """Fetch OHLCV bars from Yahoo Finance v8/finance/chart."""
-        period = kwargs.get("range", "1mo")
+        """Fetch OHLCV bars from Yahoo Finance v8/finance/chart.
+
+        An ISO ``date_range`` (inclusive) is sent as epoch ``period1``/
+        ``period2``; otherwise the chart ``range`` (default ``1mo``) is used.
+        """
+        date_range = kwargs.get("date_range") or {}
+        if date_range.get("start_date"):
+            first = date.fromisoformat(date_range["start_date"])
+            last = date.fromisoformat(date_range.get("end_date") or first.isoformat())
+            period1 = int(datetime.combine(first, time(), timezone.utc).timestamp())
+            period2 = int(
+                datetime.combine(
+                    last + timedelta(days=1), time(), timezone.utc
+                ).timestamp()
+            )
+            span = f"period1={period1}&period2={period2}"
+        else:
+            span = f"range={kwargs.get('range', '1mo')}"
         url = (
             f"https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
-            f"?interval={interval}&range={period}"
+            f"?interval={interval}&{span}"
         )
         response = await self._http.get(
             url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10
         )
         if response.status_code != 200:
+            _raise_if_unavailable(response, "Yahoo Finance ohlcv")
             return None
 
         data = response.json()
@@ -678,6 +1011,7 @@ class MarketDataService:
             url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10
         )
         if response.status_code != 200:
+            _raise_if_unavailable(response, "Yahoo Finance fundamentals")
             return None
 
         data = response.json()
@@ -727,6 +1061,7 @@ class MarketDataService:
             url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10
         )
         if response.status_code != 200:
+            _raise_if_unavailable(response, "Yahoo Finance dividends")
             return None
 
         data = response.json()
@@ -769,6 +1104,7 @@ class MarketDataService:
             url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10
         )
         if response.status_code != 200:
+            _raise_if_unavailable(response, "Yahoo Finance splits")
             return None
 
         data = response.json()
@@ -808,7 +1144,8 @@ class MarketDataService:
     ) -> list[tuple[str, Any]]:
         """Return enabled providers that have both API keys and normalizers.
 
-        Returns providers in normalizer dict insertion order (spec priority).
+        Returns providers in normalizer dict insertion order (spec priority),
+        reordered by observed latency and health when a tracker is set.
         """
         settings = self._get_all_settings()
         result: list[tuple[str, Any]] = []
@@ -818,8 +1155,61 @@ class MarketDataService:
             if setting and setting.is_enabled and setting.encrypted_api_key:
                 result.append((name, setting))
 
+        if self._health is not None:
+            by_name = dict(result)
+            result = [(n, by_name[n]) for n in self._health.rank(list(by_name))]
         return result
 
+    async def _call_provider(self, name: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Run one provider request, recording its latency and outcome.
+
+        Raises MarketDataError without calling *fetch* while the
+        provider's circuit is open. Only provider faults (429, 5xx,
+        timeouts) count as failures; a request the provider answered with
+        another error leaves the circuit closed. The response status is
+        reported to the provider's limiter when it adapts to responses; a
+        call that returns None reports nothing.
+        """
+        health = self._health
+        if health is not None and not health.acquire(name):
+            raise MarketDataError(f"{name} skipped: circuit open")
+        start = monotonic()
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            if health is not None:
+                health.release(name)
+            raise
+        except Exception as exc:
+            status = getattr(exc, "status_code", None)
+            if health is not None:
+                if _is_provider_fault(exc):
+                    health.record_failure(
+                        name, monotonic() - start, rate_limited=status == 429
+                    )
+                else:
+                    # The provider answered; only this request was bad.
+                    health.record_success(name, monotonic() - start)
+            if status is not None:
+                await self._report_response(
+                    name, status, getattr(exc, "retry_after", None)
+                )
+            raise
+        if health is not None:
+            health.record_success(name, monotonic() - start)
+        if result is not None:
+            # None means the fetcher swallowed a non-200 (or found nothing);
+            # its status is unknown here, so it must not raise the budget.
+            await self._report_response(name, 200)
+        return result
+
+    async def _report_response(
+        self, name: str, status_code: int, retry_after: str | None = None
+    ) -> None:
+        record = getattr(self._rate_limiters.get(name), "record_response", None)
+        if record is not None:
+            await record(status_code, retry_after)
+
     async def _fetch_quote_data(self, name: str, ticker: str, setting: Any) -> Any:
         """Fetch quote data from a provider."""
         api_key = self._encryption.decrypt(setting.encrypted_api_key)
@@ -851,7 +1241,9 @@ class MarketDataService:
 
         if response.status_code != 200:
             raise MarketDataError(
-                f"{name} returned status {response.status_code} for {ticker}"
+                f"{name} returned status {response.status_code} for {ticker}",
+                status_code=response.status_code,
+                retry_after=_retry_after(response),
             )
 
         return response.json()
@@ -884,7 +1276,9 @@ class MarketDataService:
 
         if response.status_code != 200:
             raise MarketDataError(
-                f"{name} returned status {response.status_code} for news"
+                f"{name} returned status {response.status_code} for news",
+                status_code=response.status_code,
+                retry_after=_retry_after(response),
             )
 
         return response.json()
@@ -913,7 +1307,74 @@ class MarketDataService:
 
         if response.status_code != 200:
             raise MarketDataError(
-                f"{name} returned status {response.status_code} for search"
+                f"{name} returned status {response.status_code} for search",
+                status_code=response.status_code,
+                retry_after=_retry_after(response),
             )
 
         return response.json()
+
+
+def _retry_after(response: Any) -> str | None:
+    headers = getattr(response, "headers", None)
+    return headers.get("Retry-After") if headers is not None else None
+
+
+def _is_unavailable(status_code: int) -> bool:
+    """True for statuses that say the provider, not the request, failed."""
+    return status_code == 429 or status_code >= 500
+
+
+def _raise_if_unavailable(response: Any, source: str) -> None:
+    """Raise MarketDataError for a 429 or 5xx *response*.
+
+    Keyless Yahoo fetchers return None for other non-200 statuses (e.g. an
+    unknown symbol), but these must reach the circuit breaker.
+    """
+    if _is_unavailable(response.status_code):
+        raise MarketDataError(
+            f"{source} returned status {response.status_code}",
+            status_code=response.status_code,
+            retry_after=_retry_after(response),
+        )
+
+
+def _is_provider_fault(exc: Exception) -> bool:
+    """True when *exc* counts against the provider's circuit.
+
+    Rate limits, server errors and requests that got no response
+    (timeouts, connection errors) do. Other HTTP statuses, such as a 404
+    for an unknown symbol, and errors about the returned data do not.
+    """
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return _is_unavailable(status)
+    return not isinstance(exc, MarketDataError)
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).date() if value.tzinfo else value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _requested_window(kwargs: Mapping[str, Any]) -> tuple[date, date] | None:
+    """Inclusive UTC date window of a daily OHLCV request, if it has one.
+
+    Requests pinned to a provider or a row ``limit``, and open-ended chart
+    ranges (``max``), are not served from the store.
+    """
+    if "provider" in kwargs or "limit" in kwargs:
+        return None
+    today = datetime.now(timezone.utc).date()
+    end = _as_date(kwargs["end_date"]) if kwargs.get("end_date") else today
+    if kwargs.get("start_date"):
+        return _as_date(kwargs["start_date"]), end
+    span = kwargs.get("range", "1mo")
+    if span == "ytd":
+        return date(end.year, 1, 1), end
+    if span not in _RANGE_DAYS:
+        return None
+    return end - timedelta(days=_RANGE_DAYS[span] - 1), end
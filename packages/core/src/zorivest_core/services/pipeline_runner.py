@@ -13,6 +13,7 @@ Sequential async executor for pipeline policies. Handles:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import time
 import uuid
@@ -84,6 +85,7 @@ class PipelineRunner:
         template_port: Any | None = None,
         pipeline_state_repo: Any | None = None,
         fetch_cache_repo: Any | None = None,
+        market_history_repo: Any | None = None,
     ) -> None:
         self.uow = uow
         self.ref_resolver = ref_resolver
@@ -101,8 +103,20 @@ class PipelineRunner:
         self._template_port = template_port
         self._pipeline_state_repo = pipeline_state_repo
         self._fetch_cache_repo = fetch_cache_repo
+        self._market_history_repo = market_history_repo
         self._active_tasks: dict[str, asyncio.Task[Any]] = {}
 
+    def _session_scope(self) -> Any:
+        """Enter the UoW for the duration of a run (session-per-task).
+
+        A scoped UoW opens a dedicated session for the calling task, so a
+        scheduled pipeline never shares a connection with API requests.
+        A shared UoW simply re-enters its reentrant session.
+        """
+        if self.uow is None:
+            return contextlib.nullcontext()
+        return self.uow
+
     async def run(
         self,
         policy: PolicyDocument,
@@ -113,6 +127,33 @@ class PipelineRunner:
         policy_id: str = "",
         run_id: str = "",
         approval_snapshot: Any | None = None,
+    ) -> dict[str, Any]:
+        """Execute a full pipeline inside its own unit-of-work scope.
+
+        See ``_run`` for argument semantics.
+        """
+        with self._session_scope():
+            return await self._run(
+                policy,
+                trigger_type,
+                dry_run=dry_run,
+                resume_from=resume_from,
+                actor=actor,
+                policy_id=policy_id,
+                run_id=run_id,
+                approval_snapshot=approval_snapshot,
+            )
+
+    async def _run(
+        self,
+        policy: PolicyDocument,
+        trigger_type: str,
+        dry_run: bool = False,
+        resume_from: str | None = None,
+        actor: str = "",
+        policy_id: str = "",
+        run_id: str = "",
+        approval_snapshot: Any | None = None,
     ) -> dict[str, Any]:
         """Execute a full pipeline.
 
@@ -151,6 +192,7 @@ class PipelineRunner:
             "template_port": self._template_port,
             "pipeline_state_repo": self._pipeline_state_repo,
             "fetch_cache_repo": self._fetch_cache_repo,
+            "market_history_repo": self._market_history_repo,
         }
         initial_outputs: dict[str, Any] = {
             k: v for k, v in _dep_map.items() if v is not None
@@ -558,6 +600,10 @@ class PipelineRunner:
         if self.uow is None:
             return []
 
+        with self._session_scope():
+            return self._recover_zombies()
+
+    def _recover_zombies(self) -> list[dict]:
         zombies = self.uow.pipeline_runs.find_zombies()
         recovered = []
 
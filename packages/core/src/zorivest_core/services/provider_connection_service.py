@@ -13,10 +13,14 @@ import asyncio
 from datetime import datetime
 from typing import Any, Mapping, Protocol
 
-from zorivest_core.application.provider_status import ProviderStatus
+from zorivest_core.application.provider_status import (
+    ProviderStatus,
+    RateBudgetStatus,
+)
 from zorivest_core.domain.enums import AuthMethod
 from zorivest_core.domain.market_data import ProviderConfig
 from zorivest_core.domain.market_provider_settings import MarketProviderSettings
+from zorivest_core.services.provider_health import ProviderHealthTracker
 
 
 class HttpClient(Protocol):
@@ -59,6 +63,12 @@ class RateLimiterProtocol(Protocol):
     async def wait_if_needed(self) -> None: ...
 
 
+class RateBudgetProtocol(Protocol):
+    """Shared per-provider request budget (zorivest_infra rate_budget)."""
+
+    def status(self, provider: str) -> RateBudgetStatus | None: ...
+
+
 # ── Provider-specific response validators (§8.6) ──
 
 _PROVIDER_VALIDATORS: dict[str, Any] = {}
@@ -227,6 +237,10 @@ class ProviderConnectionService:
         http_client: Async HTTP client.
         rate_limiters: Per-provider rate limiters.
         provider_registry: Static provider configuration registry.
+        health: Tracker shared with MarketDataService; when set,
+            list_providers reports each provider's observed health.
+        rate_budget: Shared request budget; when set, list_providers
+            reports each provider's remaining budget.
     """
 
     _ENC_PREFIX = "ENC:"
@@ -238,12 +252,16 @@ class ProviderConnectionService:
         http_client: HttpClient,
         rate_limiters: Mapping[str, RateLimiterProtocol],
         provider_registry: dict[str, ProviderConfig],
+        health: ProviderHealthTracker | None = None,
+        rate_budget: RateBudgetProtocol | None = None,
     ) -> None:
         self._uow = uow
         self._encryption = encryption
         self._http = http_client
         self._rate_limiters = rate_limiters
         self._registry = provider_registry
+        self._health = health
+        self._rate_budget = rate_budget
         self._test_semaphore = asyncio.Semaphore(2)
 
     async def list_providers(self) -> list[ProviderStatus]:
@@ -275,6 +293,16 @@ class ProviderConnectionService:
                     timeout=setting.timeout if setting and setting.timeout else 30,
                     last_test_status=(setting.last_test_status if setting else None),
                     signup_url=config.signup_url or None,
+                    health=(
+                        self._health.snapshot(name)
+                        if self._health is not None
+                        else None
+                    ),
+                    rate_budget=(
+                        self._rate_budget.status(name)
+                        if self._rate_budget is not None
+                        else None
+                    ),
                 )
             )
         return result
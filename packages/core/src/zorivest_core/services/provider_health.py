@@ -0,0 +1,163 @@
+"""Per-provider health tracking and circuit breaking for MarketDataService.
+
+Every provider call records its latency and outcome. The tracker keeps an
+EWMA of latency and error rate and counts HTTP 429 responses. A circuit
+opens after ``failure_threshold`` consecutive failures or on any 429.
+While a circuit is open, calls to that provider are skipped without a
+request. Once the cooldown has passed, a single probe call is let
+through. A successful probe closes the circuit; a failed probe reopens
+it with twice the cooldown, up to ``max_cooldown``.
+
+``rank`` orders a fallback chain by observed latency, weighted by error
+rate. Providers that have not been measured keep their configured
+priority, after the measured ones, and providers with an open circuit go
+last.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from enum import Enum
+
+from zorivest_core.application.provider_status import ProviderHealth
+
+# EWMA weight of the newest sample.
+_ALPHA = 0.2
+# A provider failing every call ranks as if it were this many times slower.
+_ERROR_PENALTY = 4.0
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Health:
+    latency_s: float | None = None
+    error_rate: float = 0.0
+    requests: int = 0
+    failures: int = 0
+    rate_limited: int = 0
+    consecutive_failures: int = 0
+    state: CircuitState = CircuitState.CLOSED
+    open_until: float = 0.0
+    cooldown_s: float = 0.0
+
+
+class ProviderHealthTracker:
+    """Latency/error statistics and a circuit breaker per provider.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        cooldown: Seconds an opened circuit stays open before a probe.
+        max_cooldown: Upper bound for the cooldown after failed probes.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        max_cooldown: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._clock = clock
+        self._health: dict[str, _Health] = {}
+
+    def acquire(self, name: str) -> bool:
+        """True when a call to *name* may go out now.
+
+        Moves an open circuit whose cooldown has passed to half-open and
+        admits this call as its probe; further calls are refused until the
+        probe is recorded or released.
+        """
+        health = self._health.get(name)
+        if health is None or health.state is CircuitState.CLOSED:
+            return True
+        if health.state is CircuitState.OPEN and self._clock() >= health.open_until:
+            health.state = CircuitState.HALF_OPEN
+            return True
+        return False
+
+    def release(self, name: str) -> None:
+        """Give back a probe that was cancelled before it completed."""
+        health = self._health.get(name)
+        if health is not None and health.state is CircuitState.HALF_OPEN:
+            health.state = CircuitState.OPEN
+
+    def record_success(self, name: str, latency_s: float) -> None:
+        health = self._record(name, latency_s, failed=False)
+        health.consecutive_failures = 0
+        health.state = CircuitState.CLOSED
+        health.cooldown_s = 0.0
+
+    def record_failure(
+        self, name: str, latency_s: float, *, rate_limited: bool = False
+    ) -> None:
+        health = self._record(name, latency_s, failed=True)
+        health.failures += 1
+        health.consecutive_failures += 1
+        if rate_limited:
+            health.rate_limited += 1
+        if health.state is CircuitState.HALF_OPEN:
+            self._open(health, min(health.cooldown_s * 2, self._max_cooldown))
+        elif rate_limited or health.consecutive_failures >= self._failure_threshold:
+            self._open(health, self._cooldown)
+
+    def rank(self, names: Sequence[str]) -> list[str]:
+        """*names* reordered by expected cost; the sort is stable."""
+        now = self._clock()
+
+        def key(name: str) -> tuple[int, float]:
+            health = self._health.get(name)
+            if health is None or health.latency_s is None:
+                return (1, 0.0)
+            if health.state is not CircuitState.CLOSED and now < health.open_until:
+                return (2, 0.0)
+            return (0, health.latency_s * (1 + _ERROR_PENALTY * health.error_rate))
+
+        return sorted(names, key=key)
+
+    def snapshot(self, name: str) -> ProviderHealth:
+        """Current health of *name* (all zeros before its first call)."""
+        health = self._health.get(name) or _Health()
+        retry_in = max(0.0, health.open_until - self._clock())
+        return ProviderHealth(
+            state=health.state.value,
+            latency_ms=(
+                round(health.latency_s * 1000, 1)
+                if health.latency_s is not None
+                else None
+            ),
+            error_rate=round(health.error_rate, 4),
+            requests=health.requests,
+            failures=health.failures,
+            rate_limited=health.rate_limited,
+            consecutive_failures=health.consecutive_failures,
+            retry_in_s=(
+                round(retry_in, 1) if health.state is CircuitState.OPEN else None
+            ),
+        )
+
+    def _record(self, name: str, latency_s: float, *, failed: bool) -> _Health:
+        health = self._health.setdefault(name, _Health())
+        health.requests += 1
+        if health.latency_s is None:
+            health.latency_s = latency_s
+        else:
+            health.latency_s += _ALPHA * (latency_s - health.latency_s)
+        health.error_rate += _ALPHA * (float(failed) - health.error_rate)
+        return health
+
+    def _open(self, health: _Health, cooldown_s: float) -> None:
+        health.state = CircuitState.OPEN
+        health.cooldown_s = cooldown_s
+        health.open_until = self._clock() + cooldown_s
@@ -9,6 +9,8 @@ MEU: MEU-89 (scheduling-api-mcp)
 
 from __future__ import annotations
 
+import inspect
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, Protocol
 
@@ -92,6 +94,14 @@ async def _execute_policy_callback(policy_id: str) -> None:
     await _scheduler_instance._execute_policy(policy_id)
 
 
+async def _run_maintenance_callback(task_id: str) -> None:
+    """Module-level APScheduler callback for maintenance tasks (picklable)."""
+    if _scheduler_instance is None:
+        logger.error("scheduler_callback_no_instance", task=task_id)
+        return
+    await _scheduler_instance._run_maintenance(task_id)
+
+
 class PipelineRunnerPort(Protocol):
     """Minimal interface for the pipeline runner used by scheduler callbacks."""
 
@@ -130,6 +140,7 @@ class SchedulerService:
         self.policy_repo = policy_repo
         self._running = False
         self._jobs: dict[str, dict[str, Any]] = {}
+        self._maintenance: dict[str, Callable[[], Any]] = {}
         self._scheduler: Any = None
         _scheduler_instance = self  # Register for module-level callback
 
@@ -218,6 +229,30 @@ class SchedulerService:
 
         logger.info("policy_scheduled", policy=policy_name, cron=cron_expression)
 
+    def schedule_maintenance(
+        self, task_id: str, task: Callable[[], Any], interval_seconds: int
+    ) -> None:
+        """Run *task* (sync or async) every *interval_seconds*.
+
+        The task itself stays in memory; the job store only persists its id,
+        so the task must be registered again on every startup.
+        """
+        self._maintenance[task_id] = task
+        if self._scheduler:
+            from apscheduler.triggers.interval import IntervalTrigger
+
+            self._scheduler.add_job(
+                func=f"{__name__}:_run_maintenance_callback",
+                trigger=IntervalTrigger(seconds=interval_seconds),
+                id=f"maintenance_{task_id}",
+                name=task_id,
+                args=[task_id],
+                replace_existing=True,
+            )
+        logger.info(
+            "maintenance_scheduled", task=task_id, interval_seconds=interval_seconds
+        )
+
     def unschedule_policy(self, policy_id: str) -> None:
         """Remove a policy's scheduled job."""
         job_id = f"policy_{policy_id}"
@@ -299,3 +334,16 @@ class SchedulerService:
             trigger_type="scheduled",
             policy_id=policy_id,
         )
+
+    async def _run_maintenance(self, task_id: str) -> None:
+        """Job callback: run a registered maintenance task, logging failures."""
+        task = self._maintenance.get(task_id)
+        if task is None:
+            logger.warning("maintenance_task_not_registered", task=task_id)
+            return
+        try:
+            result = task()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception("maintenance_task_failed", task=task_id)
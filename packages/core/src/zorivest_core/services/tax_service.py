@@ -16,6 +16,12 @@ from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from zorivest_core.application.pagination import (
+    CursorPage,
+    decode_cursor,
+    paginate,
+    scoped_kind,
+)
 from zorivest_core.domain.entities import QuarterlyEstimate, TaxLot, TaxProfile, Trade
 from zorivest_core.domain.enums import (
     AccountType,
@@ -308,6 +314,42 @@ class TaxService:
         sort_fn = _SORT_KEY_MAP.get(sort_by, _SORT_KEY_MAP["acquired_date"])
         return sorted(lots, key=sort_fn)
 
+    def get_lots_page(
+        self,
+        account_id: str | None = None,
+        ticker: str | None = None,
+        status: str = "all",
+        limit: int = 100,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> CursorPage[TaxLot]:
+        """Keyset page of lots ordered by acquisition date, then lot_id.
+
+        Raises:
+            InvalidCursorError: If *cursor* is malformed or was issued for
+                other filters.
+        """
+        is_closed = _STATUS_MAP.get(status)
+        kind = scoped_kind("tax_lots", account_id, ticker, status)
+        after = decode_cursor(kind, cursor) if cursor else None
+        with self._uow:
+            rows = self._uow.tax_lots.list_after(
+                limit=limit + 1,
+                after=after,
+                account_id=account_id,
+                ticker=ticker,
+                is_closed=is_closed,
+            )
+            page = paginate(
+                kind, rows, limit, key=lambda lot: (lot.open_date, lot.lot_id)
+            )
+            if include_total:
+                total = self._uow.tax_lots.count_filtered(
+                    account_id=account_id, ticker=ticker, is_closed=is_closed
+                )
+                page = CursorPage(page.items, page.next_cursor, total)
+        return page
+
     # ── AC-125.3: close_lot ─────────────────────────────────────────────
 
     def close_lot(self, lot_id: str, sell_trade_id: str | None = None) -> TaxLot:
@@ -1897,6 +1939,10 @@ class TaxService:
         # Track which trade IDs we've seen
         trade_exec_ids: set[str] = set()
 
+        # Writes are batched: one insert for new lots, one update per pass.
+        new_lots: list[TaxLot] = []
+        changed_lots: dict[str, TaxLot] = {}
+
         for trade in trades:
             trade_exec_ids.add(trade.exec_id)
             lot_id = f"lot-{trade.exec_id}"
@@ -1922,7 +1968,7 @@ class TaxService:
                     is_user_modified=False,
                     sync_status="synced",
                 )
-                self._uow.tax_lots.save(new_lot)
+                new_lots.append(new_lot)
                 created += 1
 
             elif existing.source_hash == source_hash:
@@ -1932,7 +1978,7 @@ class TaxService:
             elif existing.is_user_modified and conflict_resolution == "flag":
                 # AC-217-4: Flag conflict
                 existing.sync_status = "conflict"
-                self._uow.tax_lots.update(existing)
+                changed_lots[existing.lot_id] = existing
                 conflicts += 1
                 conflict_details.append(
                     SyncConflict(
@@ -1960,13 +2006,18 @@ class TaxService:
                 existing.sync_status = "synced"
                 if conflict_resolution == "auto_resolve":
                     existing.is_user_modified = False
-                self._uow.tax_lots.update(existing)
+                changed_lots[existing.lot_id] = existing
                 updated += 1
 
+        self._uow.tax_lots.save_many(new_lots)
+        self._uow.tax_lots.update_many(list(changed_lots.values()))
+        changed_lots = {}
+
         # ── Pass 2: SLD lot closing (MEU-218b) ──────────────────────────
         # After BOT pass, match SLD trades to open lots using FIFO.
         # Only handles exact quantity matches; partial sells are skipped.
-        from collections import defaultdict
+        from collections import deque
+
         from zorivest_core.domain.tax.gains_calculator import (
             calculate_realized_gain,
         )
@@ -2002,30 +2053,22 @@ class TaxService:
                     if not lot.is_closed
                 ]
 
-            # Build FIFO index: (ticker, account_id) → sorted open lots
-            fifo_index: dict[tuple[str, str], list[TaxLot]] = defaultdict(list)
-            for lot in open_lots:
-                fifo_index[(lot.ticker, lot.account_id)].append(lot)
-            # Sort each bucket by open_date (FIFO)
-            for key in fifo_index:
-                fifo_index[key].sort(key=lambda lot: lot.open_date)
-
-            # Track lot_ids already closed in this pass (avoid double-close)
-            closed_in_pass: set[str] = set()
+            # Build FIFO index: (ticker, account_id, quantity) → open lots
+            # oldest first. Keying on the quantity (rounded to the 1e-9
+            # match tolerance) makes each match a pop instead of a scan.
+            fifo_index: dict[tuple[str, str, float], deque[TaxLot]] = {}
+            for lot in sorted(open_lots, key=lambda lot: lot.open_date):
+                key = (lot.ticker, lot.account_id, round(lot.quantity, 9))
+                fifo_index.setdefault(key, deque()).append(lot)
 
             for sld in sld_trades:
-                bucket = fifo_index.get((sld.instrument, sld.account_id), [])
-                matched_lot: TaxLot | None = None
-                for candidate in bucket:
-                    if candidate.lot_id in closed_in_pass:
-                        continue
-                    # Exact quantity match only
-                    if abs(candidate.quantity - sld.quantity) < 1e-9:
-                        matched_lot = candidate
-                        break
-
-                if matched_lot is None:
+                # Exact quantity match only
+                bucket = fifo_index.get(
+                    (sld.instrument, sld.account_id, round(sld.quantity, 9))
+                )
+                if not bucket:
                     continue  # No matching open lot for this SLD
+                matched_lot = bucket.popleft()
 
                 # Close the lot
                 sale_price = Decimal(str(sld.price))
@@ -2038,8 +2081,7 @@ class TaxService:
                 if sld.exec_id not in matched_lot.linked_trade_ids:
                     matched_lot.linked_trade_ids.append(sld.exec_id)
 
-                self._uow.tax_lots.update(matched_lot)
-                closed_in_pass.add(matched_lot.lot_id)
+                changed_lots[matched_lot.lot_id] = matched_lot
                 closed += 1
 
         # AC-217-5: Orphan detection
@@ -2049,9 +2091,10 @@ class TaxService:
                 trade_id = lot.lot_id[4:]
                 if trade_id not in trade_exec_ids and not lot.is_closed:
                     lot.sync_status = "orphaned"
-                    self._uow.tax_lots.update(lot)
+                    changed_lots[lot.lot_id] = lot
                     orphaned += 1
 
+        self._uow.tax_lots.update_many(list(changed_lots.values()))
         self._uow.commit()
 
         return SyncReport(
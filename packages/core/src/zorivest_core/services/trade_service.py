@@ -6,12 +6,43 @@ Uses: CreateTrade command (commands.py)
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Sequence
+
 from zorivest_core.application.commands import CreateTrade
+from zorivest_core.application.dtos import BulkTradeResult, BulkTradeRowResult
+from zorivest_core.application.pagination import (
+    CursorPage,
+    decode_cursor,
+    paginate,
+    scoped_kind,
+)
 from zorivest_core.application.ports import UnitOfWork
 from zorivest_core.domain.entities import Trade
+from zorivest_core.domain.enums import BulkRowStatus
 from zorivest_core.domain.exceptions import BusinessRuleError, NotFoundError
 from zorivest_core.domain.trades.identity import trade_fingerprint
 
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_LOOKBACK_DAYS = 30
+DEFAULT_BULK_CHUNK_SIZE = 1000
+
+
+def _trade_from_command(command: CreateTrade) -> Trade:
+    return Trade(
+        exec_id=command.exec_id,
+        time=command.time,
+        instrument=command.instrument,
+        action=command.action,
+        quantity=command.quantity,
+        price=command.price,
+        account_id=command.account_id,
+        commission=command.commission,
+        realized_pnl=command.realized_pnl,
+        notes=command.notes,
+    )
+
 
 class TradeService:
     """Trade lifecycle: create, dedup, round-trip matching."""
@@ -33,22 +64,13 @@ class TradeService:
                     f"Trade with exec_id '{command.exec_id}' already exists"
                 )
 
-            trade = Trade(
-                exec_id=command.exec_id,
-                time=command.time,
-                instrument=command.instrument,
-                action=command.action,
-                quantity=command.quantity,
-                price=command.price,
-                account_id=command.account_id,
-                commission=command.commission,
-                realized_pnl=command.realized_pnl,
-                notes=command.notes,
-            )
+            trade = _trade_from_command(command)
 
             # Dedup by fingerprint
             fp = trade_fingerprint(trade)
-            if self.uow.trades.exists_by_fingerprint_since(fp, lookback_days=30):
+            if self.uow.trades.exists_by_fingerprint_since(
+                fp, lookback_days=FINGERPRINT_LOOKBACK_DAYS
+            ):
                 raise BusinessRuleError(
                     "Trade with matching fingerprint found within 30-day window"
                 )
@@ -57,6 +79,94 @@ class TradeService:
             self.uow.commit()
             return trade
 
+    def create_trades_bulk(
+        self,
+        commands: Sequence[CreateTrade],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> BulkTradeResult:
+        """Create many trades with the same dedup rules as ``create_trade``.
+
+        Duplicates are found with two set-based lookups (exec_ids and
+        fingerprints) instead of per-row queries; rows repeated inside the
+        batch are duplicates of their first occurrence. New trades are
+        inserted in transactions of *chunk_size* rows. If a chunk fails, it
+        is retried row by row so only the offending rows are marked as
+        errors.
+
+        Returns:
+            BulkTradeResult with one row per command, in input order.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            msg = f"chunk_size must be positive, got {chunk_size}"
+            raise ValueError(msg)
+
+        trades = [_trade_from_command(c) for c in commands]
+        fingerprints = [trade_fingerprint(t) for t in trades]
+        rows: list[BulkTradeRowResult | None] = [None] * len(trades)
+
+        with self.uow:
+            known_ids = self.uow.trades.existing_exec_ids({t.exec_id for t in trades})
+            known_fps = self.uow.trades.existing_fingerprints_since(
+                set(fingerprints), lookback_days=FINGERPRINT_LOOKBACK_DAYS
+            )
+
+            pending: list[int] = []
+            for i, (trade, fp) in enumerate(zip(trades, fingerprints)):
+                if trade.exec_id in known_ids:
+                    rows[i] = BulkTradeRowResult(
+                        i,
+                        trade.exec_id,
+                        BulkRowStatus.DUPLICATE,
+                        f"Trade with exec_id '{trade.exec_id}' already exists",
+                    )
+                elif fp in known_fps:
+                    rows[i] = BulkTradeRowResult(
+                        i,
+                        trade.exec_id,
+                        BulkRowStatus.DUPLICATE,
+                        "Trade with matching fingerprint found within 30-day window",
+                    )
+                else:
+                    pending.append(i)
+                    known_ids.add(trade.exec_id)
+                    known_fps.add(fp)
+
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start : start + chunk_size]
+                try:
+                    self.uow.trades.save_many([trades[i] for i in chunk])
+                    self.uow.commit()
+                except Exception:  # noqa: BLE001
+                    self.uow.rollback()
+                    logger.warning(
+                        "Bulk trade chunk of %d rows failed; retrying row by row",
+                        len(chunk),
+                    )
+                    for i in chunk:
+                        rows[i] = self._insert_single(i, trades[i])
+                    continue
+                for i in chunk:
+                    rows[i] = BulkTradeRowResult(
+                        i, trades[i].exec_id, BulkRowStatus.ACCEPTED
+                    )
+
+        return BulkTradeResult(rows=[r for r in rows if r is not None])
+
+    def _insert_single(self, index: int, trade: Trade) -> BulkTradeRowResult:
+        """Insert one trade in its own transaction (bulk-chunk fallback)."""
+        try:
+            self.uow.trades.save(trade)
+            self.uow.commit()
+        except Exception as exc:  # noqa: BLE001
+            self.uow.rollback()
+            return BulkTradeRowResult(
+                index, trade.exec_id, BulkRowStatus.ERROR, str(exc)
+            )
+        return BulkTradeRowResult(index, trade.exec_id, BulkRowStatus.ACCEPTED)
+
     def get_trade(self, exec_id: str) -> Trade:
         """Retrieve a trade by exec_id.
 
@@ -144,6 +254,46 @@ class TradeService:
                 search=search,
             )
 
+    def list_trades_page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        account_id: str | None = None,
+        sort: str = "-time",
+        search: str | None = None,
+        include_total: bool = False,
+    ) -> CursorPage[Trade]:
+        """Keyset page of trades ordered by ``(time, exec_id)``.
+
+        Only ``time``/``-time`` sorts are supported. The count is skipped
+        unless *include_total* is set.
+
+        Raises:
+            InvalidCursorError: If *cursor* is malformed or for another sort
+                or other filters.
+            ValueError: If *sort* is not keyset-capable.
+        """
+        if sort not in ("time", "-time"):
+            msg = f"cursor pagination supports sort 'time' or '-time', got '{sort}'"
+            raise ValueError(msg)
+        kind = scoped_kind(f"trades:{sort}", account_id, search)
+        after = decode_cursor(kind, cursor) if cursor else None
+        with self.uow:
+            rows = self.uow.trades.list_after(
+                limit=limit + 1,
+                after=after,
+                account_id=account_id,
+                search=search,
+                descending=sort == "-time",
+            )
+            page = paginate(kind, rows, limit, key=lambda t: (t.time, t.exec_id))
+            if include_total:
+                total = self.uow.trades.count_filtered(
+                    account_id=account_id, search=search
+                )
+                page = CursorPage(page.items, page.next_cursor, total)
+            return page
+
     def count_trades(
         self,
         account_id: str | None = None,
@@ -4,16 +4,24 @@
 Provides OHLCV, Quote, News, and Fundamentals schema validation
 and data quality checks.
 
+Rows are judged with boolean masks built from each schema's own checks,
+so quarantine is a single index operation; frames the masks cannot judge
+(missing columns, wrong dtypes, failed coercion) go through pandera's
+full validation instead.
+
 Spec: 09-scheduling.md §9.5c
 MEU: 86, PW3
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 import pandera as pa
+from pandera.engines import pandas_engine
 from pandera.errors import SchemaErrors
 
 
@@ -131,12 +139,177 @@ SCHEMA_REGISTRY: dict[str, pa.DataFrameSchema] = {
 _SCHEMAS = SCHEMA_REGISTRY
 
 
+# ---------------------------------------------------------------------------
+# Row masks
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnRule:
+    """What a schema column requires of each row, taken from the schema."""
+
+    name: str
+    dtype: Any  # pandera DataType
+    coerce: bool
+    nullable: bool
+    required: bool
+    checks: tuple[pa.Check, ...]
+
+
+# schema_name → (schema the rules were compiled from, rules or None)
+_COMPILED: dict[str, tuple[pa.DataFrameSchema, tuple[_ColumnRule, ...] | None]] = {}
+
+
+def _compiled_rules(
+    schema_name: str, schema: pa.DataFrameSchema
+) -> tuple[_ColumnRule, ...] | None:
+    """Column rules for *schema*, compiled once per registry entry.
+
+    None when the schema uses features the masks do not model (schema
+    checks, uniqueness, parsers, index or regex columns); such schemas
+    are always validated by pandera. Replacing the registry entry
+    recompiles.
+    """
+    cached = _COMPILED.get(schema_name)
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    rules: tuple[_ColumnRule, ...] | None = None
+    if not (
+        schema.checks
+        or schema.parsers
+        or schema.unique
+        or schema.index is not None
+        or schema.coerce
+        or schema.strict
+        or schema.drop_invalid_rows
+        or any(
+            col.regex or col.unique or col.parsers for col in schema.columns.values()
+        )
+    ):
+        rules = tuple(
+            _ColumnRule(
+                name=name,
+                dtype=col.dtype,
+                coerce=col.coerce,
+                nullable=col.nullable,
+                required=col.required,
+                checks=tuple(col.checks),
+            )
+            for name, col in schema.columns.items()
+        )
+    _COMPILED[schema_name] = (schema, rules)
+    return rules
+
+
+def _dtype_matches(rule: _ColumnRule, series: pd.Series) -> bool:
+    """Pandera's own dtype check for the column (element-wise for str)."""
+    matches = rule.dtype.check(pandas_engine.Engine.dtype(series.dtype), series)
+    return bool(matches if isinstance(matches, bool) else matches.all())
+
+
+def _row_mask(
+    rules: tuple[_ColumnRule, ...], df: pd.DataFrame
+) -> tuple[np.ndarray, dict[str, pd.Series]] | None:
+    """Which rows of *df* pass every column rule, plus the coerced columns.
+
+    Returns None when the frame fails as a whole or cannot be judged row
+    by row here (missing required column, dtype mismatch, coercion or
+    check error); pandera then decides.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    coerced: dict[str, pd.Series] = {}
+    for rule in rules:
+        if rule.name not in df.columns:
+            if rule.required:
+                return None
+            continue
+        series = cast(pd.Series, df[rule.name])
+        present = series.notna()
+        has_nulls = not bool(present.all())
+        if has_nulls:
+            if rule.nullable and rule.coerce:
+                return None  # pandera's null handling under coercion
+            if not rule.nullable:
+                mask &= present.to_numpy()
+            series = cast(pd.Series, series[present])
+        try:
+            if rule.coerce:
+                series = cast(pd.Series, rule.dtype.try_coerce(series))
+                coerced[rule.name] = series
+            if not _dtype_matches(rule, series):
+                return None
+            for check in rule.checks:
+                passed = check(series).check_output
+                if not isinstance(passed, pd.Series):
+                    return None
+                if not passed.all():
+                    # Checks skip nulls, so align back to every row
+                    mask &= passed.reindex(df.index, fill_value=True).to_numpy()
+        except Exception:  # noqa: BLE001 — any failure: let pandera report it
+            return None
+    return mask, coerced
+
+
+def _coerce_all(
+    rules: tuple[_ColumnRule, ...], df: pd.DataFrame
+) -> pd.DataFrame | None:
+    """*df* with dtypes checked and coercions applied, without row checks."""
+    out = df.copy(deep=False)
+    try:
+        for rule in rules:
+            if rule.name not in df.columns:
+                if rule.required:
+                    return None
+                continue
+            series = cast(pd.Series, df[rule.name])
+            if rule.coerce:
+                series = cast(pd.Series, rule.dtype.try_coerce(series))
+                out[rule.name] = series
+            if not _dtype_matches(rule, series):
+                return None
+    except Exception:  # noqa: BLE001 — the full validation will report it
+        return None
+    return out
+
+
+def _validate_with_pandera(
+    schema: pa.DataFrameSchema, df: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Full pandera validation; failed rows are found from its failure cases."""
+    try:
+        valid = schema.validate(df, lazy=True)
+        return cast(pd.DataFrame, valid), pd.DataFrame()
+    except SchemaErrors as e:
+        failure_index = e.failure_cases["index"]
+        if failure_index.isna().any():
+            # Column-level error (e.g. missing required column)
+            # — quarantine all rows
+            return pd.DataFrame(), cast(pd.DataFrame, df.copy())
+
+        valid_mask = ~df.index.isin(failure_index.unique())
+        valid = cast(pd.DataFrame, df[valid_mask].copy())
+        quarantined = cast(pd.DataFrame, df[~valid_mask].copy())
+        return valid, quarantined
+
+
 def validate_dataframe(
     df: pd.DataFrame,
     schema_name: str = "ohlcv",
+    *,
+    sample_size: int | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Validate a DataFrame against a named schema.
 
+    Args:
+        df: Records to validate.
+        schema_name: Key in ``SCHEMA_REGISTRY``.
+        sample_size: Opt-in for trusted providers: check nulls and value
+            ranges on a random sample of this many rows only. If the
+            sample passes, every row is accepted (dtypes and coercion are
+            still applied to the whole frame); if not, the whole frame is
+            validated. None (default) validates every row.
+
     Returns:
         Tuple of (valid_rows, quarantined_rows).
         quarantined_rows contains records that failed validation.
@@ -145,29 +318,35 @@ def validate_dataframe(
     if schema is None:
         raise ValueError(f"Unknown schema: {schema_name}")
 
-    try:
-        valid = schema.validate(df, lazy=True)
-        return cast(pd.DataFrame, valid), pd.DataFrame()
-    except SchemaErrors as e:
-        # Get indices of failed rows
-        failure_indices = set()
-        has_column_level_error = False
-        for _, row in e.failure_cases.iterrows():
-            idx = row.get("index")
-            if idx is not None and not pd.isna(idx):
-                failure_indices.add(idx)
-            else:
-                # Column-level error (e.g. missing required column)
-                # — quarantine all rows
-                has_column_level_error = True
-
-        if has_column_level_error:
-            return pd.DataFrame(), cast(pd.DataFrame, df.copy())
-
-        valid_mask = ~df.index.isin(failure_indices)
-        valid = cast(pd.DataFrame, df[valid_mask].copy())
-        quarantined = cast(pd.DataFrame, df[~valid_mask].copy())
-        return valid, quarantined
+    rules = _compiled_rules(schema_name, schema)
+    if rules is None or not df.index.is_unique:
+        # The row-mask path aligns coerced columns by label
+        return _validate_with_pandera(schema, df)
+
+    if sample_size is not None and len(df) > sample_size:
+        # Positions drawn with replacement: no permutation of the whole frame
+        picks = np.random.default_rng().integers(0, len(df), sample_size)
+        sampled = _row_mask(rules, df.iloc[picks].reset_index(drop=True))
+        if sampled is not None and sampled[0].all():
+            accepted = _coerce_all(rules, df)
+            if accepted is not None:
+                return accepted, pd.DataFrame()
+
+    judged = _row_mask(rules, df)
+    if judged is None:
+        return _validate_with_pandera(schema, df)
+    mask, coerced = judged
+
+    # Shallow copies: coerced columns are replaced whole, never written into
+    if mask.all():
+        valid, quarantined = df.copy(deep=False), pd.DataFrame()
+    else:
+        valid = df[mask].copy(deep=False)
+        quarantined = df[~mask].copy(deep=False)
+    for name, series in coerced.items():
+        # Coerced columns hold the non-null rows, which cover the valid ones
+        valid[name] = series.reindex(valid.index)
+    return cast(pd.DataFrame, valid), cast(pd.DataFrame, quarantined)
 
 
 def check_quality(
@@ -12,17 +12,30 @@ MEU: PW1
 from __future__ import annotations
 
 import math
+from collections.abc import Callable
+from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy.orm import Session
 
 from zorivest_infra.repositories.write_dispositions import (
+    DEFAULT_CHUNK_SIZE,
+    WriteResult,
     write_append,
     write_merge,
     write_replace,
 )
 
 
+# Tables whose rows record when they were fetched.  The read-through store
+# only trusts a daily bar as final when it was fetched after its session.
+FETCH_STAMPED_TABLES: frozenset[str] = frozenset({"market_ohlcv"})
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 def _sanitize_value(val: Any) -> Any:
     """Convert pandas/numpy types to native Python types for sqlite3 binding.
 
@@ -80,11 +93,23 @@ class DbWriteAdapter:
       write(df=..., table=..., disposition=..., key_columns=...)
 
     Dispatches to the appropriate write_dispositions function based on
-    the disposition parameter.
+    the disposition parameter.  Records are written in executemany()
+    batches of ``chunk_size`` rows.  Rows for ``FETCH_STAMPED_TABLES``
+    without a ``fetched_at`` are stamped with the write time.
     """
 
-    def __init__(self, *, session: Session) -> None:
+    def __init__(
+        self,
+        *,
+        session: Session,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
         self._session = session
+        self._chunk_size = chunk_size
+        self._clock = clock
 
     def write(
         self,
@@ -93,7 +118,7 @@ class DbWriteAdapter:
         table: str,
         disposition: str,
         key_columns: list[str] | None = None,
-    ) -> int:
+    ) -> WriteResult:
         """Write DataFrame records to denormalized table.
 
         Args:
@@ -103,25 +128,33 @@ class DbWriteAdapter:
             key_columns: Required when disposition is "merge".
 
         Returns:
-            Number of records written.
+            WriteResult with rows inserted vs. updated (``.total`` for both).
 
         Raises:
             ValueError: If disposition is unknown or merge is missing key_columns.
         """
         raw_records: list[dict[str, Any]] = df.to_dict(orient="records")
         records = _sanitize_records(raw_records)
+        if table in FETCH_STAMPED_TABLES:
+            # Naive UTC, like the other DateTime columns.
+            stamp = self._clock().astimezone(timezone.utc).replace(tzinfo=None)
+            for record in records:
+                if record.get("fetched_at") is None:
+                    record["fetched_at"] = stamp
 
         if disposition == "append":
             return write_append(
                 session=self._session,
                 table_name=table,
                 records=records,
+                chunk_size=self._chunk_size,
             )
         elif disposition == "replace":
             return write_replace(
                 session=self._session,
                 table_name=table,
                 records=records,
+                chunk_size=self._chunk_size,
             )
         elif disposition == "merge":
             if not key_columns:
@@ -131,6 +164,7 @@ class DbWriteAdapter:
                 table_name=table,
                 records=records,
                 key_columns=key_columns,
+                chunk_size=self._chunk_size,
             )
         else:
             raise ValueError(
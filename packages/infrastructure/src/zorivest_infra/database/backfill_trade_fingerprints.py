@@ -0,0 +1,49 @@
+# packages/infrastructure/src/zorivest_infra/database/backfill_trade_fingerprints.py
+"""Idempotent backfill of ``trades.fingerprint`` for pre-existing rows.
+
+Called at app startup after the inline migrations add the column, so
+databases created before the indexed fingerprint existed get their
+duplicate-detection keys populated. Fresh databases have nothing to do.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from zorivest_core.domain.trades.identity import trade_fingerprint
+from zorivest_infra.database.models import TradeModel
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+def backfill_trade_fingerprints(session: Session, batch_size: int = 1000) -> int:
+    """Compute fingerprints for trades whose ``fingerprint`` is NULL.
+
+    Rows are processed in batches of *batch_size* and flushed between
+    batches so memory stays bounded on large journals.
+
+    Args:
+        session: Active SQLAlchemy session (caller must commit).
+        batch_size: Number of rows loaded per batch.
+
+    Returns:
+        Number of trades updated.
+    """
+    from zorivest_infra.database.repositories import _model_to_trade
+
+    updated = 0
+    while True:
+        rows = (
+            session.query(TradeModel)
+            .filter(TradeModel.fingerprint.is_(None))
+            .order_by(TradeModel.exec_id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return updated
+        for row in rows:
+            row.fingerprint = trade_fingerprint(_model_to_trade(row))  # type: ignore[assignment]
+        session.flush()
+        updated += len(rows)
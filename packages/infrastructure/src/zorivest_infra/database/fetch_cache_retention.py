@@ -0,0 +1,81 @@
+# packages/infrastructure/src/zorivest_infra/database/fetch_cache_retention.py
+"""Retention policy for the fetch cache and the job that applies it.
+
+Criteria with relative windows (e.g. ``-30d``) produce a new entity key
+every day, so without a sweep ``fetch_cache`` only ever grows. The sweeper
+runs ``FetchCacheRepository.sweep`` in its own unit of work on a schedule
+(registered with ``SchedulerService.schedule_maintenance`` at startup) and
+remembers the last outcome for ``GET /scheduling/cache/stats``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import structlog
+
+from zorivest_infra.database.scheduling_repositories import (
+    FetchCacheRepository,
+    FetchCacheSweep,
+)
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class FetchCacheRetention:
+    """Limits the sweeper enforces.
+
+    Attributes:
+        max_bytes: Cap on stored (compressed) payload bytes.
+        max_stale_age: How long an entry is kept past its TTL for
+            conditional revalidation before it is removed.
+        interval_seconds: Time between sweeps.
+    """
+
+    max_bytes: int = 256 * 1024 * 1024
+    max_stale_age: timedelta = timedelta(days=7)
+    interval_seconds: int = 15 * 60
+
+
+class FetchCacheSweeper:
+    """Applies a ``FetchCacheRetention`` to the fetch cache.
+
+    Args:
+        uow: Unit of work entered for each sweep (its session backs *repo*).
+        repo: Repository bound to the UoW's contextual session.
+        retention: Limits to enforce.
+    """
+
+    def __init__(
+        self,
+        uow: Any,
+        repo: FetchCacheRepository,
+        retention: FetchCacheRetention | None = None,
+    ) -> None:
+        self._uow = uow
+        self.repo = repo
+        self.retention = retention or FetchCacheRetention()
+        self.last_sweep: FetchCacheSweep | None = None
+        self.last_sweep_at: datetime | None = None
+
+    def sweep(self) -> FetchCacheSweep:
+        """Run one sweep and commit it."""
+        now = datetime.now(timezone.utc)
+        with self._uow:
+            result = self.repo.sweep(
+                self.retention.max_bytes, self.retention.max_stale_age, now
+            )
+            self._uow.commit()
+        self.last_sweep, self.last_sweep_at = result, now
+        if result.expired or result.evicted:
+            logger.info(
+                "fetch_cache_swept",
+                expired=result.expired,
+                evicted=result.evicted,
+                blobs_deleted=result.blobs_deleted,
+                bytes_freed=result.bytes_freed,
+            )
+        return result
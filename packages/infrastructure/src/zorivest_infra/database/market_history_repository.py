@@ -0,0 +1,384 @@
+# pyright: reportArgumentType=false, reportReturnType=false, reportAttributeAccessIssue=false
+# SQLAlchemy Column/Session types need suppression for Column[T] → T assignments.
+
+"""SqlAlchemy market history repository (read-through store).
+
+Implements MarketHistoryRepository port (ports.py §MarketHistoryRepository)
+over the tables the market data pipelines write: market_ohlcv,
+market_fundamentals, market_dividends and market_splits.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Collection, Sequence
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from zorivest_core.application.market_expansion_dtos import (
+    DividendRecord,
+    FundamentalsSnapshot,
+    OHLCVBar,
+    StockSplit,
+)
+from zorivest_core.domain.market_history import covered_ranges, settled_before
+from zorivest_infra.database.models import (
+    MarketDividendsModel,
+    MarketFundamentalsModel,
+    MarketOHLCVModel,
+    MarketSplitsModel,
+)
+
+# market_fundamentals period under which whole snapshots are stored.
+SNAPSHOT_PERIOD = "snapshot"
+
+_NUMERIC_METRICS = (
+    "market_cap",
+    "pe_ratio",
+    "pb_ratio",
+    "ps_ratio",
+    "eps",
+    "dividend_yield",
+    "beta",
+)
+_TEXT_METRICS = ("sector", "industry")
+
+_FETCHED_MODELS: dict[str, Any] = {
+    "dividends": MarketDividendsModel,
+    "splits": MarketSplitsModel,
+}
+
+
+def _naive_utc(dt: datetime) -> datetime:
+    """Columns are naive DateTime holding UTC."""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _aware(dt: datetime | None) -> datetime | None:
+    return dt.replace(tzinfo=timezone.utc) if dt is not None else None
+
+
+def _decimal(value: Any) -> Decimal | None:
+    return Decimal(str(value)) if value is not None else None
+
+
+class SqlMarketHistoryRepository:
+    """SQL-backed read-through store for historical market data."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    # ── OHLCV ─────────────────────────────────────────────────────────
+
+    def list_ohlcv(
+        self, ticker: str, start: datetime, end: datetime
+    ) -> list[tuple[OHLCVBar, datetime | None]]:
+        rows = self._session.scalars(
+            select(MarketOHLCVModel)
+            .where(
+                MarketOHLCVModel.ticker == ticker,
+                MarketOHLCVModel.timestamp >= _naive_utc(start),
+                MarketOHLCVModel.timestamp < _naive_utc(end),
+            )
+            # Newest fetch first within a timestamp (NULLs sort last).
+            .order_by(MarketOHLCVModel.timestamp, MarketOHLCVModel.fetched_at.desc())
+        )
+        result: list[tuple[OHLCVBar, datetime | None]] = []
+        last_ts: datetime | None = None
+        for row in rows:
+            bar = _ohlcv_row_to_bar(row)
+            if bar.timestamp == last_ts:
+                continue
+            last_ts = bar.timestamp
+            result.append((bar, _aware(row.fetched_at)))
+        return result
+
+    def ohlcv_coverage(
+        self,
+        tickers: Collection[str],
+        provider: str,
+        start: datetime,
+        end: datetime,
+        now: datetime | None = None,
+    ) -> dict[str, list[tuple[date, date]]]:
+        if not tickers:
+            return {}
+        settled = settled_before(now or datetime.now(timezone.utc)).isoformat()
+        day = func.date(MarketOHLCVModel.timestamp)
+        rows = self._session.execute(
+            select(MarketOHLCVModel.ticker, day)
+            .where(
+                MarketOHLCVModel.ticker.in_(tickers),
+                MarketOHLCVModel.provider == provider,
+                MarketOHLCVModel.timestamp >= _naive_utc(start),
+                MarketOHLCVModel.timestamp < _naive_utc(end),
+                # Only final bars (bar_is_final): fetched after their day,
+                # or unstamped backfill older than the settlement window.
+                or_(
+                    and_(MarketOHLCVModel.fetched_at.is_(None), day < settled),
+                    func.date(MarketOHLCVModel.fetched_at) > day,
+                ),
+            )
+            .distinct()
+        )
+        days: dict[str, list[date]] = defaultdict(list)
+        for ticker, iso_day in rows:
+            days[ticker].append(date.fromisoformat(iso_day))
+        return {ticker: covered_ranges(d) for ticker, d in days.items()}
+
+    def save_ohlcv(self, bars: Sequence[OHLCVBar], fetched_at: datetime) -> None:
+        if not bars:
+            return
+        stamp = _naive_utc(fetched_at)
+        rows = [
+            {
+                "ticker": bar.ticker,
+                "timestamp": _naive_utc(bar.timestamp),
+                "open": bar.open,
+                "high": bar.high,
+                "low": bar.low,
+                "close": bar.close,
+                "volume": bar.volume,
+                "vwap": bar.vwap,
+                "trade_count": bar.trade_count,
+                "adjusted_close": bar.adj_close,
+                "provider": bar.provider,
+                "data_type": "ohlcv",
+                "fetched_at": stamp,
+            }
+            for bar in bars
+        ]
+        stmt = insert(MarketOHLCVModel)
+        excluded = stmt.excluded
+        self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["ticker", "timestamp", "provider"],
+                set_={
+                    col: excluded[col]
+                    for col in (
+                        "open",
+                        "high",
+                        "low",
+                        "close",
+                        "volume",
+                        "vwap",
+                        "trade_count",
+                        "adjusted_close",
+                        "fetched_at",
+                    )
+                },
+            ),
+            rows,
+        )
+
+    # ── Fundamentals ──────────────────────────────────────────────────
+
+    def get_fundamentals(self, ticker: str) -> FundamentalsSnapshot | None:
+        newest = self._session.execute(
+            select(MarketFundamentalsModel.provider, MarketFundamentalsModel.fetched_at)
+            .where(
+                MarketFundamentalsModel.ticker == ticker,
+                MarketFundamentalsModel.period == SNAPSHOT_PERIOD,
+                MarketFundamentalsModel.fetched_at.is_not(None),
+            )
+            .order_by(MarketFundamentalsModel.fetched_at.desc())
+            .limit(1)
+        ).first()
+        if newest is None:
+            return None
+        provider, fetched_at = newest
+        rows = self._session.scalars(
+            select(MarketFundamentalsModel).where(
+                MarketFundamentalsModel.ticker == ticker,
+                MarketFundamentalsModel.period == SNAPSHOT_PERIOD,
+                MarketFundamentalsModel.provider == provider,
+            )
+        )
+        metrics = {row.metric: row for row in rows}
+
+        def numeric(name: str) -> Decimal | None:
+            row = metrics.get(name)
+            return _decimal(row.value) if row is not None else None
+
+        def text(name: str) -> str | None:
+            row = metrics.get(name)
+            return row.text_value if row is not None else None
+
+        employees = metrics.get("employees")
+        return FundamentalsSnapshot(
+            ticker=ticker,
+            market_cap=numeric("market_cap"),
+            pe_ratio=numeric("pe_ratio"),
+            pb_ratio=numeric("pb_ratio"),
+            ps_ratio=numeric("ps_ratio"),
+            eps=numeric("eps"),
+            dividend_yield=numeric("dividend_yield"),
+            beta=numeric("beta"),
+            sector=text("sector"),
+            industry=text("industry"),
+            employees=int(employees.value) if employees is not None else None,
+            provider=provider,
+            timestamp=_aware(fetched_at),
+        )
+
+    def save_fundamentals(
+        self, snapshot: FundamentalsSnapshot, fetched_at: datetime
+    ) -> None:
+        # Replace the whole snapshot so metrics that became None disappear.
+        self._session.execute(
+            delete(MarketFundamentalsModel).where(
+                MarketFundamentalsModel.ticker == snapshot.ticker,
+                MarketFundamentalsModel.period == SNAPSHOT_PERIOD,
+                MarketFundamentalsModel.provider == snapshot.provider,
+            )
+        )
+        stamp = _naive_utc(fetched_at)
+        base = {
+            "ticker": snapshot.ticker,
+            "period": SNAPSHOT_PERIOD,
+            "provider": snapshot.provider,
+            "fetched_at": stamp,
+        }
+        rows = [
+            base | {"metric": name, "value": value, "text_value": None}
+            for name in (*_NUMERIC_METRICS, "employees")
+            if (value := getattr(snapshot, name)) is not None
+        ]
+        rows += [
+            base | {"metric": name, "value": 0, "text_value": value}
+            for name in _TEXT_METRICS
+            if (value := getattr(snapshot, name)) is not None
+        ]
+        if rows:
+            self._session.execute(insert(MarketFundamentalsModel), rows)
+
+    # ── Dividends / splits ────────────────────────────────────────────
+
+    def list_dividends(self, ticker: str) -> list[DividendRecord]:
+        rows = self._session.scalars(
+            select(MarketDividendsModel)
+            .where(MarketDividendsModel.ticker == ticker)
+            .order_by(MarketDividendsModel.ex_date)
+        )
+        return [
+            DividendRecord(
+                ticker=row.ticker,
+                dividend_amount=_decimal(row.dividend_amount),
+                currency=row.currency,
+                ex_date=row.ex_date,
+                record_date=row.record_date,
+                pay_date=row.pay_date,
+                declaration_date=row.declaration_date,
+                frequency=row.frequency,
+                provider=row.provider,
+            )
+            for row in rows
+        ]
+
+    def save_dividends(
+        self, records: Sequence[DividendRecord], fetched_at: datetime
+    ) -> None:
+        if not records:
+            return
+        stamp = _naive_utc(fetched_at)
+        rows = [
+            {
+                "ticker": r.ticker,
+                "dividend_amount": r.dividend_amount,
+                "currency": r.currency,
+                "ex_date": r.ex_date,
+                "record_date": r.record_date,
+                "pay_date": r.pay_date,
+                "declaration_date": r.declaration_date,
+                "frequency": r.frequency,
+                "provider": r.provider,
+                "fetched_at": stamp,
+            }
+            for r in records
+        ]
+        stmt = insert(MarketDividendsModel)
+        self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["ticker", "ex_date"],
+                set_={
+                    col: stmt.excluded[col]
+                    for col in rows[0]
+                    if col not in ("ticker", "ex_date")
+                },
+            ),
+            rows,
+        )
+
+    def list_splits(self, ticker: str) -> list[StockSplit]:
+        rows = self._session.scalars(
+            select(MarketSplitsModel)
+            .where(MarketSplitsModel.ticker == ticker)
+            .order_by(MarketSplitsModel.execution_date)
+        )
+        return [
+            StockSplit(
+                ticker=row.ticker,
+                execution_date=row.execution_date,
+                ratio_from=row.ratio_from,
+                ratio_to=row.ratio_to,
+                provider=row.provider,
+            )
+            for row in rows
+        ]
+
+    def save_splits(self, splits: Sequence[StockSplit], fetched_at: datetime) -> None:
+        if not splits:
+            return
+        stamp = _naive_utc(fetched_at)
+        rows = [
+            {
+                "ticker": s.ticker,
+                "execution_date": s.execution_date,
+                "ratio_from": s.ratio_from,
+                "ratio_to": s.ratio_to,
+                "provider": s.provider,
+                "fetched_at": stamp,
+            }
+            for s in splits
+        ]
+        stmt = insert(MarketSplitsModel)
+        self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["ticker", "execution_date"],
+                set_={
+                    col: stmt.excluded[col]
+                    for col in ("ratio_from", "ratio_to", "provider", "fetched_at")
+                },
+            ),
+            rows,
+        )
+
+    def last_fetched(self, data_type: str, ticker: str) -> datetime | None:
+        model = _FETCHED_MODELS[data_type]
+        newest = self._session.scalar(
+            select(func.max(model.fetched_at)).where(model.ticker == ticker)
+        )
+        return _aware(newest)
+
+
+def _ohlcv_row_to_bar(row: MarketOHLCVModel) -> OHLCVBar:
+    return OHLCVBar(
+        ticker=row.ticker,
+        timestamp=row.timestamp.replace(tzinfo=timezone.utc),
+        open=_decimal(row.open),
+        high=_decimal(row.high),
+        low=_decimal(row.low),
+        close=_decimal(row.close),
+        adj_close=_decimal(row.adjusted_close),
+        volume=row.volume,
+        vwap=_decimal(row.vwap),
+        trade_count=row.trade_count,
+        provider=row.provider,
+    )
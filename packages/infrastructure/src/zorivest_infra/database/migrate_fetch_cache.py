@@ -0,0 +1,50 @@
+# packages/infrastructure/src/zorivest_infra/database/migrate_fetch_cache.py
+"""Idempotent move of legacy ``fetch_cache.payload_json`` text into blobs.
+
+Called at app startup. Rows written before ``fetch_cache_blobs`` existed
+keep their uncompressed payload in ``payload_json``; each is stored
+compressed under its ``content_hash`` (once per distinct hash) and the
+column is emptied. Fresh or already migrated databases have nothing to do.
+SQLite reuses the freed pages, so the file stops growing rather than
+shrinking until the next ``VACUUM``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+
+from zorivest_infra.database.models import FetchCacheModel
+from zorivest_infra.database.scheduling_repositories import FetchCacheRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+def migrate_fetch_cache_payloads(session: Session, batch_size: int = 200) -> int:
+    """Move legacy fetch cache payloads into compressed, deduplicated blobs.
+
+    Args:
+        session: Active SQLAlchemy session (caller must commit).
+        batch_size: Number of rows loaded per batch.
+
+    Returns:
+        Number of fetch cache rows migrated.
+    """
+    repo = FetchCacheRepository(session)
+    migrated = 0
+    while True:
+        rows = (
+            session.query(FetchCacheModel)
+            .filter(func.length(FetchCacheModel.legacy_payload) > 0)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return migrated
+        for row in rows:
+            repo.store_payload(str(row.content_hash), str(row.legacy_payload))
+            row.legacy_payload = ""
+        session.flush()
+        migrated += len(rows)
@@ -9,6 +9,7 @@ per the precision warning in the spec. Display-only columns use Float.
 from __future__ import annotations
 
 import uuid
+import zlib
 
 from sqlalchemy import (
     Boolean,
@@ -27,6 +28,7 @@ from sqlalchemy import (
     event,
     text,
 )
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
@@ -50,6 +52,16 @@ class TradeModel(Base):
     commission = Column(Numeric(15, 6), default=0.0)
     realized_pnl = Column(Numeric(15, 6), default=0.0)
     notes = Column(Text, nullable=True, default="")
+    # SHA-256 of the identity fields (trade_fingerprint); NULL only on rows
+    # written before the column existed, until the startup backfill runs.
+    fingerprint = Column(String(64), nullable=True)
+
+    __table_args__ = (
+        Index("ix_trades_fingerprint_time", "fingerprint", "time"),
+        # Keyset pagination: (time, exec_id) cursor, optionally per account
+        Index("ix_trades_time_exec_id", "time", "exec_id"),
+        Index("ix_trades_account_time_exec_id", "account_id", "time", "exec_id"),
+    )
 
     images = relationship(
         "ImageModel",
@@ -152,7 +164,9 @@ class TradePlanModel(Base):
     risk_reward_ratio = Column(Float, nullable=True, default=0.0)  # MEU-66
     status = Column(String(15), default="draft")  # PlanStatus
     linked_trade_id = Column(String, ForeignKey("trades.exec_id"), nullable=True)
-    account_id = Column(String, ForeignKey("accounts.account_id"), nullable=True)
+    account_id = Column(
+        String, ForeignKey("accounts.account_id"), nullable=True, index=True
+    )
     shares_planned = Column(Integer, nullable=True)  # Position size (shares/contracts)
     position_size = Column(
         Float, nullable=True
@@ -202,6 +216,12 @@ class BalanceSnapshotModel(Base):
     datetime = Column(DateTime, nullable=False)
     balance = Column(Numeric(15, 6), nullable=False)
 
+    __table_args__ = (
+        Index(
+            "ix_balance_snapshots_account_datetime_id", "account_id", "datetime", "id"
+        ),
+    )
+
     account_rel = relationship("AccountModel", back_populates="balance_snapshots")
 
 
@@ -622,8 +642,25 @@ class ReportDeliveryModel(Base):
     report = relationship("ReportModel", back_populates="deliveries")
 
 
+class FetchCacheBlobModel(Base):
+    """Compressed fetch cache payload, stored once per content hash."""
+
+    __tablename__ = "fetch_cache_blobs"
+
+    content_hash = Column(String(64), primary_key=True)
+    codec = Column(String(16), nullable=False)  # "zlib"
+    payload = Column(LargeBinary, nullable=False)
+    raw_size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
 class FetchCacheModel(Base):
-    """HTTP response cache for fetch steps (§9.2g)."""
+    """HTTP response cache for fetch steps (§9.2g).
+
+    Payloads live in ``fetch_cache_blobs`` keyed by ``content_hash``; the
+    ``payload_json`` column only holds rows written before that table
+    existed until ``migrate_fetch_cache_payloads`` moves them (empty after).
+    """
 
     __tablename__ = "fetch_cache"
     __table_args__ = (
@@ -634,18 +671,56 @@ class FetchCacheModel(Base):
     provider = Column(String(64), nullable=False)
     data_type = Column(String(64), nullable=False)
     entity_key = Column(String(128), nullable=False)
-    payload_json = Column(Text, nullable=False)
-    content_hash = Column(String(64), nullable=False)
+    legacy_payload = Column("payload_json", Text, nullable=False, default="")
+    content_hash = Column(String(64), nullable=False, index=True)
     etag = Column(String(256), nullable=True)
     last_modified = Column(String(128), nullable=True)
     fetched_at = Column(DateTime, nullable=False)
     ttl_seconds = Column(Integer, nullable=False)
+    # Last lookup answered from this row; NULL until the first one
+    last_hit_at = Column(DateTime, nullable=True)
+
+    blob = relationship(
+        FetchCacheBlobModel,
+        primaryjoin="foreign(FetchCacheModel.content_hash)"
+        " == FetchCacheBlobModel.content_hash",
+        lazy="joined",
+        viewonly=True,
+    )
+
+    @property
+    def payload_json(self) -> str:
+        """The cached response body, decompressed."""
+        legacy: str | None = self.legacy_payload  # type: ignore[assignment]
+        if legacy:
+            return legacy
+        if self.blob is None:
+            return ""
+        return decode_fetch_payload(self.blob.codec, self.blob.payload)
+
+    @payload_json.setter
+    def payload_json(self, value: str) -> None:
+        # Uncompressed legacy storage, read back as-is until the startup
+        # migration moves it into fetch_cache_blobs.
+        self.legacy_payload = value
+
+
+def encode_fetch_payload(payload: str) -> tuple[str, bytes]:
+    """Compress a fetch cache payload; returns ``(codec, data)``."""
+    return "zlib", zlib.compress(payload.encode("utf-8"), 6)
+
+
+def decode_fetch_payload(codec: str, data: bytes) -> str:
+    if codec != "zlib":
+        raise ValueError(f"Unknown fetch cache codec '{codec}'")
+    return zlib.decompress(data).decode("utf-8")
 
 
 class AuditLogModel(Base):
     """Append-only audit trail for pipeline operations (§9.2i)."""
 
     __tablename__ = "audit_log"
+    __table_args__ = (Index("ix_audit_log_action_created_at", "action", "created_at"),)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     actor = Column(String(128), nullable=False)  # "scheduler", "mcp:agent", "gui:user"
@@ -743,6 +818,7 @@ class MarketFundamentalsModel(Base):
     ticker = Column(String(16), nullable=False)
     metric = Column(String(64), nullable=False)
     value = Column(Numeric(15, 6), nullable=False)
+    text_value = Column(String(128), nullable=True)  # sector, industry, ...
     period = Column(String(16), nullable=False)
     provider = Column(String(32), nullable=False)
     fetched_at = Column(DateTime, nullable=True)
@@ -801,6 +877,7 @@ class MarketDividendsModel(Base):
     declaration_date = Column(Date, nullable=True)
     frequency = Column(String(16), nullable=True)  # quarterly, semi-annual, annual
     provider = Column(String(32), nullable=False)
+    fetched_at = Column(DateTime, nullable=True)
 
 
 class MarketSplitsModel(Base):
@@ -822,6 +899,7 @@ class MarketSplitsModel(Base):
     ratio_from = Column(Integer, nullable=False)
     ratio_to = Column(Integer, nullable=False)
     provider = Column(String(32), nullable=False)
+    fetched_at = Column(DateTime, nullable=True)
 
 
 class MarketInsiderModel(Base):
@@ -863,7 +941,12 @@ class TaxLotModel(Base):
     """
 
     __tablename__ = "tax_lots"
-    __table_args__ = (Index("ix_tax_lots_account_ticker", "account_id", "ticker"),)
+    __table_args__ = (
+        Index("ix_tax_lots_account_ticker", "account_id", "ticker"),
+        Index("ix_tax_lots_open_date_lot_id", "open_date", "lot_id"),
+        Index("ix_tax_lots_closed_close_date", "is_closed", "close_date"),
+        Index("ix_tax_lots_ticker_open_date", "ticker", "open_date"),
+    )
 
     lot_id = Column(String, primary_key=True)
     account_id = Column(String, ForeignKey("accounts.account_id"), nullable=False)
@@ -998,3 +1081,166 @@ def _install_scheduling_triggers(
 
 
 event.listen(Base.metadata, "after_create", _install_scheduling_triggers)
+
+
+# ── Trade full-text search (SQLite FTS5) ─────────────────────────────────
+
+# Columns of the ``trades_fts`` index, in declaration order. ``exec_id`` is
+# stored so lookups join on the natural key instead of trusting rowids.
+TRADES_FTS_COLUMNS = (
+    "exec_id",
+    "instrument",
+    "account_id",
+    "notes",
+    "time_text",
+    "lessons",
+    "tags",
+)
+
+# ``trades`` is keyed by ``exec_id`` and has no INTEGER PRIMARY KEY, so its
+# implicit rowids may be renumbered by VACUUM. The index rows are keyed by
+# ``trades_fts_keys.id`` instead, which VACUUM preserves.
+_TRADES_FTS_KEYS_DDL = """CREATE TABLE trades_fts_keys (
+        id INTEGER PRIMARY KEY,
+        exec_id TEXT NOT NULL UNIQUE
+    )"""
+
+_TRADES_FTS_INSERT = """INSERT INTO trades_fts (
+        rowid, exec_id, instrument, account_id, notes, time_text, lessons, tags
+    )"""
+
+_TRADES_FTS_KEY = "(SELECT id FROM trades_fts_keys WHERE exec_id = {})"
+
+_TRADES_FTS_TRIGGER_NAMES = (
+    "trades_fts_ai",
+    "trades_fts_ad",
+    "trades_fts_au",
+    "trade_reports_fts_ai",
+    "trade_reports_fts_au",
+    "trade_reports_fts_ad",
+)
+
+_TRADES_FTS_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS trades_fts_ai
+    AFTER INSERT ON trades
+    BEGIN
+        INSERT OR IGNORE INTO trades_fts_keys (exec_id) VALUES (NEW.exec_id);
+        {_TRADES_FTS_INSERT}
+        SELECT k.id, NEW.exec_id, NEW.instrument, NEW.account_id, NEW.notes,
+               strftime('%Y-%m-%d %H:%M', NEW.time), r.lessons_learned, r.tags
+        FROM trades_fts_keys k LEFT JOIN trade_reports r ON r.trade_id = NEW.exec_id
+        WHERE k.exec_id = NEW.exec_id;
+    END;""",
+    f"""CREATE TRIGGER IF NOT EXISTS trades_fts_ad
+    AFTER DELETE ON trades
+    BEGIN
+        DELETE FROM trades_fts WHERE rowid = {_TRADES_FTS_KEY.format("OLD.exec_id")};
+        DELETE FROM trades_fts_keys WHERE exec_id = OLD.exec_id;
+    END;""",
+    f"""CREATE TRIGGER IF NOT EXISTS trades_fts_au
+    AFTER UPDATE OF exec_id, instrument, account_id, notes, time ON trades
+    BEGIN
+        DELETE FROM trades_fts WHERE rowid = {_TRADES_FTS_KEY.format("OLD.exec_id")};
+        UPDATE trades_fts_keys SET exec_id = NEW.exec_id
+        WHERE exec_id = OLD.exec_id;
+        {_TRADES_FTS_INSERT}
+        SELECT k.id, NEW.exec_id, NEW.instrument, NEW.account_id, NEW.notes,
+               strftime('%Y-%m-%d %H:%M', NEW.time), r.lessons_learned, r.tags
+        FROM trades_fts_keys k LEFT JOIN trade_reports r ON r.trade_id = NEW.exec_id
+        WHERE k.exec_id = NEW.exec_id;
+    END;""",
+    f"""CREATE TRIGGER IF NOT EXISTS trade_reports_fts_ai
+    AFTER INSERT ON trade_reports
+    BEGIN
+        UPDATE trades_fts SET lessons = NEW.lessons_learned, tags = NEW.tags
+        WHERE rowid = {_TRADES_FTS_KEY.format("NEW.trade_id")};
+    END;""",
+    f"""CREATE TRIGGER IF NOT EXISTS trade_reports_fts_au
+    AFTER UPDATE OF trade_id, lessons_learned, tags ON trade_reports
+    BEGIN
+        UPDATE trades_fts SET lessons = NULL, tags = NULL
+        WHERE rowid = {_TRADES_FTS_KEY.format("OLD.trade_id")};
+        UPDATE trades_fts SET lessons = NEW.lessons_learned, tags = NEW.tags
+        WHERE rowid = {_TRADES_FTS_KEY.format("NEW.trade_id")};
+    END;""",
+    f"""CREATE TRIGGER IF NOT EXISTS trade_reports_fts_ad
+    AFTER DELETE ON trade_reports
+    BEGIN
+        UPDATE trades_fts SET lessons = NULL, tags = NULL
+        WHERE rowid = {_TRADES_FTS_KEY.format("OLD.trade_id")};
+    END;""",
+)
+
+
+def rebuild_trade_search_index(connection) -> None:  # noqa: ANN001
+    """Repopulate ``trades_fts`` from ``trades`` and ``trade_reports``."""
+    connection.execute(text("DELETE FROM trades_fts"))
+    connection.execute(text("DELETE FROM trades_fts_keys"))
+    connection.execute(
+        text("INSERT INTO trades_fts_keys (exec_id) SELECT exec_id FROM trades")
+    )
+    connection.execute(
+        text(
+            f"""{_TRADES_FTS_INSERT}
+            SELECT k.id, t.exec_id, t.instrument, t.account_id, t.notes,
+                   strftime('%Y-%m-%d %H:%M', t.time), r.lessons_learned, r.tags
+            FROM trades t
+            JOIN trades_fts_keys k ON k.exec_id = t.exec_id
+            LEFT JOIN trade_reports r ON r.trade_id = t.exec_id"""
+        )
+    )
+
+
+def _install_trade_search_index(
+    target,  # noqa: ANN001
+    connection,  # noqa: ANN001
+    **_kw,  # noqa: ANN003
+) -> None:
+    """Create the ``trades_fts`` trigram index and its sync triggers.
+
+    The trigram tokenizer gives the same case-insensitive substring
+    semantics as the old ``LIKE '%term%'`` scan, but served from an index.
+    Existing journals are indexed once, when the table is first created.
+    Indexes built before ``trades_fts_keys`` existed were keyed by the
+    trades' implicit rowids; their triggers are replaced and the index is
+    rebuilt once. SQLite builds without FTS5/trigram skip the index and the
+    repository falls back to ``LIKE``.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    existing = set(
+        connection.execute(
+            text(
+                "SELECT name FROM sqlite_master WHERE name IN "
+                "('trades', 'trade_reports', 'trades_fts', 'trades_fts_keys')"
+            )
+        ).scalars()
+    )
+    if not {"trades", "trade_reports"} <= existing:
+        return
+    rebuild = False
+    if "trades_fts" not in existing:
+        try:
+            with connection.begin_nested():
+                connection.execute(
+                    text(
+                        "CREATE VIRTUAL TABLE trades_fts USING fts5("
+                        + ", ".join(TRADES_FTS_COLUMNS)
+                        + ", tokenize='trigram')"
+                    )
+                )
+        except OperationalError:
+            return
+        rebuild = True
+    if "trades_fts_keys" not in existing:
+        connection.execute(text(_TRADES_FTS_KEYS_DDL))
+        for name in _TRADES_FTS_TRIGGER_NAMES:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+        rebuild = True
+    if rebuild:
+        rebuild_trade_search_index(connection)
+    for ddl in _TRADES_FTS_TRIGGERS:
+        connection.execute(text(ddl))
+
+
+event.listen(Base.metadata, "after_create", _install_trade_search_index)
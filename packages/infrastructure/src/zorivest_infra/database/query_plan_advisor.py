@@ -0,0 +1,224 @@
+# packages/infrastructure/src/zorivest_infra/database/query_plan_advisor.py
+"""Index advisor: ``EXPLAIN QUERY PLAN`` over the repositories' hot queries.
+
+Each canonical workload calls real repository methods inside a unit of
+work while the SQL they emit is captured. Every captured ``SELECT`` is
+then re-run under ``EXPLAIN QUERY PLAN`` and any step that walks a whole
+table (``SCAN <table>``, with or without an index) instead of seeking is
+reported. The queries are read-only, so the advisor is safe to point at
+a live journal.
+
+Usage:
+    uv run python -m zorivest_infra.database.query_plan_advisor
+    uv run python -m zorivest_infra.database.query_plan_advisor --db-url sqlite:///zorivest.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+from zorivest_infra.database.models import Base
+from zorivest_infra.database.unit_of_work import SqlAlchemyUnitOfWork
+
+# A plan step that walks a whole table, either row by row or in index order
+# to avoid a sort ("SCAN t USING INDEX ..."). Only schema tables count, so
+# seeks ("SEARCH"), FTS5 virtual tables, materialized subqueries and
+# SQLite's own catalog are not flagged.
+_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX \w+)?$")
+
+_SINCE = datetime(2025, 1, 1)
+
+Workload = Callable[[SqlAlchemyUnitOfWork], Any]
+
+# (name, workload) pairs covering the per-request and per-run query paths.
+CANONICAL_QUERIES: tuple[tuple[str, Workload], ...] = (
+    ("trades.get", lambda uow: uow.trades.get("E1")),
+    ("trades.list_for_account", lambda uow: uow.trades.list_for_account("ACC")),
+    (
+        "trades.list_filtered[account]",
+        lambda uow: uow.trades.list_filtered(limit=50, account_id="ACC"),
+    ),
+    (
+        "trades.list_after[account]",
+        lambda uow: uow.trades.list_after(
+            limit=50, after=(_SINCE, "E1"), account_id="ACC"
+        ),
+    ),
+    (
+        "trades.count_filtered[account]",
+        lambda uow: uow.trades.count_filtered(account_id="ACC"),
+    ),
+    (
+        "trades.count_filtered[search]",
+        lambda uow: uow.trades.count_filtered(search="AAPL"),
+    ),
+    (
+        "trades.exists_by_fingerprint_since",
+        lambda uow: uow.trades.exists_by_fingerprint_since("f" * 64),
+    ),
+    (
+        "trades.existing_fingerprints_since",
+        lambda uow: uow.trades.existing_fingerprints_since(["f" * 64]),
+    ),
+    (
+        "trades.existing_exec_ids",
+        lambda uow: uow.trades.existing_exec_ids(["E1", "E2"]),
+    ),
+    (
+        "trades.stats_by_account",
+        lambda uow: uow.trades.stats_by_account(["ACC", "ACC2"]),
+    ),
+    (
+        "trade_plans.count_by_account",
+        lambda uow: uow.trade_plans.count_by_account(["ACC", "ACC2"]),
+    ),
+    (
+        "trade_reports.get_for_trade",
+        lambda uow: uow.trade_reports.get_for_trade("E1"),
+    ),
+    (
+        "balance_snapshots.list_for_account_after",
+        lambda uow: uow.balance_snapshots.list_for_account_after(
+            "ACC", limit=50, after=(_SINCE, 1)
+        ),
+    ),
+    (
+        "balance_snapshots.latest_for_accounts",
+        lambda uow: uow.balance_snapshots.latest_for_accounts(["ACC", "ACC2"]),
+    ),
+    (
+        "balance_snapshots.get_latest",
+        lambda uow: uow.balance_snapshots.get_latest("ACC"),
+    ),
+    (
+        "audit_log.count_since",
+        lambda uow: uow.audit_log.count_since(
+            "pipeline.run", _SINCE - timedelta(hours=1)
+        ),
+    ),
+    (
+        "tax_lots.list_filtered[account]",
+        lambda uow: uow.tax_lots.list_filtered(account_id="ACC"),
+    ),
+    (
+        "tax_lots.list_all_filtered[closed]",
+        lambda uow: uow.tax_lots.list_all_filtered(is_closed=True),
+    ),
+    (
+        "tax_lots.list_all_filtered[ticker]",
+        lambda uow: uow.tax_lots.list_all_filtered(ticker="AAPL"),
+    ),
+    (
+        "market_history.list_ohlcv",
+        lambda uow: uow.market_history.list_ohlcv(
+            "AAPL", _SINCE, _SINCE + timedelta(days=30)
+        ),
+    ),
+    (
+        "market_history.ohlcv_coverage",
+        lambda uow: uow.market_history.ohlcv_coverage(
+            ["AAPL", "MSFT"], "Yahoo Finance", _SINCE, _SINCE + timedelta(days=30)
+        ),
+    ),
+)
+
+
+@dataclass(frozen=True)
+class QueryPlanFinding:
+    """One full scan found in a canonical query's plan."""
+
+    query: str
+    table: str
+    detail: str
+    sql: str
+
+
+@contextmanager
+def _capture_selects(engine: Engine) -> Iterator[list[tuple[str, Any]]]:
+    captured: list[tuple[str, Any]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def explain_query_plan(engine: Engine, statement: str, parameters: Any) -> list[str]:
+    """Return the ``detail`` column of ``EXPLAIN QUERY PLAN`` for *statement*."""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in rows]
+
+
+def audit_canonical_queries(
+    engine: Engine,
+    queries: tuple[tuple[str, Workload], ...] = CANONICAL_QUERIES,
+) -> list[QueryPlanFinding]:
+    """Run each canonical workload and report every full scan.
+
+    Args:
+        engine: SQLite engine whose schema is already created.
+        queries: ``(name, workload)`` pairs; defaults to CANONICAL_QUERIES.
+
+    Returns:
+        Findings in workload order; empty when every query uses an index.
+    """
+    uow = SqlAlchemyUnitOfWork(engine)
+    findings: list[QueryPlanFinding] = []
+    for name, workload in queries:
+        with _capture_selects(engine) as captured, uow:
+            workload(uow)
+        for statement, parameters in captured:
+            for detail in explain_query_plan(engine, statement, parameters):
+                match = _FULL_SCAN.match(detail)
+                if match and match.group(1) in Base.metadata.tables:
+                    findings.append(
+                        QueryPlanFinding(
+                            query=name,
+                            table=match.group(1),
+                            detail=detail,
+                            sql=" ".join(statement.split()),
+                        )
+                    )
+    return findings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Zorivest query plan advisor")
+    parser.add_argument(
+        "--db-url",
+        default="sqlite://",
+        help="Database to inspect (default: fresh in-memory schema)",
+    )
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.db_url)
+    if args.db_url == "sqlite://":
+        Base.metadata.create_all(engine)
+    findings = audit_canonical_queries(engine)
+    for f in findings:
+        print(f"[SCAN] {f.query}: {f.detail}\n       {f.sql}")
+    if findings:
+        print(f"{len(findings)} full scan(s) in canonical queries")
+        return 1
+    print(f"[OK] {len(CANONICAL_QUERIES)} canonical queries use an index")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
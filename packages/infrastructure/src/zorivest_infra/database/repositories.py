@@ -13,11 +13,15 @@ Implements: ports.TradeRepository, ImageRepository, AccountRepository,
 from __future__ import annotations
 
 import json
+import weakref
+from collections.abc import Collection, Iterator, Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
+from sqlalchemy import Float, String, case, func, select, text, tuple_
 from sqlalchemy.orm import Session
 
+from zorivest_core.application.dtos import AccountTradeStats
 from zorivest_core.domain.entities import (
     Account,
     BalanceSnapshot,
@@ -33,6 +37,7 @@ from zorivest_core.domain.enums import (
     TradeAction,
 )
 from zorivest_core.domain.market_provider_settings import MarketProviderSettings
+from zorivest_core.domain.trades.identity import trade_fingerprint
 from zorivest_infra.database.models import (
     AccountModel,
     AppDefaultModel,
@@ -50,6 +55,43 @@ from zorivest_infra.database.models import (
 # ── Mapping helpers ─────────────────────────────────────────────────────
 
 
+# The trigram tokenizer cannot match terms shorter than three characters.
+_FTS_MIN_TERM_LEN = 3
+
+# Engines known to have the ``trades_fts`` index; only positives are cached
+# so an index created later (e.g. by a subsequent ``create_all``) is seen.
+_fts_engines: weakref.WeakSet[Any] = weakref.WeakSet()
+
+
+def _has_trade_search_index(session: Session) -> bool:
+    engine = session.get_bind().engine
+    if engine in _fts_engines:
+        return True
+    if engine.dialect.name != "sqlite":
+        return False
+    found = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trades_fts'")
+    ).first()
+    if found is not None:
+        _fts_engines.add(engine)
+    return found is not None
+
+
+def _fts_phrase(term: str) -> str:
+    """Quote *term* as a single FTS5 phrase so operators are taken literally."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+# Stay well below SQLite's bound-parameter limit for ``IN (...)`` lists.
+_IN_CHUNK_SIZE = 500
+
+
+def _in_chunks(values: Collection[str]) -> Iterator[list[str]]:
+    items = list(values)
+    for start in range(0, len(items), _IN_CHUNK_SIZE):
+        yield items[start : start + _IN_CHUNK_SIZE]
+
+
 def _trade_to_model(trade: Trade) -> TradeModel:
     return TradeModel(
         exec_id=trade.exec_id,
@@ -62,6 +104,7 @@ def _trade_to_model(trade: Trade) -> TradeModel:
         commission=trade.commission,
         realized_pnl=trade.realized_pnl,
         notes=trade.notes,
+        fingerprint=trade_fingerprint(trade),
     )
 
 
@@ -169,20 +212,56 @@ class SqlAlchemyTradeRepository:
     def exists_by_fingerprint_since(
         self, fingerprint: str, lookback_days: int = 30
     ) -> bool:
-        """Check existence by scanning trades in lookback window.
+        """Check for a trade with *fingerprint* inside the lookback window.
 
-        Note: For production, a fingerprint column + index would be more
-        efficient. This scan-based approach works for correctness.
+        Single ``EXISTS`` probe served by ``ix_trades_fingerprint_time``;
+        no rows are loaded or re-hashed.
         """
-        from zorivest_core.domain.trades.identity import trade_fingerprint
+        cutoff = datetime.now() - timedelta(days=lookback_days)
+        query = self._session.query(TradeModel.exec_id).filter(
+            TradeModel.fingerprint == fingerprint,
+            TradeModel.time >= cutoff,
+        )
+        return bool(self._session.query(query.exists()).scalar())
+
+    def existing_exec_ids(self, exec_ids: Collection[str]) -> set[str]:
+        """Return the subset of *exec_ids* already stored (chunked ``IN``)."""
+        found: set[str] = set()
+        for chunk in _in_chunks(exec_ids):
+            rows = (
+                self._session.query(TradeModel.exec_id)
+                .filter(TradeModel.exec_id.in_(chunk))
+                .all()
+            )
+            found.update(r[0] for r in rows)
+        return found
+
+    def existing_fingerprints_since(
+        self, fingerprints: Collection[str], lookback_days: int = 30
+    ) -> set[str]:
+        """Return the subset of *fingerprints* seen within the lookback window.
 
+        Set-based counterpart of ``exists_by_fingerprint_since``, served by
+        ``ix_trades_fingerprint_time``.
+        """
         cutoff = datetime.now() - timedelta(days=lookback_days)
-        recent = self._session.query(TradeModel).filter(TradeModel.time >= cutoff).all()
-        for m in recent:
-            trade = _model_to_trade(m)
-            if trade_fingerprint(trade) == fingerprint:
-                return True
-        return False
+        found: set[str] = set()
+        for chunk in _in_chunks(fingerprints):
+            rows = (
+                self._session.query(TradeModel.fingerprint)
+                .filter(
+                    TradeModel.fingerprint.in_(chunk),
+                    TradeModel.time >= cutoff,
+                )
+                .distinct()
+                .all()
+            )
+            found.update(r[0] for r in rows)
+        return found
+
+    def save_many(self, trades: Sequence[Trade]) -> None:
+        """Stage several new trades; the caller's commit inserts them together."""
+        self._session.add_all([_trade_to_model(t) for t in trades])
 
     def list_for_account(self, account_id: str) -> list[Trade]:
         rows = (
@@ -193,30 +272,84 @@ class SqlAlchemyTradeRepository:
         )
         return [_model_to_trade(r) for r in rows]
 
+    def stats_by_account(
+        self, account_ids: Collection[str]
+    ) -> dict[str, AccountTradeStats]:
+        """Count, P&L sum and winner count per account in one grouped query."""
+        stats: dict[str, AccountTradeStats] = {}
+        for chunk in _in_chunks(account_ids):
+            rows = (
+                self._session.query(
+                    TradeModel.account_id,
+                    func.count(),
+                    func.sum(TradeModel.realized_pnl),
+                    func.sum(case((TradeModel.realized_pnl > 0, 1), else_=0)),
+                )
+                .filter(TradeModel.account_id.in_(chunk))
+                .group_by(TradeModel.account_id)
+                .all()
+            )
+            for account_id, count, pnl, wins in rows:
+                stats[account_id] = AccountTradeStats(
+                    trade_count=count,
+                    total_realized_pnl=float(pnl or 0),
+                    winning_trades=int(wins or 0),
+                )
+        return stats
+
     def _build_trade_filter_query(
         self,
         account_id: str | None = None,
         search: str | None = None,
+        rank: bool = False,
     ):  # type: ignore[no-untyped-def]
-        """Build base query with account/search filters (shared by list + count)."""
+        """Build base query with account/search filters (shared by list + count).
+
+        Searches of three or more characters go through the ``trades_fts``
+        trigram index; with *rank* set, results are ordered by bm25
+        relevance. Shorter terms, or databases without the index, fall
+        back to a ``LIKE`` scan.
+        """
         query = self._session.query(TradeModel)
         if account_id is not None:
             query = query.filter(TradeModel.account_id == account_id)
 
-        if search:
-            pattern = f"%{search}%"
-            from sqlalchemy import or_, func
-
-            query = query.filter(
-                or_(
-                    func.lower(TradeModel.instrument).like(func.lower(pattern)),
-                    func.lower(TradeModel.exec_id).like(func.lower(pattern)),
-                    func.lower(TradeModel.account_id).like(func.lower(pattern)),
-                    func.lower(TradeModel.notes).like(func.lower(pattern)),
-                    func.strftime("%Y-%m-%d %H:%M", TradeModel.time).like(pattern),
+        if not search:
+            return query
+        if len(search) >= _FTS_MIN_TERM_LEN and _has_trade_search_index(self._session):
+            match = _fts_phrase(search)
+            if not rank:
+                hits = text(
+                    "SELECT exec_id FROM trades_fts WHERE trades_fts MATCH :fts_query"
+                ).bindparams(fts_query=match)
+                return query.filter(
+                    TradeModel.exec_id.in_(hits.columns(exec_id=String))
                 )
+            ranked = (
+                text(
+                    "SELECT exec_id, min(rank) AS rank FROM trades_fts "
+                    "WHERE trades_fts MATCH :fts_query GROUP BY exec_id"
+                )
+                .bindparams(fts_query=match)
+                .columns(exec_id=String, rank=Float)
+                .subquery("trade_search_hits")
+            )
+            return query.join(ranked, ranked.c.exec_id == TradeModel.exec_id).order_by(
+                ranked.c.rank.asc()
             )
-        return query
+
+        pattern = f"%{search}%"
+        from sqlalchemy import or_
+
+        return query.filter(
+            or_(
+                func.lower(TradeModel.instrument).like(func.lower(pattern)),
+                func.lower(TradeModel.exec_id).like(func.lower(pattern)),
+                func.lower(TradeModel.account_id).like(func.lower(pattern)),
+                func.lower(TradeModel.notes).like(func.lower(pattern)),
+                func.strftime("%Y-%m-%d %H:%M", TradeModel.time).like(pattern),
+            )
+        )
 
     def list_filtered(
         self,
@@ -229,22 +362,52 @@ class SqlAlchemyTradeRepository:
         """List trades with optional account filter, search, and sort.
 
         Sort format: field name with optional '-' prefix for descending.
-        Supported fields: time (default).
-        Search: case-insensitive match against instrument, exec_id, account_id.
+        Supported fields: time (default), or ``relevance`` to rank search
+        hits best-first.
+        Search: case-insensitive substring match against instrument,
+        exec_id, account_id, notes, trade time and the trade report's
+        lessons learned and tags.
         """
-        query = self._build_trade_filter_query(account_id=account_id, search=search)
+        query = self._build_trade_filter_query(
+            account_id=account_id, search=search, rank=sort == "relevance"
+        )
 
-        # Parse sort direction
-        if sort.startswith("-"):
-            order_col = getattr(TradeModel, sort[1:], TradeModel.time)
-            query = query.order_by(order_col.desc())
+        # Parse sort direction; exec_id breaks ties the way cursors expect
+        if sort == "relevance":
+            query = query.order_by(TradeModel.time.desc(), TradeModel.exec_id.desc())
+        elif sort.startswith("-"):
+            order_col: Any = getattr(TradeModel, sort[1:], TradeModel.time)
+            query = query.order_by(order_col.desc(), TradeModel.exec_id.desc())
         else:
             order_col = getattr(TradeModel, sort, TradeModel.time)
-            query = query.order_by(order_col.asc())
+            query = query.order_by(order_col.asc(), TradeModel.exec_id.asc())
 
         rows = query.offset(offset).limit(limit).all()
         return [_model_to_trade(r) for r in rows]
 
+    def list_after(
+        self,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+        account_id: str | None = None,
+        search: str | None = None,
+        descending: bool = True,
+    ) -> list[Trade]:
+        """Keyset page ordered by ``(time, exec_id)``, resuming after *after*.
+
+        Served by ``ix_trades_time_exec_id`` (or the per-account variant),
+        so the cost does not grow with page depth the way OFFSET does.
+        """
+        query = self._build_trade_filter_query(account_id=account_id, search=search)
+        key = tuple_(TradeModel.time, TradeModel.exec_id)
+        if after is not None:
+            query = query.filter(key < after if descending else key > after)
+        if descending:
+            query = query.order_by(TradeModel.time.desc(), TradeModel.exec_id.desc())
+        else:
+            query = query.order_by(TradeModel.time.asc(), TradeModel.exec_id.asc())
+        return [_model_to_trade(r) for r in query.limit(limit).all()]
+
     def count_filtered(
         self,
         account_id: str | None = None,
@@ -437,6 +600,39 @@ class SqlAlchemyBalanceSnapshotRepository:
         )
         return _model_to_snapshot(row) if row else None
 
+    def latest_for_accounts(
+        self, account_ids: Collection[str]
+    ) -> dict[str, BalanceSnapshot]:
+        """Return each account's most recent snapshot in one windowed query."""
+        latest: dict[str, BalanceSnapshot] = {}
+        for chunk in _in_chunks(account_ids):
+            ranked = (
+                select(
+                    BalanceSnapshotModel.id,
+                    func.row_number()
+                    .over(
+                        partition_by=BalanceSnapshotModel.account_id,
+                        order_by=(
+                            BalanceSnapshotModel.datetime.desc(),
+                            BalanceSnapshotModel.id.desc(),
+                        ),
+                    )
+                    .label("rn"),
+                )
+                .where(BalanceSnapshotModel.account_id.in_(chunk))
+                .subquery()
+            )
+            rows = (
+                self._session.query(BalanceSnapshotModel)
+                .join(ranked, ranked.c.id == BalanceSnapshotModel.id)
+                .filter(ranked.c.rn == 1)
+                .all()
+            )
+            for row in rows:
+                snapshot = _model_to_snapshot(row)
+                latest[snapshot.account_id] = snapshot
+        return latest
+
     def list_for_account(
         self,
         account_id: str,
@@ -447,13 +643,38 @@ class SqlAlchemyBalanceSnapshotRepository:
         rows = (
             self._session.query(BalanceSnapshotModel)
             .filter(BalanceSnapshotModel.account_id == account_id)
-            .order_by(BalanceSnapshotModel.datetime.desc())
+            .order_by(
+                BalanceSnapshotModel.datetime.desc(), BalanceSnapshotModel.id.desc()
+            )
             .offset(offset)
             .limit(limit)
             .all()
         )
         return [_model_to_snapshot(r) for r in rows]
 
+    def list_for_account_after(
+        self,
+        account_id: str,
+        limit: int = 100,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[BalanceSnapshot]:
+        """Keyset page of snapshots, newest first, resuming after ``(datetime, id)``."""
+        query = self._session.query(BalanceSnapshotModel).filter(
+            BalanceSnapshotModel.account_id == account_id
+        )
+        if after is not None:
+            query = query.filter(
+                tuple_(BalanceSnapshotModel.datetime, BalanceSnapshotModel.id) < after
+            )
+        rows = (
+            query.order_by(
+                BalanceSnapshotModel.datetime.desc(), BalanceSnapshotModel.id.desc()
+            )
+            .limit(limit)
+            .all()
+        )
+        return [_model_to_snapshot(r) for r in rows]
+
     def count_for_account(self, account_id: str) -> int:
         """Return total count of balance snapshots for an account."""
         return (
@@ -774,6 +995,19 @@ class SqlAlchemyTradePlanRepository:
             .count()
         )
 
+    def count_by_account(self, account_ids: Collection[str]) -> dict[str, int]:
+        """Count plans per account in one grouped query."""
+        counts: dict[str, int] = {}
+        for chunk in _in_chunks(account_ids):
+            rows = (
+                self._session.query(TradePlanModel.account_id, func.count())
+                .filter(TradePlanModel.account_id.in_(chunk))
+                .group_by(TradePlanModel.account_id)
+                .all()
+            )
+            counts.update(dict(rows))
+        return counts
+
     def update(self, plan: TradePlan) -> None:
         """Update existing plan via merge (upsert-safe)."""
         self._session.merge(_plan_to_model(plan))
@@ -11,12 +11,18 @@ from __future__ import annotations
 
 import json
 import uuid
-from datetime import datetime, timezone
+from collections import Counter
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, delete, event, func, or_, select, update
+from sqlalchemy.orm import Session, SessionTransaction
 
+from zorivest_core.services.fetch_memory_cache import CachedFetch, FetchMemoryCache
 from zorivest_infra.database.models import (
     AuditLogModel,
+    FetchCacheBlobModel,
     FetchCacheModel,
     PipelineRunModel,
     PipelineStateModel,
@@ -24,6 +30,7 @@ from zorivest_infra.database.models import (
     ReportDeliveryModel,
     ReportModel,
     ReportVersionModel,
+    encode_fetch_payload,
 )
 
 
@@ -216,14 +223,97 @@ class ReportRepository:
         )
 
 
+_DELETE_BATCH = 500
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes; they are UTC
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class FetchCacheSweep:
+    """Outcome of one ``FetchCacheRepository.sweep``."""
+
+    expired: int  # entries past TTL + max_stale_age
+    evicted: int  # least recently used entries removed for the size cap
+    blobs_deleted: int
+    bytes_freed: int  # compressed payload bytes
+
+
+@dataclass(frozen=True)
+class FetchCacheStats:
+    """Size of the stored fetch cache."""
+
+    entries: int
+    stale_entries: int  # past TTL, kept for revalidation until swept
+    blobs: int
+    stored_bytes: int  # compressed payload bytes
+    raw_bytes: int
+    oldest_fetched_at: datetime | None
+
+
 class FetchCacheRepository:
-    """Cache management for HTTP fetch responses."""
+    """Cache management for HTTP fetch responses.
 
-    def __init__(self, session: Session) -> None:
+    Payloads are stored zlib-compressed in ``fetch_cache_blobs``, once per
+    ``content_hash`` however many entity keys share them. An upsert whose
+    hash is already stored (e.g. a 304 revalidation) only updates the row's
+    metadata; blobs no entry references any more are deleted.
+
+    With a ``memory`` tier, lookups try it first and fresh rows read from
+    the database are copied into it; ``invalidate`` drops the provider's
+    entries from it. Upserts reach it only when the session commits, so a
+    rolled back write never lingers in memory.
+    """
+
+    def __init__(
+        self, session: Session, memory: FetchMemoryCache | None = None
+    ) -> None:
         self._session = session
+        self._memory = memory
+        # session.info key of the entries upserted in the open transaction
+        self._pending_key = ("fetch_cache_pending", id(self))
+        if memory is not None:
+            event.listen(session, "after_commit", self._publish_pending)
+            event.listen(session, "after_transaction_end", self._drop_pending)
+
+    @property
+    def memory(self) -> FetchMemoryCache | None:
+        return self._memory
 
     def get_cached(
         self, provider: str, data_type: str, entity_key: str
+    ) -> FetchCacheModel | CachedFetch | None:
+        if self._memory is not None:
+            cached = self._memory.get(provider, data_type, entity_key)
+            if cached is not None:
+                return cached
+        row = self._get_row(provider, data_type, entity_key)
+        if self._memory is not None:
+            self._memory.record_db_lookup(row is not None)
+        if row is None:
+            return None
+        row.last_hit_at = datetime.now(timezone.utc)
+        if self._memory is None or (provider, data_type, entity_key) in self._pending():
+            # Uncommitted rows wait for the commit to reach memory
+            return row
+        entry = CachedFetch(
+            provider=row.provider,
+            data_type=row.data_type,
+            entity_key=row.entity_key,
+            payload_json=row.payload_json,
+            content_hash=row.content_hash,
+            fetched_at=row.fetched_at,
+            ttl_seconds=row.ttl_seconds,
+            etag=row.etag,
+            last_modified=row.last_modified,
+        )
+        # Stale rows stay out of memory; the caller revalidates them
+        return entry if self._memory.put(entry) else row
+
+    def _get_row(
+        self, provider: str, data_type: str, entity_key: str
     ) -> FetchCacheModel | None:
         return (
             self._session.query(FetchCacheModel)
@@ -242,38 +332,269 @@ class FetchCacheRepository:
         etag: str | None = None,
         last_modified: str | None = None,
     ) -> None:
-        existing = self.get_cached(provider, data_type, entity_key)
+        existing = self._get_row(provider, data_type, entity_key)
+        self.store_payload(content_hash, payload_json)
+        fetched_at = datetime.now(timezone.utc)
         if existing is not None:
-            existing.payload_json = payload_json
+            previous_hash = str(existing.content_hash)
+            existing.legacy_payload = ""
             existing.content_hash = content_hash
             existing.ttl_seconds = ttl_seconds
             existing.etag = etag
             existing.last_modified = last_modified
-            existing.fetched_at = datetime.now(timezone.utc)
+            existing.fetched_at = fetched_at
+            if previous_hash != content_hash:
+                self._session.flush()
+                self._session.expire(existing, ["blob"])
+                self._delete_orphan_blobs([previous_hash])
         else:
             model = FetchCacheModel(
                 id=str(uuid.uuid4()),
                 provider=provider,
                 data_type=data_type,
                 entity_key=entity_key,
-                payload_json=payload_json,
+                legacy_payload="",
                 content_hash=content_hash,
                 ttl_seconds=ttl_seconds,
                 etag=etag,
                 last_modified=last_modified,
-                fetched_at=datetime.now(timezone.utc),
+                fetched_at=fetched_at,
             )
             self._session.add(model)
+        if self._memory is not None:
+            key = (provider, data_type, entity_key)
+            self._memory.discard(*key)
+            self._pending()[key] = CachedFetch(
+                provider=provider,
+                data_type=data_type,
+                entity_key=entity_key,
+                payload_json=payload_json,
+                content_hash=content_hash,
+                fetched_at=fetched_at,
+                ttl_seconds=ttl_seconds,
+                etag=etag,
+                last_modified=last_modified,
+            )
+
+    def _pending(self) -> dict[tuple[str, str, str], CachedFetch]:
+        """Entries upserted in the open transaction, keyed like the memory tier."""
+        return self._session.info.setdefault(self._pending_key, {})
+
+    def _publish_pending(self, session: Session) -> None:
+        pending = session.info.pop(self._pending_key, None)
+        if pending and self._memory is not None:
+            for entry in pending.values():
+                self._memory.put(entry)
+
+    def _drop_pending(self, session: Session, transaction: SessionTransaction) -> None:
+        # Reached after the commit published them, or on rollback/close
+        if transaction.parent is None:
+            session.info.pop(self._pending_key, None)
+
+    def store_payload(self, content_hash: str, payload_json: str) -> bool:
+        """Store *payload_json* under *content_hash* unless already stored.
+
+        Returns:
+            True when a new blob was written.
+        """
+        if self._session.get(FetchCacheBlobModel, content_hash) is not None:
+            return False
+        codec, data = encode_fetch_payload(payload_json)
+        self._session.add(
+            FetchCacheBlobModel(
+                content_hash=content_hash,
+                codec=codec,
+                payload=data,
+                raw_size=len(payload_json.encode("utf-8")),
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+        return True
 
     def invalidate(self, provider: str, data_type: str | None = None) -> int:
         """Remove cached entries. Returns count deleted."""
         q = self._session.query(FetchCacheModel).filter_by(provider=provider)
         if data_type is not None:
             q = q.filter_by(data_type=data_type)
-        count = q.count()
+        hashes = [h for (h,) in q.with_entities(FetchCacheModel.content_hash)]
+        count = len(hashes)
         q.delete(synchronize_session="fetch")
+        self._delete_orphan_blobs(hashes)
+        if self._memory is not None:
+            self._memory.invalidate(provider, data_type)
+            pending = self._pending()
+            for key in [
+                key
+                for key in pending
+                if key[0] == provider and (data_type is None or key[1] == data_type)
+            ]:
+                del pending[key]
         return count
 
+    def record_memory_hits(self) -> int:
+        """Write the memory tier's buffered hit times to ``last_hit_at``.
+
+        Memory hits skip the database, so their recency is written here in
+        one batch. A later hit already stored is never overwritten.
+
+        Returns:
+            Number of entries whose hit times were written.
+        """
+        if self._memory is None:
+            return 0
+        hits = self._memory.take_hits()
+        if not hits:
+            return 0
+        table = FetchCacheModel.__table__
+        self._session.execute(
+            update(table)
+            .where(
+                table.c.provider == bindparam("b_provider"),
+                table.c.data_type == bindparam("b_data_type"),
+                table.c.entity_key == bindparam("b_entity_key"),
+                or_(
+                    table.c.last_hit_at.is_(None),
+                    table.c.last_hit_at < bindparam("b_hit_at"),
+                ),
+            )
+            .values(last_hit_at=bindparam("b_hit_at")),
+            [
+                {
+                    "b_provider": provider,
+                    "b_data_type": data_type,
+                    "b_entity_key": entity_key,
+                    "b_hit_at": hit_at,
+                }
+                for (provider, data_type, entity_key), hit_at in hits.items()
+            ],
+        )
+        return len(hits)
+
+    def sweep(
+        self,
+        max_bytes: int,
+        max_stale_age: timedelta,
+        now: datetime | None = None,
+    ) -> FetchCacheSweep:
+        """Apply the retention policy; returns what was removed.
+
+        First removes entries more than *max_stale_age* past their TTL, then,
+        while the stored (compressed) payloads exceed *max_bytes*, removes
+        the least recently used entries, by last hit, else fetch time.
+        Hits answered from the memory tier are recorded first.
+        """
+        now = now or datetime.now(timezone.utc)
+        self.record_memory_hits()
+        rows = self._session.execute(
+            select(
+                FetchCacheModel.id,
+                FetchCacheModel.provider,
+                FetchCacheModel.data_type,
+                FetchCacheModel.entity_key,
+                FetchCacheModel.content_hash,
+                FetchCacheModel.fetched_at,
+                FetchCacheModel.ttl_seconds,
+                FetchCacheModel.last_hit_at,
+            )
+        ).all()
+        blob_sizes: dict[str, int] = dict(
+            self._session.execute(
+                select(
+                    FetchCacheBlobModel.content_hash,
+                    func.length(FetchCacheBlobModel.payload),
+                )
+            ).all()
+        )
+        refs = Counter(row.content_hash for row in rows)
+        expired = [
+            row
+            for row in rows
+            if now - _as_utc(row.fetched_at) - timedelta(seconds=row.ttl_seconds)
+            > max_stale_age
+        ]
+        for row in expired:
+            refs[row.content_hash] -= 1
+
+        stored = sum(size for h, size in blob_sizes.items() if refs[h] > 0)
+        evicted = []
+        if stored > max_bytes:
+            doomed = {row.id for row in expired}
+            by_recency = sorted(
+                (row for row in rows if row.id not in doomed),
+                key=lambda row: _as_utc(row.last_hit_at or row.fetched_at),
+            )
+            for row in by_recency:
+                if stored <= max_bytes:
+                    break
+                evicted.append(row)
+                refs[row.content_hash] -= 1
+                if refs[row.content_hash] == 0:
+                    stored -= blob_sizes.get(row.content_hash, 0)
+
+        removed = expired + evicted
+        ids = [row.id for row in removed]
+        for start in range(0, len(ids), _DELETE_BATCH):
+            self._session.execute(
+                delete(FetchCacheModel)
+                .where(FetchCacheModel.id.in_(ids[start : start + _DELETE_BATCH]))
+                .execution_options(synchronize_session="fetch")
+            )
+        orphans = [h for h in blob_sizes if refs[h] <= 0]
+        for start in range(0, len(orphans), _DELETE_BATCH):
+            self._delete_orphan_blobs(orphans[start : start + _DELETE_BATCH])
+        if self._memory is not None:
+            pending = self._pending()
+            for row in removed:
+                key = (row.provider, row.data_type, row.entity_key)
+                self._memory.discard(*key)
+                pending.pop(key, None)
+        return FetchCacheSweep(
+            expired=len(expired),
+            evicted=len(evicted),
+            blobs_deleted=len(orphans),
+            bytes_freed=sum(blob_sizes[h] for h in orphans),
+        )
+
+    def stats(self, now: datetime | None = None) -> FetchCacheStats:
+        """Entry and blob counts and sizes of the stored cache."""
+        now = now or datetime.now(timezone.utc)
+        rows = self._session.execute(
+            select(FetchCacheModel.fetched_at, FetchCacheModel.ttl_seconds)
+        ).all()
+        blobs, stored_bytes, raw_bytes = self._session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(func.length(FetchCacheBlobModel.payload)), 0),
+                func.coalesce(func.sum(FetchCacheBlobModel.raw_size), 0),
+            )
+        ).one()
+        fetched = [_as_utc(row.fetched_at) for row in rows]
+        return FetchCacheStats(
+            entries=len(rows),
+            stale_entries=sum(
+                1
+                for at, row in zip(fetched, rows)
+                if now - at > timedelta(seconds=row.ttl_seconds)
+            ),
+            blobs=blobs,
+            stored_bytes=stored_bytes,
+            raw_bytes=raw_bytes,
+            oldest_fetched_at=min(fetched, default=None),
+        )
+
+    def _delete_orphan_blobs(self, hashes: Collection[str]) -> None:
+        if not hashes:
+            return
+        referenced = select(FetchCacheModel.content_hash).where(
+            FetchCacheModel.content_hash.in_(set(hashes))
+        )
+        self._session.execute(
+            delete(FetchCacheBlobModel)
+            .where(FetchCacheBlobModel.content_hash.in_(set(hashes)))
+            .where(FetchCacheBlobModel.content_hash.not_in(referenced))
+            .execution_options(synchronize_session=False)
+        )
+
 
 class PipelineStateRepository:
     """Incremental state tracking for fetch steps — high-water marks, cursors."""
@@ -363,6 +684,20 @@ class AuditLogRepository:
             .all()
         )
 
+    def count_since(self, action: str, since: datetime) -> int:
+        """Count *action* entries created at or after *since*.
+
+        Served by ``ix_audit_log_action_created_at``.
+        """
+        return (
+            self._session.query(AuditLogModel)
+            .filter(
+                AuditLogModel.action == action,
+                AuditLogModel.created_at >= since,
+            )
+            .count()
+        )
+
 
 class DeliveryRepository:
     """CRUD operations for report deliveries (§9.2f, MEU-88)."""
@@ -12,8 +12,10 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from collections.abc import Sequence
+from typing import Any, Optional
 
+from sqlalchemy import insert, tuple_, update
 from sqlalchemy.orm import Session
 
 from zorivest_core.domain.entities import QuarterlyEstimate, TaxLot, TaxProfile
@@ -33,8 +35,8 @@ from zorivest_infra.database.models import (
 class SqlTaxLotRepository:
     """SQL-backed TaxLot repository.
 
-    Implements: get, save, update, delete, list_for_account,
-    list_filtered, count_filtered.
+    Implements: get, save, update, save_many, update_many, delete,
+    list_for_account, list_filtered, list_after, count_filtered.
     """
 
     def __init__(self, session: Session) -> None:
@@ -79,6 +81,24 @@ class SqlTaxLotRepository:
         model.sync_status = lot.sync_status
         self._session.flush()
 
+    def save_many(self, lots: Sequence[TaxLot]) -> None:
+        """Insert *lots* with one executemany instead of a flush per lot."""
+        if lots:
+            self._session.execute(
+                insert(TaxLotModel), [_lot_entity_to_row(lot) for lot in lots]
+            )
+
+    def update_many(self, lots: Sequence[TaxLot]) -> None:
+        """Write *lots* back by primary key with one executemany.
+
+        Unlike ``update`` there is no per-lot fetch or flush; lots already
+        loaded in the session are synchronized by SQLAlchemy.
+        """
+        if lots:
+            self._session.execute(
+                update(TaxLotModel), [_lot_entity_to_row(lot) for lot in lots]
+            )
+
     def delete(self, lot_id: str) -> None:
         model = self._session.get(TaxLotModel, lot_id)
         if model is not None:
@@ -112,6 +132,31 @@ class SqlTaxLotRepository:
         models = query.order_by(TaxLotModel.open_date).offset(offset).limit(limit).all()
         return [_lot_model_to_entity(m) for m in models]
 
+    def list_after(
+        self,
+        limit: int = 100,
+        after: tuple[datetime, str] | None = None,
+        account_id: str | None = None,
+        ticker: str | None = None,
+        is_closed: bool | None = None,
+    ) -> list[TaxLot]:
+        """Keyset page ordered by ``(open_date, lot_id)``, resuming after *after*."""
+        query = self._session.query(TaxLotModel)
+        if account_id is not None:
+            query = query.filter_by(account_id=account_id)
+        if ticker is not None:
+            query = query.filter_by(ticker=ticker)
+        if is_closed is not None:
+            query = query.filter_by(is_closed=is_closed)
+        if after is not None:
+            query = query.filter(
+                tuple_(TaxLotModel.open_date, TaxLotModel.lot_id) > after
+            )
+        models = (
+            query.order_by(TaxLotModel.open_date, TaxLotModel.lot_id).limit(limit).all()
+        )
+        return [_lot_model_to_entity(m) for m in models]
+
     def list_all_filtered(
         self,
         account_id: str | None = None,
@@ -264,32 +309,37 @@ def _lot_model_to_entity(model: TaxLotModel) -> TaxLot:
     )
 
 
-def _lot_entity_to_model(lot: TaxLot) -> TaxLotModel:
-    return TaxLotModel(
-        lot_id=lot.lot_id,
-        account_id=lot.account_id,
-        ticker=lot.ticker,
-        open_date=lot.open_date,
-        close_date=lot.close_date,
-        quantity=lot.quantity,
-        cost_basis=lot.cost_basis,
-        proceeds=lot.proceeds,
-        wash_sale_adjustment=lot.wash_sale_adjustment,
-        is_closed=lot.is_closed,
-        linked_trade_ids=json.dumps(lot.linked_trade_ids),
-        cost_basis_method=lot.cost_basis_method.value
+def _lot_entity_to_row(lot: TaxLot) -> dict[str, Any]:
+    """Column mapping for a lot, shared by the ORM and bulk write paths."""
+    return {
+        "lot_id": lot.lot_id,
+        "account_id": lot.account_id,
+        "ticker": lot.ticker,
+        "open_date": lot.open_date,
+        "close_date": lot.close_date,
+        "quantity": lot.quantity,
+        "cost_basis": lot.cost_basis,
+        "proceeds": lot.proceeds,
+        "wash_sale_adjustment": lot.wash_sale_adjustment,
+        "is_closed": lot.is_closed,
+        "linked_trade_ids": json.dumps(lot.linked_trade_ids),
+        "cost_basis_method": lot.cost_basis_method.value
         if lot.cost_basis_method
         else None,
-        realized_gain_loss=lot.realized_gain_loss,
-        acquisition_source=lot.acquisition_source.value
+        "realized_gain_loss": lot.realized_gain_loss,
+        "acquisition_source": lot.acquisition_source.value
         if lot.acquisition_source
         else None,
         # Phase 3F: Provenance tracking (MEU-216)
-        materialized_at=lot.materialized_at,
-        is_user_modified=lot.is_user_modified,
-        source_hash=lot.source_hash,
-        sync_status=lot.sync_status,
-    )
+        "materialized_at": lot.materialized_at,
+        "is_user_modified": lot.is_user_modified,
+        "source_hash": lot.source_hash,
+        "sync_status": lot.sync_status,
+    }
+
+
+def _lot_entity_to_model(lot: TaxLot) -> TaxLotModel:
+    return TaxLotModel(**_lot_entity_to_row(lot))
 
 
 def _profile_model_to_entity(model: TaxProfileModel) -> TaxProfile:
@@ -9,11 +9,14 @@ Provides transactional boundary with 18 repository attributes.
 
 from __future__ import annotations
 
+import asyncio
+import os
+from contextvars import ContextVar
 from typing import Any
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from zorivest_infra.database.repositories import (
     SqlAlchemyAccountRepository,
@@ -45,6 +48,9 @@ from zorivest_infra.database.email_provider_repository import (
 from zorivest_infra.database.email_template_repository import (
     EmailTemplateRepository,
 )
+from zorivest_infra.database.market_history_repository import (
+    SqlMarketHistoryRepository,
+)
 from zorivest_infra.database.tax_repository import (
     SqlQuarterlyEstimateRepository,
     SqlTaxLotRepository,
@@ -55,6 +61,58 @@ from zorivest_infra.database.wash_sale_repository import (
 )
 
 
+def _build_repositories(session: Session) -> dict[str, Any]:
+    """Instantiate every repository bound to *session*, keyed by UoW attribute."""
+    return {
+        "trades": SqlAlchemyTradeRepository(session),
+        "images": SqlAlchemyImageRepository(session),
+        "accounts": SqlAlchemyAccountRepository(session),
+        "balance_snapshots": SqlAlchemyBalanceSnapshotRepository(session),
+        "round_trips": SqlAlchemyRoundTripRepository(session),
+        "settings": SqlAlchemySettingsRepository(session),
+        "app_defaults": SqlAlchemyAppDefaultsRepository(session),
+        "market_provider_settings": SqlMarketProviderSettingsRepository(session),
+        "market_history": SqlMarketHistoryRepository(session),
+        "trade_reports": SqlAlchemyTradeReportRepository(session),  # MEU-52
+        "trade_plans": SqlAlchemyTradePlanRepository(session),  # MEU-66
+        # Scheduling repos (MEU-82)
+        "policies": PolicyRepository(session),
+        "pipeline_runs": PipelineRunRepository(session),
+        "reports": ReportRepository(session),
+        "fetch_cache": FetchCacheRepository(session),
+        "pipeline_state": PipelineStateRepository(session),  # MEU-85
+        "audit_log": AuditLogRepository(session),
+        "deliveries": DeliveryRepository(session),  # MEU-88
+        "watchlists": SqlAlchemyWatchlistRepository(session),  # MEU-90a
+        "email_provider": SqlAlchemyEmailProviderRepository(session),  # MEU-73
+        "email_templates": EmailTemplateRepository(session),  # MEU-PH6
+        "tax_lots": SqlTaxLotRepository(session),  # MEU-123
+        "tax_profiles": SqlTaxProfileRepository(session),  # MEU-124
+        "quarterly_estimates": SqlQuarterlyEstimateRepository(session),  # MEU-148
+        "wash_sale_chains": SqlWashSaleChainRepository(session),  # MEU-130
+    }
+
+
+def _current_task() -> asyncio.Task[Any] | None:
+    """Return the running asyncio task, or None when called outside a loop."""
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+class _SessionScope:
+    """Session + repositories owned by one request or task (scoped mode)."""
+
+    __slots__ = ("session", "repos", "depth", "owner")
+
+    def __init__(self, owner: asyncio.Task[Any] | None) -> None:
+        self.session: Session | None = None
+        self.repos: dict[str, Any] = {}
+        self.depth = 0
+        self.owner = owner
+
+
 class SqlAlchemyUnitOfWork:
     """Concrete UnitOfWork backed by SQLAlchemy Session.
 
@@ -64,6 +122,16 @@ class SqlAlchemyUnitOfWork:
         with uow:
             uow.trades.save(trade)
             uow.commit()
+
+    Two session scoping modes are supported:
+
+    - **shared** (default): one reentrant session per UoW instance.  Nested
+      ``with uow:`` blocks reuse it via depth counting.
+    - **scoped** (``scoped=True``): each request/task gets its own session.
+      The scope is tracked in a ``ContextVar``, so code offloaded to a worker
+      thread (``run_in_threadpool``) joins the caller's session, while a
+      separate asyncio task (e.g. a scheduled pipeline) opens its own.
+      Repository attributes and ``_session`` resolve to the caller's scope.
     """
 
     trades: SqlAlchemyTradeRepository
@@ -74,6 +142,7 @@ class SqlAlchemyUnitOfWork:
     settings: SqlAlchemySettingsRepository
     app_defaults: SqlAlchemyAppDefaultsRepository
     market_provider_settings: SqlMarketProviderSettingsRepository
+    market_history: SqlMarketHistoryRepository
     trade_reports: SqlAlchemyTradeReportRepository  # MEU-52
     trade_plans: SqlAlchemyTradePlanRepository  # MEU-66
     # Scheduling repos (MEU-82)
@@ -92,49 +161,91 @@ class SqlAlchemyUnitOfWork:
     quarterly_estimates: SqlQuarterlyEstimateRepository  # MEU-148
     wash_sale_chains: SqlWashSaleChainRepository  # MEU-130
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: Engine, *, scoped: bool = False) -> None:
         self._engine = engine
         self._session_factory = sessionmaker(bind=engine)
-        self._session: Session | None = None
+        self._scoped = scoped
         self._depth: int = 0
+        if scoped:
+            self._scope_var: ContextVar[_SessionScope | None] = ContextVar(
+                f"uow_scope_{id(self)}", default=None
+            )
+            self._registry = scoped_session(
+                self._session_factory, scopefunc=self._require_scope
+            )
+        else:
+            self._session: Session | None = None
+
+    @property
+    def scoped(self) -> bool:
+        """True when sessions are scoped per request/task."""
+        return self._scoped
+
+    @property
+    def contextual_session(self) -> Session:
+        """Session handle for long-lived collaborators built at startup.
+
+        In scoped mode this is a ``scoped_session`` proxy that resolves to
+        the caller's current scope on every call, so adapters such as
+        ``DbWriteAdapter`` never pin a single connection.  In shared mode
+        it is the shared session itself (the UoW must already be entered).
+        """
+        if self._scoped:
+            return self._registry  # type: ignore[return-value]
+        if self._session is None:
+            raise RuntimeError("UnitOfWork must be entered before use")
+        return self._session
+
+    # ── Scoped-mode internals ───────────────────────────────────────────
+
+    def _active_scope(self) -> _SessionScope | None:
+        scope = self._scope_var.get()
+        if scope is None or scope.depth == 0:
+            return None
+        task = _current_task()
+        if task is not None and scope.owner is not task:
+            # Context was inherited by a different task: give it its own session.
+            return None
+        return scope
+
+    def _require_scope(self) -> _SessionScope:
+        scope = self._active_scope()
+        if scope is None:
+            raise RuntimeError(
+                "No active unit-of-work scope; wrap the call in 'with uow:'"
+            )
+        return scope
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not set on the instance (scoped mode).
+        if name.startswith("__") or not self.__dict__.get("_scoped", False):
+            raise AttributeError(name)
+        if name == "_session":
+            scope = self._active_scope()
+            return scope.session if scope is not None else None
+        if name in _REPOSITORY_NAMES:
+            return self._require_scope().repos[name]
+        raise AttributeError(name)
+
+    # ── Context manager ─────────────────────────────────────────────────
 
     def __enter__(self) -> SqlAlchemyUnitOfWork:
+        if self._scoped:
+            scope = self._active_scope()
+            if scope is None:
+                scope = _SessionScope(owner=_current_task())
+                self._scope_var.set(scope)
+                scope.depth = 1
+                scope.session = self._registry()
+                scope.repos = _build_repositories(scope.session)
+            else:
+                scope.depth += 1
+            return self
         self._depth += 1
         if self._session is None:
             self._session = self._session_factory()
-            self.trades = SqlAlchemyTradeRepository(self._session)
-            self.images = SqlAlchemyImageRepository(self._session)
-            self.accounts = SqlAlchemyAccountRepository(self._session)
-            self.balance_snapshots = SqlAlchemyBalanceSnapshotRepository(self._session)
-            self.round_trips = SqlAlchemyRoundTripRepository(self._session)
-            self.settings = SqlAlchemySettingsRepository(self._session)
-            self.app_defaults = SqlAlchemyAppDefaultsRepository(self._session)
-            self.market_provider_settings = SqlMarketProviderSettingsRepository(
-                self._session
-            )
-            self.trade_reports = SqlAlchemyTradeReportRepository(
-                self._session
-            )  # MEU-52
-            self.trade_plans = SqlAlchemyTradePlanRepository(self._session)  # MEU-66
-            # Scheduling repos (MEU-82)
-            self.policies = PolicyRepository(self._session)
-            self.pipeline_runs = PipelineRunRepository(self._session)
-            self.reports = ReportRepository(self._session)
-            self.fetch_cache = FetchCacheRepository(self._session)
-            self.pipeline_state = PipelineStateRepository(self._session)  # MEU-85
-            self.audit_log = AuditLogRepository(self._session)
-            self.deliveries = DeliveryRepository(self._session)  # MEU-88
-            self.watchlists = SqlAlchemyWatchlistRepository(self._session)  # MEU-90a
-            self.email_provider = SqlAlchemyEmailProviderRepository(
-                self._session
-            )  # MEU-73
-            self.email_templates = EmailTemplateRepository(self._session)  # MEU-PH6
-            self.tax_lots = SqlTaxLotRepository(self._session)  # MEU-123
-            self.tax_profiles = SqlTaxProfileRepository(self._session)  # MEU-124
-            self.quarterly_estimates = SqlQuarterlyEstimateRepository(
-                self._session
-            )  # MEU-148
-            self.wash_sale_chains = SqlWashSaleChainRepository(self._session)  # MEU-130
+            for name, repo in _build_repositories(self._session).items():
+                setattr(self, name, repo)
         return self
 
     def __exit__(
@@ -143,6 +254,21 @@ class SqlAlchemyUnitOfWork:
         exc_val: BaseException | None,
         exc_tb: Any,
     ) -> None:
+        if self._scoped:
+            scope = self._active_scope()
+            if scope is None:
+                return
+            if exc_type is not None and scope.session is not None:
+                scope.session.rollback()  # Always rollback on exception
+            if scope.depth == 1:
+                self._registry.remove()  # Closes the scope's session
+                scope.session = None
+                scope.repos = {}
+                scope.depth = 0
+                self._scope_var.set(None)
+            else:
+                scope.depth -= 1
+            return
         self._depth -= 1
         if self._session is not None:
             if exc_type is not None:
@@ -162,8 +288,18 @@ class SqlAlchemyUnitOfWork:
             self._session.rollback()
 
 
+# Repository attribute names resolved per scope by ``__getattr__``.
+_REPOSITORY_NAMES: frozenset[str] = frozenset(SqlAlchemyUnitOfWork.__annotations__)
+
+
+# Milliseconds a connection waits for the SQLite write lock before raising
+# "database is locked".  WAL allows one writer at a time; with a pooled
+# engine, concurrent writers queue on this timeout instead of failing.
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+
 def _set_sqlite_pragmas(dbapi_conn: Any, connection_record: Any) -> None:
-    """Set WAL mode and NORMAL sync on SQLite connections.
+    """Set WAL mode, NORMAL sync and a busy timeout on SQLite connections.
 
     Module-level function (not a closure) so the engine remains picklable.
     APScheduler's SQLAlchemyJobStore pickles job callbacks that transitively
@@ -173,21 +309,47 @@ def _set_sqlite_pragmas(dbapi_conn: Any, connection_record: Any) -> None:
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA journal_mode=wal")
     cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
     cursor.close()
 
 
-def create_engine_with_wal(url: str, **kwargs: Any) -> Engine:
+def default_reader_count() -> int:
+    """Number of pooled WAL reader connections (one per core, at least 2)."""
+    return max(2, os.cpu_count() or 1)
+
+
+def create_engine_with_wal(
+    url: str, *, readers: int | None = None, **kwargs: Any
+) -> Engine:
     """Create a SQLAlchemy engine with WAL mode enabled.
 
     Per 02-infrastructure.md spec:
     - WAL journaling for concurrent read/write
     - NORMAL synchronous for performance
     - check_same_thread=False for multi-thread access
+
+    File-backed databases get a connection pool sized for one writer plus
+    *readers* concurrent WAL readers (default: one per core).  SQLite
+    itself serializes writers; readers never block on them under WAL.
+    In-memory URLs keep SQLAlchemy's default single-connection pool.
     """
     connect_args = kwargs.pop("connect_args", {})
     connect_args.setdefault("check_same_thread", False)
 
+    if _is_file_database(url):
+        reader_count = readers if readers is not None else default_reader_count()
+        kwargs.setdefault("pool_size", 1 + reader_count)
+        kwargs.setdefault("max_overflow", 0)
+
     engine = create_engine(url, connect_args=connect_args, **kwargs)
     event.listens_for(engine, "connect")(_set_sqlite_pragmas)
 
     return engine
+
+
+def _is_file_database(url: str) -> bool:
+    """True for sqlite URLs that point at a file (not ``:memory:``)."""
+    if not url.startswith("sqlite"):
+        return False
+    path = url.split("///", 1)[1] if "///" in url else ""
+    return bool(path) and path != ":memory:" and "mode=memory" not in path
@@ -394,3 +394,44 @@ def apply_field_mapping(
 
     result["_extra"] = extras
     return result
+
+
+def apply_field_mapping_columns(
+    *,
+    columns: dict[str, list],
+    provider: str,
+    data_type: str,
+) -> dict[str, Any]:
+    """Column-wise ``apply_field_mapping``: rename whole columns at once.
+
+    Produces the transpose of mapping each record: mapped columns under
+    their canonical names (a later source field wins a clash, as in a
+    record), then ``_extra`` with one dict of unmapped fields per record.
+    The column lists are passed through, not copied.
+
+    Args:
+        columns: Equal-length value lists keyed by provider field name.
+        provider: Data provider key (e.g., 'yahoo', 'polygon').
+        data_type: Data type key (e.g., 'ohlcv').
+
+    Returns:
+        Dict of canonical field → values, plus ``_extra``.
+    """
+    slug = _PROVIDER_SLUG_MAP.get(provider, provider)
+    mapping = FIELD_MAPPINGS.get((slug, data_type), {})
+
+    result: dict[str, Any] = {}
+    unmapped: dict[str, list] = {}
+    for src_field, values in columns.items():
+        if src_field in mapping:
+            result[mapping[src_field]] = values
+        else:
+            unmapped[src_field] = values
+
+    length = len(next(iter(columns.values()), []))
+    if unmapped:
+        names = list(unmapped)
+        result["_extra"] = [dict(zip(names, row)) for row in zip(*unmapped.values())]
+    else:
+        result["_extra"] = [{} for _ in range(length)]
+    return result
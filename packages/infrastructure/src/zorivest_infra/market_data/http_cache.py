@@ -4,25 +4,44 @@
 Provides fetch_with_cache() for conditional HTTP requests that
 minimize bandwidth by revalidating cached responses via ETags.
 
+Clients with a ``stream()`` method (``HttpxClient``, ``httpx.AsyncClient``)
+have the body read in chunks, so the body size cap and MIME allowlist
+reject a response from its headers, or as soon as the running byte count
+passes the cap, instead of after the whole body is buffered.
+
 Spec: 09-scheduling.md §9.4e
 MEU: 85
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
+from zorivest_core.services.sql_sandbox import SecurityError
+
+# Bytes of an error body kept for HttpFetchError.body_preview
+_PREVIEW_BYTES = 200
+
 
 class HttpFetchError(Exception):
     """Raised when an HTTP fetch returns a non-2xx status code.
 
     Prevents error HTML/JSON from being silently cached as valid data.
+    ``retry_after`` holds the raw ``Retry-After`` header, if any.
     """
 
-    def __init__(self, status_code: int, url: str, body_preview: str = "") -> None:
+    def __init__(
+        self,
+        status_code: int,
+        url: str,
+        body_preview: str = "",
+        retry_after: str | None = None,
+    ) -> None:
         self.status_code = status_code
         self.url = url
         self.body_preview = body_preview
+        self.retry_after = retry_after
         super().__init__(
             f"HTTP {status_code} from {url}"
             + (f": {body_preview}" if body_preview else "")
@@ -40,6 +59,8 @@ async def fetch_with_cache(
     cached_last_modified: str | None = None,
     timeout: int | float | Any = 30,
     extra_headers: dict[str, str] | None = None,
+    max_body_bytes: int | None = None,
+    allowed_mime_types: Sequence[str] | None = None,
 ) -> dict[str, Any]:
     """Fetch URL content with HTTP cache revalidation.
 
@@ -55,14 +76,20 @@ async def fetch_with_cache(
             the ``json=`` parameter to the HTTP client. Ignored for GET.
         extra_headers: Provider-specific headers (auth tokens, User-Agent)
             to include in every request. Merged with cache headers.
+        max_body_bytes: Reject bodies larger than this (§9C.4b).
+        allowed_mime_types: Reject a 2xx response whose Content-Type is
+            not in this list (§9C.4c). A missing Content-Type is allowed.
 
     Returns:
-        Dict with keys: content, cache_status, etag, last_modified
+        Dict with keys: content, cache_status, etag, last_modified,
+        content_type
 
     Raises:
         ValueError: If method is not "GET" or "POST".
         HttpFetchError: If the server returns a non-2xx status code
             (except 304 which is handled as cache revalidation for GET).
+        SecurityError: If the body exceeds ``max_body_bytes`` or the
+            Content-Type is not allowed.
     """
     if method not in ("GET", "POST"):
         raise ValueError(
@@ -74,39 +101,121 @@ async def fetch_with_cache(
     if extra_headers:
         headers.update(extra_headers)
 
-    if method == "POST":
-        # POST requests skip conditional cache headers (RFC 9110 §9.3.3)
-        response = await client.post(
-            url, headers=headers, timeout=timeout, json=json_body
-        )
-    else:
+    if method == "GET":
         # GET: add cache revalidation headers
+        # (POST requests skip conditional cache headers, RFC 9110 §9.3.3)
         if cached_etag:
             headers["If-None-Match"] = cached_etag
         if cached_last_modified:
             headers["If-Modified-Since"] = cached_last_modified
-        response = await client.get(url, headers=headers, timeout=timeout)
-
-    if response.status_code == 304 and cached_content is not None:
-        # Not Modified — cached data is still valid (GET only)
-        return {
-            "content": cached_content,
-            "cache_status": "revalidated",
-            "etag": cached_etag,
-            "last_modified": cached_last_modified,
-        }
-
-    # Validate HTTP status — reject non-2xx responses before caching
-    if response.status_code < 200 or response.status_code >= 300:
-        body_bytes = response.content if hasattr(response, "content") else b""
-        preview = body_bytes[:200].decode("utf-8", errors="replace")
-        raise HttpFetchError(response.status_code, url, preview)
-
-    # New or updated content
-    content = response.content if hasattr(response, "content") else response.read()
+
+    # Mocks answer every attribute, so look ``stream`` up on the class
+    if callable(getattr(type(client), "stream", None)):
+        request: dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if method == "POST":
+            request["json"] = json_body
+        async with client.stream(method, url, **request) as response:
+            cached = _not_modified(
+                response, cached_content, cached_etag, cached_last_modified
+            )
+            if cached is not None:
+                return cached
+            if not 200 <= response.status_code < 300:
+                preview = b""
+                async for chunk in response.aiter_bytes():
+                    preview += chunk
+                    if len(preview) >= _PREVIEW_BYTES:
+                        break
+                _raise_for_status(response, url, preview)
+            content_type = response.headers.get("Content-Type")
+            _check_mime_type(content_type, allowed_mime_types)
+            declared = response.headers.get("Content-Length")
+            if declared is not None and declared.isdigit():
+                _check_body_size(int(declared), max_body_bytes)
+            chunks: list[bytes] = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                _check_body_size(received, max_body_bytes)
+                chunks.append(chunk)
+            content = b"".join(chunks)
+    else:
+        if method == "POST":
+            response = await client.post(
+                url, headers=headers, timeout=timeout, json=json_body
+            )
+        else:
+            response = await client.get(url, headers=headers, timeout=timeout)
+        cached = _not_modified(
+            response, cached_content, cached_etag, cached_last_modified
+        )
+        if cached is not None:
+            return cached
+        # Validate HTTP status — reject non-2xx responses before caching
+        if not 200 <= response.status_code < 300:
+            body_bytes = response.content if hasattr(response, "content") else b""
+            _raise_for_status(response, url, body_bytes)
+        content_type = response.headers.get("Content-Type")
+        _check_mime_type(content_type, allowed_mime_types)
+        # New or updated content
+        content = response.content if hasattr(response, "content") else response.read()
+        _check_body_size(len(content), max_body_bytes)
+
     return {
         "content": content,
         "cache_status": "miss",
         "etag": response.headers.get("ETag"),
         "last_modified": response.headers.get("Last-Modified"),
+        "content_type": content_type,
     }
+
+
+def _not_modified(
+    response: Any,
+    cached_content: bytes | None,
+    cached_etag: str | None,
+    cached_last_modified: str | None,
+) -> dict[str, Any] | None:
+    """The cached result when the server answered 304 Not Modified (GET only)."""
+    if response.status_code != 304 or cached_content is None:
+        return None
+    return {
+        "content": cached_content,
+        "cache_status": "revalidated",
+        "etag": cached_etag,
+        "last_modified": cached_last_modified,
+    }
+
+
+def _raise_for_status(response: Any, url: str, body: bytes) -> None:
+    preview = body[:_PREVIEW_BYTES].decode("utf-8", errors="replace")
+    raise HttpFetchError(
+        response.status_code,
+        url,
+        preview,
+        retry_after=response.headers.get("Retry-After"),
+    )
+
+
+def _check_body_size(size: int, max_body_bytes: int | None) -> None:
+    """§9C.4b: body size cap."""
+    if max_body_bytes is not None and size > max_body_bytes:
+        raise SecurityError(
+            f"Response body size exceeds {max_body_bytes} byte limit "
+            f"({size} bytes received or declared, §9C.4b)"
+        )
+
+
+def _check_mime_type(
+    content_type: str | None, allowed_mime_types: Sequence[str] | None
+) -> None:
+    """§9C.4c: MIME type allowlist."""
+    if not allowed_mime_types or not content_type:
+        return
+    # Normalize: strip parameters (e.g., "application/json; charset=utf-8")
+    base_type = content_type.split(";")[0].strip().lower()
+    allowed = [m.lower() for m in allowed_mime_types]
+    if base_type not in allowed:
+        raise SecurityError(
+            f"Response MIME type mismatch: got '{base_type}', allowed: {allowed}"
+        )
@@ -0,0 +1,256 @@
+# packages/infrastructure/src/zorivest_infra/market_data/json_stream.py
+"""Incremental JSON reading for large provider responses.
+
+``JsonStreamReader`` walks a JSON document held as a sequence of byte
+chunks without building the whole tree. The caller steers it through the
+envelope (``iter_object`` / ``iter_array``) and decides per value whether
+to decode it (``read_value``, or ``iter_values`` element by element),
+drop it (``skip_value``), or read a flat numeric array straight into an
+``array.array`` (``read_number_array``).
+Only the text of the value being read is buffered, so peak memory follows
+the largest single value rather than the document.
+
+Values are decoded with the stdlib ``json`` scanner, which is the C
+accelerator from ``_json`` when available and pure Python otherwise.
+
+Used by the streaming extractors in response_extractors.py.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Buffered text is dropped once this much of it has been consumed
+_COMPACT_AT = 1 << 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_WHITESPACE_CHARS = frozenset(" \t\n\r")
+_SCALAR_END = re.compile(r"[,\]} \t\n\r]")
+_DECODER = json.JSONDecoder()
+
+
+class StreamingShapeError(ValueError):
+    """The document is malformed or not the shape the caller expected."""
+
+
+def iter_chunks(raw: bytes | str, size: int = 1 << 16) -> Iterator[bytes | str]:
+    """Split an in-memory body into chunks for ``JsonStreamReader``."""
+    view = memoryview(raw) if isinstance(raw, bytes) else raw
+    for start in range(0, len(raw), size):
+        yield view[start : start + size]  # type: ignore[misc]
+
+
+class JsonStreamReader:
+    """Pull-style reader over UTF-8 byte (or str) chunks.
+
+    Navigation is cursor-based: after ``iter_object`` yields a key or
+    ``iter_array`` yields for an element, the caller must consume exactly
+    that value (read, skip, or descend into it) before resuming the loop.
+    """
+
+    def __init__(self, chunks: Iterable[bytes | memoryview | str]) -> None:
+        self._chunks = iter(chunks)
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    # -- buffer ---------------------------------------------------------
+
+    def _fill(self) -> bool:
+        """Append the next non-empty chunk; False once the input is exhausted."""
+        if self._eof:
+            return False
+        if self._pos >= _COMPACT_AT:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = chunk if isinstance(chunk, str) else self._decode(chunk)
+            if text:
+                self._buf += text
+                return True
+        self._buf += self._decode(b"", True)
+        self._eof = True
+        return False
+
+    def _grow(self, amount: int) -> bool:
+        """Buffer at least *amount* more characters; False if none were added."""
+        target = len(self._buf) - self._pos + max(amount, 1)
+        added = False
+        while len(self._buf) - self._pos < target and self._fill():
+            added = True
+        return added
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise StreamingShapeError(f"expected {char!r}, found {found!r}")
+        self._pos += 1
+
+    # -- navigation -----------------------------------------------------
+
+    def peek_type(self) -> str:
+        """Kind of the next value: 'object', 'array', 'string' or 'scalar'."""
+        char = self._peek()
+        if not char:
+            raise StreamingShapeError("unexpected end of document")
+        return {"{": "object", "[": "array", '"': "string"}.get(char, "scalar")
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield each key of the object at the cursor, positioned at its value."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek_type() != "string":
+                raise StreamingShapeError("object key is not a string")
+            key = self.read_value()
+            self._expect(":")
+            yield key
+            char = self._peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise StreamingShapeError(f"expected ',' or '}}', found {char!r}")
+
+    def iter_array(self) -> Iterator[int]:
+        """Yield the index of each element of the array at the cursor."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            char = self._peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise StreamingShapeError(f"expected ',' or ']', found {char!r}")
+
+    def iter_values(self) -> Iterator[Any]:
+        """Yield each element of the array at the cursor, decoded.
+
+        Elements already in the buffer are decoded in a tight loop; only
+        one that spans a chunk boundary goes through ``read_value``.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        decode = _DECODER.raw_decode
+        while True:
+            buf, pos, size = self._buf, self._pos, len(self._buf)
+            while True:
+                if pos < size and buf[pos] in _WHITESPACE_CHARS:
+                    pos = _WHITESPACE.match(buf, pos).end()  # type: ignore[union-attr]
+                if pos >= size or buf[pos] not in '{["':
+                    break
+                try:
+                    value, end = decode(buf, pos)
+                except json.JSONDecodeError:
+                    break
+                if end < size and buf[end] in _WHITESPACE_CHARS:
+                    end = _WHITESPACE.match(buf, end).end()  # type: ignore[union-attr]
+                if end >= size:
+                    break
+                char = buf[end]
+                if char not in ",]":
+                    raise StreamingShapeError(f"expected ',' or ']', found {char!r}")
+                self._pos = pos = end + 1
+                yield value
+                if char == "]":
+                    return
+            value = self.read_value()
+            char = self._peek()
+            self._pos += 1
+            if char not in ",]":
+                raise StreamingShapeError(f"expected ',' or ']', found {char!r}")
+            yield value
+            if char == "]":
+                return
+
+    # -- values ---------------------------------------------------------
+
+    def read_value(self) -> Any:
+        """Decode the value at the cursor."""
+        if self._peek() not in '{["':
+            # A number cut off by the chunk boundary would decode as its
+            # prefix, so buffer up to the next delimiter first
+            while not _SCALAR_END.search(self._buf, self._pos) and self._fill():
+                pass
+        while True:
+            try:
+                value, self._pos = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                # Incomplete so far: at least double what is buffered, so a
+                # large value costs O(n) decoding in total, not O(n²)
+                if not self._grow(len(self._buf) - self._pos):
+                    raise StreamingShapeError(str(exc)) from exc
+                continue
+            return value
+
+    def skip_value(self) -> None:
+        """Consume the value at the cursor without keeping it."""
+        kind = self.peek_type()
+        if kind == "object":
+            for _ in self.iter_object():
+                self.skip_value()
+        elif kind == "array":
+            for _ in self.iter_array():
+                self.skip_value()
+        else:
+            self.read_value()
+
+    def read_number_array(self, typecode: str = "d") -> array:
+        """Read a flat array of numbers (and nulls) into ``array(typecode)``.
+
+        Nulls become NaN, so *typecode* must be a float type when the array
+        may hold them. Numbers are converted a chunk at a time, so the text
+        is never held whole. Raises StreamingShapeError for anything else.
+        """
+        self._expect("[")
+        convert = float if typecode in "fd" else int
+        values = array(typecode)
+        carry = ""  # number cut off at the end of the previous chunk
+        while True:
+            end = self._buf.find("]", self._pos)
+            text = carry + self._buf[self._pos : end if end >= 0 else None]
+            if end >= 0:
+                self._pos = end + 1
+                carry = ""
+            else:
+                self._buf, self._pos = "", 0
+                cut = text.rfind(",")
+                carry, text = text[cut + 1 :], text[: max(cut, 0)]
+            if text.strip():
+                if "null" in text:
+                    text = text.replace("null", "NaN")
+                try:
+                    values.extend(map(convert, text.split(",")))
+                except (ValueError, OverflowError) as exc:
+                    # Nested containers, strings, or non-integers for ints
+                    raise StreamingShapeError(
+                        f"not a flat number array: {exc}"
+                    ) from exc
+            if end >= 0:
+                return values
+            if not self._fill():
+                raise StreamingShapeError("unterminated array")
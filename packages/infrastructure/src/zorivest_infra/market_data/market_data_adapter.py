@@ -13,6 +13,7 @@ Spec: 09-scheduling.md §9.4, implementation-plan.md Component 2
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
 
@@ -80,6 +81,8 @@ class MarketDataProviderAdapter:
         cached_content: bytes | None = None,
         cached_etag: str | None = None,
         cached_last_modified: str | None = None,
+        max_body_bytes: int | None = None,
+        allowed_mime_types: list[str] | None = None,
     ) -> FetchAdapterResult:
         """Fetch market data from a provider with rate limiting and cache revalidation.
 
@@ -96,9 +99,13 @@ class MarketDataProviderAdapter:
             cached_content: Previously cached response bytes for conditional request.
             cached_etag: ETag from previous response for If-None-Match.
             cached_last_modified: Last-Modified from previous response.
+            max_body_bytes: Abort a download once its body passes this size.
+            allowed_mime_types: Reject responses with any other Content-Type
+                before reading the body.
 
         Returns:
-            FetchAdapterResult with content, cache_status, etag, last_modified.
+            FetchAdapterResult with content, cache_status, etag,
+            last_modified, content_type.
 
         Raises:
             ValueError: If data_type is not one of the valid types.
@@ -116,6 +123,10 @@ class MarketDataProviderAdapter:
             raise KeyError(f"Unknown provider '{provider}'. Available: {available}")
 
         tickers = resolve_tickers(criteria)
+        limits = {
+            "max_body_bytes": max_body_bytes,
+            "allowed_mime_types": allowed_mime_types,
+        }
 
         # When there are multiple tickers and the provider uses per-ticker
         # URLs (e.g. Yahoo v8/chart), iterate and merge results.
@@ -126,6 +137,7 @@ class MarketDataProviderAdapter:
                 data_type=data_type,
                 tickers=tickers,
                 criteria=criteria,
+                limits=limits,
             )
 
         # Single ticker (or no tickers) — standard single-request path
@@ -158,6 +170,7 @@ class MarketDataProviderAdapter:
             cached_etag=cached_etag,
             cached_last_modified=cached_last_modified,
             extra_headers=extra_headers,
+            **limits,
         )
 
         return FetchAdapterResult(
@@ -165,6 +178,7 @@ class MarketDataProviderAdapter:
             cache_status=result["cache_status"],
             etag=result.get("etag"),
             last_modified=result.get("last_modified"),
+            content_type=result.get("content_type"),
         )
 
     async def _fetch_multi_ticker(
@@ -175,13 +189,15 @@ class MarketDataProviderAdapter:
         data_type: str,
         tickers: list[str],
         criteria: dict[str, Any],
+        limits: dict[str, Any],
     ) -> FetchAdapterResult:
         """Fetch data for each ticker individually and merge into one response.
 
         Yahoo v8/chart (and similar APIs) only support one symbol per request.
-        This method iterates over all tickers, builds a per-ticker URL, fetches
-        via the rate limiter, and merges the parsed JSON records into a single
-        JSON array as the combined content.
+        This method builds a per-ticker URL for every ticker, fetches them
+        concurrently via the rate limiter, and merges the parsed JSON records
+        into a single JSON array in ticker order. Tickers whose request fails
+        are logged and left out.
 
         The downstream TransformStep → extract_records() will receive a top-level
         JSON list of record dicts, which the generic extractor handles correctly.
@@ -213,67 +229,52 @@ class MarketDataProviderAdapter:
                 cached_etag=None,
                 cached_last_modified=None,
                 extra_headers=extra_headers,
+                **limits,
             )
             return FetchAdapterResult(
                 content=result["content"],
                 cache_status=result["cache_status"],
                 etag=result.get("etag"),
                 last_modified=result.get("last_modified"),
+                content_type=result.get("content_type"),
             )
 
-        # GET per-ticker iteration for providers without build_request()
-        all_records: list[dict[str, Any]] = []
-        last_etag: str | None = None
-        last_modified: str | None = None
-
-        for ticker in tickers:
-            # Build per-ticker URL
-            url = builder.build_url(config.base_url, data_type, [ticker], criteria)
-            url = self._inject_query_param_key(url, config, provider)
-            logger.info(
-                "fetch_multi_ticker",
-                provider=provider,
-                ticker=ticker,
-                url=url,
+        # GET per-ticker fan-out for providers without build_request().
+        # Requests run concurrently; the rate limiter's global semaphore and
+        # per-provider token bucket bound how many are in flight at once.
+        urls = [
+            self._inject_query_param_key(
+                builder.build_url(config.base_url, data_type, [ticker], criteria),
+                config,
+                provider,
             )
-
-            try:
-                result = await self._rate_limiter.execute_with_limits(
-                    provider,
-                    self._do_fetch,
-                    url,
-                    cached_content=None,
-                    cached_etag=None,
-                    cached_last_modified=None,
-                    extra_headers=extra_headers,
-                )
-            except Exception:
-                logger.warning(
-                    "fetch_multi_ticker_error",
+            for ticker in tickers
+        ]
+        results = await asyncio.gather(
+            *(
+                self._fetch_ticker_records(
                     provider=provider,
+                    data_type=data_type,
                     ticker=ticker,
-                    exc_info=True,
-                )
-                continue
-
-            # Parse the individual response and extract records
-            content = result["content"]
-            try:
-                from zorivest_infra.market_data.response_extractors import (
-                    extract_records,
+                    url=url,
+                    extra_headers=extra_headers,
+                    limits=limits,
                 )
+                for ticker, url in zip(tickers, urls)
+            )
+        )
 
-                records = extract_records(content, provider, data_type)
-                all_records.extend(records)
-            except Exception:
-                logger.warning(
-                    "fetch_multi_ticker_extract_error",
-                    provider=provider,
-                    ticker=ticker,
-                    exc_info=True,
-                )
+        # gather() preserves argument order, so records follow the ticker list.
+        all_records: list[dict[str, Any]] = []
+        last_etag: str | None = None
+        last_modified: str | None = None
+        failed = 0
+        for outcome in results:
+            if outcome is None:
+                failed += 1
                 continue
-
+            records, result = outcome
+            all_records.extend(records)
             # Keep the last response's cache headers
             last_etag = result.get("etag") or last_etag
             last_modified = result.get("last_modified") or last_modified
@@ -282,6 +283,7 @@ class MarketDataProviderAdapter:
             "fetch_multi_ticker_complete",
             provider=provider,
             tickers_requested=len(tickers),
+            tickers_failed=failed,
             records_merged=len(all_records),
         )
 
@@ -296,6 +298,64 @@ class MarketDataProviderAdapter:
             last_modified=last_modified,
         )
 
+    async def _fetch_ticker_records(
+        self,
+        *,
+        provider: str,
+        data_type: str,
+        ticker: str,
+        url: str,
+        extra_headers: dict[str, str],
+        limits: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]] | None:
+        """Fetch one ticker of a multi-ticker request and extract its records.
+
+        Returns None (after logging) when the request or extraction fails,
+        so one bad ticker never fails the whole batch.
+        """
+        logger.info(
+            "fetch_multi_ticker",
+            provider=provider,
+            ticker=ticker,
+            url=url,
+        )
+        try:
+            result: dict[str, Any] = await self._rate_limiter.execute_with_limits(
+                provider,
+                self._do_fetch,
+                url,
+                cached_content=None,
+                cached_etag=None,
+                cached_last_modified=None,
+                extra_headers=extra_headers,
+                **limits,
+            )
+        except Exception:
+            logger.warning(
+                "fetch_multi_ticker_error",
+                provider=provider,
+                ticker=ticker,
+                exc_info=True,
+            )
+            return None
+
+        # Parse the individual response and extract records
+        try:
+            from zorivest_infra.market_data.response_extractors import (
+                extract_records,
+            )
+
+            records = extract_records(result["content"], provider, data_type)
+        except Exception:
+            logger.warning(
+                "fetch_multi_ticker_extract_error",
+                provider=provider,
+                ticker=ticker,
+                exc_info=True,
+            )
+            return None
+        return records, result
+
     async def _do_fetch(
         self,
         url: str,
@@ -306,11 +366,15 @@ class MarketDataProviderAdapter:
         cached_etag: str | None = None,
         cached_last_modified: str | None = None,
         extra_headers: dict[str, str] | None = None,
+        max_body_bytes: int | None = None,
+        allowed_mime_types: list[str] | None = None,
     ) -> dict[str, Any]:
         """Execute the HTTP fetch with cache revalidation.
 
         Supports both GET and POST methods. POST providers (OpenFIGI, SEC API)
-        pass method='POST' and json_body from their RequestSpec.
+        pass method='POST' and json_body from their RequestSpec. The body is
+        streamed and abandoned as soon as it breaks ``max_body_bytes`` or
+        ``allowed_mime_types``, which frees the rate limiter slot early.
         """
         return await fetch_with_cache(
             client=self._http_client,
@@ -322,6 +386,8 @@ class MarketDataProviderAdapter:
             cached_last_modified=cached_last_modified,
             timeout=self._timeout,
             extra_headers=extra_headers,
+            max_body_bytes=max_body_bytes,
+            allowed_mime_types=allowed_mime_types,
         )
 
     def _get_api_key(self, provider_name: str) -> str | None:
@@ -333,7 +399,8 @@ class MarketDataProviderAdapter:
         if self._uow is None or self._encryption is None:
             return None
         try:
-            setting = self._uow.market_provider_settings.get(provider_name)
+            with self._uow:
+                setting = self._uow.market_provider_settings.get(provider_name)
             if setting and setting.encrypted_api_key:
                 return self._encryption.decrypt(setting.encrypted_api_key)
         except Exception:
@@ -130,6 +130,105 @@ def normalize_api_ninjas_quote(data: dict[str, Any]) -> MarketQuote:
     )
 
 
+# ── Batch Quote Normalizers ─────────────────────────────────────────────
+# One response carries many symbols; symbols without a price are left out
+# so the caller can fall back for them.
+
+
+def _opt_float(val: Any) -> float | None:
+    return float(val) if val is not None else None
+
+
+def _opt_int(val: Any) -> int | None:
+    return int(val) if val is not None else None
+
+
+def normalize_polygon_snapshot_quotes(data: dict[str, Any]) -> list[MarketQuote]:
+    """Convert Polygon.io /v2/snapshot/.../tickers → MarketQuotes."""
+    quotes: list[MarketQuote] = []
+    for snap in data.get("tickers") or []:
+        day = snap.get("day") or {}
+        price = (snap.get("lastTrade") or {}).get("p") or day.get("c")
+        if not price:
+            continue
+        ts = snap.get("updated")
+        quotes.append(
+            MarketQuote(
+                ticker=snap.get("ticker", ""),
+                price=float(price),
+                open=_opt_float(day.get("o")),
+                high=_opt_float(day.get("h")),
+                low=_opt_float(day.get("l")),
+                previous_close=_opt_float((snap.get("prevDay") or {}).get("c")),
+                change=_opt_float(snap.get("todaysChange")),
+                change_pct=_opt_float(snap.get("todaysChangePerc")),
+                volume=_opt_int(day.get("v")),
+                timestamp=datetime.fromtimestamp(ts / 1e9, tz=timezone.utc)
+                if ts
+                else None,
+                provider="Polygon.io",
+            )
+        )
+    return quotes
+
+
+def normalize_fmp_quotes(data: list[dict[str, Any]]) -> list[MarketQuote]:
+    """Convert FMP /api/v3/quote/{csv} → MarketQuotes."""
+    quotes: list[MarketQuote] = []
+    for item in data or []:
+        if item.get("price") is None:
+            continue
+        ts = item.get("timestamp")
+        quotes.append(
+            MarketQuote(
+                ticker=item.get("symbol", ""),
+                price=float(item["price"]),
+                open=_opt_float(item.get("open")),
+                high=_opt_float(item.get("dayHigh")),
+                low=_opt_float(item.get("dayLow")),
+                previous_close=_opt_float(item.get("previousClose")),
+                change=_opt_float(item.get("change")),
+                change_pct=_opt_float(item.get("changesPercentage")),
+                volume=_opt_int(item.get("volume")),
+                timestamp=datetime.fromtimestamp(ts, tz=timezone.utc) if ts else None,
+                provider="Financial Modeling Prep",
+            )
+        )
+    return quotes
+
+
+def normalize_tradier_quotes(data: dict[str, Any]) -> list[MarketQuote]:
+    """Convert Tradier /v1/markets/quotes → MarketQuotes.
+
+    Tradier returns a bare object instead of a list for a single symbol.
+    """
+    raw = (data.get("quotes") or {}).get("quote") or []
+    items = [raw] if isinstance(raw, dict) else raw
+    quotes: list[MarketQuote] = []
+    for item in items:
+        if item.get("last") is None:
+            continue
+        ts = item.get("trade_date")
+        quotes.append(
+            MarketQuote(
+                ticker=item.get("symbol", ""),
+                price=float(item["last"]),
+                open=_opt_float(item.get("open")),
+                high=_opt_float(item.get("high")),
+                low=_opt_float(item.get("low")),
+                previous_close=_opt_float(item.get("prevclose")),
+                change=_opt_float(item.get("change")),
+                change_pct=_opt_float(item.get("change_percentage")),
+                volume=_opt_int(item.get("volume")),
+                timestamp=datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
+                if ts
+                else None,
+                provider="Tradier",
+            )
+        )
+    return quotes
+
+
 # ── Search Normalizers ──────────────────────────────────────────────────
 
 
@@ -238,6 +337,14 @@ QUOTE_NORMALIZERS: dict[str, Any] = {
     "API Ninjas": normalize_api_ninjas_quote,
 }
 
+# Maps provider name → multi-symbol quote normalizer, in batch priority
+# order. Only providers whose URL builder puts every symbol in one request.
+BATCH_QUOTE_NORMALIZERS: dict[str, Any] = {
+    "Polygon.io": normalize_polygon_snapshot_quotes,
+    "Financial Modeling Prep": normalize_fmp_quotes,
+    "Tradier": normalize_tradier_quotes,
+}
+
 NEWS_NORMALIZERS: dict[str, Any] = {
     "Finnhub": normalize_finnhub_news,
 }
@@ -5,6 +5,10 @@ Uses aiolimiter for token-bucket rate limiting per provider,
 with an asyncio.Semaphore for global concurrency control,
 and tenacity for retry with exponential backoff + jitter.
 
+With a shared ``RateBudget`` the per-provider limit is the same adaptive
+budget the API services use (rate_budget.py), taken at background
+priority, and HTTP responses are reported back to it.
+
 Spec: 09-scheduling.md §9.4c
 MEU: 85
 """
@@ -16,6 +20,9 @@ from typing import Any, Awaitable, Callable, TypeVar
 
 from aiolimiter import AsyncLimiter
 
+from zorivest_infra.market_data.http_cache import HttpFetchError
+from zorivest_infra.market_data.rate_budget import Priority, RateBudget
+
 T = TypeVar("T")
 
 
@@ -25,15 +32,23 @@ class PipelineRateLimiter:
     Args:
         limits: Mapping of provider → (max_rate, time_period) for token bucket.
         max_concurrent: Maximum total concurrent requests across all providers.
+        budget: Shared per-provider budget; replaces ``limits`` for the
+            providers it knows.
+        priority: Priority at which requests draw on ``budget``.
     """
 
     def __init__(
         self,
         limits: dict[str, tuple[float, float]],
         max_concurrent: int = 5,
+        *,
+        budget: RateBudget | None = None,
+        priority: Priority = Priority.BACKGROUND,
     ) -> None:
         self._limiters: dict[str, AsyncLimiter] = {}
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._budget = budget
+        self._priority = priority
 
         for provider, (rate, period) in limits.items():
             self._limiters[provider] = AsyncLimiter(rate, period)
@@ -48,7 +63,21 @@ class PipelineRateLimiter:
         """Execute a function with rate limiting and concurrency control.
 
         Acquires: 1) global semaphore, 2) per-provider token bucket.
+        A shared budget is acquired before the semaphore, so waiting on one
+        provider's quota does not hold a slot other providers could use.
         """
+        budget = self._budget.get(provider) if self._budget is not None else None
+        if budget is not None:
+            await budget.acquire(self._priority)
+            async with self._semaphore:
+                try:
+                    result = await func(*args, **kwargs)
+                except HttpFetchError as exc:
+                    budget.record_response(exc.status_code, exc.retry_after)
+                    raise
+            budget.record_response(200)
+            return result
+
         limiter = self._limiters.get(provider)
 
         async with self._semaphore:
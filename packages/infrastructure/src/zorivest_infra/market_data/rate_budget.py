@@ -0,0 +1,208 @@
+"""Shared adaptive rate-limit budget per provider.
+
+One ``ProviderBudget`` per provider is shared by MarketDataService,
+ProviderConnectionService (through ``BudgetLimiter`` views) and the
+pipeline ``PipelineRateLimiter``, so together they stay inside the
+provider's quota instead of each spending it in full.
+
+Each budget is a sliding 60-second window whose size adapts (AIMD):
+a 429 halves the effective per-minute rate and blocks every caller until
+``Retry-After`` (or one request interval when the header is missing);
+each success adds back 5% of the configured rate. Interactive callers
+(GUI, MCP) are served before background callers (pipelines), and
+background callers may only use ``1 - interactive_reserve`` of the window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+from zorivest_core.application.provider_status import RateBudgetStatus
+
+_WINDOW_S = 60.0
+# Additive increase per success, as a fraction of the configured rate.
+_INCREASE = 0.05
+# Multiplicative decrease per 429.
+_DECREASE = 0.5
+# Longest block applied for one 429.
+_MAX_BLOCK_S = 300.0
+# How often a background waiter re-checks for queued interactive callers.
+_YIELD_S = 0.05
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+def parse_retry_after(
+    value: str | float | None, now: datetime | None = None
+) -> float | None:
+    """Seconds to wait from a ``Retry-After`` value (delta-seconds or HTTP-date)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class ProviderBudget:
+    """Adaptive per-minute request budget for one provider.
+
+    Args:
+        limit_per_minute: The provider's quota.
+        interactive_reserve: Share of the window background callers leave free.
+        clock: Monotonic clock, injectable for tests.
+        sleep: Async sleep, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        limit_per_minute: int,
+        *,
+        interactive_reserve: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.limit_per_minute = limit_per_minute
+        self._rate = float(limit_per_minute)
+        self._reserve = interactive_reserve
+        self._clock = clock
+        self._sleep = sleep
+        self._sent: deque[float] = deque()
+        self._blocked_until = 0.0
+        self._waiting = {Priority.INTERACTIVE: 0, Priority.BACKGROUND: 0}
+        self._throttled = 0
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        """Wait until a request at *priority* fits the budget, then take a slot."""
+        self._waiting[priority] += 1
+        try:
+            while (delay := self._delay(priority)) > 0:
+                await self._sleep(delay)
+            self._sent.append(self._clock())
+        finally:
+            self._waiting[priority] -= 1
+
+    def record_response(
+        self, status_code: int, retry_after: str | float | None = None
+    ) -> None:
+        """Adapt the rate to a provider response (429 backs off, 2xx recovers)."""
+        if status_code == 429:
+            self._throttled += 1
+            self._rate = max(1.0, self._rate * _DECREASE)
+            block = parse_retry_after(retry_after)
+            if block is None:
+                block = _WINDOW_S / self._rate
+            block = min(block, _MAX_BLOCK_S)
+            self._blocked_until = max(self._blocked_until, self._clock() + block)
+        elif 200 <= status_code < 300:
+            self._rate = min(
+                float(self.limit_per_minute),
+                self._rate + self.limit_per_minute * _INCREASE,
+            )
+
+    def status(self) -> RateBudgetStatus:
+        now = self._clock()
+        self._evict(now)
+        allowance = self._allowance(Priority.INTERACTIVE)
+        return RateBudgetStatus(
+            limit_per_minute=self.limit_per_minute,
+            effective_per_minute=round(self._rate, 2),
+            used=len(self._sent),
+            remaining=max(0, allowance - len(self._sent)),
+            throttled=self._throttled,
+            blocked_for_s=round(max(0.0, self._blocked_until - now), 1),
+            waiting_interactive=self._waiting[Priority.INTERACTIVE],
+            waiting_background=self._waiting[Priority.BACKGROUND],
+        )
+
+    def _allowance(self, priority: Priority) -> int:
+        allowance = max(1, int(self._rate))
+        if priority is Priority.BACKGROUND:
+            allowance = max(1, int(allowance * (1 - self._reserve)))
+        return allowance
+
+    def _evict(self, now: float) -> None:
+        while self._sent and self._sent[0] <= now - _WINDOW_S:
+            self._sent.popleft()
+
+    def _delay(self, priority: Priority) -> float:
+        now = self._clock()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if priority is Priority.BACKGROUND and self._waiting[Priority.INTERACTIVE]:
+            return _YIELD_S
+        self._evict(now)
+        allowance = self._allowance(priority)
+        if len(self._sent) < allowance:
+            return 0.0
+        # Wait for enough of the oldest requests to leave the window.
+        return self._sent[len(self._sent) - allowance] + _WINDOW_S - now
+
+
+class BudgetLimiter:
+    """A ProviderBudget seen at one priority, for services' rate_limiters.
+
+    Satisfies the services' ``RateLimiterProtocol`` and reports provider
+    responses back to the budget.
+    """
+
+    def __init__(self, budget: ProviderBudget, priority: Priority) -> None:
+        self.budget = budget
+        self.priority = priority
+
+    async def wait_if_needed(self) -> None:
+        await self.budget.acquire(self.priority)
+
+    async def record_response(
+        self, status_code: int, retry_after: str | float | None = None
+    ) -> None:
+        self.budget.record_response(status_code, retry_after)
+
+
+class RateBudget:
+    """The shared ProviderBudget for every provider.
+
+    Args:
+        limits: Provider name → quota in requests per minute.
+    """
+
+    def __init__(self, limits: Mapping[str, int], **budget_kwargs: object) -> None:
+        self._budgets = {
+            name: ProviderBudget(limit, **budget_kwargs)  # type: ignore[arg-type]
+            for name, limit in limits.items()
+        }
+
+    def get(self, provider: str) -> ProviderBudget | None:
+        return self._budgets.get(provider)
+
+    def limiters(
+        self, priority: Priority = Priority.INTERACTIVE
+    ) -> dict[str, BudgetLimiter]:
+        """Per-provider limiters at *priority*, for a service's ``rate_limiters``."""
+        return {
+            name: BudgetLimiter(budget, priority)
+            for name, budget in self._budgets.items()
+        }
+
+    def status(self, provider: str) -> RateBudgetStatus | None:
+        budget = self._budgets.get(provider)
+        return budget.status() if budget is not None else None
@@ -7,7 +7,10 @@ Provider APIs wrap records in different envelope structures:
   - Generic: top-level list or dict
 
 This module provides `extract_records()` which handles these envelopes
-and returns a flat list of dicts for field mapping.
+and returns a flat list of dicts for field mapping. Large Polygon aggs and
+Alpha Vantage time series bodies are read incrementally instead
+(`stream_records()`, which FetchStep also uses); those and the Yahoo chart
+can also be consumed record by record (`iter_records()`).
 
 Spec: 09-scheduling.md §9.5, deficiency report §3.3
 MEU: PW12
@@ -19,10 +22,20 @@ import csv
 import io
 import json
 import re
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import chain, repeat
+from math import isnan
 from typing import Any
 
 import structlog
 
+from zorivest_infra.market_data.json_stream import (
+    JsonStreamReader,
+    StreamingShapeError,
+    iter_chunks,
+)
+
 logger = structlog.get_logger(__name__)
 
 
@@ -44,6 +57,22 @@ def _register(provider: str, data_type: str):
     return decorator
 
 
+# Key: (provider, data_type) → callable(parsed_json) → dict[str, list] | None
+# For responses that arrive as parallel arrays: the arrays are returned as
+# columns (equal length, record order) instead of being zipped into rows.
+_COLUMN_EXTRACTORS: dict[tuple[str, str], Any] = {}
+
+
+def _register_columns(provider: str, data_type: str):
+    """Decorator to register a column extractor."""
+
+    def decorator(fn):
+        _COLUMN_EXTRACTORS[(provider, data_type)] = fn
+        return fn
+
+    return decorator
+
+
 # ---------------------------------------------------------------------------
 # Yahoo extractors
 # ---------------------------------------------------------------------------
@@ -73,6 +102,7 @@ def _yahoo_quote(data: Any) -> list[dict]:
             if isinstance(result, list) and result:
                 meta = result[0].get("meta", {})
                 if isinstance(meta, dict) and meta:
+                    meta = dict(meta)  # the parsed payload may be shared
                     # v8/chart meta lacks regularMarketChange/Percent
                     # — compute from chartPreviousClose + regularMarketPrice
                     price = meta.get("regularMarketPrice")
@@ -127,50 +157,49 @@ def _yahoo_ohlcv(data: Any) -> list[dict]:
     if isinstance(data, list):
         return data
 
-    if not isinstance(data, dict):
+    columns = _yahoo_ohlcv_columns(data)
+    if columns is None:
         return []
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+@_register_columns("yahoo", "ohlcv")
+def _yahoo_ohlcv_columns(data: Any) -> dict[str, list] | None:
+    """The chart's arrays as columns, each cut or None-padded to the timestamps."""
+    if not isinstance(data, dict):
+        return None
 
     chart = data.get("chart", {})
     if not isinstance(chart, dict):
-        return []
+        return None
 
     result = chart.get("result", [])
     if not isinstance(result, list) or not result:
-        return []
+        return None
 
     first = result[0]
     timestamps = first.get("timestamp", [])
-    if not timestamps:
-        return []
+    if not isinstance(timestamps, list) or not timestamps:
+        return None
 
     indicators = first.get("indicators", {})
     if not isinstance(indicators, dict):
-        return []
+        return None
 
     quotes = indicators.get("quote", [])
     if not isinstance(quotes, list) or not quotes:
-        return []
+        return None
 
     q = quotes[0]
-    opens = q.get("open", [])
-    highs = q.get("high", [])
-    lows = q.get("low", [])
-    closes = q.get("close", [])
-    volumes = q.get("volume", [])
-
-    records: list[dict] = []
-    for i, ts in enumerate(timestamps):
-        records.append(
-            {
-                "timestamp": ts,
-                "open": opens[i] if i < len(opens) else None,
-                "high": highs[i] if i < len(highs) else None,
-                "low": lows[i] if i < len(lows) else None,
-                "close": closes[i] if i < len(closes) else None,
-                "volume": volumes[i] if i < len(volumes) else None,
-            }
-        )
-    return records
+    n = len(timestamps)
+    columns: dict[str, list] = {"timestamp": timestamps}
+    for field in ("open", "high", "low", "close", "volume"):
+        values = q.get(field) or []
+        if len(values) != n:
+            values = values[:n] + [None] * (n - len(values))
+        columns[field] = values
+    return columns
 
 
 # ---------------------------------------------------------------------------
@@ -180,19 +209,23 @@ def _yahoo_ohlcv(data: Any) -> list[dict]:
 
 @_register("polygon", "ohlcv")
 def _polygon_ohlcv(data: Any) -> list[dict]:
-    """Polygon OHLCV: {"results": [...]}.
+    """Polygon OHLCV: {"results": [...]}, or the bars already extracted.
 
     AC-24: Normalizes millisecond UNIX timestamps (t > 1e12) to seconds.
     """
-    if isinstance(data, dict):
-        results = data.get("results", [])
-        if isinstance(results, list):
-            for rec in results:
-                t = rec.get("t")
-                if isinstance(t, (int, float)) and t > 1e12:
-                    rec["t"] = int(t // 1000)
-            return results
-    return []
+    # FetchStep hands over large bodies as their streamed bars
+    results = data.get("results", []) if isinstance(data, dict) else data
+    if not isinstance(results, list):
+        return []
+    normalized = []
+    for rec in results:
+        if not isinstance(rec, dict):
+            continue
+        t = rec.get("t")
+        if isinstance(t, (int, float)) and t > 1e12:
+            rec = {**rec, "t": int(t // 1000)}
+        normalized.append(rec)
+    return normalized
 
 
 @_register("polygon", "quote")
@@ -685,6 +718,202 @@ def _tradingview_fundamentals(data: Any) -> list[dict]:
     return _tradingview_scanner_extract(data, "fundamentals")
 
 
+# ---------------------------------------------------------------------------
+# Streaming extractors
+# ---------------------------------------------------------------------------
+#
+# For the response shapes that get large (years of bars), these read the
+# body incrementally with JsonStreamReader instead of parsing it into a
+# tree first, and produce the same records as the tree extractors above.
+# They raise StreamingShapeError for anything but the usual shape;
+# stream_records() then returns None and its callers parse the body whole.
+
+# Bodies smaller than this parse faster in one json.loads call
+STREAM_MIN_BYTES = 1 << 20
+
+_OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Key: (provider, data_type) → callable(JsonStreamReader) → Iterator[dict]
+_STREAM_EXTRACTORS: dict[tuple[str, str], Any] = {}
+
+# Shapes stream_records() collects into a list. Row-oriented bodies (one
+# object per bar) shed the tree and keep only the records. A Yahoo chart
+# is columnar: its rows are built fresh from the columns either way, so
+# collecting them saves nothing over the tree and costs time; the Yahoo
+# extractor is only for callers of iter_records() that consume as they go.
+_STREAM_TO_LIST = frozenset({("polygon", "ohlcv"), ("alpha_vantage", "ohlcv")})
+
+
+def _register_stream(provider: str, data_type: str):
+    """Decorator to register a streaming extractor."""
+
+    def decorator(fn):
+        _STREAM_EXTRACTORS[(provider, data_type)] = fn
+        return fn
+
+    return decorator
+
+
+def _enter(reader: JsonStreamReader, *path: str | int) -> None:
+    """Move the reader to the value at *path* (object keys / array indexes)."""
+    for step in path:
+        if isinstance(step, str):
+            if reader.peek_type() != "object":
+                raise StreamingShapeError(f"expected an object holding {step!r}")
+            for key in reader.iter_object():
+                if key == step:
+                    break
+                reader.skip_value()
+            else:
+                raise StreamingShapeError(f"no {step!r} key")
+        else:
+            if reader.peek_type() != "array":
+                raise StreamingShapeError(f"expected an array holding [{step}]")
+            for index in reader.iter_array():
+                if index == step:
+                    break
+                reader.skip_value()
+            else:
+                raise StreamingShapeError(f"no element [{step}]")
+
+
+def _nan_to_none(values: array, length: int, as_int: bool = False) -> Iterator[Any]:
+    """Column values with NaN (JSON null) as None, padded with None to *length*."""
+    head = values[:length]
+    if as_int:
+        converted = (None if isnan(v) else int(v) for v in head)
+    else:
+        converted = (None if isnan(v) else v for v in head)
+    return chain(converted, repeat(None, length - len(head)))
+
+
+@_register_stream("yahoo", "ohlcv")
+def _yahoo_ohlcv_stream(reader: JsonStreamReader) -> Iterator[dict]:
+    """Yahoo chart: the first result's arrays are read as compact columns.
+
+    Same records as ``_yahoo_ohlcv``, except that prices are always floats.
+    """
+    _enter(reader, "chart", "result", 0)
+    if reader.peek_type() != "object":
+        raise StreamingShapeError("chart result is not an object")
+    timestamps: array | None = None
+    columns: dict[str, array] = {}
+    for key in reader.iter_object():
+        if key == "timestamp":
+            timestamps = reader.read_number_array("q")
+        elif key == "indicators":
+            _enter(reader, "quote", 0)
+            if reader.peek_type() != "object":
+                raise StreamingShapeError("chart quote is not an object")
+            for field in reader.iter_object():
+                if field in _OHLCV_FIELDS:
+                    columns[field] = reader.read_number_array()
+                else:
+                    reader.skip_value()
+            # The rest of "indicators" (adjclose, ...) is not needed
+            break
+        else:
+            reader.skip_value()
+    if not timestamps or not columns:
+        raise StreamingShapeError("chart result has no timestamps or quote")
+
+    n = len(timestamps)
+    for ts, o, h, lo, c, v in zip(
+        timestamps,
+        *(
+            _nan_to_none(columns[f], n, f == "volume")
+            if f in columns
+            else repeat(None, n)
+            for f in _OHLCV_FIELDS
+        ),
+    ):
+        yield {
+            "timestamp": ts,
+            "open": o,
+            "high": h,
+            "low": lo,
+            "close": c,
+            "volume": v,
+        }
+
+
+@_register_stream("polygon", "ohlcv")
+def _polygon_ohlcv_stream(reader: JsonStreamReader) -> Iterator[dict]:
+    """Polygon aggs: one bar of ``results`` decoded at a time."""
+    _enter(reader, "results")
+    if reader.peek_type() != "array":
+        raise StreamingShapeError("polygon results is not an array")
+    for rec in reader.iter_values():
+        if not isinstance(rec, dict):
+            raise StreamingShapeError("polygon bar is not an object")
+        t = rec.get("t")
+        if isinstance(t, (int, float)) and t > 1e12:
+            rec["t"] = int(t // 1000)
+        yield rec
+
+
+@_register_stream("alpha_vantage", "ohlcv")
+def _alpha_vantage_ohlcv_stream(reader: JsonStreamReader) -> Iterator[dict]:
+    """Alpha Vantage time series: one date's fields decoded at a time."""
+    if reader.peek_type() != "object":
+        raise StreamingShapeError("alpha vantage body is not an object")
+    for key in reader.iter_object():
+        if key.startswith("Time Series") and reader.peek_type() == "object":
+            for date_str in reader.iter_object():
+                fields = reader.read_value()
+                if not isinstance(fields, dict):
+                    raise StreamingShapeError("time series entry is not an object")
+                rec = _av_strip_prefix(fields)
+                rec["date"] = date_str
+                yield rec
+            return
+        if key in ("Note", "Information"):
+            # Rate-limit notice: the tree extractor logs it
+            raise StreamingShapeError("alpha vantage notice")
+        reader.skip_value()
+    raise StreamingShapeError("no Time Series key")
+
+
+def iter_records(
+    chunks: Iterable[bytes | str], provider: str, data_type: str
+) -> Iterator[dict]:
+    """Yield normalized records while reading a response body incrementally.
+
+    Only the shapes with a streaming extractor are supported (Yahoo chart,
+    Polygon aggs and Alpha Vantage time series OHLCV).
+
+    Raises:
+        KeyError: No streaming extractor for this provider and data type.
+        StreamingShapeError: The body is malformed or not the usual shape
+            (possibly after some records were yielded).
+    """
+    from zorivest_infra.market_data.field_mappings import _PROVIDER_SLUG_MAP
+
+    slug = _PROVIDER_SLUG_MAP.get(provider, provider)
+    extractor = _STREAM_EXTRACTORS[(slug, data_type)]
+    return extractor(JsonStreamReader(chunks))
+
+
+def stream_records(
+    raw: bytes | str, provider: str, data_type: str
+) -> list[dict] | None:
+    """Records of a large body, extracted without building its parse tree.
+
+    Only Polygon aggs and Alpha Vantage time series bodies of at least
+    ``STREAM_MIN_BYTES`` are streamed. Returns None for anything else,
+    including a body not in the usual shape, which must be parsed whole.
+    """
+    from zorivest_infra.market_data.field_mappings import _PROVIDER_SLUG_MAP
+
+    slug = _PROVIDER_SLUG_MAP.get(provider, provider)
+    if (slug, data_type) not in _STREAM_TO_LIST or len(raw) < STREAM_MIN_BYTES:
+        return None
+    try:
+        return list(iter_records(iter_chunks(raw), provider, data_type))
+    except StreamingShapeError:
+        return None  # unusual shape or malformed
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -718,6 +947,11 @@ def extract_records(
 
     slug = _PROVIDER_SLUG_MAP.get(provider, provider)
 
+    # Large bodies of the known big shapes: extract without the parse tree
+    streamed = stream_records(raw, provider, data_type)
+    if streamed is not None:
+        return streamed
+
     try:
         data = json.loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
@@ -738,6 +972,20 @@ def extract_records(
         )
         return []
 
+    return extract_parsed_records(data, provider, data_type)
+
+
+def extract_parsed_records(data: Any, provider: str, data_type: str) -> list[dict]:
+    """Like ``extract_records`` for a response that is already parsed JSON.
+
+    FetchStep parses the body once into its ``records`` output; TransformStep
+    unwraps that instead of parsing ``content`` again. Extractors do not
+    modify *data*, but the returned records may be the same objects.
+    """
+    from zorivest_infra.market_data.field_mappings import _PROVIDER_SLUG_MAP
+
+    slug = _PROVIDER_SLUG_MAP.get(provider, provider)
+
     # Look up provider-specific extractor
     extractor = _EXTRACTORS.get((slug, data_type))
     if extractor is not None:
@@ -747,3 +995,24 @@ def extract_records(
 
     # Fallback: generic extraction (no registered extractor for this combo)
     return _generic_extract(data)
+
+
+def extract_parsed_columns(
+    data: Any, provider: str, data_type: str
+) -> dict[str, list] | None:
+    """Records of an already-parsed response as columns, when it has them.
+
+    Returns ``{field: values}`` with one equal-length list per field, the
+    transpose of what ``extract_parsed_records`` returns, without building
+    a dict per record. Returns None when the provider and data type have
+    no column extractor or the response is not in its columnar shape;
+    use ``extract_parsed_records`` then. The lists may be the response's
+    own, so callers must not modify them.
+    """
+    from zorivest_infra.market_data.field_mappings import _PROVIDER_SLUG_MAP
+
+    slug = _PROVIDER_SLUG_MAP.get(provider, provider)
+    extractor = _COLUMN_EXTRACTORS.get((slug, data_type))
+    if extractor is None:
+        return None
+    return extractor(data)
@@ -11,6 +11,7 @@ Source: docs/execution/plans/2026-03-21-market-data-gui/implementation-plan.md
 from __future__ import annotations
 
 import os
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
 import httpx
@@ -58,6 +59,8 @@ class HttpxClient:
 
     Satisfies ProviderConnectionService.HttpClient:
         async def get(self, url: str, headers: dict[str, str], timeout: int) -> Any: ...
+
+    ``stream()`` lets pipeline fetches read bodies incrementally.
     """
 
     def __init__(self, client: httpx.AsyncClient | None = None) -> None:
@@ -90,5 +93,23 @@ class HttpxClient:
             url, headers=headers, timeout=timeout, cookies=cookies
         )
 
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        timeout: Any,
+        json: Any = None,
+    ) -> AbstractAsyncContextManager[httpx.Response]:
+        """Open a response without reading its body — used by fetch_with_cache.
+
+        The body is read with ``response.aiter_bytes()`` inside the context,
+        so an oversized response can be abandoned part way through.
+        """
+        return self._client.stream(
+            method, url, headers=headers, timeout=timeout, json=json
+        )
+
     async def aclose(self) -> None:
         await self._client.aclose()
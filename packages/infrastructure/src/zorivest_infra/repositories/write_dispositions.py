@@ -4,12 +4,18 @@
 Security-first write layer: only allow writes to pre-approved tables
 with pre-approved columns. Supports append, replace, and merge modes.
 
+Writes are chunked: each chunk of records is sent as one ``executemany``
+call, and merge uses a true SQLite UPSERT (``INSERT ... ON CONFLICT DO
+UPDATE``) keyed on the table's unique constraint, so existing rows keep
+their ``id`` and indexes are updated in place rather than delete+insert.
+
 Spec: 09-scheduling.md §9.5d
 MEU: 86
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from sqlalchemy import text
@@ -59,6 +65,7 @@ TABLE_ALLOWLIST: dict[str, set[str]] = {
         "ticker",
         "metric",
         "value",
+        "text_value",
         "period",
         "provider",
         "fetched_at",
@@ -86,6 +93,7 @@ TABLE_ALLOWLIST: dict[str, set[str]] = {
         "declaration_date",
         "frequency",
         "provider",
+        "fetched_at",
     },
     "market_splits": {
         "ticker",
@@ -93,6 +101,7 @@ TABLE_ALLOWLIST: dict[str, set[str]] = {
         "ratio_from",
         "ratio_to",
         "provider",
+        "fetched_at",
     },
     "market_insider": {
         "ticker",
@@ -109,6 +118,44 @@ TABLE_ALLOWLIST: dict[str, set[str]] = {
 }
 
 
+# Unique constraints usable as UPSERT conflict targets, per table.
+# Mirrors the UniqueConstraint declarations in database/models.py.
+TABLE_CONFLICT_KEYS: dict[str, list[tuple[str, ...]]] = {
+    "market_ohlcv": [
+        ("ticker", "timestamp", "provider")
+    ],  # uq_ohlcv_ticker_ts_provider
+    "market_news": [("url", "provider")],  # uq_news_url_provider
+    "market_fundamentals": [
+        ("ticker", "metric", "period", "provider")
+    ],  # uq_fund_ticker_metric_period_provider
+    "market_earnings": [
+        ("ticker", "fiscal_period", "fiscal_year")
+    ],  # uq_earnings_ticker_period_year
+    "market_dividends": [("ticker", "ex_date")],  # uq_dividends_ticker_exdate
+    "market_splits": [("ticker", "execution_date")],  # uq_splits_ticker_execdate
+    "market_insider": [
+        ("ticker", "name", "transaction_date", "transaction_code")
+    ],  # uq_insider_ticker_name_date_code
+}
+
+# Records per executemany() call.  Bounds statement memory while keeping
+# per-call overhead negligible for multi-year OHLCV loads.
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class WriteResult:
+    """Row counts reported by a write disposition."""
+
+    inserted: int = 0
+    updated: int = 0
+
+    @property
+    def total(self) -> int:
+        """Rows inserted plus rows updated."""
+        return self.inserted + self.updated
+
+
 def validate_table(table_name: str) -> bool:
     """Check if a table is in the write allowlist."""
     return table_name in TABLE_ALLOWLIST
@@ -122,43 +169,77 @@ def validate_columns(table_name: str, columns: list[str]) -> bool:
     return all(col in allowed for col in columns)
 
 
+def _checked_columns(table_name: str, records: list[dict[str, Any]]) -> list[str]:
+    """Validate the target table and record columns; return column order."""
+    if not validate_table(table_name):
+        raise ValueError(f"Table '{table_name}' not in write allowlist")
+
+    columns = list(records[0].keys())
+    if not validate_columns(table_name, columns):
+        invalid = [
+            c for c in columns if c not in TABLE_ALLOWLIST.get(table_name, set())
+        ]
+        raise ValueError(f"Columns not allowed for '{table_name}': {invalid}")
+    return columns
+
+
+def _chunks(records: list[dict[str, Any]], columns: list[str], chunk_size: int) -> Any:
+    """Yield parameter lists of at most *chunk_size* rows with uniform keys."""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    for i in range(0, len(records), chunk_size):
+        yield [
+            {col: record.get(col) for col in columns}
+            for record in records[i : i + chunk_size]
+        ]
+
+
+def _max_rowid(session: Session, table_name: str) -> int:
+    """Current highest rowid (O(1) via the primary key b-tree)."""
+    return session.execute(text(f"SELECT max(rowid) FROM {table_name}")).scalar() or 0
+
+
+def _rows_after(session: Session, table_name: str, rowid: int) -> int:
+    """Count rows inserted after *rowid* (range scan over new rows only)."""
+    return (
+        session.execute(
+            text(f"SELECT count(*) FROM {table_name} WHERE rowid > :rowid"),
+            {"rowid": rowid},
+        ).scalar()
+        or 0
+    )
+
+
 def write_append(
     *,
     session: Session,
     table_name: str,
     records: list[dict[str, Any]],
-) -> int:
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> WriteResult:
     """Append records to a table.
 
     Args:
         session: Active SQLAlchemy session.
         table_name: Target table (must be in TABLE_ALLOWLIST).
         records: List of dicts to insert.
+        chunk_size: Rows per executemany() batch.
 
     Returns:
-        Number of records inserted.
+        WriteResult with every record counted as inserted.
     """
     if not records:
-        return 0
-
-    if not validate_table(table_name):
-        raise ValueError(f"Table '{table_name}' not in write allowlist")
-
-    columns = list(records[0].keys())
-    if not validate_columns(table_name, columns):
-        invalid = [
-            c for c in columns if c not in TABLE_ALLOWLIST.get(table_name, set())
-        ]
-        raise ValueError(f"Columns not allowed for '{table_name}': {invalid}")
+        return WriteResult()
 
+    columns = _checked_columns(table_name, records)
     placeholders = ", ".join(f":{col}" for col in columns)
     col_names = ", ".join(columns)
     sql = text(f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})")
 
-    for record in records:
-        session.execute(sql, record)
+    for chunk in _chunks(records, columns, chunk_size):
+        session.execute(sql, chunk)
 
-    return len(records)
+    return WriteResult(inserted=len(records))
 
 
 def write_replace(
@@ -166,22 +247,29 @@ def write_replace(
     session: Session,
     table_name: str,
     records: list[dict[str, Any]],
-) -> int:
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> WriteResult:
     """Replace all rows in a table with new records.
 
     Args:
         session: Active SQLAlchemy session.
         table_name: Target table.
         records: Replacement records.
+        chunk_size: Rows per executemany() batch.
 
     Returns:
-        Number of records inserted.
+        WriteResult with every record counted as inserted.
     """
     if not validate_table(table_name):
         raise ValueError(f"Table '{table_name}' not in write allowlist")
 
     session.execute(text(f"DELETE FROM {table_name}"))
-    return write_append(session=session, table_name=table_name, records=records)
+    return write_append(
+        session=session,
+        table_name=table_name,
+        records=records,
+        chunk_size=chunk_size,
+    )
 
 
 def write_merge(
@@ -190,25 +278,50 @@ def write_merge(
     table_name: str,
     records: list[dict[str, Any]],
     key_columns: list[str],
-) -> int:
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> WriteResult:
     """Merge (upsert) records into a table based on key columns.
 
-    Uses INSERT OR REPLACE for SQLite.
+    Uses ``INSERT ... ON CONFLICT(<key_columns>) DO UPDATE`` so matching
+    rows are updated in place (stable ``id``, no delete/reinsert).  The
+    key columns must match one of the table's unique constraints
+    (``TABLE_CONFLICT_KEYS``).
+
+    Returns:
+        WriteResult splitting rows into inserted vs. updated.  Inserted
+        rows are counted from the rowid high-water mark taken before the
+        write; everything else in *records* was an update.
     """
     if not records:
-        return 0
+        return WriteResult()
+
+    columns = _checked_columns(table_name, records)
+    conflict_targets = {frozenset(k) for k in TABLE_CONFLICT_KEYS.get(table_name, [])}
+    if frozenset(key_columns) not in conflict_targets:
+        raise ValueError(
+            f"Merge keys {key_columns} do not match a unique constraint on "
+            f"'{table_name}'"
+        )
+    missing = [k for k in key_columns if k not in columns]
+    if missing:
+        raise ValueError(f"Records are missing merge key columns: {missing}")
 
-    if not validate_table(table_name):
-        raise ValueError(f"Table '{table_name}' not in write allowlist")
-
-    columns = list(records[0].keys())
     placeholders = ", ".join(f":{col}" for col in columns)
     col_names = ", ".join(columns)
+    update_cols = [c for c in columns if c not in key_columns]
+    if update_cols:
+        assignments = ", ".join(f"{c} = excluded.{c}" for c in update_cols)
+        action = f"DO UPDATE SET {assignments}"
+    else:
+        action = "DO NOTHING"
     sql = text(
-        f"INSERT OR REPLACE INTO {table_name} ({col_names}) VALUES ({placeholders})"
+        f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders}) "
+        f"ON CONFLICT({', '.join(key_columns)}) {action}"
     )
 
-    for record in records:
-        session.execute(sql, record)
+    high_water = _max_rowid(session, table_name)
+    for chunk in _chunks(records, columns, chunk_size):
+        session.execute(sql, chunk)
+    inserted = _rows_after(session, table_name, high_water)
 
-    return len(records)
+    return WriteResult(inserted=inserted, updated=len(records) - inserted)
@@ -0,0 +1,93 @@
+# tests/integration/test_bulk_trade_ingestion.py
+"""Integration tests for bulk trade ingestion against a real SQLite UoW."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, select
+
+from zorivest_core.application.commands import CreateTrade
+from zorivest_core.domain.enums import BulkRowStatus, TradeAction
+from zorivest_core.services.import_service import ImportService
+from zorivest_core.services.trade_service import TradeService
+from zorivest_infra.broker_adapters.tos_csv import ThinkorSwimCSVParser
+from zorivest_infra.database.models import Base, TradeModel
+from zorivest_infra.database.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _make_uow() -> SqlAlchemyUnitOfWork:
+    engine = create_engine(
+        "sqlite://", echo=False, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    return SqlAlchemyUnitOfWork(engine)
+
+
+def _cmd(i: int, *, time: datetime | None = None) -> CreateTrade:
+    return CreateTrade(
+        exec_id=f"B{i:05d}",
+        time=time or datetime.now() - timedelta(minutes=i),
+        instrument="SPY",
+        action=TradeAction.BOT,
+        quantity=10.0,
+        price=500.0 + i / 100,
+        account_id="ACC001",
+    )
+
+
+def _trade_count(uow: SqlAlchemyUnitOfWork) -> int:
+    with uow:
+        return uow._session.scalar(select(func.count()).select_from(TradeModel))
+
+
+class TestBulkTradeIngestion:
+    def test_bulk_insert_then_reimport_is_all_duplicates(self) -> None:
+        uow = _make_uow()
+        svc = TradeService(uow)
+        commands = [_cmd(i) for i in range(2500)]
+
+        first = svc.create_trades_bulk(commands, chunk_size=1000)
+        assert first.accepted == 2500
+        assert _trade_count(uow) == 2500
+
+        second = svc.create_trades_bulk(commands)
+        assert second.duplicates == 2500
+        assert _trade_count(uow) == 2500
+
+    def test_fingerprint_duplicate_with_new_exec_id(self) -> None:
+        uow = _make_uow()
+        svc = TradeService(uow)
+        original = _cmd(1)
+        svc.create_trades_bulk([original])
+
+        renamed = CreateTrade(**{**original.__dict__, "exec_id": "RENAMED"})
+        result = svc.create_trades_bulk([renamed, _cmd(2)])
+
+        assert [r.status for r in result.rows] == [
+            BulkRowStatus.DUPLICATE,
+            BulkRowStatus.ACCEPTED,
+        ]
+
+    def test_fingerprint_outside_lookback_is_accepted(self) -> None:
+        uow = _make_uow()
+        svc = TradeService(uow)
+        old = _cmd(1, time=datetime.now() - timedelta(days=45))
+        svc.create_trades_bulk([old])
+
+        renamed = CreateTrade(**{**old.__dict__, "exec_id": "RENAMED"})
+        assert svc.create_trades_bulk([renamed]).accepted == 1
+
+
+class TestImportFlowsIntoBulk:
+    def test_import_trades_is_idempotent(self, tos_csv_file) -> None:
+        uow = _make_uow()
+        trade_svc = TradeService(uow)
+        importer = ImportService(adapters=[ThinkorSwimCSVParser()])
+
+        parsed, first = importer.import_trades(tos_csv_file, trade_svc)
+        assert first.accepted == len(parsed.executions) > 0
+
+        _, second = importer.import_trades(tos_csv_file, trade_svc)
+        assert second.accepted == 0
+        assert second.duplicates == len(parsed.executions)
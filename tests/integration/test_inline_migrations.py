@@ -122,3 +122,207 @@ class TestInlineMigrationsTaxLots:
         cols = _get_column_names(engine, "tax_lots")
         missing = EXPECTED_NEW_COLUMNS - cols
         assert not missing, f"Fresh create_all DB missing columns: {missing}"
+
+
+# ── Trade fingerprint column ───────────────────────────────────────────
+
+_OLD_TRADES_DDL = """\
+CREATE TABLE trades (
+    exec_id      VARCHAR PRIMARY KEY,
+    time         DATETIME NOT NULL,
+    instrument   VARCHAR NOT NULL,
+    action       VARCHAR(3) NOT NULL,
+    quantity     FLOAT NOT NULL,
+    price        FLOAT NOT NULL,
+    account_id   VARCHAR NOT NULL,
+    commission   NUMERIC(15,6),
+    realized_pnl NUMERIC(15,6),
+    notes        TEXT DEFAULT ''
+);
+"""
+
+
+class TestInlineMigrationsTradeFingerprint:
+    """Verify the fingerprint column, its index, and the startup backfill."""
+
+    def test_old_trades_table_gains_indexed_fingerprint(self) -> None:
+        engine = create_engine("sqlite://", echo=False)
+        with engine.connect() as conn:
+            conn.execute(text(_OLD_TRADES_DDL))
+            conn.commit()
+
+        _run_inline_migrations(engine)
+
+        assert "fingerprint" in _get_column_names(engine, "trades")
+        index_names = {ix["name"] for ix in inspect(engine).get_indexes("trades")}
+        assert "ix_trades_fingerprint_time" in index_names
+
+    def test_old_trades_table_gains_keyset_indexes(self) -> None:
+        engine = create_engine("sqlite://", echo=False)
+        with engine.connect() as conn:
+            conn.execute(text(_OLD_TRADES_DDL))
+            conn.commit()
+
+        _run_inline_migrations(engine)
+
+        index_names = {ix["name"] for ix in inspect(engine).get_indexes("trades")}
+        assert {
+            "ix_trades_time_exec_id",
+            "ix_trades_account_time_exec_id",
+        } <= index_names
+
+    def test_backfill_populates_legacy_rows(self) -> None:
+        from sqlalchemy.orm import Session
+
+        from zorivest_core.domain.trades.identity import trade_fingerprint
+        from zorivest_infra.database.backfill_trade_fingerprints import (
+            backfill_trade_fingerprints,
+        )
+        from zorivest_infra.database.models import TradeModel
+        from zorivest_infra.database.repositories import _model_to_trade
+
+        engine = create_engine("sqlite://", echo=False)
+        with engine.connect() as conn:
+            conn.execute(text(_OLD_TRADES_DDL))
+            for i in range(5):
+                conn.execute(
+                    text(
+                        "INSERT INTO trades (exec_id, time, instrument, action, "
+                        "quantity, price, account_id) VALUES "
+                        f"('E{i}', '2025-01-0{i + 1} 10:00:00', 'AAPL', 'BOT', "
+                        "10, 100.5, 'ACC001')"
+                    )
+                )
+            conn.commit()
+        _run_inline_migrations(engine)
+
+        with Session(engine) as session:
+            assert backfill_trade_fingerprints(session, batch_size=2) == 5
+            session.commit()
+            rows = session.query(TradeModel).all()
+            assert all(
+                r.fingerprint == trade_fingerprint(_model_to_trade(r)) for r in rows
+            )
+            # Idempotent: nothing left to backfill.
+            assert backfill_trade_fingerprints(session) == 0
+
+    def test_fresh_db_has_fingerprint_column(self) -> None:
+        engine = create_engine("sqlite://", echo=False)
+        Base.metadata.create_all(engine)
+
+        assert "fingerprint" in _get_column_names(engine, "trades")
+
+
+# ── Hot-path indexes (query plan advisor) ──────────────────────────────
+
+_OLD_AUDIT_LOG_DDL = """\
+CREATE TABLE audit_log (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    actor         VARCHAR(128) NOT NULL,
+    action        VARCHAR(64) NOT NULL,
+    resource_type VARCHAR(64) NOT NULL,
+    resource_id   VARCHAR(36) NOT NULL,
+    details_json  TEXT,
+    created_at    DATETIME NOT NULL
+);
+"""
+
+
+class TestInlineMigrationsHotPathIndexes:
+    """Verify existing databases gain the audit_log and tax_lots indexes."""
+
+    def test_old_tables_gain_indexes(self) -> None:
+        engine = create_engine("sqlite://", echo=False)
+        with engine.connect() as conn:
+            conn.execute(text(_OLD_SHAPE_DDL))
+            conn.execute(text(_OLD_AUDIT_LOG_DDL))
+            conn.commit()
+
+        _run_inline_migrations(engine)
+
+        insp = inspect(engine)
+        lot_indexes = {ix["name"] for ix in insp.get_indexes("tax_lots")}
+        audit_indexes = {ix["name"] for ix in insp.get_indexes("audit_log")}
+        assert {
+            "ix_tax_lots_closed_close_date",
+            "ix_tax_lots_ticker_open_date",
+        } <= lot_indexes
+        assert "ix_audit_log_action_created_at" in audit_indexes
+
+
+# ── Compressed fetch cache payloads ────────────────────────────────────
+
+_OLD_FETCH_CACHE_DDL = """\
+CREATE TABLE fetch_cache (
+    id            VARCHAR(36) PRIMARY KEY,
+    provider      VARCHAR(64) NOT NULL,
+    data_type     VARCHAR(64) NOT NULL,
+    entity_key    VARCHAR(128) NOT NULL,
+    payload_json  TEXT NOT NULL,
+    content_hash  VARCHAR(64) NOT NULL,
+    etag          VARCHAR(256),
+    last_modified VARCHAR(128),
+    fetched_at    DATETIME NOT NULL,
+    ttl_seconds   INTEGER NOT NULL,
+    CONSTRAINT uq_fetch_cache UNIQUE (provider, data_type, entity_key)
+);
+"""
+
+
+class TestInlineMigrationsFetchCacheBlobs:
+    """Verify legacy fetch_cache payloads move into compressed blobs."""
+
+    def test_legacy_payloads_move_into_shared_blobs(self) -> None:
+        from sqlalchemy.orm import Session
+
+        from zorivest_infra.database.migrate_fetch_cache import (
+            migrate_fetch_cache_payloads,
+        )
+        from zorivest_infra.database.models import (
+            FetchCacheBlobModel,
+            FetchCacheModel,
+        )
+
+        payload = '{"results": [' + ",".join(['{"c": 150.25}'] * 200) + "]}"
+        engine = create_engine("sqlite://", echo=False)
+        with engine.connect() as conn:
+            conn.execute(text(_OLD_FETCH_CACHE_DDL))
+            for i, (key, body, digest) in enumerate(
+                [
+                    ("AAPL", payload, "h1"),
+                    ("AAPL|1d", payload, "h1"),
+                    ("MSFT", "[]", "h2"),
+                ]
+            ):
+                conn.execute(
+                    text(
+                        "INSERT INTO fetch_cache (id, provider, data_type, entity_key,"
+                        " payload_json, content_hash, fetched_at, ttl_seconds) VALUES"
+                        " (:id, 'Yahoo Finance', 'ohlcv', :key, :body, :digest,"
+                        " '2025-01-02 10:00:00', 3600)"
+                    ),
+                    {"id": f"row{i}", "key": key, "body": body, "digest": digest},
+                )
+            conn.commit()
+        Base.metadata.create_all(engine)
+        _run_inline_migrations(engine)
+
+        index_names = {ix["name"] for ix in inspect(engine).get_indexes("fetch_cache")}
+        assert "ix_fetch_cache_content_hash" in index_names
+        columns = {c["name"] for c in inspect(engine).get_columns("fetch_cache")}
+        assert "last_hit_at" in columns
+
+        with Session(engine) as session:
+            assert migrate_fetch_cache_payloads(session, batch_size=2) == 3
+            session.commit()
+
+            blobs = session.query(FetchCacheBlobModel).all()
+            assert {b.content_hash for b in blobs} == {"h1", "h2"}
+            h1 = next(b for b in blobs if b.content_hash == "h1")
+            assert len(h1.payload) < h1.raw_size / 10
+            rows = session.query(FetchCacheModel).all()
+            assert all(r.legacy_payload == "" for r in rows)
+            aapl = next(r for r in rows if r.entity_key == "AAPL")
+            assert aapl.payload_json == payload
+            # Idempotent: nothing left to migrate.
+            assert migrate_fetch_cache_payloads(session) == 0
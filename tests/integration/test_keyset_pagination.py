@@ -0,0 +1,195 @@
+# tests/integration/test_keyset_pagination.py
+"""Integration tests for keyset (cursor) pagination of trades, lots and balances."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from zorivest_core.application.pagination import InvalidCursorError, encode_cursor
+from zorivest_core.domain.entities import Account, BalanceSnapshot, TaxLot, Trade
+from zorivest_core.domain.enums import AccountType, TradeAction
+from zorivest_core.services.account_service import AccountService
+from zorivest_core.services.tax_service import TaxService
+from zorivest_core.services.trade_service import TradeService
+from zorivest_infra.database.models import Base
+from zorivest_infra.database.unit_of_work import SqlAlchemyUnitOfWork
+
+_BASE = datetime(2025, 3, 1, 9, 30)
+
+
+@pytest.fixture()
+def uow() -> SqlAlchemyUnitOfWork:
+    engine = create_engine(
+        "sqlite://", echo=False, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    uow = SqlAlchemyUnitOfWork(engine)
+    with uow:
+        uow.accounts.save(
+            Account(account_id="ACC001", name="Main", account_type=AccountType.BROKER)
+        )
+        # Groups of three rows share a timestamp to exercise the tie-breaker.
+        for i in range(25):
+            uow.trades.save(
+                Trade(
+                    exec_id=f"E{i:03d}",
+                    time=_BASE + timedelta(minutes=i // 3),
+                    instrument="SPY",
+                    action=TradeAction.BOT,
+                    quantity=1.0,
+                    price=100.0 + i,
+                    account_id="ACC001",
+                )
+            )
+            uow.tax_lots.save(
+                TaxLot(
+                    lot_id=f"L{i:03d}",
+                    account_id="ACC001",
+                    ticker="SPY",
+                    open_date=_BASE + timedelta(days=i // 3),
+                    close_date=None,
+                    quantity=1.0,
+                    cost_basis=Decimal("100"),
+                    proceeds=Decimal("0"),
+                    wash_sale_adjustment=Decimal("0"),
+                    is_closed=False,
+                    linked_trade_ids=[],
+                )
+            )
+            uow.balance_snapshots.save(
+                BalanceSnapshot(
+                    id=0,
+                    account_id="ACC001",
+                    datetime=_BASE + timedelta(days=i // 3),
+                    balance=Decimal(1000 + i),
+                )
+            )
+        uow.commit()
+    return uow
+
+
+def _walk(fetch) -> list:  # noqa: ANN001
+    items, cursor = [], None
+    while True:
+        page = fetch(cursor)
+        items.extend(page.items)
+        if page.next_cursor is None:
+            return items
+        cursor = page.next_cursor
+
+
+class TestTradeKeyset:
+    @pytest.mark.parametrize("sort", ["-time", "time"])
+    def test_walk_matches_offset_listing(self, uow, sort: str) -> None:
+        svc = TradeService(uow)
+        walked = _walk(lambda c: svc.list_trades_page(limit=4, cursor=c, sort=sort))
+        expected = svc.list_trades(limit=100, sort=sort)
+        assert [t.exec_id for t in walked] == [t.exec_id for t in expected]
+
+    def test_total_only_when_requested(self, uow) -> None:
+        svc = TradeService(uow)
+        assert svc.list_trades_page(limit=5).total is None
+        assert svc.list_trades_page(limit=5, include_total=True).total == 25
+
+    def test_cursor_is_bound_to_sort(self, uow) -> None:
+        svc = TradeService(uow)
+        cursor = svc.list_trades_page(limit=5, sort="-time").next_cursor
+        with pytest.raises(InvalidCursorError):
+            svc.list_trades_page(limit=5, cursor=cursor, sort="time")
+
+    def test_cursor_is_bound_to_filters(self, uow) -> None:
+        svc = TradeService(uow)
+        cursor = svc.list_trades_page(limit=5, account_id="ACC001").next_cursor
+        with pytest.raises(InvalidCursorError):
+            svc.list_trades_page(limit=5, cursor=cursor, search="SPY")
+        with pytest.raises(InvalidCursorError):
+            svc.list_trades_page(limit=5, cursor=cursor)
+
+    @pytest.mark.parametrize("sort", ["-time", "time"])
+    def test_offset_listing_breaks_ties_by_exec_id(self, uow, sort: str) -> None:
+        svc = TradeService(uow)
+        listed = svc.list_trades(limit=100, sort=sort)
+        keys = [(t.time, t.exec_id) for t in listed]
+        assert keys == sorted(keys, reverse=sort == "-time")
+
+    def test_non_time_sort_rejected(self, uow) -> None:
+        with pytest.raises(ValueError, match="cursor pagination"):
+            TradeService(uow).list_trades_page(sort="-price")
+
+    def test_seek_uses_composite_index(self, uow) -> None:
+        with uow:
+            plan = uow._session.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT exec_id FROM trades "
+                    "WHERE account_id = 'ACC001' AND (time, exec_id) < "
+                    "('2025-03-01 10:00:00.000000', 'E010') "
+                    "ORDER BY time DESC, exec_id DESC LIMIT 5"
+                )
+            ).all()
+        detail = " ".join(row[-1] for row in plan)
+        assert "ix_trades_account_time_exec_id" in detail
+        assert "TEMP B-TREE" not in detail
+
+
+class TestTaxLotKeyset:
+    def test_walk_returns_every_lot_in_order(self, uow) -> None:
+        svc = TaxService(uow)
+        walked = _walk(lambda c: svc.get_lots_page(limit=4, cursor=c))
+        assert [lot.lot_id for lot in walked] == [f"L{i:03d}" for i in range(25)]
+
+    def test_cursor_is_bound_to_filters(self, uow) -> None:
+        svc = TaxService(uow)
+        cursor = svc.get_lots_page(limit=4, ticker="SPY").next_cursor
+        with pytest.raises(InvalidCursorError):
+            svc.get_lots_page(limit=4, cursor=cursor, ticker="QQQ")
+        with pytest.raises(InvalidCursorError):
+            svc.get_lots_page(limit=4, cursor=cursor, ticker="SPY", status="open")
+        assert svc.get_lots_page(limit=4, cursor=cursor, ticker="SPY").items
+
+
+class TestBalanceHistoryKeyset:
+    def test_walk_newest_first(self, uow) -> None:
+        svc = AccountService(uow)
+        walked = _walk(
+            lambda c: svc.list_balance_history_page("ACC001", limit=4, cursor=c)
+        )
+        keys = [(s.datetime, s.id) for s in walked]
+        assert len(keys) == 25
+        assert keys == sorted(keys, reverse=True)
+
+    def test_offset_page_cursor_continues_across_ties(self, uow) -> None:
+        # The route mints the first cursor from an offset page's last row.
+        # Without the index SQLite sorts, so only ORDER BY decides ties.
+        with uow:
+            uow._session.execute(
+                text("DROP INDEX ix_balance_snapshots_account_datetime_id")
+            )
+            uow.commit()
+        svc = AccountService(uow)
+        first = svc.list_balance_history("ACC001", limit=5)
+        cursor = encode_cursor("balances:ACC001", (first[-1].datetime, first[-1].id))
+        rest = _walk(
+            lambda c: svc.list_balance_history_page(
+                "ACC001", limit=4, cursor=c or cursor
+            )
+        )
+        keys = [(s.datetime, s.id) for s in first + rest]
+        assert len(set(keys)) == 25
+        assert keys == sorted(keys, reverse=True)
+
+    def test_cursor_is_bound_to_account(self, uow) -> None:
+        svc = AccountService(uow)
+        with uow:
+            uow.accounts.save(
+                Account(
+                    account_id="ACC002", name="Alt", account_type=AccountType.BROKER
+                )
+            )
+            uow.commit()
+        cursor = svc.list_balance_history_page("ACC001", limit=4).next_cursor
+        with pytest.raises(InvalidCursorError):
+            svc.list_balance_history_page("ACC002", cursor=cursor)
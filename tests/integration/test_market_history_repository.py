@@ -0,0 +1,263 @@
+# tests/integration/test_market_history_repository.py
+"""Integration tests for SqlMarketHistoryRepository (read-through store)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from zorivest_core.application.market_expansion_dtos import (
+    DividendRecord,
+    FundamentalsSnapshot,
+    OHLCVBar,
+    StockSplit,
+)
+
+_T0 = datetime(2026, 3, 2, 14, 30, tzinfo=timezone.utc)
+_FETCHED = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+_DAY0 = datetime(2026, 3, 2, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def repo(db_session):
+    from zorivest_infra.database.market_history_repository import (
+        SqlMarketHistoryRepository,
+    )
+
+    return SqlMarketHistoryRepository(db_session)
+
+
+def _bar(day: int, close: str = "100", provider: str = "Yahoo Finance") -> OHLCVBar:
+    return OHLCVBar(
+        ticker="AAPL",
+        timestamp=_T0 + timedelta(days=day),
+        open=Decimal("99"),
+        high=Decimal("101"),
+        low=Decimal("98"),
+        close=Decimal(close),
+        adj_close=None,
+        volume=1000,
+        vwap=None,
+        trade_count=None,
+        provider=provider,
+    )
+
+
+class TestOhlcv:
+    def test_round_trip_within_range(self, repo) -> None:
+        repo.save_ohlcv([_bar(0), _bar(1), _bar(2)], _FETCHED)
+
+        rows = repo.list_ohlcv("AAPL", _T0, _T0 + timedelta(days=2))
+
+        assert [bar.timestamp for bar, _ in rows] == [_T0, _T0 + timedelta(days=1)]
+        bar, fetched_at = rows[0]
+        assert bar.close == Decimal("100")
+        assert bar.provider == "Yahoo Finance"
+        assert fetched_at == _FETCHED
+
+    def test_save_upserts_on_ticker_timestamp_provider(self, repo) -> None:
+        repo.save_ohlcv([_bar(0, close="100")], _FETCHED)
+        later = _FETCHED + timedelta(hours=1)
+        repo.save_ohlcv([_bar(0, close="105")], later)
+
+        rows = repo.list_ohlcv("AAPL", _T0, _T0 + timedelta(days=1))
+
+        assert len(rows) == 1
+        assert rows[0][0].close == Decimal("105")
+        assert rows[0][1] == later
+
+    def test_newest_fetch_wins_across_providers(self, repo) -> None:
+        repo.save_ohlcv([_bar(0, close="100", provider="Polygon")], _FETCHED)
+        repo.save_ohlcv([_bar(0, close="101")], _FETCHED + timedelta(minutes=5))
+
+        rows = repo.list_ohlcv("AAPL", _T0, _T0 + timedelta(days=1))
+
+        assert len(rows) == 1
+        assert rows[0][0].provider == "Yahoo Finance"
+
+    def test_empty_save_is_noop(self, repo) -> None:
+        repo.save_ohlcv([], _FETCHED)
+
+        assert repo.list_ohlcv("AAPL", _T0, _T0 + timedelta(days=30)) == []
+
+
+class TestOhlcvCoverage:
+    def test_final_bars_compact_into_ranges(self, repo) -> None:
+        # Mon 2 – Fri 6 Mar fetched afterwards; Mon 9 fetched mid-session.
+        repo.save_ohlcv([_bar(d) for d in range(5)], _FETCHED)
+        repo.save_ohlcv([_bar(7)], _T0 + timedelta(days=7, hours=1))
+
+        coverage = repo.ohlcv_coverage(
+            ["AAPL", "MSFT"], "Yahoo Finance", _T0, _T0 + timedelta(days=30)
+        )
+
+        assert coverage == {"AAPL": [(date(2026, 3, 2), date(2026, 3, 6))]}
+
+    def test_unstamped_bars_in_settlement_window_are_not_covered(
+        self, repo, db_session
+    ) -> None:
+        from sqlalchemy import text
+
+        # Rows a pipeline stored without fetched_at, Mon 2 – Fri 6 Mar.
+        for d in range(5):
+            db_session.execute(
+                text(
+                    "INSERT INTO market_ohlcv (ticker, timestamp, open, high, low,"
+                    " close, volume, provider) VALUES ('AAPL', :ts, 1, 1, 1, 1, 1,"
+                    " 'Yahoo Finance')"
+                ),
+                {"ts": (_T0 + timedelta(days=d)).replace(tzinfo=None)},
+            )
+        now = _T0 + timedelta(days=4, hours=5)
+
+        coverage = repo.ohlcv_coverage(
+            ["AAPL"], "Yahoo Finance", _DAY0, _FETCHED, now=now
+        )
+
+        assert coverage == {"AAPL": [(date(2026, 3, 2), date(2026, 3, 4))]}
+
+    def test_coverage_is_per_provider(self, repo) -> None:
+        repo.save_ohlcv([_bar(0, provider="Polygon.io")], _FETCHED)
+
+        assert repo.ohlcv_coverage(["AAPL"], "Yahoo Finance", _T0, _FETCHED) == {}
+        assert repo.ohlcv_coverage([], "Polygon.io", _T0, _FETCHED) == {}
+
+
+class TestPipelineWrites:
+    """Bars stored by a pipeline run follow the same finality rules."""
+
+    def _store_through_pipeline(self, db_session, written_at: datetime) -> None:
+        from zorivest_core.domain.pipeline import StepContext
+        from zorivest_core.pipeline_steps.market_data_store_step import (
+            MarketDataStoreStep,
+        )
+        from zorivest_infra.adapters.db_write_adapter import DbWriteAdapter
+
+        writer = DbWriteAdapter(session=db_session, clock=lambda: written_at)
+        context = StepContext(
+            run_id="run", policy_id="policy", outputs={"db_writer": writer}
+        )
+        record = {
+            "ticker": "AAPL",
+            "timestamp": "2026-03-02 14:30:00",
+            "open": 99.0,
+            "high": 101.0,
+            "low": 98.0,
+            "close": 100.0,
+            "volume": 1000,
+            "provider": "Yahoo Finance",
+        }
+        params = {"data_type": "ohlcv", "write_mode": "upsert", "records": [record]}
+        asyncio.run(MarketDataStoreStep().execute(params, context))
+
+    def test_same_day_bar_is_refetched_after_its_session(
+        self, repo, db_session
+    ) -> None:
+        from zorivest_core.domain.market_history import missing_ohlcv_ranges
+
+        day = date(2026, 3, 2)
+        self._store_through_pipeline(db_session, _T0 + timedelta(hours=1))
+
+        [(_, fetched_at)] = repo.list_ohlcv("AAPL", _DAY0, _DAY0 + timedelta(days=1))
+        stored = {day: fetched_at}
+
+        assert fetched_at == _T0 + timedelta(hours=1)
+        assert missing_ohlcv_ranges(day, day, stored, _FETCHED) == [(day, day)]
+        coverage = repo.ohlcv_coverage(["AAPL"], "Yahoo Finance", _DAY0, _FETCHED)
+        assert coverage == {}
+
+    def test_bar_stored_after_its_session_is_final(self, repo, db_session) -> None:
+        from zorivest_core.domain.market_history import missing_ohlcv_ranges
+
+        day = date(2026, 3, 2)
+        self._store_through_pipeline(db_session, _FETCHED)
+
+        [(_, fetched_at)] = repo.list_ohlcv("AAPL", _DAY0, _DAY0 + timedelta(days=1))
+
+        assert missing_ohlcv_ranges(day, day, {day: fetched_at}, _FETCHED) == []
+
+
+class TestFundamentals:
+    def _snapshot(self, **overrides: object) -> FundamentalsSnapshot:
+        values: dict[str, object] = {
+            "ticker": "AAPL",
+            "market_cap": Decimal("3000000"),
+            "pe_ratio": Decimal("28.5"),
+            "pb_ratio": None,
+            "ps_ratio": None,
+            "eps": Decimal("6.1"),
+            "dividend_yield": None,
+            "beta": Decimal("1.2"),
+            "sector": "Technology",
+            "industry": "Consumer Electronics",
+            "employees": 160000,
+            "provider": "Yahoo Finance",
+            "timestamp": _FETCHED,
+        }
+        values.update(overrides)
+        return FundamentalsSnapshot(**values)  # type: ignore[arg-type]
+
+    def test_round_trip_keeps_text_fields(self, repo) -> None:
+        repo.save_fundamentals(self._snapshot(), _FETCHED)
+
+        got = repo.get_fundamentals("AAPL")
+
+        assert got is not None
+        assert got.pe_ratio == Decimal("28.5")
+        assert got.pb_ratio is None
+        assert got.sector == "Technology"
+        assert got.industry == "Consumer Electronics"
+        assert got.employees == 160000
+        assert got.timestamp == _FETCHED
+
+    def test_resave_replaces_snapshot(self, repo) -> None:
+        repo.save_fundamentals(self._snapshot(), _FETCHED)
+        later = _FETCHED + timedelta(days=1)
+        repo.save_fundamentals(self._snapshot(pe_ratio=None), later)
+
+        got = repo.get_fundamentals("AAPL")
+
+        assert got is not None
+        assert got.pe_ratio is None
+        assert got.timestamp == later
+
+    def test_missing_ticker(self, repo) -> None:
+        assert repo.get_fundamentals("MSFT") is None
+
+
+class TestDividendsAndSplits:
+    def test_dividends_upsert_and_last_fetched(self, repo) -> None:
+        div = DividendRecord(
+            ticker="AAPL",
+            dividend_amount=Decimal("0.25"),
+            currency="USD",
+            ex_date=date(2026, 2, 9),
+            record_date=None,
+            pay_date=None,
+            declaration_date=None,
+            frequency=None,
+            provider="Yahoo Finance",
+        )
+        repo.save_dividends([div], _FETCHED)
+        later = _FETCHED + timedelta(days=2)
+        repo.save_dividends([div], later)
+
+        assert repo.list_dividends("AAPL") == [div]
+        assert repo.last_fetched("dividends", "AAPL") == later
+        assert repo.last_fetched("dividends", "MSFT") is None
+
+    def test_splits_round_trip(self, repo) -> None:
+        split = StockSplit(
+            ticker="AAPL",
+            execution_date=date(2020, 8, 31),
+            ratio_from=1,
+            ratio_to=4,
+            provider="Yahoo Finance",
+        )
+        repo.save_splits([split], _FETCHED)
+
+        assert repo.list_splits("AAPL") == [split]
+        assert repo.last_fetched("splits", "AAPL") == _FETCHED
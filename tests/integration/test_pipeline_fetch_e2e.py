@@ -67,7 +67,7 @@ async def test_PW2_AC7_fetch_step_happy_path_ohlcv():
     )
 
     assert result.status.value == "success"
-    assert result.output["content"] is not None
+    assert result.output["records"] is not None
     assert result.output["content_len"] > 0
     assert result.output["provider"] == "Polygon.io"
     assert result.output["data_type"] == "ohlcv"
@@ -242,6 +242,7 @@ async def test_PW2_AC7_etag_revalidation_304():
                 "data_type": "ohlcv",
                 "criteria": {"symbol": "AAPL"},
                 "use_cache": True,
+                "include_content": True,
             },
             context=context,
         )
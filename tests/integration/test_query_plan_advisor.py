@@ -0,0 +1,63 @@
+# tests/integration/test_query_plan_advisor.py
+"""Integration tests for the EXPLAIN QUERY PLAN index advisor."""
+
+from __future__ import annotations
+
+from sqlalchemy import create_engine, text
+
+from zorivest_infra.database.models import Base
+from zorivest_infra.database.query_plan_advisor import (
+    CANONICAL_QUERIES,
+    audit_canonical_queries,
+    main,
+)
+
+
+def _engine():  # noqa: ANN202
+    engine = create_engine("sqlite://", echo=False)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+class TestQueryPlanAdvisor:
+    def test_canonical_queries_use_indexes(self) -> None:
+        findings = audit_canonical_queries(_engine())
+        assert findings == [], "\n".join(f"{f.query}: {f.detail}" for f in findings)
+
+    def test_missing_index_is_reported(self) -> None:
+        engine = _engine()
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_audit_log_action_created_at"))
+
+        findings = audit_canonical_queries(engine)
+
+        assert [(f.query, f.table) for f in findings] == [
+            ("audit_log.count_since", "audit_log")
+        ]
+        assert findings[0].detail == "SCAN audit_log"
+
+    def test_index_order_walk_is_reported(self) -> None:
+        engine = _engine()
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_tax_lots_closed_close_date"))
+
+        findings = audit_canonical_queries(
+            engine,
+            tuple(q for q in CANONICAL_QUERIES if q[0].startswith("tax_lots.")),
+        )
+
+        assert [f.query for f in findings] == ["tax_lots.list_all_filtered[closed]"]
+        assert "USING INDEX" in findings[0].detail
+
+    def test_cli_exit_code(self, tmp_path, capsys) -> None:
+        assert main([]) == 0
+
+        db_url = f"sqlite:///{tmp_path / 'advisor.db'}"
+        engine = create_engine(db_url)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_trades_account_time_exec_id"))
+        engine.dispose()
+
+        assert main(["--db-url", db_url]) == 1
+        assert "trades.count_filtered[account]" in capsys.readouterr().out
@@ -168,6 +168,70 @@ class TestTradeRepository:
         session.commit()
         assert repo.exists_by_fingerprint_since(fp)
 
+    def test_fingerprint_column_persisted(self, session: Session) -> None:
+        """Saved and updated trades carry their fingerprint in the indexed column."""
+        from zorivest_infra.database.models import TradeModel
+
+        SqlAlchemyAccountRepository(session).save(_make_account())
+        session.flush()
+
+        repo = SqlAlchemyTradeRepository(session)
+        trade = _make_trade()
+        repo.save(trade)
+        session.commit()
+        row = session.get(TradeModel, "E001")
+        assert row is not None
+        assert row.fingerprint == trade_fingerprint(trade)
+
+        trade.price = 151.25
+        repo.update(trade)
+        session.commit()
+        session.refresh(row)
+        assert row.fingerprint == trade_fingerprint(trade)
+
+    def test_exists_by_fingerprint_respects_lookback(self, session: Session) -> None:
+        """Trades older than the lookback window are not reported as duplicates."""
+        from datetime import timedelta
+
+        SqlAlchemyAccountRepository(session).save(_make_account())
+        session.flush()
+
+        repo = SqlAlchemyTradeRepository(session)
+        trade = _make_trade()
+        trade.time = datetime.now() - timedelta(days=45)
+        fp = trade_fingerprint(trade)
+        repo.save(trade)
+        session.commit()
+
+        assert not repo.exists_by_fingerprint_since(fp, lookback_days=30)
+        assert repo.exists_by_fingerprint_since(fp, lookback_days=60)
+
+    def test_stats_by_account_aggregates_in_sql(self, session: Session) -> None:
+        acct_repo = SqlAlchemyAccountRepository(session)
+        acct_repo.save(_make_account("ACC001"))
+        acct_repo.save(_make_account("ACC002"))
+        acct_repo.save(_make_account("ACC003"))
+        session.flush()
+
+        repo = SqlAlchemyTradeRepository(session)
+        for i, pnl in enumerate([100.5, -50.0, 200.0]):
+            trade = _make_trade(f"E{i}")
+            trade.realized_pnl = pnl
+            repo.save(trade)
+        other = _make_trade("X1")
+        other.account_id = "ACC002"
+        repo.save(other)
+        session.commit()
+
+        stats = repo.stats_by_account(["ACC001", "ACC002", "ACC003"])
+
+        assert set(stats) == {"ACC001", "ACC002"}
+        assert stats["ACC001"].trade_count == 3
+        assert stats["ACC001"].winning_trades == 2
+        assert stats["ACC001"].total_realized_pnl == pytest.approx(250.5)
+        assert stats["ACC002"].trade_count == 1
+        assert stats["ACC002"].winning_trades == 0
+
 
 class TestImageRepository:
     """AC-14.5, AC-14.6."""
@@ -265,6 +329,35 @@ class TestBalanceSnapshotRepository:
         assert len(results) == 1
         assert results[0].balance == Decimal("50000")
 
+    def test_latest_for_accounts(self, session: Session) -> None:
+        acct_repo = SqlAlchemyAccountRepository(session)
+        for aid in ("ACC001", "ACC002", "ACC003"):
+            acct_repo.save(_make_account(aid))
+        session.flush()
+
+        repo = SqlAlchemyBalanceSnapshotRepository(session)
+        for aid, day, balance in [
+            ("ACC001", 15, "50000"),
+            ("ACC001", 20, "51000"),
+            ("ACC001", 10, "49000"),
+            ("ACC002", 1, "700"),
+        ]:
+            repo.save(
+                BalanceSnapshot(
+                    id=0,
+                    account_id=aid,
+                    datetime=datetime(2025, 1, day),
+                    balance=Decimal(balance),
+                )
+            )
+        session.commit()
+
+        latest = repo.latest_for_accounts(["ACC001", "ACC002", "ACC003"])
+
+        assert set(latest) == {"ACC001", "ACC002"}
+        assert latest["ACC001"].balance == Decimal("51000")
+        assert latest["ACC002"].balance == Decimal("700")
+
 
 class TestRoundTripRepository:
     """AC-14.9."""
@@ -468,6 +561,44 @@ class TestTradePlanRepository:
         plans = repo.list_all(limit=10, offset=0)
         assert len(plans) == 3
 
+    def test_count_by_account(self, session: Session) -> None:
+        from zorivest_core.domain.entities import TradePlan
+
+        acct_repo = SqlAlchemyAccountRepository(session)
+        acct_repo.save(_make_account("ACC001"))
+        acct_repo.save(_make_account("ACC002"))
+        session.flush()
+
+        repo = SqlAlchemyTradePlanRepository(session)
+        for i, account_id in enumerate(["ACC001", "ACC001", "ACC002", None]):
+            repo.save(
+                TradePlan(
+                    id=0,
+                    ticker=f"T{i}",
+                    direction=TradeAction.BOT,
+                    conviction=ConvictionLevel.MEDIUM,
+                    strategy_name="Test",
+                    strategy_description="",
+                    entry_price=100.0,
+                    stop_loss=95.0,
+                    target_price=110.0,
+                    entry_conditions="",
+                    exit_conditions="",
+                    timeframe="swing",
+                    risk_reward_ratio=2.0,
+                    status=PlanStatus.DRAFT,
+                    created_at=datetime(2026, 3, 12),
+                    updated_at=datetime(2026, 3, 12),
+                    account_id=account_id,
+                )
+            )
+        session.commit()
+
+        assert repo.count_by_account(["ACC001", "ACC002", "ACC003"]) == {
+            "ACC001": 2,
+            "ACC002": 1,
+        }
+
     def test_update(self, session: Session) -> None:
         from zorivest_core.domain.entities import TradePlan
 
@@ -196,6 +196,41 @@ class TestTaxLotLinkedTradeIds:
         assert fetched.linked_trade_ids == ["exec-001", "exec-002", "exec-003"]
 
 
+class TestTaxLotBulkWrites:
+    """save_many / update_many write whole batches in one statement each."""
+
+    def test_save_many_and_get(self, tax_lot_repo) -> None:
+        tax_lot_repo.save_many([_make_lot(lot_id=f"lot-{i}") for i in range(3)])
+
+        assert tax_lot_repo.count_filtered() == 3
+        fetched = tax_lot_repo.get("lot-2")
+        assert fetched is not None
+        assert fetched.cost_basis == Decimal("150.00")
+        assert fetched.linked_trade_ids == ["exec-001"]
+
+    def test_update_many(self, tax_lot_repo) -> None:
+        tax_lot_repo.save_many([_make_lot(lot_id=f"lot-{i}") for i in range(3)])
+        lots = [tax_lot_repo.get(f"lot-{i}") for i in range(2)]
+        for lot in lots:
+            lot.is_closed = True
+            lot.close_date = datetime(2025, 7, 1, tzinfo=timezone.utc)
+            lot.proceeds = Decimal("175.00")
+
+        tax_lot_repo.update_many(lots)
+
+        assert tax_lot_repo.count_filtered(is_closed=True) == 2
+        fetched = tax_lot_repo.get("lot-0")
+        assert fetched is not None
+        assert fetched.proceeds == Decimal("175.00")
+        assert tax_lot_repo.get("lot-2").is_closed is False
+
+    def test_empty_batches_are_noops(self, tax_lot_repo) -> None:
+        tax_lot_repo.save_many([])
+        tax_lot_repo.update_many([])
+
+        assert tax_lot_repo.count_filtered() == 0
+
+
 # ── TaxProfile Repository Tests ────────────────────────────────────────
 
 
@@ -0,0 +1,183 @@
+# tests/integration/test_trade_search.py
+"""Integration tests for the ``trades_fts`` full-text trade search index."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from zorivest_core.domain.entities import Account, Trade, TradeReport
+from zorivest_core.domain.enums import AccountType, TradeAction
+from zorivest_infra.database.models import Base
+from zorivest_infra.database.unit_of_work import SqlAlchemyUnitOfWork
+
+
+def _trade(exec_id: str, instrument: str, notes: str = "", **kw) -> Trade:  # noqa: ANN003
+    return Trade(
+        exec_id=exec_id,
+        time=kw.pop("time", datetime(2025, 3, 1, 9, 30)),
+        instrument=instrument,
+        action=TradeAction.BOT,
+        quantity=1.0,
+        price=100.0,
+        account_id="ACC001",
+        notes=notes,
+        **kw,
+    )
+
+
+def _report(trade_id: str, lessons: str, tags: list[str]) -> TradeReport:
+    return TradeReport(
+        id=0,
+        trade_id=trade_id,
+        setup_quality=3,
+        execution_quality=3,
+        followed_plan=True,
+        emotional_state="neutral",
+        created_at=datetime(2025, 3, 2),
+        lessons_learned=lessons,
+        tags=tags,
+    )
+
+
+@pytest.fixture()
+def uow() -> SqlAlchemyUnitOfWork:
+    engine = create_engine(
+        "sqlite://", echo=False, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    uow = SqlAlchemyUnitOfWork(engine)
+    with uow:
+        uow.accounts.save(
+            Account(account_id="ACC001", name="Main", account_type=AccountType.BROKER)
+        )
+        uow.trades.save(_trade("T1", "AAPL", notes="gap and go breakout"))
+        uow.trades.save(
+            _trade("T2", "MSFT", notes="faded the open", time=datetime(2025, 3, 3, 10))
+        )
+        uow.trades.save(
+            _trade("T3", "NVDA", notes="", time=datetime(2025, 4, 15, 14, 5))
+        )
+        uow.commit()
+        uow.trade_reports.save(_report("T3", "Sized too big into earnings", ["fomo"]))
+        uow.commit()
+    return uow
+
+
+def _search(uow: SqlAlchemyUnitOfWork, term: str, sort: str = "-time") -> list[str]:
+    with uow:
+        return [t.exec_id for t in uow.trades.list_filtered(search=term, sort=sort)]
+
+
+class TestTradeSearchIndex:
+    @pytest.mark.parametrize(
+        ("term", "expected"),
+        [
+            ("aapl", ["T1"]),
+            ("BREAKOUT", ["T1"]),
+            ("acc001", ["T3", "T2", "T1"]),
+            ("2025-04-15 14:05", ["T3"]),
+            ("earnings", ["T3"]),
+            ("fomo", ["T3"]),
+        ],
+    )
+    def test_substring_match_across_columns(self, uow, term, expected) -> None:
+        assert _search(uow, term) == expected
+
+    def test_short_terms_fall_back_to_like(self, uow) -> None:
+        assert _search(uow, "T2") == ["T2"]
+
+    def test_fts_operators_are_literal(self, uow) -> None:
+        assert _search(uow, 'open" OR "aapl') == []
+        assert _search(uow, "NEAR(x y)") == []
+
+    def test_index_follows_trade_updates_and_deletes(self, uow) -> None:
+        with uow:
+            trade = uow.trades.get("T2")
+            trade.notes = "held through lunch"
+            uow.trades.update(trade)
+            uow.trades.delete("T1")
+            uow.commit()
+        assert _search(uow, "faded") == []
+        assert _search(uow, "lunch") == ["T2"]
+        assert _search(uow, "breakout") == []
+
+    def test_index_survives_renumbered_trade_rowids(self, uow) -> None:
+        # VACUUM may renumber the implicit rowids of ``trades``; shifting
+        # them directly does the same without firing the column triggers.
+        with uow:
+            uow._session.execute(text("UPDATE trades SET rowid = rowid + 100"))
+            uow.commit()
+        with uow:
+            trade = uow.trades.get("T2")
+            trade.notes = "held through lunch"
+            uow.trades.update(trade)
+            uow.trades.delete("T1")
+            report = uow.trade_reports.get_for_trade("T3")
+            report.lessons_learned = "Respect the stop"
+            uow.trade_reports.update(report)
+            uow.commit()
+        assert _search(uow, "faded") == []
+        assert _search(uow, "breakout") == []
+        assert _search(uow, "lunch") == ["T2"]
+        assert _search(uow, "the stop") == ["T3"]
+        assert _search(uow, "nvda") == ["T3"]
+
+    def test_rowid_keyed_index_is_migrated(self, uow) -> None:
+        with uow:
+            uow._session.execute(text("DROP TABLE trades_fts_keys"))
+            uow._session.execute(text("DELETE FROM trades_fts"))
+            uow.commit()
+        Base.metadata.create_all(uow._engine)
+        assert _search(uow, "breakout") == ["T1"]
+        with uow:
+            uow.trades.delete("T1")
+            uow.commit()
+        assert _search(uow, "breakout") == []
+
+    def test_index_follows_report_changes(self, uow) -> None:
+        with uow:
+            report = uow.trade_reports.get_for_trade("T3")
+            report.lessons_learned = "Respect the stop"
+            uow.trade_reports.update(report)
+            uow.commit()
+        assert _search(uow, "earnings") == []
+        assert _search(uow, "the stop") == ["T3"]
+
+        with uow:
+            uow.trade_reports.delete(uow.trade_reports.get_for_trade("T3").id)
+            uow.commit()
+        assert _search(uow, "the stop") == []
+
+    def test_relevance_sort_ranks_best_match_first(self, uow) -> None:
+        with uow:
+            uow.trades.save(_trade("T4", "AMD", notes="open open open drive"))
+            uow.commit()
+        assert _search(uow, "open", sort="relevance") == ["T4", "T2"]
+
+    def test_count_uses_same_filter(self, uow) -> None:
+        with uow:
+            assert uow.trades.count_filtered(search="acc001") == 3
+            assert uow.trades.count_filtered(search="earnings") == 1
+
+    def test_existing_rows_indexed_when_table_is_created(self, uow) -> None:
+        with uow:
+            uow._session.execute(text("DROP TABLE trades_fts"))
+            uow.commit()
+        Base.metadata.create_all(uow._engine)
+        assert _search(uow, "breakout") == ["T1"]
+        assert _search(uow, "fomo") == ["T3"]
+
+    def test_search_is_driven_by_the_index(self, uow) -> None:
+        with uow:
+            plan = uow._session.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT exec_id FROM trades WHERE exec_id IN "
+                    "(SELECT exec_id FROM trades_fts WHERE trades_fts MATCH '\"aapl\"')"
+                )
+            ).all()
+        detail = " ".join(row[-1] for row in plan)
+        assert "VIRTUAL TABLE" in detail
+        assert "SCAN trades" not in detail.replace("SCAN trades_fts", "")
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from datetime import datetime
 
-from sqlalchemy import create_engine
+import pytest
+from sqlalchemy import create_engine, text
 
 from zorivest_core.domain.entities import Account, Trade
 from zorivest_core.domain.enums import AccountType, TradeAction
@@ -180,3 +183,115 @@ class TestUnitOfWork:
         with uow3:
             trade = uow3.trades.get("E_ROLLBACK")
             assert trade is None, "Trade should have been rolled back"
+
+
+class TestScopedUnitOfWork:
+    """Session-per-request / session-per-task scoping mode."""
+
+    def test_repos_require_active_scope(self) -> None:
+        """Repository access outside 'with uow:' raises instead of sharing."""
+        uow = SqlAlchemyUnitOfWork(_make_engine(), scoped=True)
+
+        assert uow._session is None
+        with pytest.raises(RuntimeError, match="No active unit-of-work scope"):
+            _ = uow.trades
+
+    def test_nested_enter_reuses_session(self) -> None:
+        """Nested 'with uow:' joins the caller's scope; outer exit closes it."""
+        uow = SqlAlchemyUnitOfWork(_make_engine(), scoped=True)
+
+        with uow:
+            outer = uow._session
+            with uow:
+                assert uow._session is outer
+            assert uow._session is outer
+        assert uow._session is None
+
+    def test_threads_get_independent_sessions(self) -> None:
+        """Each thread opens its own session."""
+        uow = SqlAlchemyUnitOfWork(_make_engine(), scoped=True)
+        sessions: list[object] = []
+        barrier = threading.Barrier(2)
+
+        def worker() -> None:
+            with uow:
+                sessions.append(uow._session)
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(sessions) == 2
+        assert sessions[0] is not sessions[1]
+
+    def test_child_task_gets_own_session(self) -> None:
+        """A task spawned inside a scope does not share its parent's session."""
+        uow = SqlAlchemyUnitOfWork(_make_engine(), scoped=True)
+
+        async def child() -> object:
+            with uow:
+                return uow._session
+
+        async def parent() -> tuple[object, object]:
+            with uow:
+                mine = uow._session
+                theirs = await asyncio.create_task(child())
+                assert uow._session is mine
+                return mine, theirs
+
+        mine, theirs = asyncio.run(parent())
+        assert mine is not theirs
+
+    def test_threadpool_offload_joins_caller_scope(self) -> None:
+        """Work offloaded to a thread (context copied) reuses the request session."""
+        uow = SqlAlchemyUnitOfWork(_make_engine(), scoped=True)
+
+        async def handler() -> tuple[object, object]:
+            with uow:
+
+                def service_call() -> object:
+                    with uow:
+                        return uow._session
+
+                return uow._session, await asyncio.to_thread(service_call)
+
+        mine, offloaded = asyncio.run(handler())
+        assert mine is offloaded
+
+    def test_contextual_session_resolves_per_scope(self) -> None:
+        """The contextual session proxy writes through the active scope."""
+        engine = _make_engine()
+        uow = SqlAlchemyUnitOfWork(engine, scoped=True)
+        proxy = uow.contextual_session
+
+        with uow:
+            uow.accounts.save(
+                Account(account_id="ACC1", name="A", account_type=AccountType.BROKER)
+            )
+            proxy.commit()
+
+        with pytest.raises(RuntimeError):
+            proxy.execute(text("SELECT 1"))
+
+        with uow:
+            assert uow.accounts.get("ACC1") is not None
+
+    def test_exception_rolls_back_scope(self) -> None:
+        """An exception inside the outermost scope discards its writes."""
+        engine = _make_engine()
+        uow = SqlAlchemyUnitOfWork(engine, scoped=True)
+
+        with pytest.raises(RuntimeError):
+            with uow:
+                uow.accounts.save(
+                    Account(
+                        account_id="ACC_X", name="X", account_type=AccountType.BROKER
+                    )
+                )
+                raise RuntimeError("boom")
+
+        with uow:
+            assert uow.accounts.get("ACC_X") is None
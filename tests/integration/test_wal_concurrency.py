@@ -8,12 +8,18 @@ Requires file-based SQLite (WAL doesn't work with :memory:).
 from __future__ import annotations
 
 import threading
+import time
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from zorivest_core.domain.entities import Account
+from zorivest_core.domain.enums import AccountType
 from zorivest_infra.database.models import Base
-from zorivest_infra.database.unit_of_work import create_engine_with_wal
+from zorivest_infra.database.unit_of_work import (
+    SqlAlchemyUnitOfWork,
+    create_engine_with_wal,
+)
 
 
 class TestWalMode:
@@ -89,3 +95,90 @@ class TestPerThreadSessions:
             result = session.execute(text("SELECT val FROM items"))
             rows = result.fetchall()
             assert any(r[0] == "from_writer" for r in rows)
+
+
+class TestScopedSessionLoad:
+    """Load test: scoped sessions on a pooled engine do not queue readers."""
+
+    _HOLD_SECONDS = 0.4
+
+    def _reader_latency(self, tmp_path, readers: int) -> float:  # type: ignore[no-untyped-def]
+        """Max latency of 4 concurrent GETs while a slow request holds a session."""
+        engine = create_engine_with_wal(
+            f"sqlite:///{tmp_path / f'load_{readers}.db'}",
+            readers=readers,
+            pool_timeout=5,
+        )
+        Base.metadata.create_all(engine)
+        uow = SqlAlchemyUnitOfWork(engine, scoped=True)
+        holding = threading.Event()
+
+        def slow_request() -> None:
+            with uow:
+                uow.accounts.list_all()
+                holding.set()
+                time.sleep(self._HOLD_SECONDS)
+
+        latencies: list[float] = []
+
+        def get_request() -> None:
+            start = time.perf_counter()
+            with uow:
+                uow.accounts.list_all()
+            latencies.append(time.perf_counter() - start)
+
+        slow = threading.Thread(target=slow_request)
+        slow.start()
+        assert holding.wait(timeout=5)
+        gets = [threading.Thread(target=get_request) for _ in range(4)]
+        for t in gets:
+            t.start()
+        for t in gets + [slow]:
+            t.join(timeout=10)
+        engine.dispose()
+        assert len(latencies) == 4
+        return max(latencies)
+
+    def test_readers_do_not_queue_behind_slow_request(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """With a reader pool, GETs finish while a slow request is in flight;
+        with a single connection they queue until it completes."""
+        single = self._reader_latency(tmp_path, readers=0)
+        pooled = self._reader_latency(tmp_path, readers=4)
+
+        assert single >= self._HOLD_SECONDS * 0.5
+        assert pooled < self._HOLD_SECONDS * 0.5
+
+    def test_reader_sees_committed_state_during_open_write(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """A WAL reader is not blocked by another scope's uncommitted write."""
+        engine = create_engine_with_wal(f"sqlite:///{tmp_path / 'rw.db'}")
+        Base.metadata.create_all(engine)
+        uow = SqlAlchemyUnitOfWork(engine, scoped=True)
+        written = threading.Event()
+        read_done = threading.Event()
+        seen: list[int] = []
+
+        def writer() -> None:
+            with uow:
+                uow.accounts.save(
+                    Account(account_id="W1", name="W", account_type=AccountType.BROKER)
+                )
+                uow._session.flush()  # holds the write lock, uncommitted
+                written.set()
+                read_done.wait(timeout=5)
+                uow.commit()
+
+        def reader() -> None:
+            written.wait(timeout=5)
+            with uow:
+                seen.append(len(uow.accounts.list_all()))
+            read_done.set()
+
+        threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        assert seen == [0]
+        with uow:
+            assert len(uow.accounts.list_all()) == 1
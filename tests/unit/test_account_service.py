@@ -10,6 +10,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from zorivest_core.application.commands import CreateAccount, UpdateBalance
+from zorivest_core.application.dtos import AccountTradeStats
 from zorivest_core.domain.entities import Account, BalanceSnapshot
 from zorivest_core.domain.enums import AccountType
 from zorivest_core.domain.exceptions import (
@@ -393,13 +394,11 @@ class TestGetAccountMetrics:
         )
         uow.accounts.get.return_value = account
 
-        trade1 = MagicMock()
-        trade1.realized_pnl = Decimal("100.50")
-        trade2 = MagicMock()
-        trade2.realized_pnl = Decimal("-50.00")
-        trade3 = MagicMock()
-        trade3.realized_pnl = Decimal("200.00")
-        uow.trades.list_for_account.return_value = [trade1, trade2, trade3]
+        uow.trades.stats_by_account.return_value = {
+            "ACC001": AccountTradeStats(
+                trade_count=3, total_realized_pnl=250.50, winning_trades=2
+            )
+        }
         uow.round_trips = MagicMock()
         uow.round_trips.list_for_account.return_value = [MagicMock(), MagicMock()]
 
@@ -409,7 +408,9 @@ class TestGetAccountMetrics:
         assert metrics["trade_count"] == 3
         assert metrics["round_trip_count"] == 2
         assert metrics["win_rate"] == 66.67  # 2/3 winners
-        assert metrics["total_realized_pnl"] == Decimal("250.50")
+        assert metrics["total_realized_pnl"] == 250.50
+        uow.trades.stats_by_account.assert_called_once_with(["ACC001"])
+        uow.trades.list_for_account.assert_not_called()
 
     def test_metrics_with_no_trades(self) -> None:
         """AC-12: get_account_metrics returns zeroes with no trades."""
@@ -420,7 +421,7 @@ class TestGetAccountMetrics:
             account_type=AccountType.BROKER,
         )
         uow.accounts.get.return_value = account
-        uow.trades.list_for_account.return_value = []
+        uow.trades.stats_by_account.return_value = {}
 
         svc = AccountService(uow)
         metrics = svc.get_account_metrics("ACC001")
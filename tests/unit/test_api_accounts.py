@@ -22,6 +22,7 @@ def client():
     account_svc = MagicMock()
     # MEU-71: enriched responses call get_latest_balance — default to None
     account_svc.get_latest_balance.return_value = None
+    account_svc.get_latest_balances.return_value = {}
     # MEU-37 AC-12: GET /{id} calls get_account_metrics — default to empty
     account_svc.get_account_metrics.return_value = {
         "trade_count": 0,
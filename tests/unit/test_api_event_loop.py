@@ -0,0 +1,188 @@
+# tests/unit/test_api_event_loop.py
+"""Tests for the event-loop execution layer (worker pool + loop-lag monitor)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import anyio.to_thread
+import httpx
+import pytest
+
+from zorivest_api.dependencies import get_tax_service
+from zorivest_api.event_loop import (
+    LoopLagMonitor,
+    configure_thread_pool,
+    default_thread_pool_size,
+    thread_pool_size_from_env,
+    thread_pool_stats,
+)
+from zorivest_api.main import create_app
+
+_SLOW_REPORT_S = 0.5
+
+
+def _slow_tax_app():  # noqa: ANN202
+    """App whose tax alpha report blocks its thread for _SLOW_REPORT_S."""
+    svc = MagicMock()
+
+    def slow_report(tax_year: int) -> dict:
+        time.sleep(_SLOW_REPORT_S)  # stands in for a heavy SQLAlchemy report
+        return {"tax_year": tax_year}
+
+    svc.tax_alpha_report.side_effect = slow_report
+    app = create_app()
+    app.state.db_unlocked = True
+    app.dependency_overrides[get_tax_service] = lambda: svc
+    return app
+
+
+class TestBlockingHandlersOffLoop:
+    @pytest.mark.asyncio
+    async def test_slow_tax_report_does_not_delay_health(self) -> None:
+        app = _slow_tax_app()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            report = asyncio.create_task(
+                client.get("/api/v1/tax/alpha", params={"tax_year": 2025})
+            )
+            await asyncio.sleep(0.05)  # the report is now running
+            health = await client.get("/api/v1/health")
+            report_done_first = report.done()
+
+            assert (await report).status_code == 200
+
+        assert health.status_code == 200
+        # Had the report blocked the loop, health could not answer before it.
+        # (Ordering, not wall time: a GC pause late in a full run can stall
+        # both requests alike.)
+        assert not report_done_first
+
+    @pytest.mark.asyncio
+    async def test_loop_keeps_ticking_during_slow_report(self) -> None:
+        app = _slow_tax_app()
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            resp = await client.get("/api/v1/tax/alpha", params={"tax_year": 2025})
+        await monitor.stop()
+
+        assert resp.status_code == 200
+        # A blocked loop would tick once or twice while the report sleeps.
+        # (Tick count, not max lag: a GC pause late in a full run can delay
+        # a single tick past any fixed bound.)
+        assert monitor.stats().samples >= 10
+
+
+class TestSharedSessionHandlersOnLoop:
+    @pytest.mark.asyncio
+    async def test_blocking_handler_runs_on_loop_thread(self) -> None:
+        app = _slow_tax_app()
+        app.state.uow = MagicMock(scoped=False)
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        svc = app.dependency_overrides[get_tax_service]()
+        svc.tax_alpha_report.side_effect = lambda tax_year: (
+            threads.append(threading.get_ident()) or {"tax_year": tax_year}
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            resp = await client.get("/api/v1/tax/alpha", params={"tax_year": 2025})
+
+        assert resp.status_code == 200
+        # The shared Session must not be used from a worker thread.
+        assert threads == [loop_thread]
+
+    @pytest.mark.asyncio
+    async def test_scoped_mode_still_offloads(self) -> None:
+        app = _slow_tax_app()
+        app.state.uow = MagicMock(scoped=True)
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        svc = app.dependency_overrides[get_tax_service]()
+        svc.tax_alpha_report.side_effect = lambda tax_year: (
+            threads.append(threading.get_ident()) or {"tax_year": tax_year}
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            resp = await client.get("/api/v1/tax/alpha", params={"tax_year": 2025})
+
+        assert resp.status_code == 200
+        assert threads and threads[0] != loop_thread
+
+
+class TestLoopLagMonitor:
+    @pytest.mark.asyncio
+    async def test_records_lag_while_loop_is_blocked(self) -> None:
+        monitor = LoopLagMonitor(interval=0.01, warn_ms=100)
+        monitor.start()
+        await asyncio.sleep(0.03)
+        time.sleep(0.2)  # block the loop
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        stats = monitor.stats()
+        assert stats.max_ms >= 150
+        assert stats.slow_ticks == 1
+        assert stats.p99_ms == stats.max_ms
+
+    def test_stats_empty_before_first_sample(self) -> None:
+        stats = LoopLagMonitor().stats()
+
+        assert stats.samples == 0
+        assert stats.max_ms == 0.0
+
+    def test_window_is_bounded_but_max_is_lifetime(self) -> None:
+        monitor = LoopLagMonitor(window=3)
+        for lag in (500.0, 1.0, 2.0, 3.0):
+            monitor.record(lag)
+
+        stats = monitor.stats()
+        assert stats.samples == 3
+        assert stats.last_ms == 3.0
+        assert stats.mean_ms == 2.0
+        assert stats.max_ms == 500.0
+        assert stats.slow_ticks == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_without_start_is_noop(self) -> None:
+        await LoopLagMonitor().stop()
+
+
+class TestThreadPoolSizing:
+    def test_default_matches_db_connections(self) -> None:
+        assert default_thread_pool_size(scoped=True, readers=4) == 5
+
+    def test_shared_session_mode_is_serialized(self) -> None:
+        assert default_thread_pool_size(scoped=False, readers=4) == 1
+
+    def test_env_override(self, monkeypatch) -> None:
+        monkeypatch.setenv("ZORIVEST_THREAD_POOL_SIZE", "12")
+
+        assert thread_pool_size_from_env(scoped=True) == 12
+
+    @pytest.mark.asyncio
+    async def test_configure_bounds_default_limiter(self) -> None:
+        configure_thread_pool(3)
+
+        stats = thread_pool_stats()
+        assert stats.size == 3
+        assert stats.busy == 0
+        assert anyio.to_thread.current_default_thread_limiter().total_tokens == 3
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_pool(self) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            configure_thread_pool(0)
@@ -328,3 +328,40 @@ class TestAppStateWiring:
                 assert resp.status_code == 200, (
                     f"{path} returned {resp.status_code}: {resp.text}"
                 )
+
+    def test_requests_use_scoped_sessions(self) -> None:
+        """Lifespan wires a scoped UoW; each request gets its own session."""
+        from zorivest_api.main import create_app
+
+        app = create_app()
+        with TestClient(app, raise_server_exceptions=False) as client:
+            app.state.db_unlocked = True
+            uow = app.state.uow
+            assert uow.scoped is True
+
+            seen: list[object] = []
+            original = app.state.account_service.list_accounts
+
+            def spy(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+                seen.append(uow._session)
+                return original(*args, **kwargs)
+
+            app.state.account_service.list_accounts = spy
+            for _ in range(2):
+                assert client.get("/api/v1/accounts").status_code == 200
+
+            assert len(seen) == 2
+            assert all(s is not None for s in seen)
+            assert seen[0] is not seen[1]
+            assert uow._session is None  # no scope left open after requests
+
+    def test_shared_session_mode_opt_out(self, monkeypatch) -> None:
+        """ZORIVEST_DB_SESSION_SCOPE=shared keeps the legacy shared session."""
+        from zorivest_api.main import create_app
+
+        monkeypatch.setenv("ZORIVEST_DB_SESSION_SCOPE", "shared")
+        app = create_app()
+        with TestClient(app, raise_server_exceptions=False) as client:
+            app.state.db_unlocked = True
+            assert app.state.uow.scoped is False
+            assert client.get("/api/v1/accounts").status_code == 200
@@ -438,6 +438,30 @@ class TestLiveWiring:
             assert "running" in data
             assert "job_count" in data
 
+    def test_fetch_cache_stats_and_sweeper_job(self, monkeypatch, tmp_path) -> None:
+        """Cache stats resolve from app state; the sweeper job is scheduled."""
+        from zorivest_api.main import create_app
+        from zorivest_api.dependencies import require_unlocked_db
+
+        db_file = tmp_path / "test_cache_stats.db"
+        monkeypatch.setenv("ZORIVEST_DB_URL", f"sqlite:///{db_file}")
+
+        app = create_app()
+        app.state.db_unlocked = True
+        app.dependency_overrides[require_unlocked_db] = lambda: None
+
+        with TestClient(app) as tc:
+            resp = tc.get("/api/v1/scheduling/cache/stats")
+            assert resp.status_code == 200
+            data = resp.json()
+            assert data["entries"] == 0
+            assert data["stored_bytes"] == 0
+            assert data["last_sweep"] is None
+            assert data["memory"]["tiers"]["memory"]["hits"] == 0
+
+            jobs = tc.get("/api/v1/scheduling/scheduler/status").json()["jobs"]
+            assert "maintenance_fetch_cache_sweep" in {j["id"] for j in jobs}
+
     @pytest.mark.asyncio()
     async def test_live_manual_run_route(self, monkeypatch, tmp_path) -> None:
         """V1: Prove POST /policies/{id}/run works through default app-state.
@@ -232,6 +232,26 @@ class TestServiceStatus:
         assert "detail" in data
 
 
+class TestServiceRuntime:
+    def test_runtime_reports_loop_lag_and_thread_pool(self, authed_client) -> None:
+        """GET /service/runtime exposes the lifespan's loop-lag monitor."""
+        client, token = authed_client
+        resp = client.get(
+            "/api/v1/service/runtime",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["event_loop"]["max_ms"] >= 0
+        assert data["event_loop"]["slow_ticks"] >= 0
+        assert data["thread_pool"]["size"] >= 1
+        assert data["thread_pool"]["busy"] == 0
+
+    def test_runtime_requires_auth(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/service/runtime")
+        assert resp.status_code == 403
+
+
 # ── AC-10: POST /api/v1/service/graceful-shutdown ────────────────────
 
 
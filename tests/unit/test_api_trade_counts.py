@@ -19,6 +19,7 @@ def client():
     account_svc = MagicMock()
     # Default mock: get_latest_balance returns None (enrichment helper)
     account_svc.get_latest_balance.return_value = None
+    account_svc.get_latest_balances.return_value = {}
     # Default mock: get_account_metrics returns empty (GET /{id} enrichment)
     account_svc.get_account_metrics.return_value = {
         "trade_count": 0,
@@ -108,6 +108,110 @@ class TestCreateTrade:
         trade_svc.create_trade.assert_called_once()
 
 
+class TestCreateTradesBulk:
+    def _payload(self, exec_id: str, **overrides) -> dict:
+        row = {
+            "exec_id": exec_id,
+            "time": "2025-01-15T10:30:00",
+            "instrument": "AAPL",
+            "action": "BOT",
+            "quantity": 100.0,
+            "price": 150.50,
+            "account_id": "ACC001",
+        }
+        row.update(overrides)
+        return row
+
+    def test_bulk_reports_per_row_status(self, client) -> None:
+        """Invalid rows become errors; service rows map back to input indexes."""
+        from zorivest_core.application.dtos import BulkTradeResult, BulkTradeRowResult
+        from zorivest_core.domain.enums import BulkRowStatus
+
+        http, trade_svc, _ = client
+        trade_svc.create_trades_bulk.return_value = BulkTradeResult(
+            rows=[
+                BulkTradeRowResult(0, "E1", BulkRowStatus.ACCEPTED),
+                BulkTradeRowResult(1, "E3", BulkRowStatus.DUPLICATE, "exists"),
+            ]
+        )
+
+        resp = http.post(
+            "/api/v1/trades/bulk",
+            json={
+                "trades": [
+                    self._payload("E1"),
+                    self._payload("E2", quantity=-5),
+                    self._payload("E3"),
+                ]
+            },
+        )
+
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert (data["accepted"], data["duplicates"], data["errors"]) == (1, 1, 1)
+        assert [(r["index"], r["exec_id"], r["status"]) for r in data["results"]] == [
+            (0, "E1", "accepted"),
+            (1, "E2", "error"),
+            (2, "E3", "duplicate"),
+        ]
+        assert "quantity" in data["results"][1]["reason"]
+        (commands,) = trade_svc.create_trades_bulk.call_args.args
+        assert [c.exec_id for c in commands] == ["E1", "E3"]
+
+    def test_bulk_rejects_empty_batch(self, client) -> None:
+        http, _, _ = client
+        resp = http.post("/api/v1/trades/bulk", json={"trades": []})
+        assert resp.status_code == 422
+
+
+class TestListTradesCursor:
+    def test_cursor_uses_keyset_page(self, client) -> None:
+        from zorivest_core.application.pagination import CursorPage
+
+        http, trade_svc, _ = client
+        trade_svc.list_trades_page.return_value = CursorPage(
+            items=[_sample_trade()], next_cursor="next-token"
+        )
+
+        resp = http.get(
+            "/api/v1/trades", params={"cursor": "tok", "include_total": "false"}
+        )
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["next_cursor"] == "next-token"
+        assert data["total"] is None
+        trade_svc.list_trades_page.assert_called_once()
+        assert trade_svc.list_trades_page.call_args.kwargs["include_total"] is False
+        trade_svc.count_trades.assert_not_called()
+
+    def test_full_offset_page_returns_cursor(self, client) -> None:
+        from zorivest_core.application.pagination import decode_cursor, scoped_kind
+
+        http, trade_svc, _ = client
+        trade_svc.list_trades.return_value = [_sample_trade()]
+        trade_svc.count_trades.return_value = 10
+
+        resp = http.get("/api/v1/trades", params={"limit": 1})
+
+        token = resp.json()["next_cursor"]
+        kind = scoped_kind("trades:-time", None, None)
+        assert decode_cursor(kind, token) == (
+            datetime(2025, 1, 15, 10, 30),
+            "E001",
+        )
+
+    def test_invalid_cursor_returns_422(self, client) -> None:
+        from zorivest_core.application.pagination import InvalidCursorError
+
+        http, trade_svc, _ = client
+        trade_svc.list_trades_page.side_effect = InvalidCursorError("bad")
+
+        resp = http.get("/api/v1/trades", params={"cursor": "garbage"})
+
+        assert resp.status_code == 422
+
+
 class TestListTrades:
     def test_list_trades_default(self, client) -> None:
         """AC-2: GET /trades returns paginated list."""
@@ -626,7 +626,7 @@ class TestModuleImports:
         assert mod.ImageAttachmentDTO is ImageAttachmentDTO
 
     def test_dtos_module_no_unexpected_exports(self) -> None:
-        """AC-20: dtos module has exactly 4 DTO classes."""
+        """AC-20: dtos module has exactly the 4 DTO classes + bulk/aggregate results."""
         import zorivest_core.application.dtos as mod
 
         public = {n for n in dir(mod) if not n.startswith("_")}
@@ -635,7 +635,12 @@ class TestModuleImports:
             "AccountDTO",
             "BalanceSnapshotDTO",
             "ImageAttachmentDTO",
+            "AccountTradeStats",
+            "BulkTradeRowResult",
+            "BulkTradeResult",
+            "BulkRowStatus",
             "dataclass",
+            "field",
             "datetime",
             "Decimal",
             "AccountType",
@@ -15,6 +15,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from zorivest_infra.adapters.db_write_adapter import DbWriteAdapter
+from zorivest_infra.repositories.write_dispositions import DEFAULT_CHUNK_SIZE
 
 
 def _make_adapter(session: Any | None = None) -> DbWriteAdapter:
@@ -40,13 +41,14 @@ class TestDbWriteAdapterDispatch:
             {"ticker": "MSFT", "close": 330.0},
         ]
 
-        result = adapter.write(df=df_mock, table="market_ohlcv", disposition="append")
+        result = adapter.write(df=df_mock, table="market_quotes", disposition="append")
 
         assert result == 3
         mock_append.assert_called_once_with(
             session=session,
-            table_name="market_ohlcv",
+            table_name="market_quotes",
             records=df_mock.to_dict.return_value,
+            chunk_size=DEFAULT_CHUNK_SIZE,
         )
 
     @patch("zorivest_infra.adapters.db_write_adapter.write_replace")
@@ -59,13 +61,14 @@ class TestDbWriteAdapterDispatch:
         df_mock = MagicMock()
         df_mock.to_dict.return_value = [{"ticker": "AAPL", "close": 150.0}]
 
-        result = adapter.write(df=df_mock, table="market_ohlcv", disposition="replace")
+        result = adapter.write(df=df_mock, table="market_quotes", disposition="replace")
 
         assert result == 2
         mock_replace.assert_called_once_with(
             session=session,
-            table_name="market_ohlcv",
+            table_name="market_quotes",
             records=df_mock.to_dict.return_value,
+            chunk_size=DEFAULT_CHUNK_SIZE,
         )
 
     @patch("zorivest_infra.adapters.db_write_adapter.write_merge")
@@ -80,7 +83,7 @@ class TestDbWriteAdapterDispatch:
 
         result = adapter.write(
             df=df_mock,
-            table="market_ohlcv",
+            table="market_quotes",
             disposition="merge",
             key_columns=["ticker"],
         )
@@ -88,9 +91,10 @@ class TestDbWriteAdapterDispatch:
         assert result == 5
         mock_merge.assert_called_once_with(
             session=session,
-            table_name="market_ohlcv",
+            table_name="market_quotes",
             records=df_mock.to_dict.return_value,
             key_columns=["ticker"],
+            chunk_size=DEFAULT_CHUNK_SIZE,
         )
 
 
@@ -115,6 +119,11 @@ class TestDbWriteAdapterNegative:
         with pytest.raises(ValueError, match="key_columns required"):
             adapter.write(df=df_mock, table="market_ohlcv", disposition="merge")
 
+    def test_chunk_size_must_be_positive(self) -> None:
+        """chunk_size < 1 is rejected at construction."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            DbWriteAdapter(session=MagicMock(), chunk_size=0)
+
 
 class TestDbWriteAdapterInterface:
     """Verify adapter matches TransformStep._write_data() call interface."""
@@ -296,3 +305,157 @@ class TestSanitizeRecords:
         rec = sanitized[0]
         assert isinstance(rec["timestamp"], datetime)
         assert isinstance(rec["ticker"], str)
+
+
+# ---------------------------------------------------------------------------
+# Bulk write paths against real SQLite (executemany + UPSERT)
+# ---------------------------------------------------------------------------
+
+
+class _Records:
+    """Minimal DataFrame stand-in exposing to_dict(orient="records")."""
+
+    def __init__(self, records: list[dict[str, Any]]) -> None:
+        self._records = records
+
+    def to_dict(self, orient: str = "records") -> list[dict[str, Any]]:
+        return self._records
+
+
+def _bars(closes: list[float], ticker: str = "AAPL") -> list[dict[str, Any]]:
+    return [
+        {
+            "ticker": ticker,
+            "timestamp": datetime(2026, 1, 1 + i),
+            "open": c,
+            "high": c,
+            "low": c,
+            "close": c,
+            "volume": 100,
+            "provider": "Yahoo Finance",
+        }
+        for i, c in enumerate(closes)
+    ]
+
+
+@pytest.fixture()
+def ohlcv_session():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from zorivest_infra.database.models import Base
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+class TestBulkWrites:
+    """Chunked executemany writes and ON CONFLICT upserts."""
+
+    def test_append_reports_inserted(self, ohlcv_session) -> None:
+        adapter = DbWriteAdapter(session=ohlcv_session, chunk_size=2)
+
+        result = adapter.write(
+            df=_Records(_bars([1.0, 2.0, 3.0, 4.0, 5.0])),
+            table="market_ohlcv",
+            disposition="append",
+        )
+
+        assert (result.inserted, result.updated, result.total) == (5, 0, 5)
+
+    def test_append_chunks_into_executemany_batches(self) -> None:
+        """Each chunk is one execute() call carrying a list of parameter sets."""
+        session = MagicMock()
+        adapter = DbWriteAdapter(session=session, chunk_size=2)
+
+        adapter.write(
+            df=_Records(_bars([1.0, 2.0, 3.0, 4.0, 5.0])),
+            table="market_ohlcv",
+            disposition="append",
+        )
+
+        batches = [call.args[1] for call in session.execute.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_merge_upserts_in_place(self, ohlcv_session) -> None:
+        """Existing keys are updated without changing their id."""
+        from sqlalchemy import text
+
+        adapter = DbWriteAdapter(session=ohlcv_session, chunk_size=2)
+        keys = ["ticker", "timestamp", "provider"]
+        adapter.write(
+            df=_Records(_bars([1.0, 2.0, 3.0])),
+            table="market_ohlcv",
+            disposition="merge",
+            key_columns=keys,
+        )
+        ids_before = (
+            ohlcv_session.execute(
+                text("SELECT id FROM market_ohlcv ORDER BY timestamp")
+            )
+            .scalars()
+            .all()
+        )
+
+        result = adapter.write(
+            df=_Records(_bars([10.0, 20.0, 30.0, 40.0])),
+            table="market_ohlcv",
+            disposition="merge",
+            key_columns=keys,
+        )
+
+        assert (result.inserted, result.updated) == (1, 3)
+        rows = ohlcv_session.execute(
+            text("SELECT id, close FROM market_ohlcv ORDER BY timestamp")
+        ).all()
+        assert [r.id for r in rows[:3]] == ids_before
+        assert [float(r.close) for r in rows] == [10.0, 20.0, 30.0, 40.0]
+
+    def test_merge_rejects_keys_without_unique_constraint(self, ohlcv_session) -> None:
+        adapter = DbWriteAdapter(session=ohlcv_session)
+
+        with pytest.raises(ValueError, match="unique constraint"):
+            adapter.write(
+                df=_Records(_bars([1.0])),
+                table="market_ohlcv",
+                disposition="merge",
+                key_columns=["ticker"],
+            )
+
+    def test_merge_rejects_disallowed_columns(self, ohlcv_session) -> None:
+        adapter = DbWriteAdapter(session=ohlcv_session)
+        records = _bars([1.0])
+        records[0]["id"] = 99
+
+        with pytest.raises(ValueError, match="Columns not allowed"):
+            adapter.write(
+                df=_Records(records),
+                table="market_ohlcv",
+                disposition="merge",
+                key_columns=["ticker", "timestamp", "provider"],
+            )
+
+    def test_ohlcv_rows_are_stamped_with_write_time(self, ohlcv_session) -> None:
+        """Pipeline bars carry fetched_at so partial same-day bars stay stale."""
+        from sqlalchemy import text
+
+        written = datetime(2026, 1, 2, 18, 0, tzinfo=timezone.utc)
+        adapter = DbWriteAdapter(session=ohlcv_session, clock=lambda: written)
+        records = _bars([1.0, 2.0])
+        records[1]["fetched_at"] = datetime(2026, 1, 5)
+
+        adapter.write(df=_Records(records), table="market_ohlcv", disposition="append")
+
+        stamps = (
+            ohlcv_session.execute(
+                text("SELECT fetched_at FROM market_ohlcv ORDER BY timestamp")
+            )
+            .scalars()
+            .all()
+        )
+        assert [datetime.fromisoformat(s) for s in stamps] == [
+            datetime(2026, 1, 2, 18, 0),
+            datetime(2026, 1, 5),
+        ]
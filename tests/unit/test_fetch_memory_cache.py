@@ -0,0 +1,168 @@
+"""Tests for FetchMemoryCache (freshness, byte-bounded LRU, invalidation)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from zorivest_core.domain.pipeline import MARKET_CLOSED_TTL_MULTIPLIER
+from zorivest_core.services.fetch_memory_cache import (
+    PARSED_SIZE_FACTOR,
+    CachedFetch,
+    FetchMemoryCache,
+)
+
+_MARKET_CLOSED = "zorivest_core.services.fetch_memory_cache.is_market_closed"
+_T0 = datetime(2026, 3, 16, 15, 0, tzinfo=timezone.utc)
+
+
+class FakeNow:
+    def __init__(self) -> None:
+        self.now = _T0
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _market_open():
+    with patch(_MARKET_CLOSED, return_value=False):
+        yield
+
+
+def _entry(
+    key: str = "k1",
+    payload: str = '{"a": 1}',
+    *,
+    provider: str = "yahoo",
+    data_type: str = "ohlcv",
+    ttl: int = 3600,
+    fetched_at: datetime = _T0,
+) -> CachedFetch:
+    return CachedFetch(
+        provider=provider,
+        data_type=data_type,
+        entity_key=key,
+        payload_json=payload,
+        content_hash=f"h-{key}",
+        fetched_at=fetched_at,
+        ttl_seconds=ttl,
+    )
+
+
+class TestCachedFetch:
+    def test_records_parsed_once(self) -> None:
+        entry = _entry(payload='[{"close": 1.5}]')
+        assert entry.records == [{"close": 1.5}]
+        assert entry.records is entry.records
+
+    def test_non_json_payload_kept_as_text(self) -> None:
+        assert _entry(payload="a,b\n1,2").records == "a,b\n1,2"
+
+    def test_naive_fetched_at_is_utc(self) -> None:
+        entry = _entry(fetched_at=_T0.replace(tzinfo=None))
+        assert entry.fetched_at == _T0
+
+
+class TestFreshness:
+    def test_expired_entry_is_dropped(self) -> None:
+        now = FakeNow()
+        cache = FetchMemoryCache(now=now)
+        assert cache.put(_entry(ttl=60))
+
+        now.now += timedelta(seconds=60)
+        assert cache.get("yahoo", "ohlcv", "k1") is not None
+        now.now += timedelta(seconds=1)
+        assert cache.get("yahoo", "ohlcv", "k1") is None
+        assert cache.stats().entries == 0
+        assert cache.stats().bytes == 0
+
+    def test_stale_entry_not_stored(self) -> None:
+        cache = FetchMemoryCache(now=lambda: _T0 + timedelta(hours=2))
+        assert not cache.put(_entry(ttl=3600))
+        assert cache.stats().entries == 0
+
+    def test_market_closed_extends_market_data_only(self) -> None:
+        age = timedelta(seconds=120 * MARKET_CLOSED_TTL_MULTIPLIER - 1)
+        cache = FetchMemoryCache(now=lambda: _T0 + age)
+        with patch(_MARKET_CLOSED, return_value=True):
+            assert cache.put(_entry("q", data_type="quote", ttl=120))
+            assert not cache.put(_entry("n", data_type="news", ttl=120))
+
+
+class TestByteBound:
+    def test_evicts_least_recently_used(self) -> None:
+        payload = "x" * 100
+        size = len(payload) * (1 + PARSED_SIZE_FACTOR)
+        cache = FetchMemoryCache(max_bytes=2 * size, now=FakeNow())
+        cache.put(_entry("a", payload))
+        cache.put(_entry("b", payload))
+        assert cache.get("yahoo", "ohlcv", "a") is not None  # b is now oldest
+
+        cache.put(_entry("c", payload))
+
+        assert cache.get("yahoo", "ohlcv", "b") is None
+        assert cache.get("yahoo", "ohlcv", "a") is not None
+        stats = cache.stats()
+        assert (stats.entries, stats.bytes, stats.evictions) == (2, 2 * size, 1)
+
+    def test_oversized_entry_not_stored(self) -> None:
+        cache = FetchMemoryCache(max_bytes=100, now=FakeNow())
+        assert not cache.put(_entry(payload="x" * 100))
+        assert cache.stats().bytes == 0
+
+    def test_replacing_entry_recharges_size(self) -> None:
+        cache = FetchMemoryCache(now=FakeNow())
+        cache.put(_entry(payload="x" * 10))
+        cache.put(_entry(payload="x" * 20))
+        assert cache.stats().bytes == 20 * (1 + PARSED_SIZE_FACTOR)
+
+
+class TestInvalidate:
+    def test_by_provider_and_data_type(self) -> None:
+        cache = FetchMemoryCache(now=FakeNow())
+        cache.put(_entry("1", data_type="ohlcv"))
+        cache.put(_entry("2", data_type="quote"))
+        cache.put(_entry("3", provider="polygon"))
+
+        assert cache.invalidate("yahoo", "quote") == 1
+        assert cache.get("yahoo", "quote", "2") is None
+        assert cache.get("yahoo", "ohlcv", "1") is not None
+
+        assert cache.invalidate("yahoo") == 1
+        assert cache.stats().entries == 1
+        assert cache.get("polygon", "ohlcv", "3") is not None
+
+
+class TestHitTimes:
+    def test_hits_are_buffered_until_taken(self) -> None:
+        now = FakeNow()
+        cache = FetchMemoryCache(now=now)
+        cache.put(_entry("a"))
+        cache.put(_entry("b"))
+        cache.get("yahoo", "ohlcv", "a")
+        now.now += timedelta(seconds=5)
+        cache.get("yahoo", "ohlcv", "a")
+        cache.get("yahoo", "ohlcv", "missing")
+
+        assert cache.take_hits() == {("yahoo", "ohlcv", "a"): now.now}
+        assert cache.take_hits() == {}
+
+
+class TestStats:
+    def test_per_tier_hit_rates(self) -> None:
+        cache = FetchMemoryCache(now=FakeNow())
+        cache.get("yahoo", "ohlcv", "k1")  # memory miss, then …
+        cache.record_db_lookup(True)  # … found in the database
+        cache.put(_entry())
+        cache.get("yahoo", "ohlcv", "k1")
+        cache.get("yahoo", "ohlcv", "k1")
+        cache.get("yahoo", "ohlcv", "other")
+        cache.record_db_lookup(False)
+
+        assert cache.stats().as_dict() == {
+            "memory": {"hits": 2, "misses": 2, "hit_rate": 0.5},
+            "db": {"hits": 1, "misses": 1, "hit_rate": 0.5},
+        }
@@ -7,6 +7,7 @@ Acceptance criteria AC-F1..AC-F15 per implementation-plan §9.4.
 from __future__ import annotations
 
 import hashlib
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -317,6 +318,7 @@ async def test_AC_F11_fetch_step_cache_hit():
                 "data_type": "ohlcv",
                 "criteria": {},
                 "use_cache": True,
+                "include_content": True,
             },
             context=context,
         )
@@ -550,8 +552,80 @@ async def test_AC_F17_fetch_step_calls_provider_adapter():
     assert call_kwargs["provider"] == "ibkr"
     assert call_kwargs["data_type"] == "ohlcv"
     assert "criteria" in call_kwargs
-    assert result.output["content"] == '{"data": [1, 2, 3]}'
+    assert result.output["records"] == {"data": [1, 2, 3]}
     assert result.output["content_len"] > 0
+    # Raw body is opt-in (include_content); records are what steps consume
+    assert "content" not in result.output
+
+
+@pytest.mark.asyncio
+async def test_large_polygon_body_is_streamed_into_records(monkeypatch):
+    """Large bodies of the streamed shapes become their bars, never a tree."""
+    import json
+    from unittest.mock import AsyncMock
+
+    from zorivest_core.domain.pipeline import StepContext
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+    from zorivest_infra.market_data import response_extractors
+
+    bars = [{"o": 1.0, "c": 2.0, "t": 1_700_000_000_000 + i} for i in range(3)]
+    mock_adapter = AsyncMock()
+    mock_adapter.fetch.return_value = {
+        "content": json.dumps({"status": "OK", "results": bars}).encode(),
+        "cache_status": "miss",
+    }
+    monkeypatch.setattr(response_extractors, "STREAM_MIN_BYTES", 1)
+
+    def no_tree(*args, **kwargs):
+        raise AssertionError("body was parsed whole")
+
+    monkeypatch.setattr(json, "loads", no_tree)
+    result = await FetchStep().execute(
+        params={"provider": "Polygon.io", "data_type": "ohlcv", "use_cache": False},
+        context=StepContext(
+            run_id="run-1",
+            policy_id="pol-1",
+            outputs={"provider_adapter": mock_adapter},
+        ),
+    )
+
+    assert [r["t"] for r in result.output["records"]] == [1_700_000_000] * 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_step_passes_body_limits_to_adapter():
+    """The size cap and MIME allowlist reach the adapter, which streams the
+    body and aborts early instead of buffering it first."""
+    from zorivest_core.domain.pipeline import StepContext
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+
+    mock_adapter = AsyncMock()
+    mock_adapter.fetch.return_value = {
+        "content": b"[]",
+        "cache_status": "miss",
+        "etag": None,
+        "last_modified": None,
+    }
+    context = StepContext(
+        run_id="run-1",
+        policy_id="pol-1",
+        outputs={"provider_adapter": mock_adapter},
+    )
+
+    await FetchStep().execute(
+        params={
+            "provider": "ibkr",
+            "data_type": "quote",
+            "use_cache": False,
+            "max_body_bytes": 1024,
+            "allowed_mime_types": ["application/json"],
+        },
+        context=context,
+    )
+
+    call_kwargs = mock_adapter.fetch.call_args.kwargs
+    assert call_kwargs["max_body_bytes"] == 1024
+    assert call_kwargs["allowed_mime_types"] == ["application/json"]
 
 
 # ---------------------------------------------------------------------------
@@ -785,6 +859,101 @@ async def test_PW2_AC3_check_cache_returns_none_when_repo_missing():
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_memory_tier_hit_reuses_parsed_records():
+    """A memory-tier hit hands out its parsed records and reports tier stats."""
+    from zorivest_core.domain.pipeline import StepContext
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+    from zorivest_core.services.fetch_memory_cache import CachedFetch, FetchMemoryCache
+
+    memory = FetchMemoryCache()
+    entry = CachedFetch(
+        provider="yahoo",
+        data_type="news",
+        entity_key="k",
+        payload_json='[{"title": "t"}]',
+        content_hash="h1",
+        fetched_at=datetime.now(timezone.utc),
+        ttl_seconds=3600,
+    )
+    memory.put(entry)
+    memory.get("yahoo", "news", "k")
+    cache_repo = MagicMock()
+    cache_repo.memory = memory
+    cache_repo.get_cached.return_value = entry
+    context = StepContext(
+        run_id="run-1",
+        policy_id="pol-1",
+        outputs={"fetch_cache_repo": cache_repo},
+    )
+
+    result = await FetchStep().execute(
+        {"provider": "yahoo", "data_type": "news"}, context
+    )
+
+    assert result.output["cache_status"] == "hit"
+    assert result.output["records"] is entry.records
+    assert result.output["cache_tiers"]["memory"] == {
+        "hits": 1,
+        "misses": 0,
+        "hit_rate": 1.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_streamed_records_match_across_miss_and_cache_tiers(monkeypatch):
+    """A large body yields the same records fresh, from the DB and from memory."""
+    from zorivest_core.domain.pipeline import StepContext
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+    from zorivest_core.services.fetch_memory_cache import CachedFetch
+    from zorivest_infra.market_data import response_extractors
+
+    monkeypatch.setattr(response_extractors, "STREAM_MIN_BYTES", 1)
+    bars = [{"o": 1.0, "c": 2.0, "t": 1_700_000_000_000 + i} for i in range(3)]
+    body = json.dumps({"status": "OK", "results": bars})
+    params = {"provider": "Polygon.io", "data_type": "ohlcv"}
+
+    adapter = AsyncMock()
+    adapter.fetch.return_value = {"content": body.encode(), "cache_status": "miss"}
+    miss = await FetchStep().execute(
+        {**params, "use_cache": False},
+        StepContext(
+            run_id="run-1", policy_id="pol-1", outputs={"provider_adapter": adapter}
+        ),
+    )
+
+    entry = CachedFetch(
+        provider="Polygon.io",
+        data_type="ohlcv",
+        entity_key="k",
+        payload_json=body,
+        content_hash="h1",
+        fetched_at=datetime.now(timezone.utc),
+        ttl_seconds=3600,
+    )
+    db_row = MagicMock()
+    for name in ("payload_json", "content_hash", "fetched_at", "ttl_seconds"):
+        setattr(db_row, name, getattr(entry, name))
+    outputs = []
+    for hit in (db_row, entry):
+        cache_repo = MagicMock()
+        cache_repo.memory = None
+        cache_repo.get_cached.return_value = hit
+        result = await FetchStep().execute(
+            params,
+            StepContext(
+                run_id="run-1",
+                policy_id="pol-1",
+                outputs={"fetch_cache_repo": cache_repo},
+            ),
+        )
+        assert result.output["cache_status"] == "hit"
+        outputs.append(result.output["records"])
+
+    assert isinstance(miss.output["records"], list)
+    assert outputs == [miss.output["records"]] * 2
+
+
 # ---------------------------------------------------------------------------
 # AC-4 (PW2): Market-closed TTL extension (4× for ohlcv/quote)
 # ---------------------------------------------------------------------------
@@ -1024,3 +1193,177 @@ async def test_PW2_F2_entity_key_uses_resolved_criteria():
     # Verify the cache repo was called with the resolved key, not the raw key
     call_kwargs = mock_cache_repo.get_cached.call_args
     assert call_kwargs.kwargs["entity_key"] == resolved_key
+
+
+# ---------------------------------------------------------------------------
+# Gap-aware OHLCV: fetch only the windows market_ohlcv does not cover
+# ---------------------------------------------------------------------------
+
+
+def _gap_context(coverage: dict, adapter: AsyncMock) -> tuple:
+    from zorivest_core.domain.pipeline import StepContext
+
+    history_repo = MagicMock()
+    history_repo.ohlcv_coverage.return_value = coverage
+    cache_repo = MagicMock()
+    cache_repo.get_cached.return_value = None
+    context = StepContext(
+        run_id="run-1",
+        policy_id="pol-1",
+        outputs={
+            "provider_adapter": adapter,
+            "market_history_repo": history_repo,
+            "fetch_cache_repo": cache_repo,
+        },
+    )
+    return context, history_repo, cache_repo
+
+
+def _gap_adapter() -> AsyncMock:
+    adapter = AsyncMock()
+
+    async def fetch(**kwargs):
+        criteria = kwargs["criteria"]
+        rows = [
+            {"ticker": t, "from": criteria["date_range"]["start_date"]}
+            for t in criteria["tickers"]
+        ]
+        return {"content": json.dumps(rows).encode(), "cache_status": "miss"}
+
+    adapter.fetch.side_effect = fetch
+    return adapter
+
+
+def _gap_params(**overrides) -> dict:
+    params = {
+        "provider": "Yahoo Finance",
+        "data_type": "ohlcv",
+        "criteria": {
+            "tickers": ["AAPL", "MSFT"],
+            "date_range": {"start_date": "2026-03-02", "end_date": "2026-03-13"},
+        },
+    }
+    params.update(overrides)
+    return params
+
+
+@pytest.mark.asyncio
+async def test_gap_fill_requests_only_missing_windows():
+    """Tickers missing the same window share one request; covered days are skipped."""
+    from datetime import date
+
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+
+    adapter = _gap_adapter()
+    coverage = {
+        "AAPL": [(date(2026, 3, 2), date(2026, 3, 6))],
+        "MSFT": [(date(2026, 3, 2), date(2026, 3, 6))],
+    }
+    context, history_repo, cache_repo = _gap_context(coverage, adapter)
+
+    result = await FetchStep().execute(_gap_params(), context)
+
+    assert result.status.value == "success"
+    adapter.fetch.assert_called_once()
+    criteria = adapter.fetch.call_args.kwargs["criteria"]
+    assert criteria["tickers"] == ["AAPL", "MSFT"]
+    assert criteria["date_range"] == {
+        "start_date": "2026-03-09",
+        "end_date": "2026-03-13",
+    }
+    assert result.output["cache_status"] == "partial"
+    assert result.output["gap_windows"] == [["2026-03-09", "2026-03-13"]]
+    assert [r["ticker"] for r in result.output["records"]] == ["AAPL", "MSFT"]
+    assert history_repo.ohlcv_coverage.call_args.args[1] == "Yahoo Finance"
+    # Gap-only content must not be cached under the full request's key
+    cache_repo.upsert.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_gap_fill_covered_range_skips_provider():
+    """A fully stored range returns no records without calling the provider."""
+    from datetime import date
+
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+
+    adapter = _gap_adapter()
+    covered = [(date(2026, 2, 23), date(2026, 3, 20))]
+    context, _, _ = _gap_context({"AAPL": covered, "MSFT": covered}, adapter)
+
+    result = await FetchStep().execute(_gap_params(), context)
+
+    adapter.fetch.assert_not_called()
+    assert result.output["cache_status"] == "covered"
+    assert result.output["records"] == []
+    assert result.output["content_len"] == 2
+
+
+@pytest.mark.asyncio
+async def test_gap_fill_splits_windows_per_ticker():
+    """Different gaps per ticker become separate, window-capped requests."""
+    from datetime import date
+
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+
+    adapter = _gap_adapter()
+    coverage = {"AAPL": [(date(2026, 3, 2), date(2026, 3, 13))]}
+    context, _, _ = _gap_context(coverage, adapter)
+
+    result = await FetchStep().execute(_gap_params(window_days=7), context)
+
+    calls = [c.kwargs["criteria"] for c in adapter.fetch.call_args_list]
+    assert [(c["tickers"], c["date_range"]["start_date"]) for c in calls] == [
+        (["MSFT"], "2026-03-02"),
+        (["MSFT"], "2026-03-09"),
+    ]
+    assert result.output["gap_windows"] == [
+        ["2026-03-02", "2026-03-08"],
+        ["2026-03-09", "2026-03-13"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gap_fill_without_coverage_uses_normal_fetch():
+    """Nothing stored yet: the original request goes out and is cached."""
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+
+    adapter = _gap_adapter()
+    context, _, cache_repo = _gap_context({}, adapter)
+
+    result = await FetchStep().execute(_gap_params(), context)
+
+    adapter.fetch.assert_called_once()
+    assert adapter.fetch.call_args.kwargs["criteria"]["date_range"] == {
+        "start_date": "2026-03-02",
+        "end_date": "2026-03-13",
+    }
+    assert result.output["cache_status"] == "miss"
+    cache_repo.upsert.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"gap_fill": False},
+        {"data_type": "quote"},
+        {
+            "criteria": {
+                "tickers": ["AAPL"],
+                "interval": "5m",
+                "date_range": {"start_date": "2026-03-02", "end_date": "2026-03-13"},
+            }
+        },
+    ],
+)
+async def test_gap_fill_not_applicable(overrides):
+    """Disabled, non-OHLCV and intraday requests never consult coverage."""
+    from zorivest_core.pipeline_steps.fetch_step import FetchStep
+
+    adapter = _gap_adapter()
+    context, history_repo, _ = _gap_context({}, adapter)
+
+    await FetchStep().execute(_gap_params(**overrides), context)
+
+    history_repo.ohlcv_coverage.assert_not_called()
+    adapter.fetch.assert_called_once()
@@ -12,6 +12,7 @@ import pytest
 from zorivest_infra.market_data.field_mappings import (
     FIELD_MAPPINGS,
     apply_field_mapping,
+    apply_field_mapping_columns,
 )
 
 
@@ -832,3 +833,39 @@ class TestTradingViewMappings:
         assert result["pe_ratio"] == 28.5
         assert result["dividend_yield"] == 0.5
         assert result["name"] == "Apple Inc"
+
+
+# ── Column-wise mapping ────────────────────────────────────────────────────
+
+
+class TestColumnMapping:
+    """apply_field_mapping_columns is the transpose of mapping each record."""
+
+    def test_matches_record_mapping(self) -> None:
+        columns = {
+            "t": [1, 2],
+            "o": [10.0, 11.0],
+            "c": [10.5, 11.5],
+            "otc": [False, True],
+        }
+        result = apply_field_mapping_columns(
+            columns=columns, provider="Polygon.io", data_type="ohlcv"
+        )
+        rows = [
+            apply_field_mapping(
+                record=dict(zip(columns, values)),
+                provider="Polygon.io",
+                data_type="ohlcv",
+            )
+            for values in zip(*columns.values())
+        ]
+        assert list(result) == list(rows[0])
+        assert [dict(zip(result, values)) for values in zip(*result.values())] == rows
+
+    def test_columns_are_renamed_not_copied(self) -> None:
+        opens = [1.0, 2.0]
+        result = apply_field_mapping_columns(
+            columns={"o": opens}, provider="polygon", data_type="ohlcv"
+        )
+        assert result["open"] is opens
+        assert result["_extra"] == [{}, {}]
@@ -14,9 +14,12 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
+from zorivest_core.services.sql_sandbox import SecurityError
 from zorivest_infra.market_data.http_cache import HttpFetchError, fetch_with_cache
+from zorivest_infra.market_data.service_factory import HttpxClient
 
 
 # ---------------------------------------------------------------------------
@@ -287,3 +290,131 @@ async def test_AC5_post_with_extra_headers():
     call_kwargs = mock_client.post.call_args.kwargs
     headers = call_kwargs.get("headers", {})
     assert headers.get("X-OPENFIGI-APIKEY") == "test-key-123"
+
+
+# ---------------------------------------------------------------------------
+# Streaming download: body cap and MIME allowlist enforced while reading
+# ---------------------------------------------------------------------------
+
+_CHUNK = 64 * 1024
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Response body of ``chunks`` 64 KiB chunks that counts what was read."""
+
+    def __init__(self, chunks: int) -> None:
+        self.chunks = chunks
+        self.read = 0
+
+    async def __aiter__(self):
+        for _ in range(self.chunks):
+            self.read += 1
+            yield b"x" * _CHUNK
+
+
+def _streaming_client(
+    body: _CountingStream, headers: dict[str, str] | None = None, status: int = 200
+) -> HttpxClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, headers=headers or {}, stream=body)
+
+    return HttpxClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+@pytest.mark.asyncio
+async def test_stream_returns_body_and_content_type():
+    body = _CountingStream(3)
+    client = _streaming_client(body, {"Content-Type": "application/json", "ETag": "v1"})
+
+    result = await fetch_with_cache(
+        client=client,
+        url="https://example.test/chart",
+        max_body_bytes=5 * 1024 * 1024,
+        allowed_mime_types=["application/json"],
+    )
+
+    assert result["content"] == b"x" * (3 * _CHUNK)
+    assert result["content_type"] == "application/json"
+    assert result["etag"] == "v1"
+    assert result["cache_status"] == "miss"
+
+
+@pytest.mark.asyncio
+async def test_stream_aborts_once_running_size_passes_cap():
+    """No Content-Length: reading stops at the first chunk over the cap."""
+    body = _CountingStream(10_000)  # 625 MiB if read to the end
+    client = _streaming_client(body, {"Content-Type": "application/json"})
+
+    with pytest.raises(SecurityError, match="1048576 byte limit"):
+        await fetch_with_cache(
+            client=client,
+            url="https://example.test/chart",
+            max_body_bytes=1024 * 1024,
+        )
+
+    assert body.read == 1024 * 1024 // _CHUNK + 1
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_declared_content_length_before_reading():
+    body = _CountingStream(100)
+    client = _streaming_client(
+        body,
+        {"Content-Type": "application/json", "Content-Length": str(100 * _CHUNK)},
+    )
+
+    with pytest.raises(SecurityError):
+        await fetch_with_cache(
+            client=client,
+            url="https://example.test/chart",
+            max_body_bytes=1024 * 1024,
+        )
+
+    assert body.read == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_disallowed_mime_type_before_reading():
+    body = _CountingStream(100)
+    client = _streaming_client(body, {"Content-Type": "text/html; charset=utf-8"})
+
+    with pytest.raises(SecurityError, match="text/html"):
+        await fetch_with_cache(
+            client=client,
+            url="https://example.test/chart",
+            allowed_mime_types=["application/json", "text/csv"],
+        )
+
+    assert body.read == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_error_reads_only_a_preview():
+    body = _CountingStream(100)
+    client = _streaming_client(body, {"Retry-After": "30"}, status=429)
+
+    with pytest.raises(HttpFetchError) as exc_info:
+        await fetch_with_cache(client=client, url="https://example.test/chart")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == "30"
+    assert len(exc_info.value.body_preview) == 200
+    assert body.read == 1
+
+
+@pytest.mark.asyncio
+async def test_buffered_client_still_enforces_cap():
+    """Clients without stream() are checked after the body is read."""
+    mock_client = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b"x" * 2048
+    mock_response.headers = {}
+    mock_client.get.return_value = mock_response
+
+    with pytest.raises(SecurityError):
+        await fetch_with_cache(
+            client=mock_client,
+            url="https://example.test/chart",
+            max_body_bytes=1024,
+        )
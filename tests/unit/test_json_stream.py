@@ -0,0 +1,144 @@
+# tests/unit/test_json_stream.py
+"""Tests for the incremental JSON reader used by the streaming extractors.
+
+Every document is fed in chunks of several sizes, down to one byte, so
+tokens, numbers and multi-byte characters are split at every position.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from zorivest_infra.market_data.json_stream import (
+    JsonStreamReader,
+    StreamingShapeError,
+    iter_chunks,
+)
+
+_CHUNK_SIZES = (1, 2, 3, 7, 64, 1 << 16)
+
+
+def _readers(raw: bytes | str):
+    for size in _CHUNK_SIZES:
+        yield JsonStreamReader(iter_chunks(raw, size))
+
+
+class TestNavigation:
+    def test_iter_object_and_skip_value_reach_nested_key(self) -> None:
+        raw = json.dumps(
+            {
+                "meta": {"a": [1, {"b": "}]"}], "c": None},
+                "skip": 'text with \\" quote',
+                "target": {"x": 1.5},
+            }
+        ).encode()
+        for reader in _readers(raw):
+            found = None
+            for key in reader.iter_object():
+                if key == "target":
+                    found = reader.read_value()
+                else:
+                    reader.skip_value()
+            assert found == {"x": 1.5}
+
+    def test_iter_array_yields_indexes(self) -> None:
+        for reader in _readers(b'[ "a" , {"k": []}, 3 ]'):
+            seen = []
+            for index in reader.iter_array():
+                seen.append((index, reader.read_value()))
+            assert seen == [(0, "a"), (1, {"k": []}), (2, 3)]
+
+    def test_empty_containers(self) -> None:
+        for reader in _readers(b'{"a": [], "b": {}}'):
+            keys = []
+            for key in reader.iter_object():
+                keys.append(key)
+                assert (
+                    list(reader.iter_array() if key == "a" else reader.iter_object())
+                    == []
+                )
+            assert keys == ["a", "b"]
+
+    def test_peek_type(self) -> None:
+        reader = JsonStreamReader([b'[{}, [], "s", 1]'])
+        kinds = []
+        for _ in reader.iter_array():
+            kinds.append(reader.peek_type())
+            reader.skip_value()
+        assert kinds == ["object", "array", "string", "scalar"]
+
+
+class TestReadValues:
+    @pytest.mark.parametrize(
+        "doc",
+        [
+            [],
+            [-1.25e-3, 12345678901234, 0, True, False, None],
+            [{"a": 1, "b": [2, 3]}, "é ü 漢", [[]], {"t": "]"}],
+        ],
+    )
+    def test_iter_values_matches_json_loads(self, doc: list) -> None:
+        for indent in (None, 2):
+            raw = json.dumps(doc, indent=indent, ensure_ascii=False).encode()
+            for reader in _readers(raw):
+                assert list(reader.iter_values()) == doc
+
+    def test_number_split_across_chunks_is_not_truncated(self) -> None:
+        reader = JsonStreamReader([b"[-1.", b"5e", b"2, 7", b"0]"])
+        assert list(reader.iter_values()) == [-150.0, 70]
+
+    def test_str_chunks_are_accepted(self) -> None:
+        reader = JsonStreamReader(iter_chunks('{"k": "v"}', 3))
+        assert reader.read_value() == {"k": "v"}
+
+
+class TestReadNumberArray:
+    def test_floats_ints_and_nulls(self) -> None:
+        raw = b"[1.5, null, -2, 3e2 ,4]"
+        for reader in _readers(raw):
+            values = reader.read_number_array()
+            assert values[0] == 1.5
+            assert math.isnan(values[1])
+            assert list(values[2:]) == [-2.0, 300.0, 4.0]
+
+    def test_integer_typecode(self) -> None:
+        raw = json.dumps(list(range(1_700_000_000, 1_700_000_500))).encode()
+        for reader in _readers(raw):
+            assert reader.read_number_array("q").tolist() == list(
+                range(1_700_000_000, 1_700_000_500)
+            )
+
+    def test_empty_array(self) -> None:
+        for reader in _readers(b"[ ]"):
+            assert len(reader.read_number_array()) == 0
+
+    @pytest.mark.parametrize("raw", [b'[1, "2"]', b"[1, [2]]", b"[1, {}]"])
+    def test_not_flat_numbers_raises(self, raw: bytes) -> None:
+        with pytest.raises(StreamingShapeError):
+            JsonStreamReader([raw]).read_number_array()
+
+    def test_fraction_in_integer_array_raises(self) -> None:
+        with pytest.raises(StreamingShapeError):
+            JsonStreamReader([b"[1, 2.5]"]).read_number_array("q")
+
+
+class TestMalformed:
+    @pytest.mark.parametrize(
+        "raw",
+        [b'{"a": 1', b'{"a" 1}', b"[1 2]", b'{"a": [1, 2}', b"[1, 2"],
+    )
+    def test_malformed_documents_raise_shape_error(self, raw: bytes) -> None:
+        for reader in _readers(raw):
+            with pytest.raises(StreamingShapeError):
+                reader.skip_value()
+
+    def test_unexpected_container_raises(self) -> None:
+        with pytest.raises(StreamingShapeError):
+            list(JsonStreamReader([b"{}"]).iter_array())
+
+    def test_empty_input_raises(self) -> None:
+        with pytest.raises(StreamingShapeError):
+            JsonStreamReader([]).peek_type()
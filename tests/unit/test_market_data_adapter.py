@@ -698,3 +698,48 @@ async def test_multi_ticker_empty_list_falls_through():
     # Should work via standard path (empty tickers → len 0, not > 1)
     assert isinstance(result, dict)
     assert mock_client.get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_multi_ticker_fetches_concurrently_in_ticker_order():
+    """Per-ticker requests overlap up to the limiter's cap; records keep ticker order.
+
+    Later tickers answer first, so a completion-ordered merge would reverse them.
+    """
+    import asyncio
+    import json
+
+    from zorivest_infra.market_data.market_data_adapter import (
+        MarketDataProviderAdapter,
+    )
+    from zorivest_infra.market_data.pipeline_rate_limiter import PipelineRateLimiter
+
+    tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META"]
+    in_flight = 0
+    peak = 0
+
+    async def _slow_get(url, *args, **kwargs):
+        nonlocal in_flight, peak
+        ticker = next(t for t in tickers if f"/{t}" in url)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (len(tickers) - tickers.index(ticker)))
+        in_flight -= 1
+        return _make_yahoo_quote_response(ticker, 100.0)
+
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=_slow_get)
+    adapter = MarketDataProviderAdapter(
+        http_client=mock_client,
+        rate_limiter=PipelineRateLimiter({}, max_concurrent=3),
+    )
+
+    result = await adapter.fetch(
+        provider="Yahoo Finance",
+        data_type="quote",
+        criteria={"tickers": tickers},
+    )
+
+    records = json.loads(result["content"])
+    assert [r.get("symbol") or r.get("ticker") for r in records] == tickers
+    assert peak == 3
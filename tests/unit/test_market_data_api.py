@@ -7,7 +7,7 @@ Tests 8 endpoints using TestClient with dependency overrides.
 from __future__ import annotations
 
 from collections.abc import Generator
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -24,6 +24,7 @@ from zorivest_core.application.market_dtos import (
     SecFiling,
     TickerSearchResult,
 )
+from zorivest_core.services.market_data_cache import MarketDataCache
 from zorivest_core.services.market_data_service import MarketDataError
 
 
@@ -138,6 +139,64 @@ class TestGetQuote:
 # ── News endpoint ───────────────────────────────────────────────────────
 
 
+class TestGetQuotes:
+    """Tests for POST /api/v1/market-data/quotes."""
+
+    def test_returns_quotes_and_missing(
+        self, client: TestClient, mock_market_data_service: AsyncMock
+    ) -> None:
+        mock_market_data_service.get_quotes.return_value = {
+            "AAPL": MarketQuote(ticker="AAPL", price=181.18, provider="Tradier")
+        }
+        resp = client.post(
+            "/api/v1/market-data/quotes", json={"tickers": ["AAPL", " ZZZZ ", "AAPL"]}
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [q["ticker"] for q in data["quotes"]] == ["AAPL"]
+        assert data["missing"] == ["ZZZZ"]
+        mock_market_data_service.get_quotes.assert_awaited_once_with(
+            ["AAPL", "ZZZZ", "AAPL"]
+        )
+
+    def test_empty_tickers_returns_422(self, client: TestClient) -> None:
+        resp = client.post("/api/v1/market-data/quotes", json={"tickers": []})
+        assert resp.status_code == 422
+
+    def test_locked_db_returns_403(self, locked_client: TestClient) -> None:
+        resp = locked_client.post(
+            "/api/v1/market-data/quotes", json={"tickers": ["AAPL"]}
+        )
+        assert resp.status_code == 403
+
+
+class TestCacheStats:
+    """Tests for GET /api/v1/market-data/cache."""
+
+    def test_returns_counters(
+        self, client: TestClient, mock_market_data_service: AsyncMock
+    ) -> None:
+        cache = MarketDataCache(max_entries=8)
+        cache.put("quote", "AAPL", object())
+        cache.get("quote", "AAPL")
+        cache.get("quote", "MSFT")
+        mock_market_data_service.cache_stats = MagicMock(return_value=cache.stats())
+
+        resp = client.get("/api/v1/market-data/cache")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert (data["size"], data["max_entries"]) == (1, 8)
+        assert (data["hits"], data["misses"]) == (1, 1)
+        assert data["by_type"]["quote"] == {"hits": 1, "misses": 1, "coalesced": 0}
+
+    def test_disabled_cache_returns_404(
+        self, client: TestClient, mock_market_data_service: AsyncMock
+    ) -> None:
+        mock_market_data_service.cache_stats = MagicMock(return_value=None)
+        resp = client.get("/api/v1/market-data/cache")
+        assert resp.status_code == 404
+
+
 class TestGetNews:
     """Tests for GET /api/v1/market-data/news."""
 
@@ -0,0 +1,146 @@
+"""Tests for MarketDataCache (TTL, single-flight, LRU bound, counters)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from zorivest_core.domain.pipeline import MARKET_CLOSED_TTL_MULTIPLIER
+from zorivest_core.services.market_data_cache import CACHE_TTL, MarketDataCache
+
+_MARKET_CLOSED = "zorivest_core.services.market_data_cache.is_market_closed"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _market_open():
+    with patch(_MARKET_CLOSED, return_value=False):
+        yield
+
+
+def _fetcher(value: object):
+    calls: list[int] = []
+
+    async def fetch() -> object:
+        calls.append(1)
+        await asyncio.sleep(0)
+        return value
+
+    return fetch, calls
+
+
+class TestTtl:
+    def test_entry_expires_after_data_type_ttl(self) -> None:
+        clock = FakeClock()
+        cache = MarketDataCache(clock=clock)
+        cache.put("quote", "AAPL", "q1")
+
+        clock.now += CACHE_TTL["quote"] - 1
+        assert cache.get("quote", "AAPL") == "q1"
+        clock.now += 1
+        assert cache.get("quote", "AAPL") is None
+        assert cache.stats().size == 0
+
+    def test_market_closed_extends_quote_ttl_only(self) -> None:
+        clock = FakeClock()
+        cache = MarketDataCache(clock=clock)
+        with patch(_MARKET_CLOSED, return_value=True):
+            cache.put("quote", "AAPL", "q")
+            cache.put("news", (None, 5), "n")
+
+        clock.now += CACHE_TTL["news"]
+        assert cache.get("news", (None, 5)) is None
+        clock.now = 1000.0 + CACHE_TTL["quote"] * MARKET_CLOSED_TTL_MULTIPLIER - 1
+        assert cache.get("quote", "AAPL") == "q"
+
+    def test_search_has_its_own_ttl(self) -> None:
+        assert CACHE_TTL["search"] == 3600
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_fetch(self) -> None:
+        cache = MarketDataCache()
+        fetch, calls = _fetcher("q")
+
+        async def run() -> list[object]:
+            return await asyncio.gather(
+                *(cache.get_or_fetch("quote", "AAPL", fetch) for _ in range(10))
+            )
+
+        assert asyncio.run(run()) == ["q"] * 10
+        assert len(calls) == 1
+        stats = cache.stats()
+        assert (stats.misses, stats.coalesced, stats.in_flight) == (1, 9, 0)
+
+    def test_errors_reach_every_waiter_and_are_not_cached(self) -> None:
+        cache = MarketDataCache()
+        calls = 0
+
+        async def failing() -> object:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError("provider down")
+
+        async def run() -> list[object]:
+            return await asyncio.gather(
+                *(cache.get_or_fetch("quote", "AAPL", failing) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == 1
+
+        fetch, _ = _fetcher("q")
+        assert asyncio.run(cache.get_or_fetch("quote", "AAPL", fetch)) == "q"
+
+    def test_cancelled_waiter_does_not_cancel_shared_fetch(self) -> None:
+        cache = MarketDataCache()
+        fetch, calls = _fetcher("q")
+
+        async def run() -> object:
+            first = asyncio.ensure_future(cache.get_or_fetch("quote", "AAPL", fetch))
+            second = asyncio.ensure_future(cache.get_or_fetch("quote", "AAPL", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "q"
+        assert len(calls) == 1
+        assert cache.get("quote", "AAPL") == "q"
+
+
+class TestLru:
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = MarketDataCache(max_entries=2)
+        cache.put("quote", "A", 1)
+        cache.put("quote", "B", 2)
+        cache.get("quote", "A")  # A is now most recent
+        cache.put("quote", "C", 3)
+
+        assert cache.get("quote", "B") is None
+        assert cache.get("quote", "A") == 1
+        assert cache.get("quote", "C") == 3
+        stats = cache.stats()
+        assert (stats.size, stats.evictions) == (2, 1)
+
+    def test_counters_are_kept_per_data_type(self) -> None:
+        cache = MarketDataCache()
+        cache.put("search", "apple", [])
+        cache.get("search", "apple")
+        cache.get("news", (None, 5))
+
+        stats = cache.stats()
+        assert stats.by_type["search"].hits == 1
+        assert stats.by_type["news"].misses == 1
+        assert (stats.hits, stats.misses) == (1, 1)
@@ -183,7 +183,7 @@ class TestMarketDataPort:
         from zorivest_core.application.ports import MarketDataPort
 
         assert issubclass(MarketDataPort, Protocol)
-        # Value: verify all 12 public methods (4 Phase 8 + 8 Phase 8a)
+        # Value: verify all 13 public methods (5 Phase 8 + 8 Phase 8a)
         public_methods = {
             name
             for name, _ in inspect.getmembers(
@@ -194,6 +194,7 @@ class TestMarketDataPort:
         assert public_methods == {
             # Phase 8 (original)
             "get_quote",
+            "get_quotes",
             "get_news",
             "search_ticker",
             "get_sec_filings",
@@ -18,6 +18,8 @@ from zorivest_core.application.market_dtos import (
     MarketNewsItem,
     MarketQuote,
 )
+from zorivest_core.services.market_data_cache import MarketDataCache
+from zorivest_core.services.provider_health import ProviderHealthTracker
 from zorivest_core.services.market_data_service import (
     MarketDataError,
     MarketDataService,
@@ -43,6 +45,9 @@ def _make_service(
     settings: list[Any] | None = None,
     http_responses: list[FakeHttpResponse] | None = None,
     http_side_effect: Exception | None = None,
+    batch_quote_normalizers: dict[str, Any] | None = None,
+    cache: MarketDataCache | None = None,
+    health: ProviderHealthTracker | None = None,
 ) -> MarketDataService:
     """Create a MarketDataService with mocked dependencies."""
     # Fake UoW with market_provider_settings
@@ -99,6 +104,17 @@ def _make_service(
             signup_url="https://finnhub.io/register",
             response_validator_key="c",
         ),
+        "Tradier": ProviderConfig(
+            name="Tradier",
+            base_url="https://api.tradier.com",
+            auth_method=AuthMethod.BEARER_HEADER,
+            auth_param_name="Authorization",
+            headers_template={"Authorization": "Bearer {api_key}"},
+            test_endpoint="/v1/markets/quotes?symbols=AAPL",
+            default_rate_limit=120,
+            signup_url="https://tradier.com",
+            response_validator_key="quotes",
+        ),
     }
 
     # Normalizer registries (simple pass-through for testing)
@@ -135,8 +151,11 @@ def _make_service(
         rate_limiters={"Alpha Vantage": fake_limiter, "Finnhub": fake_limiter},
         provider_registry=registry,
         quote_normalizers=quote_normalizers,
+        batch_quote_normalizers=batch_quote_normalizers,
         news_normalizers=news_normalizers,
         search_normalizers=search_normalizers,
+        cache=cache,
+        health=health,
     )
 
 
@@ -251,6 +270,298 @@ class TestGetQuote:
         assert result.provider == "Finnhub"
 
 
+_FINNHUB_OK = {"c": 181.18, "o": 178.55, "h": 182.01, "l": 177.99}
+
+
+@patch.object(
+    MarketDataService, "_yahoo_quote", side_effect=Exception("Yahoo disabled in test")
+)
+class TestProviderHealthRouting:
+    """Tests for MarketDataService with a ProviderHealthTracker."""
+
+    def test_rate_limited_provider_is_skipped_until_cooldown(
+        self, _mock_yahoo: MagicMock
+    ) -> None:
+        health = ProviderHealthTracker()
+        svc = _make_service(
+            settings=[_make_setting("Alpha Vantage"), _make_setting("Finnhub")],
+            http_responses=[
+                FakeHttpResponse(429, {}),
+                FakeHttpResponse(200, _FINNHUB_OK),
+                FakeHttpResponse(200, _FINNHUB_OK),
+            ],
+            health=health,
+        )
+
+        asyncio.run(svc.get_quote("AAPL"))
+        result = asyncio.run(svc.get_quote("MSFT"))
+
+        assert result.provider == "Finnhub"
+        assert svc._http.get.call_count == 3  # no second Alpha Vantage request
+        assert health.snapshot("Alpha Vantage").state == "open"
+        assert health.snapshot("Yahoo Finance").failures == 2
+
+    def test_faster_provider_is_tried_first(self, _mock_yahoo: MagicMock) -> None:
+        health = ProviderHealthTracker()
+        health.record_success("Alpha Vantage", 0.8)
+        health.record_success("Finnhub", 0.1)
+        svc = _make_service(
+            settings=[_make_setting("Alpha Vantage"), _make_setting("Finnhub")],
+            http_responses=[FakeHttpResponse(200, _FINNHUB_OK)],
+            health=health,
+        )
+
+        result = asyncio.run(svc.get_quote("AAPL"))
+
+        assert result.provider == "Finnhub"
+        assert svc._http.get.call_count == 1
+        assert health.snapshot("Finnhub").requests == 2
+
+
+class TestCircuitFailureClassification:
+    """Only 429s, 5xx and failed requests count against a provider."""
+
+    def _quote(self, alpha_vantage: FakeHttpResponse) -> ProviderHealthTracker:
+        health = ProviderHealthTracker(failure_threshold=1)
+        svc = _make_service(
+            settings=[_make_setting("Alpha Vantage"), _make_setting("Finnhub")],
+            http_responses=[alpha_vantage, FakeHttpResponse(200, _FINNHUB_OK)],
+            health=health,
+        )
+        with patch.object(MarketDataService, "_yahoo_quote", return_value=None):
+            result = asyncio.run(svc.get_quote("AAPL"))
+        assert result.provider == "Finnhub"
+        return health
+
+    def test_client_error_leaves_circuit_closed(self) -> None:
+        health = self._quote(FakeHttpResponse(404, {}))
+
+        snapshot = health.snapshot("Alpha Vantage")
+        assert snapshot.state == "closed"
+        assert snapshot.failures == 0
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_unavailable_status_opens_circuit(self, status: int) -> None:
+        health = self._quote(FakeHttpResponse(status, {}))
+
+        snapshot = health.snapshot("Alpha Vantage")
+        assert snapshot.state == "open"
+        assert snapshot.failures == 1
+
+    def test_yahoo_server_error_is_a_failure(self) -> None:
+        health = ProviderHealthTracker()
+        svc = _make_service(
+            settings=[_make_setting("Finnhub")],
+            http_responses=[
+                FakeHttpResponse(503, {}),
+                FakeHttpResponse(200, _FINNHUB_OK),
+            ],
+            health=health,
+        )
+
+        result = asyncio.run(svc.get_quote("AAPL"))
+
+        assert result.provider == "Finnhub"
+        assert health.snapshot("Yahoo Finance").failures == 1
+
+    def test_yahoo_unknown_symbol_is_not_a_failure(self) -> None:
+        health = ProviderHealthTracker()
+        svc = _make_service(
+            settings=[_make_setting("Finnhub")],
+            http_responses=[
+                FakeHttpResponse(404, {}),
+                FakeHttpResponse(200, _FINNHUB_OK),
+            ],
+            health=health,
+        )
+
+        result = asyncio.run(svc.get_quote("AAPL"))
+
+        assert result.provider == "Finnhub"
+        assert health.snapshot("Yahoo Finance").failures == 0
+
+
+class TestRateLimiterFeedback:
+    """Provider responses are reported to limiters that adapt to them."""
+
+    def test_429_and_retry_after_reach_the_limiter(self) -> None:
+        response = FakeHttpResponse(429, {})
+        response.headers = {"Retry-After": "7"}
+        svc = _make_service(
+            settings=[_make_setting("Alpha Vantage"), _make_setting("Finnhub")],
+            http_responses=[response, FakeHttpResponse(200, _FINNHUB_OK)],
+        )
+
+        with patch.object(MarketDataService, "_yahoo_quote", return_value=None):
+            asyncio.run(svc.get_quote("AAPL"))
+
+        limiter = svc._rate_limiters["Finnhub"]  # same fake for both providers
+        assert limiter.record_response.await_args_list == [
+            ((429, "7"),),
+            ((200, None),),
+        ]
+
+    def test_swallowed_error_status_is_not_reported_as_success(self) -> None:
+        svc = _make_service(
+            settings=[_make_setting("Finnhub")],
+            http_responses=[
+                FakeHttpResponse(404, {}),
+                FakeHttpResponse(200, _FINNHUB_OK),
+            ],
+        )
+        yahoo_limiter = AsyncMock()
+        svc._rate_limiters["Yahoo Finance"] = yahoo_limiter
+
+        quote = asyncio.run(svc.get_quote("AAPL"))
+
+        # Yahoo's 404 came back as None, so its limiter hears nothing.
+        assert quote.provider == "Finnhub"
+        yahoo_limiter.record_response.assert_not_awaited()
+
+
+# ── get_quotes tests ────────────────────────────────────────────────────
+
+
+def _tradier_batch(data: dict) -> list[MarketQuote]:
+    return [
+        MarketQuote(ticker=q["symbol"], price=q["last"], provider="Tradier")
+        for q in data["quotes"]["quote"]
+    ]
+
+
+def _yahoo(ticker: str) -> MarketQuote:
+    return MarketQuote(ticker=ticker, price=1.0, provider="Yahoo Finance")
+
+
+class TestGetQuotes:
+    """Tests for MarketDataService.get_quotes (batched quotes)."""
+
+    def test_batch_provider_first_then_single_fallback_for_misses(self) -> None:
+        response = FakeHttpResponse(
+            200,
+            {"quotes": {"quote": [{"symbol": "MSFT", "last": 410.0}]}},
+        )
+        svc = _make_service(
+            settings=[_make_setting("Tradier")],
+            http_responses=[response],
+            batch_quote_normalizers={"Tradier": _tradier_batch},
+        )
+
+        with patch.object(
+            MarketDataService, "_yahoo_quote", side_effect=_yahoo
+        ) as yahoo:
+            result = asyncio.run(svc.get_quotes(["AAPL", "msft", "AAPL"]))
+
+        assert list(result) == ["AAPL", "msft"]
+        assert result["msft"].provider == "Tradier"
+        assert result["AAPL"].provider == "Yahoo Finance"
+        # One batch request for both symbols; only the miss goes per symbol.
+        (url, *_), _ = svc._http.get.call_args
+        assert "symbols=AAPL%2Cmsft" in url
+        yahoo.assert_called_once_with("AAPL")
+
+    def test_symbols_are_chunked(self) -> None:
+        responses = [
+            FakeHttpResponse(200, {"quotes": {"quote": [{"symbol": t, "last": 1.0}]}})
+            for t in ("A", "C")
+        ]
+        svc = _make_service(
+            settings=[_make_setting("Tradier")],
+            http_responses=responses,
+            batch_quote_normalizers={"Tradier": _tradier_batch},
+        )
+
+        with (
+            patch("zorivest_core.services.market_data_service._QUOTE_BATCH_SIZE", 2),
+            patch.object(MarketDataService, "_yahoo_quote", side_effect=_yahoo),
+        ):
+            result = asyncio.run(svc.get_quotes(["A", "B", "C"]))
+
+        assert svc._http.get.call_count == 2
+        assert {t: q.provider for t, q in result.items()} == {
+            "A": "Tradier",
+            "B": "Yahoo Finance",
+            "C": "Tradier",
+        }
+
+    def test_unquotable_tickers_are_omitted(self) -> None:
+        svc = _make_service(
+            settings=[_make_setting("Tradier")],
+            http_side_effect=ConnectionError("down"),
+            batch_quote_normalizers={"Tradier": _tradier_batch},
+        )
+
+        with patch.object(
+            MarketDataService, "_yahoo_quote", side_effect=Exception("down")
+        ):
+            assert asyncio.run(svc.get_quotes(["AAPL"])) == {}
+
+
+class TestQuoteCache:
+    """Tests for MarketDataService with a MarketDataCache."""
+
+    def test_concurrent_quotes_share_one_fetch(self) -> None:
+        svc = _make_service(cache=MarketDataCache())
+        calls = 0
+
+        async def slow_yahoo(self: Any, ticker: str) -> MarketQuote:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _yahoo(ticker)
+
+        async def run() -> list[MarketQuote]:
+            return await asyncio.gather(*(svc.get_quote("aapl") for _ in range(5)))
+
+        with patch.object(MarketDataService, "_yahoo_quote", slow_yahoo):
+            quotes = asyncio.run(run())
+            asyncio.run(svc.get_quote("AAPL"))
+
+        assert calls == 1
+        assert len({id(q) for q in quotes}) == 1
+        stats = svc.cache_stats()
+        assert (stats.misses, stats.coalesced, stats.hits) == (1, 4, 1)
+
+    def test_get_quotes_serves_and_fills_cache(self) -> None:
+        response = FakeHttpResponse(
+            200, {"quotes": {"quote": [{"symbol": "MSFT", "last": 410.0}]}}
+        )
+        svc = _make_service(
+            settings=[_make_setting("Tradier")],
+            http_responses=[response],
+            batch_quote_normalizers={"Tradier": _tradier_batch},
+            cache=MarketDataCache(),
+        )
+
+        with patch.object(
+            MarketDataService, "_yahoo_quote", side_effect=_yahoo
+        ) as yahoo:
+            asyncio.run(svc.get_quote("AAPL"))
+            result = asyncio.run(svc.get_quotes(["AAPL", "MSFT"]))
+            again = asyncio.run(svc.get_quote("msft"))
+
+        assert result["MSFT"].provider == "Tradier"
+        assert again is result["MSFT"]
+        yahoo.assert_called_once_with("AAPL")
+        # Only MSFT went to the batch provider.
+        (url, *_), _ = svc._http.get.call_args
+        assert "symbols=MSFT" in url
+
+    def test_get_quotes_counts_each_miss_once(self) -> None:
+        svc = _make_service(cache=MarketDataCache())
+
+        with patch.object(MarketDataService, "_yahoo_quote", side_effect=_yahoo):
+            asyncio.run(svc.get_quotes(["AAPL", "MSFT"]))
+            again = asyncio.run(svc.get_quote("aapl"))
+
+        assert again.provider == "Yahoo Finance"
+        stats = svc.cache_stats()
+        assert (stats.misses, stats.hits) == (2, 1)
+
+    def test_no_cache_stats_without_cache(self) -> None:
+        assert _make_service().cache_stats() is None
+
+
 # ── get_news tests ──────────────────────────────────────────────────────
 
 
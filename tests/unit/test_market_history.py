@@ -0,0 +1,448 @@
+# tests/unit/test_market_history.py
+"""Tests for the read-through market history store.
+
+Covers the freshness/gap policy in zorivest_core.domain.market_history and
+MarketDataService's read-through paths (``read_through=True``) against an
+in-memory MarketHistoryRepository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from zorivest_core.application.market_expansion_dtos import (
+    DividendRecord,
+    FundamentalsSnapshot,
+    OHLCVBar,
+)
+from zorivest_core.domain.market_history import (
+    MAX_FETCH_WINDOWS,
+    bar_is_final,
+    coverage_gaps,
+    covered_ranges,
+    is_fresh,
+    missing_ohlcv_ranges,
+    split_windows,
+)
+from zorivest_core.services.market_data_service import (
+    MarketDataError,
+    MarketDataService,
+)
+
+# Wednesday, mid-session.
+_NOW = datetime(2026, 3, 18, 15, 0, tzinfo=timezone.utc)
+_TODAY = _NOW.date()
+
+
+def _final(*days: date) -> dict[date, datetime | None]:
+    return {
+        day: datetime.combine(day + timedelta(days=1), time(1), timezone.utc)
+        for day in days
+    }
+
+
+def _weekdays(start: date, end: date) -> list[date]:
+    return [
+        start + timedelta(days=i)
+        for i in range((end - start).days + 1)
+        if (start + timedelta(days=i)).weekday() < 5
+    ]
+
+
+# ── Freshness policy ────────────────────────────────────────────────────
+
+
+class TestFreshness:
+    def test_is_fresh_uses_per_type_ttl(self) -> None:
+        assert is_fresh("ohlcv", _NOW - timedelta(minutes=30), _NOW)
+        assert not is_fresh("ohlcv", _NOW - timedelta(hours=2), _NOW)
+        assert is_fresh("fundamentals", _NOW - timedelta(hours=2), _NOW)
+        assert not is_fresh("dividends", None, _NOW)
+
+    def test_backfilled_bar_is_final(self) -> None:
+        assert bar_is_final(date(2026, 3, 2), None, _NOW)
+
+    def test_unstamped_bar_in_settlement_window_is_not_final(self) -> None:
+        yesterday = _TODAY - timedelta(days=1)
+        assert not bar_is_final(_TODAY, None, _NOW)
+        assert not bar_is_final(yesterday, None, _NOW)
+        assert bar_is_final(yesterday - timedelta(days=1), None, _NOW)
+
+    def test_bar_fetched_during_its_session_is_not_final(self) -> None:
+        fetched = datetime(2026, 3, 2, 18, 0, tzinfo=timezone.utc)
+        assert not bar_is_final(date(2026, 3, 2), fetched, _NOW)
+        assert bar_is_final(date(2026, 3, 2), fetched + timedelta(hours=7), _NOW)
+
+
+class TestMissingRanges:
+    def test_empty_store_fetches_whole_range(self) -> None:
+        windows = missing_ohlcv_ranges(date(2026, 3, 2), date(2026, 3, 13), {}, _NOW)
+        assert windows == [(date(2026, 3, 2), date(2026, 3, 13))]
+
+    def test_covered_history_is_never_refetched(self) -> None:
+        stored = _final(*_weekdays(date(2026, 3, 2), date(2026, 3, 13)))
+        assert (
+            missing_ohlcv_ranges(date(2026, 2, 28), date(2026, 3, 15), stored, _NOW)
+            == []
+        )
+
+    def test_only_gaps_are_fetched(self) -> None:
+        days = _weekdays(date(2026, 3, 2), date(2026, 3, 13))
+        stored = _final(
+            *[d for d in days if not date(2026, 3, 4) <= d <= date(2026, 3, 6)]
+        )
+
+        windows = missing_ohlcv_ranges(
+            date(2026, 2, 25), date(2026, 3, 13), stored, _NOW
+        )
+
+        assert windows == [
+            (date(2026, 2, 25), date(2026, 2, 27)),
+            (date(2026, 3, 4), date(2026, 3, 6)),
+        ]
+
+    def test_single_missing_weekday_is_treated_as_holiday(self) -> None:
+        days = _weekdays(date(2026, 3, 2), date(2026, 3, 13))
+        stored = _final(*[d for d in days if d != date(2026, 3, 9)])  # a Monday
+
+        assert (
+            missing_ohlcv_ranges(date(2026, 3, 2), date(2026, 3, 13), stored, _NOW)
+            == []
+        )
+
+    def test_end_is_clamped_to_today(self) -> None:
+        windows = missing_ohlcv_ranges(date(2026, 3, 16), date(2026, 3, 31), {}, _NOW)
+        assert windows == [(date(2026, 3, 16), _TODAY)]
+
+    def test_live_bar_refetched_only_when_stale(self) -> None:
+        stored = _final(*_weekdays(date(2026, 3, 9), date(2026, 3, 17)))
+        start = date(2026, 3, 9)
+
+        stored[_TODAY] = _NOW - timedelta(minutes=10)
+        assert missing_ohlcv_ranges(start, _TODAY, stored, _NOW) == []
+
+        stored[_TODAY] = _NOW - timedelta(hours=2)
+        assert missing_ohlcv_ranges(start, _TODAY, stored, _NOW) == [(_TODAY, _TODAY)]
+
+    def test_partial_bar_refetched_after_its_session(self) -> None:
+        yesterday = _TODAY - timedelta(days=1)
+        stored = _final(*_weekdays(date(2026, 3, 9), date(2026, 3, 16)))
+        stored[yesterday] = datetime.combine(yesterday, time(18), timezone.utc)
+
+        assert missing_ohlcv_ranges(date(2026, 3, 9), yesterday, stored, _NOW) == [
+            (yesterday, yesterday)
+        ]
+
+    def test_many_gaps_collapse_into_one_window(self) -> None:
+        days = _weekdays(date(2026, 1, 5), date(2026, 3, 13))
+        # Every other week stored: five week-long gaps, more than the cap.
+        stored = _final(*[d for d in days if (d - days[0]).days // 7 % 2 == 0])
+        assert len(days) // 5 // 2 > MAX_FETCH_WINDOWS
+
+        windows = missing_ohlcv_ranges(days[0], days[-1], stored, _NOW)
+
+        assert windows == [(date(2026, 1, 12), date(2026, 3, 13))]
+
+
+# ── Service read-through ────────────────────────────────────────────────
+
+
+class TestCoverageIndex:
+    def test_covered_ranges_span_weekends_and_single_holidays(self) -> None:
+        # Mon 2 – Fri 6 Mar, Tue 10 – Fri 13 (Mon 9 missing), Mon 23 alone.
+        days = [*_weekdays(date(2026, 3, 2), date(2026, 3, 13)), date(2026, 3, 23)]
+        days.remove(date(2026, 3, 9))
+
+        assert covered_ranges(days) == [
+            (date(2026, 3, 2), date(2026, 3, 13)),
+            (date(2026, 3, 23), date(2026, 3, 23)),
+        ]
+
+    def test_gaps_are_the_uncovered_weekdays(self) -> None:
+        covered = [(date(2026, 3, 4), date(2026, 3, 6))]
+
+        assert coverage_gaps(date(2026, 3, 2), date(2026, 3, 13), covered) == [
+            (date(2026, 3, 2), date(2026, 3, 3)),
+            (date(2026, 3, 9), date(2026, 3, 13)),
+        ]
+
+    def test_lone_gap_is_holiday_only_before_newest_coverage(self) -> None:
+        covered = [
+            (date(2026, 3, 2), date(2026, 3, 6)),
+            (date(2026, 3, 10), date(2026, 3, 13)),
+        ]
+        start, end = date(2026, 3, 2), date(2026, 3, 16)
+
+        # Mon 9 sits between stored bars; Mon 16 may simply not be stored yet.
+        assert coverage_gaps(start, end, covered) == [
+            (date(2026, 3, 16), date(2026, 3, 16))
+        ]
+
+    def test_weekend_only_gap_is_dropped(self) -> None:
+        covered = [(date(2026, 3, 2), date(2026, 3, 6))]
+
+        assert coverage_gaps(date(2026, 3, 2), date(2026, 3, 8), covered) == []
+
+    def test_split_windows_caps_days_per_request(self) -> None:
+        gaps = [(date(2026, 1, 1), date(2026, 1, 25))]
+
+        assert split_windows(gaps, 10) == [
+            (date(2026, 1, 1), date(2026, 1, 10)),
+            (date(2026, 1, 11), date(2026, 1, 20)),
+            (date(2026, 1, 21), date(2026, 1, 25)),
+        ]
+
+
+class FakeHistoryStore:
+    """In-memory MarketHistoryRepository."""
+
+    def __init__(self) -> None:
+        self.bars: dict[datetime, tuple[OHLCVBar, datetime | None]] = {}
+        self.fundamentals: FundamentalsSnapshot | None = None
+        self.events: dict[str, list[Any]] = {"dividends": [], "splits": []}
+        self.fetched: dict[str, datetime | None] = {}
+
+    def list_ohlcv(self, ticker: str, start: datetime, end: datetime) -> list:
+        return [self.bars[ts] for ts in sorted(self.bars) if start <= ts < end]
+
+    def save_ohlcv(self, bars: list[OHLCVBar], fetched_at: datetime) -> None:
+        for bar in bars:
+            self.bars[bar.timestamp] = (bar, fetched_at)
+
+    def get_fundamentals(self, ticker: str) -> FundamentalsSnapshot | None:
+        return self.fundamentals
+
+    def save_fundamentals(self, snapshot: FundamentalsSnapshot, fetched_at) -> None:
+        self.fundamentals = snapshot
+
+    def list_dividends(self, ticker: str) -> list[Any]:
+        return self.events["dividends"]
+
+    def save_dividends(self, records: list[Any], fetched_at: datetime) -> None:
+        self.events["dividends"] = list(records)
+        self.fetched["dividends"] = fetched_at
+
+    def last_fetched(self, data_type: str, ticker: str) -> datetime | None:
+        return self.fetched.get(data_type)
+
+
+def _bar(day: date, close: str = "100") -> OHLCVBar:
+    return OHLCVBar(
+        ticker="AAPL",
+        timestamp=datetime.combine(day, time(14, 30), timezone.utc),
+        open=Decimal("99"),
+        high=Decimal("101"),
+        low=Decimal("98"),
+        close=Decimal(close),
+        adj_close=None,
+        volume=1000,
+        vwap=None,
+        trade_count=None,
+        provider="Yahoo Finance",
+    )
+
+
+def _service(store: FakeHistoryStore) -> tuple[MarketDataService, AsyncMock]:
+    uow = MagicMock()
+    uow.__enter__ = MagicMock(return_value=uow)
+    uow.__exit__ = MagicMock(return_value=False)
+    uow.market_history = store
+    svc = MarketDataService(
+        uow=uow,
+        encryption=MagicMock(),
+        http_client=AsyncMock(),
+        rate_limiters={},
+        provider_registry={},
+        read_through=True,
+    )
+    fetch = AsyncMock()
+    svc._fetch_data_type = fetch  # type: ignore[method-assign]
+    return svc, fetch
+
+
+def _store_days(store: FakeHistoryStore, days: list[date]) -> None:
+    store.save_ohlcv([_bar(d) for d in days], None)  # type: ignore[arg-type]
+
+
+class TestReadThroughOhlcv:
+    def test_covered_range_is_served_from_store(self) -> None:
+        store = FakeHistoryStore()
+        days = _weekdays(date(2025, 6, 2), date(2025, 6, 13))
+        _store_days(store, days)
+        svc, fetch = _service(store)
+
+        bars = asyncio.run(
+            svc.get_ohlcv(
+                "AAPL", start_date=date(2025, 6, 2), end_date=date(2025, 6, 13)
+            )
+        )
+
+        fetch.assert_not_awaited()
+        assert [b.timestamp.date() for b in bars] == days
+
+    def test_only_missing_sub_range_is_fetched_and_written_back(self) -> None:
+        store = FakeHistoryStore()
+        _store_days(store, _weekdays(date(2025, 6, 2), date(2025, 6, 6)))
+        svc, fetch = _service(store)
+        new_days = _weekdays(date(2025, 6, 9), date(2025, 6, 13))
+        fetch.return_value = [_bar(d, close="110") for d in new_days]
+
+        bars = asyncio.run(
+            svc.get_ohlcv(
+                "AAPL", start_date=date(2025, 6, 2), end_date=date(2025, 6, 13)
+            )
+        )
+
+        fetch.assert_awaited_once_with(
+            "ohlcv",
+            "AAPL",
+            interval="1d",
+            date_range={"start_date": "2025-06-09", "end_date": "2025-06-13"},
+        )
+        assert len(bars) == 10
+        assert bars[-1].close == Decimal("110")
+        assert len(store.bars) == 10
+
+        # Second request: everything is local now.
+        fetch.reset_mock()
+        asyncio.run(
+            svc.get_ohlcv(
+                "AAPL", start_date=date(2025, 6, 2), end_date=date(2025, 6, 13)
+            )
+        )
+        fetch.assert_not_awaited()
+
+    def test_failed_gap_fetch_serves_stored_bars(self) -> None:
+        store = FakeHistoryStore()
+        _store_days(store, _weekdays(date(2025, 6, 2), date(2025, 6, 6)))
+        svc, fetch = _service(store)
+        fetch.side_effect = MarketDataError("all providers failed")
+
+        bars = asyncio.run(
+            svc.get_ohlcv(
+                "AAPL", start_date=date(2025, 6, 2), end_date=date(2025, 6, 13)
+            )
+        )
+
+        assert len(bars) == 5
+
+    def test_failure_with_empty_store_raises(self) -> None:
+        svc, fetch = _service(FakeHistoryStore())
+        fetch.side_effect = MarketDataError("all providers failed")
+
+        with pytest.raises(MarketDataError):
+            asyncio.run(svc.get_ohlcv("AAPL", start_date=date(2025, 6, 2)))
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"interval": "1h"},
+            {"provider": "Polygon"},
+            {"limit": 10},
+            {"range": "max"},
+        ],
+    )
+    def test_unsupported_requests_bypass_store(self, kwargs: dict) -> None:
+        store = FakeHistoryStore()
+        svc, fetch = _service(store)
+        fetch.return_value = [_bar(date(2025, 6, 2))]
+
+        asyncio.run(svc.get_ohlcv("AAPL", **kwargs))
+
+        fetch.assert_awaited_once()
+        assert "date_range" not in fetch.await_args.kwargs
+        assert store.bars == {}
+
+
+class TestReadThroughSnapshots:
+    def _snapshot(self, fetched: datetime) -> FundamentalsSnapshot:
+        return FundamentalsSnapshot(
+            ticker="AAPL",
+            market_cap=None,
+            pe_ratio=Decimal("28"),
+            pb_ratio=None,
+            ps_ratio=None,
+            eps=None,
+            dividend_yield=None,
+            beta=None,
+            sector="Technology",
+            industry=None,
+            employees=None,
+            provider="Yahoo Finance",
+            timestamp=fetched,
+        )
+
+    def test_fresh_fundamentals_served_from_store(self) -> None:
+        store = FakeHistoryStore()
+        store.fundamentals = self._snapshot(datetime.now(timezone.utc))
+        svc, fetch = _service(store)
+
+        result = asyncio.run(svc.get_fundamentals("AAPL"))
+
+        fetch.assert_not_awaited()
+        assert result is store.fundamentals
+
+    def test_stale_fundamentals_refetched_and_saved(self) -> None:
+        store = FakeHistoryStore()
+        store.fundamentals = self._snapshot(
+            datetime.now(timezone.utc) - timedelta(days=2)
+        )
+        fresh = self._snapshot(datetime.now(timezone.utc))
+        svc, fetch = _service(store)
+        fetch.return_value = fresh
+
+        assert asyncio.run(svc.get_fundamentals("AAPL")) is fresh
+        assert store.fundamentals is fresh
+
+    def test_dividends_cached_until_ttl(self) -> None:
+        store = FakeHistoryStore()
+        svc, fetch = _service(store)
+        div = DividendRecord(
+            ticker="AAPL",
+            dividend_amount=Decimal("0.25"),
+            currency="USD",
+            ex_date=date(2025, 5, 12),
+            record_date=None,
+            pay_date=None,
+            declaration_date=None,
+            frequency=None,
+            provider="Yahoo Finance",
+        )
+        fetch.return_value = [div]
+
+        first = asyncio.run(svc.get_dividends("AAPL"))
+        second = asyncio.run(svc.get_dividends("AAPL"))
+
+        assert first == second == [div]
+        fetch.assert_awaited_once()
+
+
+class TestYahooDateRange:
+    def test_date_range_sent_as_epoch_periods(self) -> None:
+        http = AsyncMock()
+        http.get.return_value = MagicMock(status_code=404)
+        svc = MarketDataService(
+            uow=MagicMock(),
+            encryption=MagicMock(),
+            http_client=http,
+            rate_limiters={},
+            provider_registry={},
+        )
+
+        asyncio.run(
+            svc._yahoo_ohlcv(
+                "AAPL",
+                date_range={"start_date": "2025-06-02", "end_date": "2025-06-06"},
+            )
+        )
+
+        url = http.get.await_args.args[0]
+        assert "period1=1748822400" in url  # 2025-06-02T00:00Z
+        assert "period2=1749254400" in url  # 2025-06-07T00:00Z
+        assert "range=" not in url
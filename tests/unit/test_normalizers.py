@@ -22,9 +22,12 @@ from zorivest_infra.market_data.normalizers import (
     normalize_eodhd_quote,
     normalize_finnhub_news,
     normalize_finnhub_quote,
+    normalize_fmp_quotes,
     normalize_fmp_search,
     normalize_polygon_quote,
+    normalize_polygon_snapshot_quotes,
     normalize_sec_filing,
+    normalize_tradier_quotes,
 )
 
 
@@ -337,6 +340,52 @@ class TestNormalizeApiNinjasQuote:
 # ── FMP Search ──────────────────────────────────────────────────────────
 
 
+class TestBatchQuoteNormalizers:
+    """Multi-symbol quote responses (POST /market-data/quotes)."""
+
+    def test_polygon_snapshot(self) -> None:
+        data = {
+            "tickers": [
+                {
+                    "ticker": "AAPL",
+                    "day": {"o": 180.0, "h": 182.0, "l": 179.0, "c": 181.0, "v": 5e7},
+                    "lastTrade": {"p": 181.18},
+                    "prevDay": {"c": 179.5},
+                    "todaysChange": 1.68,
+                    "todaysChangePerc": 0.94,
+                    "updated": 1_700_000_000_000_000_000,
+                },
+                {"ticker": "HALT", "day": {}, "lastTrade": {}},
+            ]
+        }
+        quotes = normalize_polygon_snapshot_quotes(data)
+        assert [q.ticker for q in quotes] == ["AAPL"]
+        assert quotes[0].price == pytest.approx(181.18)
+        assert quotes[0].previous_close == pytest.approx(179.5)
+        assert quotes[0].volume == 50_000_000
+        assert quotes[0].timestamp is not None
+
+    def test_fmp_quotes(self) -> None:
+        data = [
+            {"symbol": "AAPL", "price": 181.18, "previousClose": 179.5},
+            {"symbol": "MSFT", "price": 410.0, "changesPercentage": 1.2},
+            {"symbol": "NOPE", "price": None},
+        ]
+        quotes = normalize_fmp_quotes(data)
+        assert [q.ticker for q in quotes] == ["AAPL", "MSFT"]
+        assert quotes[1].change_pct == pytest.approx(1.2)
+        assert all(q.provider == "Financial Modeling Prep" for q in quotes)
+
+    def test_tradier_single_symbol_object(self) -> None:
+        data = {"quotes": {"quote": {"symbol": "AAPL", "last": 181.18}}}
+        quotes = normalize_tradier_quotes(data)
+        assert [(q.ticker, q.price) for q in quotes] == [("AAPL", 181.18)]
+
+    def test_tradier_unmatched_only(self) -> None:
+        data = {"quotes": {"unmatched_symbols": {"symbol": "ZZZZ"}}}
+        assert normalize_tradier_quotes(data) == []
+
+
 class TestNormalizeFmpSearch:
     """Tests for normalize_fmp_search."""
 
@@ -0,0 +1,63 @@
+# tests/unit/test_pagination.py
+"""Tests for keyset pagination cursor primitives."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from zorivest_core.application.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    scoped_kind,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestCursorCodec:
+    def test_round_trip_preserves_datetime_and_tiebreaker(self) -> None:
+        key = (datetime(2025, 1, 15, 10, 30, 0, 123456), "E001")
+        token = encode_cursor("trades:-time", key)
+        assert decode_cursor("trades:-time", token) == key
+
+    def test_token_is_url_safe(self) -> None:
+        token = encode_cursor("tax_lots", (datetime(2025, 1, 1), "lot/+?&="))
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    def test_rejects_cursor_for_other_listing(self) -> None:
+        token = encode_cursor("trades:-time", (datetime(2025, 1, 1), "E1"))
+        with pytest.raises(InvalidCursorError, match="trades:time"):
+            decode_cursor("trades:time", token)
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "!!!"])
+    def test_rejects_malformed_token(self, token: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("trades:-time", token)
+
+    def test_scoped_kind_depends_on_filters(self) -> None:
+        assert scoped_kind("trades:-time", "A1", None) == scoped_kind(
+            "trades:-time", "A1", None
+        )
+        assert scoped_kind("trades:-time", "A1", None) != scoped_kind(
+            "trades:-time", None, "A1"
+        )
+
+    def test_invalid_cursor_is_value_error(self) -> None:
+        assert issubclass(InvalidCursorError, ValueError)
+
+
+class TestPaginate:
+    def test_extra_row_yields_cursor_for_last_returned_item(self) -> None:
+        page = paginate("k", [1, 2, 3], limit=2, key=lambda n: (n,))
+        assert page.items == [1, 2]
+        assert decode_cursor("k", page.next_cursor or "") == (2,)
+
+    def test_last_page_has_no_cursor(self) -> None:
+        page = paginate("k", [1, 2], limit=2, key=lambda n: (n,))
+        assert page.items == [1, 2]
+        assert page.next_cursor is None
+        assert page.total is None
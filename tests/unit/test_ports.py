@@ -32,11 +32,16 @@ class TestTradeRepository:
             "delete",
             "exists",
             "exists_by_fingerprint_since",
+            "existing_exec_ids",
+            "existing_fingerprints_since",
             "get",
+            "list_after",
             "list_all",
             "list_filtered",
             "list_for_account",
             "save",
+            "save_many",
+            "stats_by_account",
             "update",
         }
         actual_methods = {
@@ -58,11 +63,16 @@ class TestTradeRepository:
             "delete",
             "exists",
             "exists_by_fingerprint_since",
+            "existing_exec_ids",
+            "existing_fingerprints_since",
             "get",
+            "list_after",
             "list_all",
             "list_filtered",
             "list_for_account",
             "save",
+            "save_many",
+            "stats_by_account",
             "update",
         }
         actual_methods = {
@@ -323,7 +333,7 @@ class TestProtocolConvention:
             if obj.__module__ == mod.__name__ and issubclass(obj, Protocol)
         ]
         # Value: verify exact count matches module integrity test
-        assert len(port_classes) == 24
+        assert len(port_classes) == 25
         for cls in port_classes:
             assert cls is not None, f"{cls.__name__} unexpectedly None"
 
@@ -338,8 +348,8 @@ class TestProtocolConvention:
                 is_runtime = getattr(obj, "_is_runtime_protocol", False)
                 assert not is_runtime, f"{name} must NOT be @runtime_checkable"
                 checked_count += 1
-        # Value: verify we actually checked all 24 module classes
-        assert checked_count == 25
+        # Value: verify we actually checked all 26 module classes
+        assert checked_count == 26
 
 
 # ── AC-8: Import surface ────────────────────────────────────────────────
@@ -416,6 +426,8 @@ class TestModuleIntegrity:
             "MarketDataPort",
             # Phase 8 additions (MEU-60)
             "MarketProviderSettingsRepository",
+            # Read-through market history store
+            "MarketHistoryRepository",
             # Phase 1 additions (MEU-52)
             "TradeReportRepository",
             # Phase 1 additions (MEU-66)
@@ -10,14 +10,19 @@ import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
+from unittest.mock import MagicMock
 
-from zorivest_core.application.provider_status import ProviderStatus
+from zorivest_core.application.provider_status import (
+    ProviderStatus,
+    RateBudgetStatus,
+)
 from zorivest_core.domain.enums import AuthMethod
 from zorivest_core.domain.market_data import ProviderConfig
 from zorivest_core.services.provider_connection_service import (
     ProviderConnectionService,
 )
 from zorivest_core.domain.market_provider_settings import MarketProviderSettings
+from zorivest_core.services.provider_health import ProviderHealthTracker
 
 
 # ── Test Fixtures ────────────────────────────────────────────────────────
@@ -239,6 +244,8 @@ def _make_service(
     uow: MockUoW | None = None,
     http: MockHttpClient | None = None,
     rate_limiters: dict[str, MockRateLimiter] | None = None,
+    health: ProviderHealthTracker | None = None,
+    rate_budget: Any = None,
 ) -> tuple[ProviderConnectionService, MockUoW, MockHttpClient]:
     """Create a service with test doubles."""
     _uow = uow or MockUoW()
@@ -246,7 +253,9 @@ def _make_service(
     _enc = MockEncryption()
     _rl = rate_limiters or {}
     registry = _make_registry()
-    svc = ProviderConnectionService(_uow, _enc, _http, _rl, registry)
+    svc = ProviderConnectionService(
+        _uow, _enc, _http, _rl, registry, health=health, rate_budget=rate_budget
+    )
     return svc, _uow, _http
 
 
@@ -309,6 +318,46 @@ class TestListProviders:
 
         asyncio.run(_run())
 
+    def test_reports_tracked_health(self) -> None:
+        async def _run() -> None:
+            health = ProviderHealthTracker()
+            health.record_failure("Finnhub", 0.5, rate_limited=True)
+            svc, _, _ = _make_service(health=health)
+            result = {p.provider_name: p for p in await svc.list_providers()}
+            assert result["Finnhub"].health.state == "open"
+            assert result["Finnhub"].health.rate_limited == 1
+            assert result["Alpha Vantage"].health.requests == 0
+
+        asyncio.run(_run())
+
+    def test_reports_rate_budget(self) -> None:
+        async def _run() -> None:
+            budget = MagicMock()
+            budget.status.side_effect = lambda name: RateBudgetStatus(
+                limit_per_minute=60,
+                effective_per_minute=30.0,
+                used=3,
+                remaining=27,
+                throttled=1,
+                blocked_for_s=0.0,
+                waiting_interactive=0,
+                waiting_background=2,
+            )
+            svc, _, _ = _make_service(rate_budget=budget)
+            result = {p.provider_name: p for p in await svc.list_providers()}
+            assert result["Finnhub"].rate_budget.remaining == 27
+            budget.status.assert_any_call("Finnhub")
+
+        asyncio.run(_run())
+
+    def test_no_health_without_tracker(self) -> None:
+        async def _run() -> None:
+            svc, _, _ = _make_service()
+            result = await svc.list_providers()
+            assert all(p.health is None for p in result)
+
+        asyncio.run(_run())
+
 
 # ── AC-3/AC-4/AC-5/AC-6: configure_provider ──
 
@@ -0,0 +1,105 @@
+"""Tests for ProviderHealthTracker (EWMA stats, circuit breaker, ranking)."""
+
+from __future__ import annotations
+
+from zorivest_core.services.provider_health import ProviderHealthTracker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _tracker(**kwargs: float) -> tuple[ProviderHealthTracker, FakeClock]:
+    clock = FakeClock()
+    return ProviderHealthTracker(clock=clock, **kwargs), clock
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self) -> None:
+        tracker, _ = _tracker(failure_threshold=3)
+        for _ in range(2):
+            tracker.record_failure("A", 1.0)
+        assert tracker.acquire("A")
+        tracker.record_failure("A", 1.0)
+
+        assert not tracker.acquire("A")
+        snap = tracker.snapshot("A")
+        assert (snap.state, snap.consecutive_failures, snap.retry_in_s) == (
+            "open",
+            3,
+            30.0,
+        )
+
+    def test_success_resets_consecutive_failures(self) -> None:
+        tracker, _ = _tracker(failure_threshold=2)
+        tracker.record_failure("A", 1.0)
+        tracker.record_success("A", 0.1)
+        tracker.record_failure("A", 1.0)
+        assert tracker.acquire("A")
+
+    def test_rate_limit_opens_immediately(self) -> None:
+        tracker, _ = _tracker()
+        tracker.record_failure("A", 0.1, rate_limited=True)
+        assert not tracker.acquire("A")
+        assert tracker.snapshot("A").rate_limited == 1
+
+    def test_single_probe_after_cooldown(self) -> None:
+        tracker, clock = _tracker(failure_threshold=1, cooldown=10)
+        tracker.record_failure("A", 1.0)
+        clock.now += 10
+
+        assert tracker.acquire("A")
+        assert tracker.snapshot("A").state == "half_open"
+        assert not tracker.acquire("A")  # probe already out
+        tracker.record_success("A", 0.2)
+        assert tracker.snapshot("A").state == "closed"
+        assert tracker.acquire("A")
+
+    def test_failed_probe_doubles_cooldown(self) -> None:
+        tracker, clock = _tracker(failure_threshold=1, cooldown=10, max_cooldown=15)
+        tracker.record_failure("A", 1.0)
+        clock.now += 10
+        tracker.acquire("A")
+        tracker.record_failure("A", 1.0)
+        assert tracker.snapshot("A").retry_in_s == 15.0  # capped at max_cooldown
+
+    def test_released_probe_can_be_retried(self) -> None:
+        tracker, clock = _tracker(failure_threshold=1, cooldown=10)
+        tracker.record_failure("A", 1.0)
+        clock.now += 10
+        tracker.acquire("A")
+        tracker.release("A")
+        assert tracker.acquire("A")
+
+
+class TestRank:
+    def test_measured_providers_by_latency_then_unmeasured_in_order(self) -> None:
+        tracker, _ = _tracker()
+        tracker.record_success("C", 0.5)
+        tracker.record_success("D", 0.1)
+        assert tracker.rank(["A", "B", "C", "D"]) == ["D", "C", "A", "B"]
+
+    def test_errors_weigh_against_latency(self) -> None:
+        tracker, _ = _tracker()
+        tracker.record_success("fast", 0.1)
+        tracker.record_failure("fast", 0.1)
+        tracker.record_failure("fast", 0.1)
+        tracker.record_success("steady", 0.15)
+        assert tracker.rank(["fast", "steady"]) == ["steady", "fast"]
+
+    def test_open_circuits_go_last(self) -> None:
+        tracker, _ = _tracker()
+        tracker.record_failure("A", 0.01, rate_limited=True)
+        assert tracker.rank(["A", "B"]) == ["B", "A"]
+
+    def test_latency_is_an_ewma(self) -> None:
+        tracker, _ = _tracker()
+        tracker.record_success("A", 1.0)
+        tracker.record_success("A", 2.0)
+        snap = tracker.snapshot("A")
+        assert snap.latency_ms == 1200.0
+        assert (snap.requests, snap.failures, snap.error_rate) == (2, 0, 0.0)
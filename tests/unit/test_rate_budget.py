@@ -0,0 +1,171 @@
+"""Tests for the shared adaptive rate budget (rate_budget.py)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zorivest_infra.market_data.http_cache import HttpFetchError
+from zorivest_infra.market_data.pipeline_rate_limiter import PipelineRateLimiter
+from zorivest_infra.market_data.rate_budget import (
+    BudgetLimiter,
+    Priority,
+    ProviderBudget,
+    RateBudget,
+    parse_retry_after,
+)
+
+
+class FakeTime:
+    """Clock plus sleep that advances it, so waits take no real time."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _budget(limit: int, **kwargs: float) -> tuple[ProviderBudget, FakeTime]:
+    t = FakeTime()
+    return ProviderBudget(limit, clock=t, sleep=t.sleep, **kwargs), t
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self) -> None:
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(2.5) == 2.5
+
+    def test_http_date(self) -> None:
+        now = datetime(2026, 1, 5, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("Mon, 05 Jan 2026 12:00:30 GMT", now) == 30.0
+
+    def test_missing_or_garbage(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestWindow:
+    def test_limit_per_sliding_minute(self) -> None:
+        budget, t = _budget(2)
+
+        async def run() -> None:
+            for _ in range(3):
+                await budget.acquire()
+
+        asyncio.run(run())
+        assert t.sleeps == [60.0]
+        assert budget.status().used == 1  # the first two left the window
+
+    def test_status_reports_remaining(self) -> None:
+        budget, _ = _budget(5)
+        asyncio.run(budget.acquire())
+        status = budget.status()
+        assert (status.limit_per_minute, status.used, status.remaining) == (5, 1, 4)
+
+
+class TestAimd:
+    def test_429_halves_rate_and_honours_retry_after(self) -> None:
+        budget, t = _budget(10)
+        budget.record_response(429, "12")
+
+        status = budget.status()
+        assert (status.effective_per_minute, status.throttled) == (5.0, 1)
+        assert status.blocked_for_s == 12.0
+        asyncio.run(budget.acquire())
+        assert t.sleeps == [12.0]
+
+    def test_429_without_header_blocks_one_interval(self) -> None:
+        budget, _ = _budget(10)
+        budget.record_response(429)
+        assert budget.status().blocked_for_s == 12.0  # 60s / 5 per minute
+
+    def test_successes_recover_additively_up_to_limit(self) -> None:
+        budget, _ = _budget(20)
+        budget.record_response(429, "0")
+        budget.record_response(429, "0")
+        assert budget.status().effective_per_minute == 5.0
+        budget.record_response(200)
+        assert budget.status().effective_per_minute == 6.0
+        for _ in range(50):
+            budget.record_response(200)
+        assert budget.status().effective_per_minute == 20.0
+
+    def test_rate_never_drops_below_one(self) -> None:
+        budget, _ = _budget(2)
+        for _ in range(5):
+            budget.record_response(429, "0")
+        assert budget.status().effective_per_minute == 1.0
+
+
+class TestPriority:
+    def test_background_leaves_interactive_reserve(self) -> None:
+        budget, t = _budget(5)  # background may use 4 of 5
+
+        async def run() -> None:
+            for _ in range(4):
+                await budget.acquire(Priority.BACKGROUND)
+            await budget.acquire(Priority.INTERACTIVE)  # reserve slot, no wait
+
+        asyncio.run(run())
+        assert t.sleeps == []
+
+    def test_interactive_preempts_waiting_background(self) -> None:
+        budget, _ = _budget(1)
+        order: list[str] = []
+
+        async def take(label: str, priority: Priority) -> None:
+            await budget.acquire(priority)
+            order.append(label)
+
+        async def run() -> None:
+            await budget.acquire(Priority.INTERACTIVE)  # fill the window
+            background = asyncio.create_task(take("background", Priority.BACKGROUND))
+            await asyncio.sleep(0)
+            await take("interactive", Priority.INTERACTIVE)
+            await background
+
+        asyncio.run(run())
+        assert order == ["interactive", "background"]
+
+
+class TestSharing:
+    def test_limiters_share_one_budget(self) -> None:
+        budget = RateBudget({"Finnhub": 60})
+        interactive = budget.limiters(Priority.INTERACTIVE)["Finnhub"]
+        background = budget.limiters(Priority.BACKGROUND)["Finnhub"]
+        assert isinstance(interactive, BudgetLimiter)
+        assert interactive.budget is background.budget
+
+        asyncio.run(interactive.wait_if_needed())
+        asyncio.run(background.wait_if_needed())
+        assert budget.status("Finnhub").used == 2
+        assert budget.status("Unknown") is None
+
+    def test_pipeline_limiter_draws_on_budget_and_reports_429(self) -> None:
+        budget = RateBudget({"Finnhub": 60})
+        limiter = PipelineRateLimiter({}, budget=budget)
+        ok = AsyncMock(return_value={"content": b"[]"})
+        throttled = AsyncMock(
+            side_effect=HttpFetchError(429, "https://x", retry_after="5")
+        )
+
+        async def run() -> None:
+            await limiter.execute_with_limits("Finnhub", ok)
+            with pytest.raises(HttpFetchError):
+                await limiter.execute_with_limits("Finnhub", throttled)
+
+        asyncio.run(run())
+        status = budget.status("Finnhub")
+        assert (status.used, status.throttled) == (2, 1)
+        assert status.effective_per_minute == 30.0
+        assert status.blocked_for_s > 0
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 
+import pytest
 
 # ---------------------------------------------------------------------------
 # AC-2a: Yahoo quote envelope extraction
@@ -1203,3 +1204,203 @@ class TestTradingViewFundamentalsExtractor:
         assert len(records) == 1
         assert records[0]["market_cap_basic"] == 2800000000000
         assert records[0]["name"] == "Apple Inc"
+
+
+# ---------------------------------------------------------------------------
+# Streaming extraction of large OHLCV bodies
+# ---------------------------------------------------------------------------
+
+
+def _yahoo_chart(bars: int) -> dict:
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"symbol": "AAPL"},
+                    "timestamp": [1700000000 + 60 * i for i in range(bars)],
+                    "indicators": {
+                        "quote": [
+                            {
+                                "open": [100.0 + i for i in range(bars)],
+                                "high": [105.5 + i for i in range(bars)],
+                                "low": [None] + [99.25 + i for i in range(1, bars)],
+                                "close": [103.0 + i for i in range(bars)],
+                                "volume": [1000 + i for i in range(bars)],
+                            }
+                        ],
+                        "adjclose": [{"adjclose": [1.0] * bars}],
+                    },
+                }
+            ],
+            "error": None,
+        }
+    }
+
+
+def _polygon_aggs(bars: int) -> dict:
+    return {
+        "ticker": "AAPL",
+        "results": [
+            {
+                "v": 1000 + i,
+                "o": 100.5 + i,
+                "c": 101.5 + i,
+                "h": 102.0 + i,
+                "l": 99.0 + i,
+                "t": (1700000000 + 60 * i) * 1000,
+            }
+            for i in range(bars)
+        ],
+        "status": "OK",
+    }
+
+
+def _alpha_vantage_series(bars: int) -> dict:
+    return {
+        "Meta Data": {"2. Symbol": "AAPL"},
+        "Time Series (1min)": {
+            f"2024-01-02 {i // 60:02d}:{i % 60:02d}:00": {
+                "1. open": f"{100 + i}.0000",
+                "2. high": f"{101 + i}.0000",
+                "3. low": f"{99 + i}.0000",
+                "4. close": f"{100 + i}.5000",
+                "5. volume": str(1000 + i),
+            }
+            for i in range(bars)
+        },
+    }
+
+
+class TestColumnExtraction:
+    """extract_parsed_columns returns the transpose of the record extractor."""
+
+    def test_yahoo_chart_columns_match_records(self) -> None:
+        from zorivest_infra.market_data.response_extractors import (
+            extract_parsed_columns,
+            extract_parsed_records,
+        )
+
+        data = _yahoo_chart(5)
+        quote = data["chart"]["result"][0]["indicators"]["quote"][0]
+        quote["volume"] = quote["volume"][:3]  # short array is None-padded
+
+        columns = extract_parsed_columns(data, "Yahoo Finance", "ohlcv")
+        records = extract_parsed_records(data, "Yahoo Finance", "ohlcv")
+
+        assert columns is not None
+        assert columns["volume"][3:] == [None, None]
+        assert [dict(zip(columns, row)) for row in zip(*columns.values())] == records
+
+    def test_unsupported_or_unusual_shape_returns_none(self) -> None:
+        from zorivest_infra.market_data.response_extractors import (
+            extract_parsed_columns,
+        )
+
+        assert extract_parsed_columns(_polygon_aggs(2), "polygon", "ohlcv") is None
+        assert extract_parsed_columns({"chart": {}}, "yahoo", "ohlcv") is None
+        assert extract_parsed_columns([{"open": 1.0}], "yahoo", "ohlcv") is None
+
+
+class TestStreamingExtraction:
+    """iter_records / large bodies in extract_records match the tree extractors."""
+
+    @pytest.mark.parametrize(
+        ("provider", "body"),
+        [
+            ("polygon", _polygon_aggs(500)),
+            ("alpha_vantage", _alpha_vantage_series(500)),
+            ("Yahoo Finance", _yahoo_chart(500)),
+        ],
+    )
+    def test_iter_records_matches_tree_extractor(
+        self, provider: str, body: dict
+    ) -> None:
+        from zorivest_infra.market_data.json_stream import iter_chunks
+        from zorivest_infra.market_data.response_extractors import (
+            extract_parsed_records,
+            iter_records,
+        )
+
+        raw = json.dumps(body).encode()
+        expected = extract_parsed_records(json.loads(raw), provider, "ohlcv")
+        for size in (7, 4096):
+            streamed = list(iter_records(iter_chunks(raw, size), provider, "ohlcv"))
+            assert streamed == expected
+
+    def test_large_polygon_body_is_streamed(self, monkeypatch) -> None:
+        from zorivest_infra.market_data import response_extractors
+
+        raw = json.dumps(_polygon_aggs(50)).encode()
+        monkeypatch.setattr(response_extractors, "STREAM_MIN_BYTES", 1)
+
+        def no_tree(*args, **kwargs):
+            raise AssertionError("body was parsed whole")
+
+        monkeypatch.setattr(response_extractors.json, "loads", no_tree)
+        records = response_extractors.extract_records(raw, "polygon", "ohlcv")
+
+        assert len(records) == 50
+        assert records[0]["t"] == 1700000000
+
+    def test_unusual_shape_falls_back_to_tree(self, monkeypatch) -> None:
+        from zorivest_infra.market_data import response_extractors
+
+        # "results" as an object is not the streaming shape
+        raw = json.dumps({"results": {"o": 1.0, "t": 1}}).encode()
+        monkeypatch.setattr(response_extractors, "STREAM_MIN_BYTES", 1)
+        parsed = []
+        loads = response_extractors.json.loads
+
+        def spy(body, *args, **kwargs):
+            parsed.append(body)
+            return loads(body, *args, **kwargs)
+
+        monkeypatch.setattr(response_extractors.json, "loads", spy)
+        records = response_extractors.extract_records(raw, "polygon", "ohlcv")
+
+        assert records == []
+        assert parsed == [raw]
+
+    def test_alpha_vantage_notice_falls_back_to_tree(self, monkeypatch) -> None:
+        from zorivest_infra.market_data import response_extractors
+
+        raw = json.dumps({"Note": "API call frequency exceeded"}).encode()
+        monkeypatch.setattr(response_extractors, "STREAM_MIN_BYTES", 1)
+
+        assert response_extractors.extract_records(raw, "alpha_vantage", "ohlcv") == []
+
+    def test_unsupported_shape_raises_key_error(self) -> None:
+        from zorivest_infra.market_data.response_extractors import iter_records
+
+        with pytest.raises(KeyError):
+            iter_records([b"[]"], "fmp", "ohlcv")
+
+    def test_stream_records_only_for_large_streamed_shapes(self, monkeypatch) -> None:
+        from zorivest_infra.market_data import response_extractors
+
+        raw = json.dumps(_polygon_aggs(5)).encode()
+        stream_records = response_extractors.stream_records
+        assert stream_records(raw, "Polygon.io", "ohlcv") is None  # small
+
+        monkeypatch.setattr(response_extractors, "STREAM_MIN_BYTES", 1)
+        streamed = stream_records(raw, "Polygon.io", "ohlcv")
+        assert streamed is not None and len(streamed) == 5
+        assert stream_records(raw, "fmp", "ohlcv") is None
+        assert (
+            stream_records(
+                json.dumps(_yahoo_chart(5)).encode(), "Yahoo Finance", "ohlcv"
+            )
+            is None
+        )
+        assert stream_records(b'{"results": {}}', "polygon", "ohlcv") is None
+
+    def test_streamed_polygon_bars_extract_unchanged(self, monkeypatch) -> None:
+        from zorivest_infra.market_data import response_extractors
+
+        monkeypatch.setattr(response_extractors, "STREAM_MIN_BYTES", 1)
+        raw = json.dumps(_polygon_aggs(5)).encode()
+        streamed = response_extractors.stream_records(raw, "polygon", "ohlcv")
+
+        assert response_extractors.extract_parsed_records(
+            streamed, "polygon", "ohlcv"
+        ) == response_extractors.extract_records(raw, "polygon", "ohlcv")
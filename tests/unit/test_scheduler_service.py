@@ -0,0 +1,38 @@
+"""Tests for SchedulerService maintenance jobs."""
+
+from __future__ import annotations
+
+import pytest
+
+from zorivest_core.services import scheduler_service
+from zorivest_core.services.scheduler_service import SchedulerService
+
+
+@pytest.mark.asyncio
+async def test_maintenance_callback_runs_sync_and_async_tasks() -> None:
+    svc = SchedulerService()
+    calls: list[str] = []
+
+    async def async_task() -> None:
+        calls.append("async")
+
+    svc.schedule_maintenance("sync", lambda: calls.append("sync"), 60)
+    svc.schedule_maintenance("async", async_task, 60)
+
+    await scheduler_service._run_maintenance_callback("sync")
+    await scheduler_service._run_maintenance_callback("async")
+
+    assert calls == ["sync", "async"]
+
+
+@pytest.mark.asyncio
+async def test_maintenance_failure_does_not_propagate() -> None:
+    svc = SchedulerService()
+
+    def boom() -> None:
+        raise RuntimeError("sweep failed")
+
+    svc.schedule_maintenance("boom", boom, 60)
+
+    await svc._run_maintenance("boom")
+    await svc._run_maintenance("unregistered")
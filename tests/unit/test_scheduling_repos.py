@@ -19,7 +19,12 @@ import pytest
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 
-from zorivest_infra.database.models import Base
+from zorivest_core.services.fetch_memory_cache import CachedFetch, FetchMemoryCache
+from zorivest_infra.database.models import (
+    Base,
+    FetchCacheBlobModel,
+    FetchCacheModel,
+)
 from zorivest_infra.database.scheduling_repositories import (
     AuditLogRepository,
     FetchCacheRepository,
@@ -329,6 +334,245 @@ class TestFetchCacheRepository:
 
         assert repo.get_cached("ibkr", "quotes", "AAPL") is None
 
+    def test_identical_payloads_share_one_compressed_blob(self, session):
+        repo = FetchCacheRepository(session)
+        payload = '{"bars": [' + ",".join(['{"c": 101.5}'] * 500) + "]}"
+        repo.upsert("yahoo", "ohlcv", "AAPL", payload, "h1", 3600)
+        repo.upsert("yahoo", "ohlcv", "AAPL|1d", payload, "h1", 3600)
+        session.commit()
+
+        blobs = session.query(FetchCacheBlobModel).all()
+        assert len(blobs) == 1
+        assert blobs[0].codec == "zlib"
+        assert len(blobs[0].payload) < blobs[0].raw_size / 10
+        assert repo.get_cached("yahoo", "ohlcv", "AAPL|1d").payload_json == payload
+
+    def test_same_hash_upsert_only_touches_metadata(self, session):
+        repo = FetchCacheRepository(session)
+        repo.upsert("yahoo", "ohlcv", "AAPL", '{"c": 1}', "h1", 3600, etag="e1")
+        session.commit()
+        blob = session.get(FetchCacheBlobModel, "h1")
+        created_at = blob.created_at
+
+        repo.upsert("yahoo", "ohlcv", "AAPL", '{"c": 1}', "h1", 3600, etag="e2")
+        session.commit()
+
+        assert session.get(FetchCacheBlobModel, "h1").created_at == created_at
+        assert repo.get_cached("yahoo", "ohlcv", "AAPL").etag == "e2"
+
+    def test_unreferenced_blobs_are_deleted(self, session):
+        repo = FetchCacheRepository(session)
+        repo.upsert("ibkr", "quotes", "AAPL", '{"p": 1}', "h1", 3600)
+        repo.upsert("ibkr", "quotes", "MSFT", '{"p": 1}', "h1", 3600)
+        repo.upsert("ibkr", "quotes", "TSLA", '{"p": 2}', "h2", 3600)
+        session.commit()
+
+        repo.upsert("ibkr", "quotes", "TSLA", '{"p": 3}', "h3", 3600)
+        repo.invalidate("ibkr", "quotes")
+        session.commit()
+        assert session.query(FetchCacheBlobModel).count() == 0
+
+    def test_shared_blob_survives_partial_invalidate(self, session):
+        repo = FetchCacheRepository(session)
+        repo.upsert("ibkr", "quotes", "AAPL", '{"p": 1}', "h1", 3600)
+        repo.upsert("ibkr", "ohlcv", "AAPL", '{"p": 1}', "h1", 3600)
+        session.commit()
+
+        repo.invalidate("ibkr", "quotes")
+        session.commit()
+        assert repo.get_cached("ibkr", "ohlcv", "AAPL").payload_json == '{"p": 1}'
+
+
+class TestFetchCacheMemoryTier:
+    def test_upsert_writes_through_to_memory(self, session):
+        memory = FetchMemoryCache()
+        repo = FetchCacheRepository(session, memory=memory)
+        repo.upsert("yahoo", "ohlcv", "AAPL", '[{"c": 1}]', "h1", 3600, etag="e1")
+        session.commit()
+
+        entry = repo.get_cached("yahoo", "ohlcv", "AAPL")
+        assert isinstance(entry, CachedFetch)
+        assert (entry.records, entry.etag) == ([{"c": 1}], "e1")
+        assert FetchCacheRepository(session).get_cached("yahoo", "ohlcv", "AAPL")
+        assert memory.stats().memory.hits == 1
+        assert memory.stats().db.hits + memory.stats().db.misses == 0
+
+    def test_upsert_reaches_memory_only_on_commit(self, session):
+        memory = FetchMemoryCache()
+        repo = FetchCacheRepository(session, memory=memory)
+        repo.upsert("yahoo", "ohlcv", "AAPL", "[]", "h1", 3600)
+
+        entry = repo.get_cached("yahoo", "ohlcv", "AAPL")
+
+        assert entry is not None and not isinstance(entry, CachedFetch)
+        assert memory.stats().entries == 0
+        session.commit()
+        assert memory.stats().entries == 1
+
+    def test_rolled_back_upsert_never_reaches_memory(self, session):
+        memory = FetchMemoryCache()
+        repo = FetchCacheRepository(session, memory=memory)
+        repo.upsert("yahoo", "ohlcv", "AAPL", "[]", "h1", 3600)
+        session.commit()
+        repo.upsert("yahoo", "ohlcv", "AAPL", '[{"c": 2}]', "h2", 3600)
+
+        session.rollback()
+        session.commit()
+
+        entry = repo.get_cached("yahoo", "ohlcv", "AAPL")
+        assert entry is not None and entry.payload_json == "[]"
+
+    def test_database_hit_fills_memory(self, session):
+        FetchCacheRepository(session).upsert("yahoo", "ohlcv", "AAPL", "[]", "h1", 3600)
+        session.commit()
+        memory = FetchMemoryCache()
+        repo = FetchCacheRepository(session, memory=memory)
+
+        first = repo.get_cached("yahoo", "ohlcv", "AAPL")
+        second = repo.get_cached("yahoo", "ohlcv", "AAPL")
+
+        assert isinstance(first, CachedFetch)
+        assert second is first
+        assert memory.stats().as_dict()["db"] == {
+            "hits": 1,
+            "misses": 0,
+            "hit_rate": 1.0,
+        }
+
+    def test_stale_row_returned_but_not_kept(self, session):
+        memory = FetchMemoryCache(now=lambda: _now() + timedelta(hours=2))
+        FetchCacheRepository(session).upsert("yahoo", "news", "AAPL", "[]", "h1", 60)
+        session.commit()
+        repo = FetchCacheRepository(session, memory=memory)
+
+        entry = repo.get_cached("yahoo", "news", "AAPL")
+
+        assert entry is not None and not isinstance(entry, CachedFetch)
+        assert memory.stats().entries == 0
+
+    def test_invalidate_drops_memory_entries(self, session):
+        memory = FetchMemoryCache()
+        repo = FetchCacheRepository(session, memory=memory)
+        repo.upsert("ibkr", "quotes", "AAPL", "{}", "h1", 3600)
+        repo.upsert("ibkr", "ohlcv", "AAPL", "{}", "h1", 3600)
+        session.commit()
+
+        repo.invalidate("ibkr", "quotes")
+        session.commit()
+
+        assert repo.get_cached("ibkr", "quotes", "AAPL") is None
+        assert memory.stats().entries == 1
+
+
+class TestFetchCacheRetention:
+    _NOW = datetime(2026, 3, 16, 12, 0, tzinfo=timezone.utc)
+
+    def _add(self, session, repo, key, payload, digest, *, age_h, hit_h=None):
+        repo.upsert("yahoo", "ohlcv", key, payload, digest, 3600)
+        session.flush()
+        row = repo._get_row("yahoo", "ohlcv", key)
+        row.fetched_at = self._NOW - timedelta(hours=age_h)
+        row.last_hit_at = (
+            self._NOW - timedelta(hours=hit_h) if hit_h is not None else None
+        )
+        session.commit()
+
+    def _blob_size(self, session, digest):
+        return len(session.get(FetchCacheBlobModel, digest).payload)
+
+    def test_removes_entries_past_max_stale_age(self, session):
+        repo = FetchCacheRepository(session)
+        self._add(session, repo, "old", '{"a": 1}', "h1", age_h=50)
+        self._add(session, repo, "stale", '{"b": 2}', "h2", age_h=20)
+        size = self._blob_size(session, "h1")
+
+        result = repo.sweep(10**9, timedelta(days=1), now=self._NOW)
+        session.commit()
+
+        assert (result.expired, result.evicted) == (1, 0)
+        assert (result.blobs_deleted, result.bytes_freed) == (1, size)
+        assert repo.get_cached("yahoo", "ohlcv", "old") is None
+        assert repo.get_cached("yahoo", "ohlcv", "stale") is not None
+
+    def test_size_cap_evicts_least_recently_used(self, session):
+        repo = FetchCacheRepository(session)
+        self._add(session, repo, "a", '{"a": 1}', "h1", age_h=3, hit_h=0)
+        self._add(session, repo, "b", '{"b": 2}', "h2", age_h=2)
+        self._add(session, repo, "c", '{"c": 3}', "h3", age_h=1)
+        cap = self._blob_size(session, "h1") + self._blob_size(session, "h3")
+
+        result = repo.sweep(cap, timedelta(days=1), now=self._NOW)
+        session.commit()
+
+        assert (result.expired, result.evicted) == (0, 1)
+        assert {r.entity_key for r in session.query(FetchCacheModel)} == {"a", "c"}
+        assert repo.stats(now=self._NOW).stored_bytes <= cap
+
+    def test_shared_blob_freed_only_with_last_reference(self, session):
+        repo = FetchCacheRepository(session)
+        self._add(session, repo, "a", '{"a": 1}', "h1", age_h=3)
+        self._add(session, repo, "a2", '{"a": 1}', "h1", age_h=2)
+        self._add(session, repo, "b", '{"b": 2}', "h2", age_h=1)
+
+        result = repo.sweep(
+            self._blob_size(session, "h2"), timedelta(days=1), now=self._NOW
+        )
+        session.commit()
+
+        assert result.evicted == 2
+        assert result.blobs_deleted == 1
+        assert {r.entity_key for r in session.query(FetchCacheModel)} == {"b"}
+
+    def test_sweep_drops_memory_entries(self, session):
+        memory = FetchMemoryCache()
+        repo = FetchCacheRepository(session, memory=memory)
+        repo.upsert("yahoo", "ohlcv", "a", '{"a": 1}', "h1", 3600)
+        session.commit()
+        assert memory.stats().entries == 1
+
+        repo.sweep(0, timedelta(days=1))
+        session.commit()
+
+        assert memory.stats().entries == 0
+        assert repo.get_cached("yahoo", "ohlcv", "a") is None
+
+    def test_memory_hits_count_as_recent_use(self, session):
+        memory = FetchMemoryCache()
+        repo = FetchCacheRepository(session, memory=memory)
+        self._add(session, repo, "a", '{"a": 1}', "h1", age_h=3)
+        self._add(session, repo, "b", '{"b": 2}', "h2", age_h=2)
+        self._add(session, repo, "c", '{"c": 3}', "h3", age_h=1)
+        cap = self._blob_size(session, "h1") + self._blob_size(session, "h3")
+        assert isinstance(repo.get_cached("yahoo", "ohlcv", "a"), CachedFetch)
+
+        result = repo.sweep(cap, timedelta(days=1), now=self._NOW)
+        session.commit()
+
+        assert result.evicted == 1
+        assert {r.entity_key for r in session.query(FetchCacheModel)} == {"a", "c"}
+        assert repo._get_row("yahoo", "ohlcv", "a").last_hit_at is not None
+
+    def test_lookup_records_last_hit(self, session):
+        repo = FetchCacheRepository(session)
+        self._add(session, repo, "a", "{}", "h1", age_h=1)
+
+        repo.get_cached("yahoo", "ohlcv", "a")
+        session.commit()
+
+        assert repo._get_row("yahoo", "ohlcv", "a").last_hit_at is not None
+
+    def test_stats(self, session):
+        repo = FetchCacheRepository(session)
+        self._add(session, repo, "a", '{"a": 1}', "h1", age_h=3)
+        self._add(session, repo, "a2", '{"a": 1}', "h1", age_h=0)
+
+        stats = repo.stats(now=self._NOW)
+
+        assert (stats.entries, stats.stale_entries, stats.blobs) == (2, 1, 1)
+        assert stats.stored_bytes == self._blob_size(session, "h1")
+        assert stats.raw_bytes == len('{"a": 1}')
+        assert stats.oldest_fetched_at == self._NOW - timedelta(hours=3)
+
 
 # ── AC-7: AuditLogRepository ─────────────────────────────────────────────
 
@@ -8,12 +8,12 @@ deletion workflow (TradeWarningModal).
 
 from __future__ import annotations
 
-from datetime import datetime
 from unittest.mock import MagicMock
 
 
-from zorivest_core.domain.entities import Account, Trade
-from zorivest_core.domain.enums import AccountType, TradeAction
+from zorivest_core.application.dtos import AccountTradeStats
+from zorivest_core.domain.entities import Account
+from zorivest_core.domain.enums import AccountType
 from zorivest_core.services.account_service import AccountService
 
 
@@ -25,18 +25,6 @@ def _make_uow() -> MagicMock:
     return uow
 
 
-def _sample_trade(exec_id: str = "E001", account_id: str = "ACC001") -> Trade:
-    return Trade(
-        exec_id=exec_id,
-        time=datetime(2025, 1, 15, 10, 30),
-        instrument="AAPL",
-        action=TradeAction.BOT,
-        quantity=100.0,
-        price=150.50,
-        account_id=account_id,
-    )
-
-
 def _sample_account(account_id: str = "ACC001", **overrides: object) -> Account:
     defaults = {
         "account_id": account_id,
@@ -56,11 +44,10 @@ class TestGetTradeCounts:
     def test_single_account_with_trades(self) -> None:
         """Returns correct trade_count and plan_count for one account."""
         uow = _make_uow()
-        uow.trades.list_for_account.return_value = [
-            _sample_trade("E001"),
-            _sample_trade("E002"),
-        ]
-        uow.trade_plans.count_for_account.return_value = 1
+        uow.trades.stats_by_account.return_value = {
+            "ACC001": AccountTradeStats(trade_count=2)
+        }
+        uow.trade_plans.count_by_account.return_value = {"ACC001": 1}
 
         svc = AccountService(uow)
         result = svc.get_trade_counts(["ACC001"])
@@ -68,14 +55,14 @@ class TestGetTradeCounts:
         assert result == {
             "ACC001": {"trade_count": 2, "plan_count": 1},
         }
-        uow.trades.list_for_account.assert_called_once_with("ACC001")
-        uow.trade_plans.count_for_account.assert_called_once_with("ACC001")
+        uow.trades.stats_by_account.assert_called_once_with(["ACC001"])
+        uow.trade_plans.count_by_account.assert_called_once_with(["ACC001"])
 
     def test_single_account_no_trades(self) -> None:
         """Returns zero counts when account has no trades or plans."""
         uow = _make_uow()
-        uow.trades.list_for_account.return_value = []
-        uow.trade_plans.count_for_account.return_value = 0
+        uow.trades.stats_by_account.return_value = {}
+        uow.trade_plans.count_by_account.return_value = {}
 
         svc = AccountService(uow)
         result = svc.get_trade_counts(["ACC001"])
@@ -91,22 +78,10 @@ class TestGetTradeCounts:
         # ACC001 has 3 trades, 0 plans
         # ACC002 has 0 trades, 2 plans
         # ACC003 has 0 trades, 0 plans
-        def mock_trades(account_id: str):
-            if account_id == "ACC001":
-                return [
-                    _sample_trade("E001", "ACC001"),
-                    _sample_trade("E002", "ACC001"),
-                    _sample_trade("E003", "ACC001"),
-                ]
-            return []
-
-        def mock_plans(account_id: str):
-            if account_id == "ACC002":
-                return 2
-            return 0
-
-        uow.trades.list_for_account.side_effect = mock_trades
-        uow.trade_plans.count_for_account.side_effect = mock_plans
+        uow.trades.stats_by_account.return_value = {
+            "ACC001": AccountTradeStats(trade_count=3)
+        }
+        uow.trade_plans.count_by_account.return_value = {"ACC002": 2}
 
         svc = AccountService(uow)
         result = svc.get_trade_counts(["ACC001", "ACC002", "ACC003"])
@@ -116,19 +91,10 @@ class TestGetTradeCounts:
             "ACC002": {"trade_count": 0, "plan_count": 2},
             "ACC003": {"trade_count": 0, "plan_count": 0},
         }
-
-    def test_none_trades_treated_as_zero(self) -> None:
-        """Handles repo returning None instead of empty list."""
-        uow = _make_uow()
-        uow.trades.list_for_account.return_value = None
-        uow.trade_plans.count_for_account.return_value = None
-
-        svc = AccountService(uow)
-        result = svc.get_trade_counts(["ACC001"])
-
-        assert result == {
-            "ACC001": {"trade_count": 0, "plan_count": 0},
-        }
+        # One grouped query per table, not one per account.
+        uow.trades.stats_by_account.assert_called_once()
+        uow.trade_plans.count_by_account.assert_called_once()
+        uow.trades.list_for_account.assert_not_called()
 
     def test_empty_account_ids_returns_empty(self) -> None:
         """Returns empty dict when no account IDs provided."""
@@ -138,14 +104,14 @@ class TestGetTradeCounts:
         result = svc.get_trade_counts([])
 
         assert result == {}
-        uow.trades.list_for_account.assert_not_called()
-        uow.trade_plans.count_for_account.assert_not_called()
+        uow.trades.stats_by_account.assert_not_called()
+        uow.trade_plans.count_by_account.assert_not_called()
 
     def test_uow_context_manager_used(self) -> None:
         """Verifies UoW context manager is entered for session management."""
         uow = _make_uow()
-        uow.trades.list_for_account.return_value = []
-        uow.trade_plans.count_for_account.return_value = 0
+        uow.trades.stats_by_account.return_value = {}
+        uow.trade_plans.count_by_account.return_value = {}
 
         svc = AccountService(uow)
         svc.get_trade_counts(["ACC001"])
@@ -132,6 +132,18 @@ def _mock_uow(
     return uow
 
 
+def _saved_lots(uow: MagicMock) -> list[TaxLot]:
+    """Flatten every batch passed to ``tax_lots.save_many``."""
+    return [lot for call in uow.tax_lots.save_many.call_args_list for lot in call[0][0]]
+
+
+def _updated_lots(uow: MagicMock) -> list[TaxLot]:
+    """Flatten every batch passed to ``tax_lots.update_many``."""
+    return [
+        lot for call in uow.tax_lots.update_many.call_args_list for lot in call[0][0]
+    ]
+
+
 def _compute_expected_hash(trade: Trade) -> str:
     """Mirror the expected hash computation for test verification."""
     raw = f"{trade.exec_id}|{trade.instrument}|{trade.quantity}|{trade.price}|{trade.time.isoformat()}"
@@ -152,7 +164,8 @@ class TestSyncLotsNewCreation:
         report = svc.sync_lots()
 
         assert report.created == 1
-        uow.tax_lots.save.assert_called()
+        uow.tax_lots.save_many.assert_called()
+        uow.tax_lots.save.assert_not_called()
 
     def test_skips_sell_trades(self) -> None:
         """Only BOT trades create lots; SLD trades are ignored."""
@@ -179,7 +192,7 @@ class TestSyncLotsNewCreation:
 
         svc.sync_lots()
 
-        saved_lot = uow.tax_lots.save.call_args[0][0]
+        saved_lot = _saved_lots(uow)[0]
         assert saved_lot.source_hash is not None
         assert len(saved_lot.source_hash) == 64  # SHA-256 hex
 
@@ -190,7 +203,7 @@ class TestSyncLotsNewCreation:
 
         svc.sync_lots()
 
-        saved_lot = uow.tax_lots.save.call_args[0][0]
+        saved_lot = _saved_lots(uow)[0]
         assert saved_lot.materialized_at is not None
 
 
@@ -386,7 +399,7 @@ class TestSyncLotsPerAccount:
 
         # Should only process ACC-1 trade
         assert report.created == 1
-        saved_lot = uow.tax_lots.save.call_args[0][0]
+        saved_lot = _saved_lots(uow)[0]
         assert saved_lot.account_id == "ACC-1"
 
 
@@ -446,10 +459,10 @@ def _mock_uow_with_tracking(
     saved_lots: list[TaxLot] = []
     original_lots = list(lots or [])
 
-    def save_and_track(lot: TaxLot) -> None:
-        saved_lots.append(lot)
+    def save_and_track(lots: list[TaxLot]) -> None:
+        saved_lots.extend(lots)
 
-    uow.tax_lots.save.side_effect = save_and_track
+    uow.tax_lots.save_many.side_effect = save_and_track
 
     # After BOT pass, list_all_filtered should return original + newly saved
     def list_all_with_saved(**kwargs: object) -> list[TaxLot]:
@@ -490,8 +503,7 @@ class TestSyncLotsCloseSLD:
         assert report.created == 1  # BOT creates lot
         assert report.closed == 1  # SLD closes it
         # Verify the lot was updated with close data
-        update_calls = uow.tax_lots.update.call_args_list
-        closed_updates = [call[0][0] for call in update_calls if call[0][0].is_closed]
+        closed_updates = [lot for lot in _updated_lots(uow) if lot.is_closed]
         assert len(closed_updates) == 1
         closed_lot = closed_updates[0]
         assert closed_lot.is_closed is True
@@ -557,8 +569,7 @@ class TestSyncLotsCloseSLD:
         assert report.created == 2  # Both BOTs create lots
         assert report.closed == 1  # Only oldest closed
         # Verify the OLDEST lot was closed (by checking lot_id pattern)
-        update_calls = uow.tax_lots.update.call_args_list
-        closed_updates = [call[0][0] for call in update_calls if call[0][0].is_closed]
+        closed_updates = [lot for lot in _updated_lots(uow) if lot.is_closed]
         assert len(closed_updates) == 1
         assert closed_updates[0].lot_id == "lot-T-BOT-OLD"
 
@@ -574,6 +585,47 @@ class TestSyncLotsCloseSLD:
         assert report.created == 1
         assert report.closed == 0  # Partial not handled
 
+    def test_matches_oldest_lot_of_equal_quantity(self) -> None:
+        """An older lot of a different size does not block the FIFO match."""
+        bot_big = _bot_trade(
+            exec_id="T-BOT-BIG",
+            quantity=300.0,
+            time=datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc),
+        )
+        bot_a = _bot_trade(
+            exec_id="T-BOT-A",
+            time=datetime(2024, 2, 1, 10, 0, tzinfo=timezone.utc),
+        )
+        bot_b = _bot_trade(
+            exec_id="T-BOT-B",
+            time=datetime(2024, 3, 1, 10, 0, tzinfo=timezone.utc),
+        )
+        sells = [_sld_trade(exec_id=f"T-SLD-{i}") for i in range(3)]
+        uow = _mock_uow_with_tracking(trades=[bot_b, bot_big, bot_a, *sells])
+        svc = TaxService(uow)
+
+        report = svc.sync_lots()
+
+        assert report.closed == 2
+        closed_ids = [lot.lot_id for lot in _updated_lots(uow) if lot.is_closed]
+        assert closed_ids == ["lot-T-BOT-A", "lot-T-BOT-B"]
+
+    def test_writes_are_batched(self) -> None:
+        """New lots go through one save_many; closes through update_many."""
+        bots = [_bot_trade(exec_id=f"T-BOT-{i}") for i in range(3)]
+        sell = _sld_trade(exec_id="T-SLD-1")
+        uow = _mock_uow_with_tracking(trades=[*bots, sell])
+        svc = TaxService(uow)
+
+        svc.sync_lots()
+
+        uow.tax_lots.save_many.assert_called_once()
+        assert len(_saved_lots(uow)) == 3
+        assert len(_updated_lots(uow)) == 1
+        uow.tax_lots.save.assert_not_called()
+        uow.tax_lots.update.assert_not_called()
+        uow.commit.assert_called_once()
+
 
 # ── AC-218b E2E: Full pipeline test ─────────────────────────────────────
 
@@ -632,8 +684,7 @@ class TestSyncLotsEndToEnd:
         assert report.skipped == 0
 
         # Verify closed lots have non-zero gains
-        update_calls = uow.tax_lots.update.call_args_list
-        closed_lots = [call[0][0] for call in update_calls if call[0][0].is_closed]
+        closed_lots = [lot for lot in _updated_lots(uow) if lot.is_closed]
         assert len(closed_lots) == 2
         for lot in closed_lots:
             assert lot.is_closed is True
@@ -10,8 +10,9 @@ import pytest
 
 from zorivest_core.application.commands import CreateTrade
 from zorivest_core.domain.entities import Trade
-from zorivest_core.domain.enums import TradeAction
+from zorivest_core.domain.enums import BulkRowStatus, TradeAction
 from zorivest_core.domain.exceptions import BusinessRuleError, NotFoundError
+from zorivest_core.domain.trades.identity import trade_fingerprint
 from zorivest_core.services.trade_service import TradeService
 
 
@@ -75,6 +76,103 @@ class TestCreateTrade:
             svc.create_trade(_make_create_trade_cmd())
 
 
+class TestCreateTradesBulk:
+    """Bulk ingestion: set-based dedup, chunked commits, per-row status."""
+
+    def _uow(self, known_ids=(), known_fps=()) -> MagicMock:
+        uow = _make_uow()
+        uow.trades.existing_exec_ids.return_value = set(known_ids)
+        uow.trades.existing_fingerprints_since.return_value = set(known_fps)
+        return uow
+
+    def test_dedup_uses_set_based_lookups(self) -> None:
+        uow = self._uow()
+        cmds = [
+            _make_create_trade_cmd(exec_id=f"E{i}", price=100.0 + i) for i in range(5)
+        ]
+
+        result = TradeService(uow).create_trades_bulk(cmds)
+
+        assert result.accepted == 5
+        uow.trades.existing_exec_ids.assert_called_once_with(
+            {f"E{i}" for i in range(5)}
+        )
+        uow.trades.existing_fingerprints_since.assert_called_once()
+        uow.trades.exists.assert_not_called()
+        uow.trades.exists_by_fingerprint_since.assert_not_called()
+
+    def test_rows_report_duplicates_in_input_order(self) -> None:
+        stored = Trade(
+            exec_id="OTHER",
+            time=datetime(2025, 1, 15, 10, 30, 0),
+            instrument="AAPL",
+            action=TradeAction.BOT,
+            quantity=100.0,
+            price=42.0,
+            account_id="ACC001",
+        )
+        fp = trade_fingerprint(stored)
+        uow = self._uow(known_ids={"E0"}, known_fps={fp})
+        cmds = [
+            _make_create_trade_cmd(exec_id="E0", price=1.0),  # known exec_id
+            _make_create_trade_cmd(exec_id="E1", price=42.0),  # known fingerprint
+            _make_create_trade_cmd(exec_id="E2", price=2.0),  # new
+            _make_create_trade_cmd(exec_id="E2", price=3.0),  # repeated in batch
+            _make_create_trade_cmd(exec_id="E3", price=2.0),  # same economics as E2
+        ]
+
+        result = TradeService(uow).create_trades_bulk(cmds)
+
+        assert [r.status for r in result.rows] == [
+            BulkRowStatus.DUPLICATE,
+            BulkRowStatus.DUPLICATE,
+            BulkRowStatus.ACCEPTED,
+            BulkRowStatus.DUPLICATE,
+            BulkRowStatus.DUPLICATE,
+        ]
+        assert [r.index for r in result.rows] == [0, 1, 2, 3, 4]
+        assert "fingerprint" in result.rows[1].reason
+
+    def test_inserts_in_chunks(self) -> None:
+        uow = self._uow()
+        cmds = [
+            _make_create_trade_cmd(exec_id=f"E{i}", price=100.0 + i) for i in range(5)
+        ]
+
+        TradeService(uow).create_trades_bulk(cmds, chunk_size=2)
+
+        sizes = [len(c.args[0]) for c in uow.trades.save_many.call_args_list]
+        assert sizes == [2, 2, 1]
+        assert uow.commit.call_count == 3
+
+    def test_failed_chunk_isolates_bad_rows(self) -> None:
+        uow = self._uow()
+        uow.trades.save_many.side_effect = RuntimeError("constraint failed")
+
+        def _save(trade: Trade) -> None:
+            if trade.exec_id == "E1":
+                raise RuntimeError("bad row")
+
+        uow.trades.save.side_effect = _save
+        cmds = [
+            _make_create_trade_cmd(exec_id=f"E{i}", price=100.0 + i) for i in range(3)
+        ]
+
+        result = TradeService(uow).create_trades_bulk(cmds)
+
+        assert [r.status for r in result.rows] == [
+            BulkRowStatus.ACCEPTED,
+            BulkRowStatus.ERROR,
+            BulkRowStatus.ACCEPTED,
+        ]
+        assert result.rows[1].reason == "bad row"
+        assert uow.rollback.call_count == 2
+
+    def test_chunk_size_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            TradeService(self._uow()).create_trades_bulk([], chunk_size=0)
+
+
 class TestGetTrade:
     def test_get_trade_success(self) -> None:
         trade = Trade(
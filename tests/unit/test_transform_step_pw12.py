@@ -373,11 +373,32 @@ class TestOutputKeyAndPresentationMapping:
             assert "symbol" in q, "ticker should be renamed to symbol"
             assert "price" in q, "last should be renamed to price"
 
+    def test_presentation_records_match_per_record_mapping(self) -> None:
+        """Column renames give the same records, including on a name clash."""
+        import pandas as pd
+
+        for df in (
+            pd.DataFrame([{"ticker": "AAPL", "last": 150.0, "volume": 1000}]),
+            pd.DataFrame([{"ticker": "AAPL", "symbol": "AAPL.O", "last": 1.0}]),
+        ):
+            expected = TransformStep._apply_presentation_mapping(df.to_dict("records"))
+            assert TransformStep._presentation_records(df) == expected
+
     def test_params_has_output_key_field(self) -> None:
         """TransformStep.Params accepts output_key with default 'records'."""
         p = TransformStep.Params(target_table="market_ohlcv")
         assert p.output_key == "records"
 
+    def test_params_validation_sample_size(self) -> None:
+        """validation_sample_size is opt-in and must be positive."""
+        from pydantic import ValidationError
+
+        assert TransformStep.Params(target_table="t").validation_sample_size is None
+        p = TransformStep.Params(target_table="t", validation_sample_size=500)
+        assert p.validation_sample_size == 500
+        with pytest.raises(ValidationError):
+            TransformStep.Params(target_table="t", validation_sample_size=0)
+
     def test_params_custom_output_key(self) -> None:
         """TransformStep.Params accepts custom output_key."""
         p = TransformStep.Params(target_table="market_ohlcv", output_key="quotes")
@@ -464,3 +485,202 @@ class TestZeroRecordWarning:
 
         with pytest.raises(ValidationError):
             TransformStep.Params(target_table="market_ohlcv", min_records=-1)
+
+
+# ---------------------------------------------------------------------------
+# Single-parse hand-off: FetchStep records → TransformStep
+# ---------------------------------------------------------------------------
+
+
+class TestParsedRecordHandoff:
+    """TransformStep consumes the fetch step's parsed ``records`` instead of
+    parsing the raw ``content`` a second time, and leaves them unmodified
+    (they may be shared with the fetch cache's memory tier)."""
+
+    @staticmethod
+    def _polygon_payload() -> dict:
+        return {
+            "results": [
+                {
+                    "o": 100.0,
+                    "h": 110.0,
+                    "l": 95.0,
+                    "c": 105.0,
+                    "v": 1000,
+                    "t": 1773619200000,
+                },
+                {
+                    "o": 200.0,
+                    "h": 210.0,
+                    "l": 195.0,
+                    "c": 205.0,
+                    "v": 2000,
+                    "t": 1773705600000,
+                },
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_fetch_output_transforms_without_reparsing(self) -> None:
+        from unittest.mock import AsyncMock, patch
+
+        from zorivest_core.pipeline_steps.fetch_step import FetchStep
+
+        adapter = AsyncMock()
+        adapter.fetch.return_value = {
+            "content": json.dumps(self._polygon_payload()).encode(),
+            "cache_status": "miss",
+            "etag": None,
+            "last_modified": None,
+        }
+        ctx = _make_context(outputs={"provider_adapter": adapter})
+        fetch = await FetchStep().execute(
+            params={
+                "provider": "Polygon.io",
+                "data_type": "ohlcv",
+                "criteria": {"symbol": "AAPL"},
+                "use_cache": False,
+            },
+            context=ctx,
+        )
+        assert "content" not in fetch.output
+
+        writer = _mock_writer()
+        ctx.outputs["fetch_polygon"] = fetch.output
+        ctx.outputs["db_writer"] = writer
+        with patch(
+            "zorivest_infra.market_data.response_extractors.extract_records",
+            side_effect=AssertionError("raw content parsed again"),
+        ):
+            result = await TransformStep().execute(
+                params={"target_table": "market_ohlcv"},
+                context=ctx,
+            )
+
+        assert result.status == PipelineStatus.SUCCESS
+        assert result.output["records_written"] == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_records_are_not_modified(self) -> None:
+        import copy
+
+        parsed = self._polygon_payload()
+        snapshot = copy.deepcopy(parsed)
+        writer = _mock_writer()
+        ctx = _make_context(
+            outputs={
+                "fetch_polygon": {
+                    "records": parsed,
+                    "provider": "Polygon.io",
+                    "data_type": "ohlcv",
+                },
+                "db_writer": writer,
+            },
+        )
+
+        result = await TransformStep().execute(
+            params={"target_table": "market_ohlcv"},
+            context=ctx,
+        )
+
+        assert result.status == PipelineStatus.SUCCESS
+        assert parsed == snapshot
+
+
+# ---------------------------------------------------------------------------
+# Columnar OHLCV: parallel arrays stay columns into the DataFrame
+# ---------------------------------------------------------------------------
+
+
+class TestColumnarOhlcv:
+    """A Yahoo chart is extracted, mapped and enriched column by column,
+    with the same result as going through one dict per bar."""
+
+    @staticmethod
+    def _chart_payload() -> dict:
+        return {
+            "chart": {
+                "result": [
+                    {
+                        "meta": {"symbol": "AAPL"},
+                        "timestamp": [1773619200, 1773705600, 1773792000],
+                        "indicators": {
+                            "quote": [
+                                {
+                                    "open": [100, 200.5, None],
+                                    "high": [110, 210.5, None],
+                                    "low": [95, 195.5, None],
+                                    "close": [105, 205.5, None],
+                                    "volume": [1000, 2000, None],
+                                }
+                            ]
+                        },
+                    }
+                ],
+                "error": None,
+            }
+        }
+
+    async def _run(self, parsed: dict) -> tuple:
+        writer = _mock_writer()
+        ctx = _make_context(
+            outputs={
+                "fetch_yahoo": {
+                    "records": parsed,
+                    "provider": "Yahoo Finance",
+                    "data_type": "ohlcv",
+                },
+                "db_writer": writer,
+            },
+        )
+        result = await TransformStep().execute(
+            params={"target_table": "market_ohlcv", "quality_threshold": 0.5},
+            context=ctx,
+        )
+        return result, writer.write.call_args.kwargs["df"]
+
+    @pytest.mark.asyncio
+    async def test_columnar_path_skips_row_extraction(self) -> None:
+        from unittest.mock import patch
+
+        with patch(
+            "zorivest_infra.market_data.response_extractors.extract_parsed_records",
+            side_effect=AssertionError("chart zipped into rows"),
+        ):
+            result, df = await self._run(self._chart_payload())
+
+        assert result.status == PipelineStatus.SUCCESS
+        # The all-null bar is quarantined; whole-number prices became floats
+        assert result.output["records_quarantined"] == 1
+        assert list(df["open"]) == [100.0, 200.5]
+        assert str(df["open"].dtype) == "float64"
+
+    @pytest.mark.asyncio
+    async def test_matches_row_path(self) -> None:
+        import pandas as pd
+        from unittest.mock import patch
+
+        payload = self._chart_payload()
+        # Floats throughout, so the row path does not trip on int prices
+        quote = payload["chart"]["result"][0]["indicators"]["quote"][0]
+        for field in ("open", "high", "low", "close"):
+            quote[field] = [None if v is None else float(v) for v in quote[field]]
+
+        columnar, columnar_df = await self._run(payload)
+        with patch.object(TransformStep, "_extract_parsed_columns", return_value=None):
+            rows, rows_df = await self._run(payload)
+
+        pd.testing.assert_frame_equal(columnar_df, rows_df)
+        assert columnar.output == rows.output
+        assert columnar.output["records"][0]["_extra"] == {}
+
+    @pytest.mark.asyncio
+    async def test_parsed_payload_is_not_modified(self) -> None:
+        import copy
+
+        parsed = self._chart_payload()
+        snapshot = copy.deepcopy(parsed)
+
+        await self._run(parsed)
+
+        assert parsed == snapshot
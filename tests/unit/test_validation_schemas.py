@@ -358,3 +358,111 @@ class TestSchemaTypes:
         import pandera as pa
 
         assert isinstance(FUNDAMENTALS_SCHEMA, pa.DataFrameSchema)
+
+
+# ── Row masks and sampled validation ──────────────────────────────────────
+
+
+def _ohlcv_frame(n: int = 10, bad: tuple[int, ...] = ()) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "open": [100.0 + i for i in range(n)],
+            "high": [110.0 + i for i in range(n)],
+            "low": [95.0 + i for i in range(n)],
+            "close": [105.0 + i for i in range(n)],
+            "volume": [1000.0 * (i + 1) for i in range(n)],
+        }
+    )
+    df.loc[list(bad), "open"] = -1.0
+    return df
+
+
+class TestMaskValidation:
+    """Row masks agree with pandera's own verdict, row for row."""
+
+    def test_quarantine_matches_pandera(self) -> None:
+        from zorivest_core.services.validation_gate import (
+            OHLCV_SCHEMA,
+            _validate_with_pandera,
+        )
+
+        df = _ohlcv_frame(bad=(2, 7))
+        df.loc[4, "volume"] = None
+
+        valid, quarantined = validate_dataframe(df, schema_name="ohlcv")
+        expected_valid, expected_quarantined = _validate_with_pandera(OHLCV_SCHEMA, df)
+
+        assert list(quarantined.index) == [2, 4, 7]
+        assert list(valid.index) == list(expected_valid.index)
+        assert list(quarantined.index) == list(expected_quarantined.index)
+        # Valid rows come back coerced, as from a clean pandera run
+        assert str(valid["volume"].dtype) == "int64"
+
+    def test_clean_frame_matches_pandera_output(self) -> None:
+        from zorivest_core.services.validation_gate import OHLCV_SCHEMA
+
+        df = _ohlcv_frame()
+        valid, quarantined = validate_dataframe(df, schema_name="ohlcv")
+
+        pd.testing.assert_frame_equal(valid, OHLCV_SCHEMA.validate(df))
+        assert quarantined.empty
+
+    def test_wrong_dtype_quarantines_everything(self) -> None:
+        df = _ohlcv_frame().astype({"open": "int64"})
+        valid, quarantined = validate_dataframe(df, schema_name="ohlcv")
+        assert valid.empty
+        assert len(quarantined) == len(df)
+
+    def test_duplicate_index_labels(self) -> None:
+        single = _ohlcv_frame(n=2, bad=(1,))
+        df = pd.concat([single, single])
+
+        valid, quarantined = validate_dataframe(df, schema_name="ohlcv")
+
+        assert list(valid.index) == [0, 0]
+        assert list(quarantined.index) == [1, 1]
+
+    def test_unsupported_schema_uses_pandera(self, monkeypatch) -> None:
+        import pandera as pa
+
+        from zorivest_core.services import validation_gate
+
+        schema = pa.DataFrameSchema(
+            validation_gate.OHLCV_SCHEMA.columns,
+            checks=pa.Check(lambda d: d["high"] >= d["low"]),
+        )
+        monkeypatch.setitem(validation_gate.SCHEMA_REGISTRY, "ohlcv", schema)
+        df = _ohlcv_frame()
+        df.loc[3, "high"] = 1.0
+
+        valid, quarantined = validate_dataframe(df, schema_name="ohlcv")
+
+        assert validation_gate._compiled_rules("ohlcv", schema) is None
+        assert list(quarantined.index) == [3]
+
+
+class TestSampledValidation:
+    """sample_size: value rules on a sample, the rest accepted if it passes."""
+
+    def test_clean_frame_is_accepted_and_coerced(self) -> None:
+        valid, quarantined = validate_dataframe(
+            _ohlcv_frame(n=50), schema_name="ohlcv", sample_size=5
+        )
+        assert len(valid) == 50
+        assert quarantined.empty
+        assert str(valid["volume"].dtype) == "int64"
+
+    def test_failing_sample_validates_every_row(self) -> None:
+        # Nine of ten rows are bad, so any sample of five contains one
+        df = _ohlcv_frame(bad=tuple(range(9)))
+        valid, quarantined = validate_dataframe(df, schema_name="ohlcv", sample_size=5)
+        assert list(valid.index) == [9]
+        assert len(quarantined) == 9
+
+    def test_dtypes_are_checked_in_full(self) -> None:
+        df = _ohlcv_frame(n=50)
+        df["volume"] = df["volume"].astype(object)
+        df.loc[49, "volume"] = "n/a"  # not coercible; the sample of 1 may miss it
+        valid, quarantined = validate_dataframe(df, schema_name="ohlcv", sample_size=1)
+        assert 49 in quarantined.index
+        assert 49 not in valid.index
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""TransformStep on a Yahoo chart OHLCV response: row-wise vs columnar.
+
+Hands a parsed Yahoo v8/chart payload (as FetchStep outputs it) to
+``TransformStep`` two ways:
+
+* ``rows``: the chart's parallel arrays are zipped into one dict per bar,
+  each dict is field-mapped and enriched, and the list becomes the
+  DataFrame. This is what every response went through before the
+  columnar path.
+* ``columns``: the arrays are renamed, enriched and cast as whole columns
+  and become the DataFrame directly.
+
+Two stages are timed: ``frame`` (extract, map, enrich, build the
+DataFrame) and ``execute`` (the whole step: validation, the writer's
+``to_dict`` at the write boundary, and the output records). Reports the
+median time, bars per second, and the peak traced memory of ``execute``.
+
+Usage:
+    uv run python tools/bench_columnar_transform.py
+    uv run python tools/bench_columnar_transform.py --bars 1000000 --repeat 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+from zorivest_core.domain.pipeline import StepContext
+from zorivest_core.pipeline_steps.transform_step import TransformStep
+
+_START = 1_262_615_400  # 2010-01-04 14:30 UTC
+_PROVIDER = "Yahoo Finance"
+
+
+def _chart(bars: int, seed: int) -> dict[str, Any]:
+    rng = random.Random(seed)
+    opens, highs, lows, closes, volumes = [], [], [], [], []
+    price = 50.0
+    for _ in range(bars):
+        price *= 1 + rng.gauss(0, 0.001)
+        o = price * (1 + rng.gauss(0, 0.0005))
+        opens.append(round(o, 4))
+        highs.append(round(max(o, price) * 1.0005, 4))
+        lows.append(round(min(o, price) * 0.9995, 4))
+        closes.append(round(price, 4))
+        volumes.append(rng.randint(100, 500_000))
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"symbol": "BENCH", "dataGranularity": "1m"},
+                    "timestamp": [_START + 60 * i for i in range(bars)],
+                    "indicators": {
+                        "quote": [
+                            {
+                                "open": opens,
+                                "high": highs,
+                                "low": lows,
+                                "close": closes,
+                                "volume": volumes,
+                            }
+                        ]
+                    },
+                }
+            ],
+            "error": None,
+        }
+    }
+
+
+class _Writer:
+    """Stops at the write boundary: builds the row dicts, writes nothing."""
+
+    def write(self, *, df: Any, table: str, disposition: str) -> int:
+        return len(df.to_dict(orient="records"))
+
+
+def _frame(step: TransformStep, chart: dict[str, Any], columnar: bool) -> Any:
+    import pandas as pd
+
+    if columnar:
+        columns = step._extract_parsed_columns(chart, _PROVIDER, "ohlcv")
+        columns = step._apply_column_mapping(columns, _PROVIDER, "ohlcv")
+        columns = step._enrich_columns(columns, _PROVIDER)
+        return step._columns_to_frame(columns, "ohlcv")
+    records = step._extract_parsed_records(chart, _PROVIDER, "ohlcv")
+    records = step._apply_mapping(records, _PROVIDER, "ohlcv")
+    return pd.DataFrame(step._enrich_records(records, _PROVIDER))
+
+
+def _execute(step: TransformStep, chart: dict[str, Any], columnar: bool) -> Any:
+    context = StepContext(
+        run_id="bench",
+        policy_id="bench",
+        outputs={
+            "fetch": {"records": chart, "provider": _PROVIDER, "data_type": "ohlcv"},
+            "db_writer": _Writer(),
+        },
+    )
+    run = step.execute(params={"target_table": "market_ohlcv"}, context=context)
+    if columnar:
+        return asyncio.run(run)
+    with patch.object(TransformStep, "_extract_parsed_columns", return_value=None):
+        return asyncio.run(run)
+
+
+def _median(fn: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return statistics.median(timings)
+
+
+def _peak(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Columnar transform benchmark")
+    parser.add_argument(
+        "--bars", type=int, default=250_000, help="Minute bars in the chart"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    chart = _chart(args.bars, args.seed)
+    step = TransformStep()
+    _execute(step, chart, columnar=True)  # warm up imports and schemas
+
+    mb = 1024 * 1024
+    print(f"{args.bars:,} bars")
+    print(f"{'':18} {'time':>9} {'bars/s':>12} {'peak mem':>10}")
+    for columnar in (False, True):
+        label = "columns" if columnar else "rows"
+        frame_s = _median(lambda c=columnar: _frame(step, chart, c), args.repeat)
+        execute_s = _median(lambda c=columnar: _execute(step, chart, c), args.repeat)
+        peak = _peak(lambda c=columnar: _execute(step, chart, c))
+        print(f"{label + ' frame':18} {frame_s:>8.2f}s {args.bars / frame_s:>12,.0f}")
+        print(
+            f"{label + ' execute':18} {execute_s:>8.2f}s "
+            f"{args.bars / execute_s:>12,.0f} {peak / mb:>8.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Oversized provider response: buffered download vs streamed with early abort.
+
+Serves a response far larger than FetchStep's 5 MB body cap through an
+in-process ``httpx.MockTransport`` (no network) and rejects it with
+``fetch_with_cache`` two ways:
+
+* ``buffered``: a client without ``stream()``. The whole body is read
+  into memory before the cap is checked, which is how every fetch worked
+  before streaming.
+* ``streamed``: ``HttpxClient``. The body is read in chunks and the
+  download is abandoned at the first chunk past the cap.
+
+Both run with and without a ``Content-Length`` header (with one, the
+streamed path rejects before reading anything). Reports peak traced
+memory, bytes pulled from the transport, and time to rejection.
+
+Usage:
+    uv run python tools/bench_fetch_body_cap.py
+    uv run python tools/bench_fetch_body_cap.py --body-mb 500 --cap-mb 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Any
+
+import httpx
+
+from zorivest_core.services.sql_sandbox import SecurityError
+from zorivest_infra.market_data.http_cache import fetch_with_cache
+from zorivest_infra.market_data.service_factory import HttpxClient
+
+_CHUNK = 64 * 1024
+
+
+class _Body(httpx.AsyncByteStream):
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self.pulled = 0
+
+    async def __aiter__(self):
+        while self.pulled < self._size:
+            self.pulled += _CHUNK
+            yield bytes(_CHUNK)  # a fresh buffer per chunk, like a socket read
+
+
+class _BufferedClient:
+    """HttpxClient without ``stream()``: get() returns a fully read response."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    async def get(self, url: str, headers: dict[str, str], timeout: Any) -> Any:
+        return await self._client.get(url, headers=headers, timeout=timeout)
+
+
+async def _reject(streamed: bool, body_bytes: int, cap: int, declare: bool) -> dict:
+    body = _Body(body_bytes)
+    headers = {"Content-Type": "application/json"}
+    if declare:
+        headers["Content-Length"] = str(body_bytes)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers=headers, stream=body)
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = HttpxClient(http) if streamed else _BufferedClient(http)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        await fetch_with_cache(
+            client=client, url="https://provider.test/chart", max_body_bytes=cap
+        )
+    except SecurityError:
+        pass
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await http.aclose()
+    return {"peak": peak, "pulled": min(body.pulled, body_bytes), "seconds": elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Body size cap benchmark")
+    parser.add_argument("--body-mb", type=int, default=200)
+    parser.add_argument("--cap-mb", type=int, default=5)
+    args = parser.parse_args()
+
+    mb = 1024 * 1024
+    body, cap = args.body_mb * mb, args.cap_mb * mb
+    print(f"{args.body_mb} MB response, {args.cap_mb} MB cap")
+    print(f"{'':34} {'peak mem':>10} {'pulled':>10} {'time':>9}")
+    for declare in (False, True):
+        for streamed in (False, True):
+            r = asyncio.run(_reject(streamed, body, cap, declare))
+            label = (
+                f"{'streamed' if streamed else 'buffered'}, "
+                f"{'with' if declare else 'no'} Content-Length"
+            )
+            print(
+                f"{label:34} {r['peak'] / mb:>8.1f}MB {r['pulled'] / mb:>8.1f}MB "
+                f"{r['seconds'] * 1000:>7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
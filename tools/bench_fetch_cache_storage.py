@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Fetch cache storage size: legacy text rows vs compressed, shared blobs.
+
+Builds a SQLite database holding a realistic fetch cache in the legacy
+shape (uncompressed ``payload_json`` per row): a year of daily Yahoo chart
+bars and a fundamentals document per ticker, cached under several entity
+keys per ticker the way different policies' criteria produce them. Then
+runs ``migrate_fetch_cache_payloads`` and reports file size before and
+after (both measured after ``VACUUM``).
+
+Usage:
+    uv run python tools/bench_fetch_cache_storage.py
+    uv run python tools/bench_fetch_cache_storage.py --tickers 500 --keys-per-ticker 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import tempfile
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from zorivest_infra.database.migrate_fetch_cache import migrate_fetch_cache_payloads
+from zorivest_infra.database.models import Base, FetchCacheModel
+
+
+def _chart(ticker: str, rng: random.Random, days: int = 252) -> str:
+    start = datetime(2025, 1, 2, 14, 30, tzinfo=timezone.utc)
+    stamps, opens, highs, lows, closes, volumes = [], [], [], [], [], []
+    price = rng.uniform(20, 400)
+    for i in range(days):
+        price *= 1 + rng.gauss(0, 0.015)
+        o = price * (1 + rng.gauss(0, 0.004))
+        stamps.append(int((start + timedelta(days=i)).timestamp()))
+        opens.append(round(o, 4))
+        highs.append(round(max(o, price) * (1 + abs(rng.gauss(0, 0.006))), 4))
+        lows.append(round(min(o, price) * (1 - abs(rng.gauss(0, 0.006))), 4))
+        closes.append(round(price, 4))
+        volumes.append(rng.randint(100_000, 90_000_000))
+    quote = {"open": opens, "high": highs, "low": lows, "close": closes}
+    return json.dumps(
+        {
+            "chart": {
+                "result": [
+                    {
+                        "meta": {"symbol": ticker, "currency": "USD"},
+                        "timestamp": stamps,
+                        "indicators": {
+                            "quote": [quote | {"volume": volumes}],
+                            "adjclose": [{"adjclose": closes}],
+                        },
+                    }
+                ],
+                "error": None,
+            }
+        }
+    )
+
+
+def _fundamentals(ticker: str, rng: random.Random) -> str:
+    periods = [
+        {
+            "date": f"{2025 - q // 4}-{(3 - q % 4) * 3 + 3:02d}-30",
+            "revenue": rng.randint(10**8, 10**11),
+            "netIncome": rng.randint(-(10**9), 10**10),
+            "eps": round(rng.uniform(-2, 12), 4),
+            "grossProfitRatio": round(rng.uniform(0.1, 0.8), 6),
+            "operatingCashFlow": rng.randint(10**7, 10**10),
+        }
+        for q in range(20)
+    ]
+    return json.dumps([{"symbol": ticker, "period": "quarter", **p} for p in periods])
+
+
+def _legacy_rows(tickers: int, keys_per_ticker: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = []
+    for n in range(tickers):
+        ticker = f"T{n:04d}"
+        for data_type, body in (
+            ("ohlcv", _chart(ticker, rng)),
+            ("fundamentals", _fundamentals(ticker, rng)),
+        ):
+            digest = hashlib.sha256(body.encode()).hexdigest()
+            for k in range(keys_per_ticker):
+                rows.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "provider": "Yahoo Finance",
+                        "data_type": data_type,
+                        "entity_key": hashlib.sha256(
+                            f"{ticker}|{k}".encode()
+                        ).hexdigest(),
+                        "payload_json": body,
+                        "content_hash": digest,
+                        "fetched_at": now,
+                        "ttl_seconds": 3600,
+                    }
+                )
+    return rows
+
+
+def _vacuumed_size(engine, path: str) -> int:  # noqa: ANN001
+    with engine.connect() as conn:
+        conn.execute(text("VACUUM"))
+    return os.path.getsize(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fetch cache storage size benchmark")
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument(
+        "--keys-per-ticker",
+        type=int,
+        default=3,
+        help="Entity keys caching the same payload (policies with different criteria)",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        rows = _legacy_rows(args.tickers, args.keys_per_ticker, args.seed)
+        with engine.begin() as conn:
+            conn.execute(FetchCacheModel.__table__.insert(), rows)
+        payload_bytes = sum(len(r["payload_json"].encode()) for r in rows)
+        before = _vacuumed_size(engine, path)
+
+        with Session(engine) as session:
+            migrated = migrate_fetch_cache_payloads(session)
+            session.commit()
+        after = _vacuumed_size(engine, path)
+        engine.dispose()
+
+    mb = 1024 * 1024
+    print(f"rows               {len(rows):>10,} ({migrated:,} migrated)")
+    print(f"raw payload        {payload_bytes / mb:>10.1f} MB")
+    print(f"db size, legacy    {before / mb:>10.1f} MB")
+    print(f"db size, blobs     {after / mb:>10.1f} MB")
+    print(f"reduction          {before / after:>10.1f}x ({1 - after / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""FetchStep → TransformStep hand-off: raw content vs parsed records.
+
+Feeds a ~5 MB Yahoo chart OHLCV body through ``FetchStep`` (stub adapter,
+no cache) and then through TransformStep's record extraction, both ways:
+
+* ``content``: the fetch output also carries the raw body and the
+  transform extracts from it (parsing the JSON a second time), which is
+  what every pipeline did before ``include_content`` existed.
+* ``records``: the default; the transform unwraps the records FetchStep
+  already parsed.
+
+For each it reports the extraction time, the peak memory of fetch plus
+hand-off (tracemalloc), and the size of the step output that the runner
+persists to ``pipeline_steps.output_json``.
+
+Usage:
+    uv run python tools/bench_fetch_transform_handoff.py
+    uv run python tools/bench_fetch_transform_handoff.py --mb 2 --repeat 9
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from zorivest_core.domain.pipeline import StepContext
+from zorivest_core.pipeline_steps.fetch_step import FetchStep
+from zorivest_core.pipeline_steps.transform_step import TransformStep
+from zorivest_core.services.pipeline_runner import _safe_json_output
+
+# Serialized size of one bar across the chart's parallel arrays
+_BYTES_PER_BAR = 53
+
+
+def _chart_body(target_bytes: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    bars = target_bytes // _BYTES_PER_BAR
+    start = datetime(2000, 1, 3, 14, 30, tzinfo=timezone.utc)
+    stamps, opens, highs, lows, closes, volumes = [], [], [], [], [], []
+    price = 50.0
+    for i in range(bars):
+        price *= 1 + rng.gauss(0, 0.015)
+        o = price * (1 + rng.gauss(0, 0.004))
+        stamps.append(int((start + timedelta(minutes=5 * i)).timestamp()))
+        opens.append(round(o, 4))
+        highs.append(round(max(o, price) * (1 + abs(rng.gauss(0, 0.006))), 4))
+        lows.append(round(min(o, price) * (1 - abs(rng.gauss(0, 0.006))), 4))
+        closes.append(round(price, 4))
+        volumes.append(rng.randint(100_000, 90_000_000))
+    quote = {"open": opens, "high": highs, "low": lows, "close": closes}
+    return json.dumps(
+        {
+            "chart": {
+                "result": [
+                    {
+                        "meta": {"symbol": "BENCH", "currency": "USD"},
+                        "timestamp": stamps,
+                        "indicators": {"quote": [quote | {"volume": volumes}]},
+                    }
+                ],
+                "error": None,
+            }
+        }
+    ).encode()
+
+
+class _StubAdapter:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def fetch(self, **_: Any) -> dict[str, Any]:
+        return {
+            "content": self._body,
+            "cache_status": "miss",
+            "etag": None,
+            "last_modified": None,
+        }
+
+
+async def _fetch(body: bytes, include_content: bool) -> dict[str, Any]:
+    context = StepContext(
+        run_id="bench",
+        policy_id="bench",
+        outputs={"provider_adapter": _StubAdapter(body)},
+    )
+    result = await FetchStep().execute(
+        params={
+            "provider": "Yahoo Finance",
+            "data_type": "ohlcv",
+            "criteria": {"symbol": "BENCH"},
+            "use_cache": False,
+            "gap_fill": False,
+            "max_body_bytes": len(body),
+            "include_content": include_content,
+        },
+        context=context,
+    )
+    return result.output
+
+
+def _hand_off(output: dict[str, Any]) -> list[dict]:
+    transform = TransformStep()
+    if "content" in output:
+        return transform._extract_records(
+            output["content"], output["provider"], output["data_type"]
+        )
+    return transform._extract_parsed_records(
+        output["records"], output["provider"], output["data_type"]
+    )
+
+
+def _measure(body: bytes, include_content: bool, repeat: int) -> dict[str, float]:
+    output = asyncio.run(_fetch(body, include_content))
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        records = _hand_off(output)
+        timings.append(time.perf_counter() - t0)
+    bars = len(records)
+    persisted = len(_safe_json_output(output) or "")
+    del output, records
+
+    tracemalloc.start()
+    output = asyncio.run(_fetch(body, include_content))
+    records = _hand_off(output)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del output, records
+
+    return {
+        "bars": bars,
+        "extract_s": statistics.median(timings),
+        "peak_bytes": peak,
+        "persisted_bytes": persisted,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="FetchStep → TransformStep hand-off benchmark"
+    )
+    parser.add_argument("--mb", type=float, default=5.0, help="Response body size")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    body = _chart_body(int(args.mb * 1024 * 1024), args.seed)
+    before = _measure(body, include_content=True, repeat=args.repeat)
+    after = _measure(body, include_content=False, repeat=args.repeat)
+
+    mb = 1024 * 1024
+    print(f"body               {len(body) / mb:>8.2f} MB, {after['bars']:,} bars")
+    print(f"{'':18} {'content':>10} {'records':>10}")
+    print(
+        f"extract            {before['extract_s'] * 1000:>8.1f}ms "
+        f"{after['extract_s'] * 1000:>8.1f}ms"
+    )
+    print(
+        f"peak memory        {before['peak_bytes'] / mb:>8.1f}MB "
+        f"{after['peak_bytes'] / mb:>8.1f}MB"
+    )
+    print(
+        f"output_json        {before['persisted_bytes'] / mb:>8.1f}MB "
+        f"{after['persisted_bytes'] / mb:>8.1f}MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Multi-ticker fetch benchmark against a local stub HTTP server.
+
+Starts a threaded HTTP server that answers Yahoo v8/chart requests after a
+fixed delay (simulated round trip) and times
+``MarketDataProviderAdapter.fetch`` for a watchlist of N tickers through a
+real ``httpx.AsyncClient`` and ``PipelineRateLimiter``. ``--compare`` also
+runs each size with ``max_concurrent=1``, which serializes the per-ticker
+requests the way the old one-at-a-time loop did.
+
+Usage:
+    uv run python tools/bench_multi_ticker.py                     # 50, 300 tickers
+    uv run python tools/bench_multi_ticker.py --tickers 300 --latency-ms 80 --compare
+    uv run python tools/bench_multi_ticker.py --compare --min-speedup 3  # exit 1 if slower
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from unittest.mock import patch
+
+import httpx
+import structlog
+
+from zorivest_infra.market_data.market_data_adapter import MarketDataProviderAdapter
+from zorivest_infra.market_data.pipeline_rate_limiter import PipelineRateLimiter
+from zorivest_infra.market_data.provider_registry import PROVIDER_REGISTRY
+
+_PROVIDER = "Yahoo Finance"
+
+
+def _handler(latency_s: float) -> type[BaseHTTPRequestHandler]:
+    class ChartHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            time.sleep(latency_s)
+            symbol = self.path.split("?")[0].rstrip("/").rsplit("/", 1)[-1]
+            body = json.dumps(
+                {"chart": {"result": [{"meta": {"symbol": symbol}}]}}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    return ChartHandler
+
+
+@contextmanager
+def _stub_server(latency_s: float) -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(latency_s))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def _fetch_seconds(n: int, max_concurrent: int) -> float:
+    tickers = [f"T{i:04d}" for i in range(n)]
+    limits = httpx.Limits(max_connections=max_concurrent)
+    async with httpx.AsyncClient(limits=limits) as client:
+        adapter = MarketDataProviderAdapter(
+            http_client=client,
+            rate_limiter=PipelineRateLimiter({}, max_concurrent=max_concurrent),
+        )
+        start = time.perf_counter()
+        result = await adapter.fetch(
+            provider=_PROVIDER,
+            data_type="quote",
+            criteria={"tickers": tickers},
+        )
+        elapsed = time.perf_counter() - start
+    symbols = [
+        r.get("symbol") or r.get("ticker") for r in json.loads(result["content"])
+    ]
+    assert symbols == tickers, "records out of ticker order"
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Multi-ticker fetch benchmark")
+    parser.add_argument("--tickers", type=int, nargs="+", default=[50, 300])
+    parser.add_argument(
+        "--latency-ms", type=float, default=50.0, help="Stub server delay per request"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="PipelineRateLimiter max_concurrent for the concurrent run",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Also time the serialized (max_concurrent=1) path",
+    )
+    parser.add_argument(
+        "--min-speedup",
+        type=float,
+        default=None,
+        help="With --compare, fail (exit 1) if the largest run is less than this much faster",
+    )
+    args = parser.parse_args()
+    # One info line per ticker request would dominate the output.
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+
+    speedup = None
+    with _stub_server(args.latency_ms / 1000) as base_url:
+        config = replace(PROVIDER_REGISTRY[_PROVIDER], base_url=base_url)
+        with patch.dict(PROVIDER_REGISTRY, {_PROVIDER: config}):
+            for n in args.tickers:
+                fast = asyncio.run(_fetch_seconds(n, args.concurrency))
+                line = (
+                    f"{n:>6,} tickers   concurrent({args.concurrency}) "
+                    f"{fast:7.2f} s ({n / fast:7,.0f} req/s)"
+                )
+                if args.compare:
+                    slow = asyncio.run(_fetch_seconds(n, 1))
+                    speedup = slow / fast
+                    line += f"   serialized {slow:7.2f} s ({speedup:4.1f}x)"
+                print(line, flush=True)
+
+    failed = (
+        args.min_speedup is not None
+        and speedup is not None
+        and speedup < args.min_speedup
+    )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
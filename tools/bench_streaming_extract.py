@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Record extraction from large OHLCV bodies: parse tree vs incremental.
+
+Generates minute-bar responses in the three large shapes (Yahoo chart,
+Polygon aggs, Alpha Vantage intraday time series) and extracts records
+three ways:
+
+* ``tree``: ``json.loads`` then the envelope extractor, which is what
+  ``extract_records`` did for every body before the streaming path.
+* ``stream``: ``iter_records`` collected into a list, which is what
+  ``extract_records`` now does for Polygon and Alpha Vantage bodies over
+  ``STREAM_MIN_BYTES`` (a Yahoo chart is columnar, so the list is as
+  large as the tree and it stays on the tree path).
+* ``iterate``: ``iter_records`` consumed one record at a time, for a
+  caller that does not need the whole list.
+
+Reports the median time and the peak traced memory of each. The body
+itself is allocated before tracing starts.
+
+Usage:
+    uv run python tools/bench_streaming_extract.py
+    uv run python tools/bench_streaming_extract.py --bars 980000 --repeat 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from zorivest_infra.market_data.json_stream import iter_chunks
+from zorivest_infra.market_data.response_extractors import (
+    extract_parsed_records,
+    iter_records,
+)
+
+_START = 1_262_615_400  # 2010-01-04 14:30 UTC
+
+
+def _walk(rng: random.Random, bars: int) -> list[tuple[float, ...]]:
+    price, rows = 50.0, []
+    for _ in range(bars):
+        price *= 1 + rng.gauss(0, 0.001)
+        o = price * (1 + rng.gauss(0, 0.0005))
+        rows.append(
+            (
+                round(o, 4),
+                round(max(o, price) * 1.0005, 4),
+                round(min(o, price) * 0.9995, 4),
+                round(price, 4),
+                rng.randint(100, 500_000),
+            )
+        )
+    return rows
+
+
+def _yahoo(rows: list[tuple[float, ...]]) -> bytes:
+    opens, highs, lows, closes, volumes = (list(c) for c in zip(*rows))
+    return json.dumps(
+        {
+            "chart": {
+                "result": [
+                    {
+                        "meta": {"symbol": "BENCH", "dataGranularity": "1m"},
+                        "timestamp": [_START + 60 * i for i in range(len(rows))],
+                        "indicators": {
+                            "quote": [
+                                {
+                                    "open": opens,
+                                    "high": highs,
+                                    "low": lows,
+                                    "close": closes,
+                                    "volume": volumes,
+                                }
+                            ]
+                        },
+                    }
+                ],
+                "error": None,
+            }
+        }
+    ).encode()
+
+
+def _polygon(rows: list[tuple[float, ...]]) -> bytes:
+    results = [
+        {
+            "v": v,
+            "vw": c,
+            "o": o,
+            "c": c,
+            "h": h,
+            "l": lo,
+            "t": (_START + 60 * i) * 1000,
+        }
+        for i, (o, h, lo, c, v) in enumerate(rows)
+    ]
+    return json.dumps(
+        {"ticker": "BENCH", "resultsCount": len(rows), "results": results}
+    ).encode()
+
+
+def _alpha_vantage(rows: list[tuple[float, ...]]) -> bytes:
+    series = {
+        time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(_START + 60 * i)): {
+            "1. open": f"{o:.4f}",
+            "2. high": f"{h:.4f}",
+            "3. low": f"{lo:.4f}",
+            "4. close": f"{c:.4f}",
+            "5. volume": str(v),
+        }
+        for i, (o, h, lo, c, v) in enumerate(rows)
+    }
+    return json.dumps(
+        {"Meta Data": {"2. Symbol": "BENCH"}, "Time Series (1min)": series}
+    ).encode()
+
+
+_SHAPES = {
+    "yahoo": ("Yahoo Finance", _yahoo),
+    "polygon": ("Polygon.io", _polygon),
+    "alpha_vantage": ("Alpha Vantage", _alpha_vantage),
+}
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming extraction benchmark")
+    parser.add_argument(
+        "--bars", type=int, default=250_000, help="Minute bars per body"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--shape", choices=sorted(_SHAPES), action="append")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = _walk(random.Random(args.seed), args.bars)
+    mb = 1024 * 1024
+    print(f"{args.bars:,} bars")
+    print(f"{'':24} {'time':>9} {'bars/s':>11} {'peak mem':>10}")
+    for shape in args.shape or list(_SHAPES):
+        provider, build = _SHAPES[shape]
+        body = build(rows)
+        print(f"{shape} ({len(body) / mb:.1f} MB body)")
+        ways = {
+            "tree": lambda b=body, p=provider: extract_parsed_records(
+                json.loads(b), p, "ohlcv"
+            ),
+            "stream": lambda b=body, p=provider: list(
+                iter_records(iter_chunks(b), p, "ohlcv")
+            ),
+            "iterate": lambda b=body, p=provider: sum(
+                1 for _ in iter_records(iter_chunks(b), p, "ohlcv")
+            ),
+        }
+        for name, fn in ways.items():
+            seconds, peak = _measure(fn, args.repeat)
+            print(
+                f"  {name:22} {seconds:>8.2f}s {args.bars / seconds:>11,.0f} "
+                f"{peak / mb:>8.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Tax lot sync benchmark (batched vs. per-lot writes).
+
+Builds a throwaway SQLite journal with N BOT trades (half of them closed
+by a matching SLD) and times ``TaxService.sync_lots`` at increasing lot
+counts: the first sync materializes and closes every lot, the second is
+an idempotent re-sync. ``--compare`` re-runs each size with
+``save_many``/``update_many`` replaced by per-lot ``save``/``update``.
+
+Usage:
+    uv run python tools/bench_sync_lots.py                    # 1k, 10k, 100k lots
+    uv run python tools/bench_sync_lots.py --lots 5000 50000 --compare
+    uv run python tools/bench_sync_lots.py --budget-s 30      # exit 1 if slower
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import create_engine, text
+
+from zorivest_core.services.tax_service import TaxService
+from zorivest_infra.database.models import Base
+from zorivest_infra.database.tax_repository import SqlTaxLotRepository
+from zorivest_infra.database.unit_of_work import SqlAlchemyUnitOfWork
+
+_SYMBOLS = ("SPY", "QQQ", "AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META", "GOOG")
+
+
+def _populate(engine, n: int) -> None:  # noqa: ANN001
+    base = datetime(2020, 1, 1, 9, 30)
+    rows = []
+    for i in range(n):
+        bot = {
+            "exec_id": f"B{i:07d}",
+            "time": base + timedelta(minutes=i),
+            "instrument": _SYMBOLS[i % 9],
+            "action": "BOT",
+            "quantity": 1 + i % 50,
+            "price": 100 + i % 37,
+        }
+        rows.append(bot)
+        if i % 2 == 0:
+            rows.append(
+                bot
+                | {
+                    "exec_id": f"S{i:07d}",
+                    "time": base + timedelta(days=400, minutes=i),
+                    "action": "SLD",
+                    "price": 110 + i % 41,
+                }
+            )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO accounts (account_id, name, account_type, created_at) "
+                "VALUES ('ACC001', 'Bench', 'broker', '2025-01-01 00:00:00')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO trades (exec_id, time, instrument, action, quantity, "
+                "price, account_id, commission, realized_pnl) "
+                "VALUES (:exec_id, :time, :instrument, :action, :quantity, :price, "
+                "'ACC001', 0, 0)"
+            ),
+            rows,
+        )
+
+
+@contextmanager
+def _per_lot_writes() -> Iterator[None]:
+    """Swap the bulk writes for the one-statement-per-lot path."""
+    original = SqlTaxLotRepository.save_many, SqlTaxLotRepository.update_many
+
+    def save_many(self, lots):  # noqa: ANN001, ANN202
+        for lot in lots:
+            self.save(lot)
+
+    def update_many(self, lots):  # noqa: ANN001, ANN202
+        for lot in lots:
+            self.update(lot)
+
+    SqlTaxLotRepository.save_many = save_many  # type: ignore[method-assign]
+    SqlTaxLotRepository.update_many = update_many  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        SqlTaxLotRepository.save_many, SqlTaxLotRepository.update_many = original
+
+
+def _sync_seconds(uow: SqlAlchemyUnitOfWork) -> tuple[float, int, int]:
+    with uow:
+        start = time.perf_counter()
+        report = TaxService(uow).sync_lots(account_id="ACC001")
+        return time.perf_counter() - start, report.created, report.closed
+
+
+def _run(n: int) -> tuple[float, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        _populate(engine, n)
+        uow = SqlAlchemyUnitOfWork(engine)
+        first, created, closed = _sync_seconds(uow)
+        assert created == n and closed == (n + 1) // 2, (created, closed)
+        resync, created, _ = _sync_seconds(uow)
+        assert created == 0
+        engine.dispose()
+    return first, resync
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tax lot sync benchmark")
+    parser.add_argument("--lots", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Also time the per-lot save/update path",
+    )
+    parser.add_argument(
+        "--budget-s",
+        type=float,
+        default=None,
+        help="Fail (exit 1) if the largest batched first sync exceeds this budget",
+    )
+    args = parser.parse_args()
+
+    first = 0.0
+    for n in args.lots:
+        print(f"Syncing {n:,} lots ...", flush=True)
+        first, resync = _run(n)
+        line = (
+            f"{n:>9,} lots   batched first {first:7.2f} s "
+            f"({n / first:>9,.0f} lots/s)   re-sync {resync:7.2f} s"
+        )
+        if args.compare:
+            with _per_lot_writes():
+                slow, _ = _run(n)
+            line += f"   per-lot first {slow:7.2f} s ({slow / first:4.1f}x)"
+        print(line)
+
+    sys.exit(1 if args.budget_s is not None and first > args.budget_s else 0)
+
+
+if __name__ == "__main__":
+    main()
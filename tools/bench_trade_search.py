@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Trade search benchmark (FTS5 trigram index vs. LIKE scan).
+
+Builds a throwaway SQLite journal with N synthetic trades, then times
+``SqlAlchemyTradeRepository.list_filtered`` searches through the
+``trades_fts`` index and through the legacy ``LIKE`` scan.
+
+Usage:
+    uv run python tools/bench_trade_search.py                 # 500k trades
+    uv run python tools/bench_trade_search.py --trades 100000 --runs 20
+    uv run python tools/bench_trade_search.py --budget-ms 10  # exit 1 if slower
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from zorivest_infra.database import repositories
+from zorivest_infra.database.models import Base
+from zorivest_infra.database.repositories import SqlAlchemyTradeRepository
+from zorivest_infra.database.unit_of_work import SqlAlchemyUnitOfWork
+
+_SYMBOLS = ("SPY", "QQQ", "AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META", "GOOG")
+
+# (label, search term): a rare ticker, an exact exec_id and an exec_id prefix.
+_QUERIES = (
+    ("rare instrument", "ZZQX"),
+    ("exact exec_id", "E0123456"),
+    ("exec_id prefix", "E01234"),
+    ("lessons learned", "faded the open"),
+)
+
+
+def _populate(engine, n: int) -> None:  # noqa: ANN001
+    base = datetime(2020, 1, 1, 9, 30)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO accounts (account_id, name, account_type, created_at) "
+                "VALUES ('ACC001', 'Bench', 'broker', '2025-01-01 00:00:00')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO trades (exec_id, time, instrument, action, quantity, "
+                "price, account_id, commission, realized_pnl, notes) "
+                "VALUES (:exec_id, :time, :instrument, 'BOT', 1, 100, 'ACC001', "
+                "0, 0, :notes)"
+            ),
+            [
+                {
+                    "exec_id": f"E{i:07d}",
+                    "time": base + timedelta(minutes=i),
+                    "instrument": "ZZQX" if i % 5000 == 0 else _SYMBOLS[i % 9],
+                    "notes": f"session {i % 997}",
+                }
+                for i in range(n)
+            ],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO trade_reports (trade_id, lessons_learned, created_at) "
+                "SELECT exec_id, 'faded the open', time FROM trades "
+                "WHERE rowid % 7919 = 0"
+            )
+        )
+
+
+def _time_ms(repo: SqlAlchemyTradeRepository, search: str, runs: int) -> float:
+    repo.list_filtered(limit=50, search=search)  # warm the page cache
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        repo.list_filtered(limit=50, search=search)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Trade search benchmark")
+    parser.add_argument("--trades", type=int, default=500_000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Fail (exit 1) if any indexed search median exceeds this budget",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        print(f"Populating {args.trades:,} trades ...", flush=True)
+        _populate(engine, args.trades)
+
+        uow = SqlAlchemyUnitOfWork(engine)
+        over_budget = False
+        with uow:
+            repo = uow.trades
+            for label, search in _QUERIES:
+                indexed = _time_ms(repo, search, args.runs)
+                original = repositories._FTS_MIN_TERM_LEN
+                repositories._FTS_MIN_TERM_LEN = sys.maxsize  # force LIKE
+                try:
+                    scan = _time_ms(repo, search, max(1, args.runs // 5))
+                finally:
+                    repositories._FTS_MIN_TERM_LEN = original
+                print(
+                    f"{label:<16} {search!r:<18} fts {indexed:8.2f} ms   "
+                    f"like {scan:8.2f} ms"
+                )
+                if args.budget_ms is not None and indexed > args.budget_ms:
+                    over_budget = True
+        engine.dispose()
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
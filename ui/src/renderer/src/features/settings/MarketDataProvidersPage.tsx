@@ -21,6 +21,28 @@ declare global {
 
 // ── Types (G6: exact API field names from ProviderStatus) ────────────────────
 
+export interface ProviderHealth {
+    state: 'closed' | 'open' | 'half_open'
+    latency_ms: number | null
+    error_rate: number
+    requests: number
+    failures: number
+    rate_limited: number
+    consecutive_failures: number
+    retry_in_s: number | null
+}
+
+export interface RateBudgetStatus {
+    limit_per_minute: number
+    effective_per_minute: number
+    used: number
+    remaining: number
+    throttled: number
+    blocked_for_s: number
+    waiting_interactive: number
+    waiting_background: number
+}
+
 export interface ProviderStatus {
     provider_name: string
     display_name: string | null
@@ -30,6 +52,8 @@ export interface ProviderStatus {
     timeout: number
     last_test_status: string | null
     signup_url: string | null
+    health?: ProviderHealth | null
+    rate_budget?: RateBudgetStatus | null
 }
 
 /** Use display_name when available, otherwise fall back to provider_name. */